@@ -12,11 +12,11 @@
 # into the package namespace
 from ._version import __version__
 
+import importlib as _importlib
+
 from . import algorithms as alg
 from . import construction as cst
 from . import objects as obj
-from . import report as rpt
-from . import protocols
 
 from .algorithms.core import *
 from .algorithms.gaugeopt import *
@@ -25,8 +25,43 @@ from .algorithms.grammatrix import *
 from .construction.gateconstruction import *  # *_qubit_gate fns
 from .objects import Basis
 from .tools import *
-from .drivers import *
 
 #NUMPY BUG FIX (imported from tools)
 from .tools.compattools import _numpy14einsumfix
 _numpy14einsumfix()
+
+#Sub-packages that take a long time to import (e.g. because they use the report machinery or
+# the model packs) are only imported when they are first accessed, via the module-level
+# `__getattr__` below (see PEP 562).  This keeps `import pygsti` fast for scripts that don't need them.
+_lazy_submodules = {'report': 'report', 'rpt': 'report', 'protocols': 'protocols',
+                    'drivers': 'drivers', 'extras': 'extras'}
+_lazy_star_modules = ('drivers',)  # sub-packages whose public names belong in this namespace (as with `import *`)
+
+
+def _public_names(module):
+    return getattr(module, '__all__', [nm for nm in dir(module) if not nm.startswith('_')])
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        module = _importlib.import_module('.' + _lazy_submodules[name], __name__)
+        globals()[name] = module
+        return module
+
+    if name == '__all__':  # so `from pygsti import *` includes the lazily-imported names
+        return sorted(set([nm for nm in globals() if not nm.startswith('_')]) | set(_lazy_submodules)
+                      | set().union(*[_public_names(_importlib.import_module('.' + modname, __name__))
+                                      for modname in _lazy_star_modules]))
+
+    if not name.startswith('_'):
+        for modname in _lazy_star_modules:
+            module = _importlib.import_module('.' + modname, __name__)
+            if name in _public_names(module):
+                globals()[name] = getattr(module, name)
+                return globals()[name]
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return __getattr__('__all__')
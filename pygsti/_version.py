@@ -11,8 +11,15 @@
 __version__ = "unknown"
 
 try:
-    from pkg_resources import get_distribution, DistributionNotFound
-    __version__ = get_distribution('pygsti').version
+    try:  # importlib.metadata (python 3.8+) is much faster to import than pkg_resources
+        from importlib.metadata import version as _get_version, PackageNotFoundError as DistributionNotFound
+    except ImportError:
+        from pkg_resources import DistributionNotFound
+
+        def _get_version(dist_name):
+            from pkg_resources import get_distribution
+            return get_distribution(dist_name).version
+    __version__ = _get_version('pygsti')
 except DistributionNotFound:
     # package not installed
     try:
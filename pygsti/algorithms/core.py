@@ -11,7 +11,6 @@
 
 import numpy as _np
 import scipy.optimize as _spo
-import scipy.stats as _stats
 import warnings as _warnings
 import time as _time
 
@@ -1158,10 +1157,9 @@ def do_mc2gst(dataset, startModel, circuitsToUse,
         N = evaltree_cache['totalCntVec']
         fweights = None
     else:
-        KM = evTree.num_final_elements()  # shorthand for combined spam+circuit dimension
-        N = _np.empty(KM, 'd')  # totalCntVec
-        cntVecMx = _np.empty(KM, 'd')
-        fweights = _np.empty(KM, 'd') if useFreqWeightedChiSq else None  # usually not used
+        cntVecMx, N = dataset.to_count_matrix(dsCircuitsToUse, lookup, outcomes_lookup,
+                                              evTree.num_final_elements())  # N = totalCntVec
+        fweights = None  # usually not used
 
         #NOTE on chi^2 expressions:
         #in general case:   chi^2 = sum (p_i-f_i)^2/p_i  (for i summed over outcomes)
@@ -1171,17 +1169,9 @@ def do_mc2gst(dataset, startModel, circuitsToUse,
         #                         = (p - f)^2 * ( ((1-p) + p)/(p*(1-p)) )
         #                         = 1/(p*(1-p)) * (p - f)^2
 
-        for (i, opStr) in enumerate(dsCircuitsToUse):
-            cnts = dataset[opStr].counts
-            N[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-            cntVecMx[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
-            if useFreqWeightedChiSq:
-                wts = []
-                for x in outcomes_lookup[i]:
-                    Nx = dataset[opStr].total
-                    f1 = dataset[opStr].fraction(x); f2 = (f1 + 1) / (Nx + 2)
-                    wts.append(_np.sqrt(Nx / (f2 * (1 - f2))))
-                fweights[lookup[i]] = wts
+        if useFreqWeightedChiSq:
+            f2 = (cntVecMx / N + 1) / (N + 2)
+            fweights = _np.sqrt(N / (f2 * (1 - f2)))
 
         if circuitWeights is not None:
             for i in range(len(circuitsToUse)):
@@ -1297,6 +1287,7 @@ def _do_runopt(mdl, objective, objective_name, maxiter, maxfev, tol, fditer, ext
         else:
             nModelParams = mdl.num_params()  # just use total number of params
 
+        import scipy.stats as _stats  # (imported here b/c importing scipy.stats is slow)
         if objective_name == "chi2":  # could use isinstance(objective, Chi2Function) here?
             totChi2 = sum_minErrVec
             # reject GST model if p-value < threshold (~0.05?)
@@ -2239,15 +2230,8 @@ def _do_mlgst_base(dataset, startModel, circuitsToUse,
         cntVecMx = evaltree_cache['cntVecMx']
         totalCntVec = evaltree_cache['totalCntVec']
     else:
-        KM = evTree.num_final_elements()  # shorthand for combined spam+circuit dimension
-        cntVecMx = _np.empty(KM, 'd')
-        totalCntVec = _np.empty(KM, 'd')
-        for (i, opStr) in enumerate(dsCircuitsToUse):
-            cnts = dataset[opStr].counts
-            totalCntVec[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-            cntVecMx[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
-            # OLD: totalCntVec[ lookup[i] ] = dataset[opStr].total
-            # OLD: cntVecMx[ lookup[i] ] = [ dataset[opStr][x] for x in outcomes_lookup[i] ]
+        cntVecMx, totalCntVec = dataset.to_count_matrix(dsCircuitsToUse, lookup, outcomes_lookup,
+                                                        evTree.num_final_elements())
 
         if circuitWeights is not None:
             #From this point downward, scaling cntVecMx, totalCntVec and
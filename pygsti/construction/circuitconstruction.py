@@ -14,6 +14,7 @@ import numpy.random as _rndm
 
 from ..tools import listtools as _lt
 from ..objects import circuit as _cir
+from ..objects import circuitarray as _ca
 from ..objects import Model as _Model
 from ..objects.label import Label as _Lbl
 
@@ -443,6 +444,67 @@ def list_partial_strings(circuit):
     return ret
 
 
+def list_fiducial_pair_circuits(baseStr, fiducialPairs):
+    """
+    List the circuits `prepStr + baseStr + effectStr` for the given fiducial pairs.
+
+    The returned circuits (including their string representations) are the
+    same as those obtained by adding the circuits together, but they are
+    created much more quickly when there are many pairs, since the layer
+    labels and strings of `baseStr` and of each fiducial are only processed
+    once rather than once per pair.
+
+    Parameters
+    ----------
+    baseStr : Circuit
+        The base circuit, typically a germ power.
+
+    fiducialPairs : list
+        A list of `(prepStr, effectStr)` 2-tuples of Circuits.
+
+    Returns
+    -------
+    list of Circuits
+    """
+    processed = {}  # id(circuit) => (layer labels, string, line labels) or None when it must be added normally
+
+    def process(c):
+        #Circuit.__add__ expands any sub-circuits, which we skip, so only use static circuits without any
+        # sub-circuits (whose expanded labels are the labels themselves - labels are interned).
+        key = id(c)
+        if key not in processed:
+            lbls = c.layertup if c._static else None
+            if lbls is not None:
+                expanded = tuple(_itertools.chain(*[l.expand_subcircuits() for l in lbls]))
+                if len(expanded) != len(lbls) or any([x is not y for x, y in zip(expanded, lbls)]):
+                    lbls = None
+            processed[key] = (lbls, c._labels_lines_str()[0], c.line_labels) if (lbls is not None) else None
+        return processed[key]
+
+    def join_strs(s1, s2):  # as in Circuit.__add__
+        if s1 == "{}": return s2
+        return (s1 + s2) if s2 != "{}" else s1
+
+    def join_lines(l1, l2):  # as in Circuit.__add__
+        return l1 if l1 == l2 else l1 + tuple([l for l in l2 if l not in l1])
+
+    base = process(baseStr) if len(fiducialPairs) > 0 else None
+    ret = []
+    for prepStr, effectStr in fiducialPairs:
+        prep = process(prepStr); effect = process(effectStr)
+        if base is None or prep is None or effect is None:
+            ret.append(prepStr + baseStr + effectStr)
+            continue
+
+        line_labels = join_lines(join_lines(prep[2], base[2]), effect[2])
+        s = join_strs(join_strs(prep[1], base[1]), effect[1])
+        if line_labels != ('*',):
+            s += "@(" + ','.join(map(str, line_labels)) + ")"  # matches to _opSeqToStr in circuit.py!
+        ret.append(_cir.Circuit(prep[0] + base[0] + effect[0], line_labels, None, False, s,
+                                check=False, expand_subcircuits=False))
+    return ret
+
+
 def list_lgst_circuits(prepStrs, effectStrs, opLabelSrc):
     """
     List the operation sequences required for running LGST.
@@ -593,9 +655,10 @@ def translate_circuit_list(circuitList, aliasDict):
 
     Parameters
     ----------
-    circuitList : list of Circuits
+    circuitList : list of Circuits or CircuitArray
         The list of operation sequences to use as the base for find & replace
-        operations.
+        operations.  If a :class:`CircuitArray` is given, the replacement is
+        vectorized and a `CircuitArray` is returned.
 
     aliasDict : dict
         A dictionary whose keys are single operation labels and whose values are
@@ -608,6 +671,8 @@ def translate_circuit_list(circuitList, aliasDict):
     """
     if aliasDict is None:
         return circuitList
+    elif isinstance(circuitList, _ca.CircuitArray):
+        return circuitList.translate(aliasDict)
     else:
         new_circuits = [_cir.Circuit(tuple(_itertools.chain(
             *[aliasDict.get(lbl, (lbl,)) for lbl in opstr])),
@@ -779,8 +844,9 @@ def filter_circuits(circuits, sslbls_to_keep, new_sslbls=None, drop=False, idle=
 
     Parameters
     ----------
-    circuits : list
-        A list of operation sequences to act on.
+    circuits : list or CircuitArray
+        A list of operation sequences to act on.  If a :class:`CircuitArray`
+        is given, the filtering is vectorized and a `CircuitArray` is returned.
 
     sslbls_to_keep : list
         A list of state space labels specifying which operation labels should
@@ -805,6 +871,8 @@ def filter_circuits(circuits, sslbls_to_keep, new_sslbls=None, drop=False, idle=
     list
         A list of Circuits
     """
+    if isinstance(circuits, _ca.CircuitArray):
+        return circuits.filter(sslbls_to_keep, new_sslbls, drop, idle)
     if drop:
         ret = []
         for s in circuits:
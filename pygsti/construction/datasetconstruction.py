@@ -282,53 +282,11 @@ def merge_outcomes(dataset, label_merge_dict, recordZeroCnts=True):
     -------
     merged_dataset : DataSet object
         The DataSet with outcomes merged according to the rules given in label_merge_dict.
+        Its outcome labels are in the order of `label_merge_dict`'s keys, and the merged
+        counts at each time are stored in sorted outcome-label order.
     """
-    # strings -> tuple outcome labels in keys and values of label_merge_dict
-    to_outcome = _ld.OutcomeLabelDict.to_outcome  # shorthand
-    label_merge_dict = {to_outcome(key): list(map(to_outcome, val))
-                        for key, val in label_merge_dict.items()}
-
-    new_outcomes = label_merge_dict.keys()
-    merged_dataset = _ds.DataSet(outcomeLabels=new_outcomes)
-    merge_dict_old_outcomes = [outcome for sublist in label_merge_dict.values() for outcome in sublist]
-    if not set(dataset.get_outcome_labels()).issubset(merge_dict_old_outcomes):
-        raise ValueError(
-            "`label_merge_dict` must account for all the outcomes in original dataset."
-            " It's missing directives for:\n%s" %
-            '\n'.join(set(map(str, dataset.get_outcome_labels())) - set(map(str, merge_dict_old_outcomes)))
-        )
-
-    # New code that works for time-series data.
-    for key in dataset.keys():
-        times, linecounts = dataset[key].get_timeseries()
-        count_dict_list = []
-        for i in range(len(times)):
-            count_dict = {}
-            for new_outcome in new_outcomes:
-                count_dict[new_outcome] = 0
-                for old_outcome in label_merge_dict[new_outcome]:
-                    count_dict[new_outcome] += linecounts[i].get(old_outcome, 0)
-            if recordZeroCnts is False:
-                for new_outcome in new_outcomes:
-                    if count_dict[new_outcome] == 0:
-                        del count_dict[new_outcome]
-            count_dict_list.append(count_dict)
-
-        merged_dataset.add_series_data(key, count_dict_list, times, aux=dataset[key].aux)
-
-    # Old code that doesn't work for time-series data.
-    #for key in dataset.keys():
-    #    linecounts = dataset[key].counts
-    #    count_dict = {}
-    #    for new_outcome in new_outcomes:
-    #        count_dict[new_outcome] = 0
-    #        for old_outcome in label_merge_dict[new_outcome]:
-    #            count_dict[new_outcome] += linecounts.get(old_outcome, 0)
-    #    merged_dataset.add_count_dict(key, count_dict, aux=dataset[key].aux,
-    #                                  recordZeroCnts=recordZeroCnts)
-
-    merged_dataset.done_adding_data()
-    return merged_dataset
+    return dataset._merge_outcomes([label_merge_dict], recordZeroCnts, sortOutcomes=False, keepAux=True,
+                                   dropZeroCnts=True)[0]
 
 
 def create_qubit_merge_dict(nQubits, qubits_to_keep):
@@ -483,11 +441,9 @@ def filter_dataset(dataset, sectors_to_keep, sindices_to_keep=None,
     ds_merged = dataset.merge_outcomes(create_merge_dict(sindices_to_keep,
                                                          dataset.get_outcome_labels()),
                                        recordZeroCnts=recordZeroCnts)
-    ds_merged = ds_merged.copy_nonstatic()
-    if filtercircuits:
+    if filtercircuits:  # ds_merged is a new static DataSet, so it can be processed in place
         ds_merged.process_circuits(lambda s: _gstrc.filter_circuit(
             s, sectors_to_keep, new_sectors, idle), aggregate=True)
-    ds_merged.done_adding_data()
     return ds_merged
 
 
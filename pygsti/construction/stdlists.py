@@ -172,6 +172,7 @@ def make_lsgst_lists(opLabelSrc, prepStrs, effectStrs, germList, maxLengthList,
 
     #running list of all strings so far (LGST strings or empty)
     lsgst_list = lgst_list[:] if includeLGST else _gsc.circuit_list([()])
+    lsgst_list = _lt.remove_duplicates(lsgst_list); lsgst_set = set(lsgst_list)
     lsgst_listOfLists = []  # list of lists to return
 
     Rfn = _getTruncFunction(truncScheme)
@@ -213,13 +214,16 @@ def make_lsgst_lists(opLabelSrc, prepStrs, effectStrs, germList, maxLengthList,
                         [fiducialPairs[germ][k] for k in
                          sorted(rndm.choice(nPairs, nPairsToKeep, replace=False))]
 
-                lst += _gsc.create_circuit_list("f[0]+R(germ,N)+f[1]",
-                                                f=fiducialPairsThisIter,
-                                                germ=germ, N=maxLen,
-                                                R=Rfn, order=('f',))
+                #the germ power is computed just once for all of the fiducial pairs
+                lst += _gsc.list_fiducial_pair_circuits(Rfn(germ, maxLen), fiducialPairsThisIter)
         if nest:
-            lsgst_list += lst  # add new strings to running list
-            lsgst_listOfLists.append(_lt.remove_duplicates(lsgst_list))
+            #add new strings to running list (which has no duplicates) - same as removing duplicates
+            # from the concatenation of all the lists so far, but without re-hashing earlier strings.
+            for opstr in lst:
+                if opstr not in lsgst_set:
+                    lsgst_set.add(opstr)
+                    lsgst_list.append(opstr)
+            lsgst_listOfLists.append(lsgst_list[:])
         else:
             lsgst_listOfLists.append(_lt.remove_duplicates(lst))
 
@@ -651,12 +651,11 @@ def _load_dataset(dataFilenameOrSet, comm, verbosity):
     """Loads a DataSet from the dataFilenameOrSet argument of functions in this module."""
     printer = _objs.VerbosityPrinter.build_printer(verbosity, comm)
     if isinstance(dataFilenameOrSet, str):
-        if comm is None or comm.Get_rank() == 0:
-            if _os.path.splitext(dataFilenameOrSet)[1] == ".pkl":
-                with open(dataFilenameOrSet, 'rb') as pklfile:
-                    ds = _pickle.load(pklfile)
-            else:
-                ds = _io.load_dataset(dataFilenameOrSet, True, "aggregate", printer)
+        if _os.path.splitext(dataFilenameOrSet)[1] != ".pkl":
+            ds = _io.load_dataset(dataFilenameOrSet, True, "aggregate", verbosity=printer, comm=comm)
+        elif comm is None or comm.Get_rank() == 0:
+            with open(dataFilenameOrSet, 'rb') as pklfile:
+                ds = _pickle.load(pklfile)
             if comm is not None: comm.bcast(ds, root=0)
         else:
             ds = comm.bcast(None, root=0)
@@ -253,8 +253,10 @@ class StabilityAnalyzer(object):
 
         Parameters
         ----------
-        ds : DataSet or MultiDataSet
-            A DataSet containing time-series data to be analyzed for signs of instability.
+        ds : DataSet or MultiDataSet or DataSetBuilder
+            A DataSet containing time-series data to be analyzed for signs of instability.  If a
+            DataSetBuilder is given (e.g., one that is being filled by a running experiment), then the
+            data in its latest snapshot is analyzed.
 
         transform : str, optional
             The type of transform to use in the spectral analysis. Options are:
@@ -316,6 +318,8 @@ class StabilityAnalyzer(object):
             analyzes to be implemented.
 
         """
+        if isinstance(ds, _obj.DataSetBuilder):
+            ds = ds.snapshot()  # the data added so far (without copying it)
         assert(isinstance(ds, _obj.dataset.DataSet)), "The input data must be a pyGSTi DataSet!"
         tempds = ds.copy_nonstatic()  # Copy so that we can edit the dataset.
         multids = _obj.MultiDataSet()  # This is where the formatted data is recorded
@@ -61,10 +61,110 @@ except ImportError:
 
     from .slowcircuitparser import *
 
+import re as _re
+import functools as _functools
 import warnings as _warnings
 from ply import lex, yacc
 from ...objects import label as _lbl
 
+#Circuit-list and data files repeat the same fiducials, germ powers and layers many times over, so strings are
+# split into their top-level parts ("chunks": a simple label like Gx:0, a layer like [Gx:0Gy:1] or a
+# sub-expression like (GxGy)^4, each with an optional exponent) and the parsed chunks are kept in an LRU cache.
+_CHUNK_CACHE_SIZE = 20000
+_chunk_regex = _re.compile(r"\([^()]*\)(?:\^\d+)?|\[[^\[\]]*\](?:\^\d+)?|\{\}(?:\^\d+)?|(?:rho|[GIM])[^GIM(\[{]*")
+
+
+@_functools.lru_cache(maxsize=_CHUNK_CACHE_SIZE)
+def _parse_chunk(chunk, create_subcircuits, integerize_sslbls):
+    return tuple(parse_circuit(chunk, create_subcircuits, integerize_sslbls)[0])
+
+
+def _parse_line_labels(labels):
+    """ Parse the part of a circuit string after its '@' (as the `parse_circuit` implementations do) """
+    labels = labels.strip("( )")  # remove opening and closing parenthesis
+    if len(labels) > 0:
+        def process(x): return int(x) if x.strip().isdigit() else x.strip()
+        return tuple(map(process, labels.split(',')))
+    return ()  # no labels
+
+
+def parse_circuit_memoized(code, create_subcircuits=True, integerize_sslbls=True):
+    """
+    Parse a circuit string, re-using the parsed forms of its parts that have been seen before.
+
+    This gives the same result as `parse_circuit`, which is used directly on
+    any string that isn't a simple concatenation of chunks (e.g. one with
+    nested parenthesis), since the parsing of such strings is context
+    dependent.
+
+    Parameters
+    ----------
+    code : str
+        A circuit encoded as a single-line string.
+
+    create_subcircuits : bool, optional
+        Whether to create sub-circuit-labels for parenthesized expressions
+        or to just expand these into non-subcircuit labels.
+
+    integerize_sslbls : bool, optional
+        Whether to convert integer-valued state space labels to `int`s.
+
+    Returns
+    -------
+    layer_labels : list
+        The layer-labels of the circuit.
+    line_labels : tuple or None
+        The line labels of the circuit (None if there are none in `code`).
+    """
+    if '@' in code:  # format:  <string>@<line_labels>
+        layers_code, labels = code.split('@')
+        labels = _parse_line_labels(labels)
+    else:
+        layers_code, labels = code, None
+
+    layers_code = layers_code.replace('*', '')  # multiplication is implicit (no need for '*' ops)
+    chunks = _chunk_regex.findall(layers_code)
+    nChunks = len(chunks)
+    if sum(map(len, chunks)) != len(layers_code):  # unsupported or invalid syntax => parse normally
+        return parse_circuit(code, create_subcircuits, integerize_sslbls)
+
+    result = []
+    for k, chunk in enumerate(chunks):
+        #preps & POVMs are only allowed at the beginning & end, so they can't be parsed in isolation elsewhere
+        if ('rho' in chunk and (k > 0 or not chunk.startswith('rho'))) or \
+           ('M' in chunk and (k < nChunks - 1 or chunk[0] != 'M')):
+            return parse_circuit(code, create_subcircuits, integerize_sslbls)
+        result.extend(_parse_chunk(chunk, create_subcircuits, integerize_sslbls))
+    return result, labels
+
+
+def parse_circuits(codes, create_subcircuits=True, integerize_sslbls=True):
+    """
+    Parse a list of circuit strings.
+
+    Parts of the strings (e.g. fiducials, germ powers and layers) that occur
+    many times are only parsed once (see :func:`parse_circuit_memoized`).
+
+    Parameters
+    ----------
+    codes : list of strs
+        The circuits, each encoded as a single-line string.
+
+    create_subcircuits : bool, optional
+        Whether to create sub-circuit-labels for parenthesized expressions
+        or to just expand these into non-subcircuit labels.
+
+    integerize_sslbls : bool, optional
+        Whether to convert integer-valued state space labels to `int`s.
+
+    Returns
+    -------
+    list
+        A list of `(layer_labels, line_labels)` tuples, as returned by
+        :func:`parse_circuit_memoized`, one per string.
+    """
+    return [parse_circuit_memoized(code, create_subcircuits, integerize_sslbls) for code in codes]
+
 
 class CircuitLexer:
     """ Lexer for matching and interpreting text-format operation sequences """
@@ -214,9 +314,36 @@ class CircuitParser(object):
 
         This method will dispatch to the optimized Cython
         implementation, if available. Otherwise, the slower native
-        python implementation will be used.
+        python implementation will be used.  Parsed parts of the string
+        are cached (see :func:`parse_circuit_memoized`).
         """
-        return parse_circuit(code, create_subcircuits, integerize_sslbls)
+        return parse_circuit_memoized(code, create_subcircuits, integerize_sslbls)
+
+    def parse_circuits(self, codes, create_subcircuits=True, integerize_sslbls=True):
+        """
+        Parse a list of circuit strings.
+
+        Parts of the strings that occur many times are only parsed once.
+
+        Parameters
+        ----------
+        codes : list of strs
+            The circuits, each encoded as a single-line string.
+
+        create_subcircuits : bool, optional
+            Whether to create sub-circuit-labels when parsing.
+
+        integerize_sslbls : bool, optional
+            Whether to convert integer-valued state space labels to `int`s.
+
+        Returns
+        -------
+        list
+            A list of `(layer_labels, line_labels)` tuples, one per string.
+        """
+        if self.mode == "ply":
+            return [self.parse(code, create_subcircuits) for code in codes]
+        return parse_circuits(codes, create_subcircuits, integerize_sslbls)
 
     @property
     def lookup(self):
@@ -68,39 +68,7 @@ def encode_obj(py_obj, binary):
     # Pygsti object encoding
     elif is_pygsti_obj:  # or class_hasattr(py_obj, '__pygsti_getstate__')
 
-        #Get State (and/or init args)
-        if class_hasattr(py_obj, '__pygsti_reduce__'):
-            red = py_obj.__pygsti_reduce__()  # returns class, construtor_args, state
-            assert(red[0] is py_obj.__class__), "No support for weird reducing!"
-            init_args = red[1] if len(red) > 1 else []
-            state = red[2] if len(red) > 2 else {}
-            if state is None: state = {}
-            state.update({'__init_args__': init_args})
-        elif class_hasattr(py_obj, '__pygsti_getstate__'):
-            state = py_obj.__pygsti_getstate__()  # must return a dict
-        elif class_hasattr(py_obj, '__getstate__'):
-            state = py_obj.__getstate__()
-        elif hasattr(py_obj, '__dict__'):
-            state = py_obj.__dict__  # take __dict__ as state
-        elif class_hasattr(py_obj, '__reduce__'):
-            red = py_obj.__reduce__()  # returns class, construtor_args, state
-            if red[0] is not py_obj.__class__:
-                state = None  # weird reducing can happen, for instance, for namedtuples - just punt
-            else:
-                init_args = red[1] if len(red) > 1 else []
-                state = red[2] if len(red) > 2 else {}
-                if state is None: state = {}
-                state.update({'__init_args__': init_args})
-        else:
-            state = None
-
-        if state is None:  # Note: __dict__ and __getstate__ may *return* None (python 2.7)
-            if hasattr(py_obj, '_asdict'):  # named tuples
-                state = {'__init_args__': list(py_obj._asdict().values())}
-                # values will be ordered as per __init__ so no need for keys
-            else:
-                raise ValueError("Can't get state of %s object" % type(py_obj))
-
+        state = get_pygsti_state(py_obj)
         d = {k: encode_obj(v, binary) for k, v in state.items()}
 
         #DEBUG (instead of above line)
@@ -147,6 +115,56 @@ def encode_obj(py_obj, binary):
         return encode_std_obj(py_obj, binary)
 
 
+def get_pygsti_state(py_obj):
+    """
+    Get the state of pyGSTi object `py_obj` that is encoded by :func:`encode_obj`.
+
+    Parameters
+    ----------
+    py_obj : object
+        The pyGSTi object.
+
+    Returns
+    -------
+    dict
+        The object's state, which includes an `'__init_args__'` key when
+        the object should be re-created by calling its constructor.
+    """
+    #Get State (and/or init args)
+    if class_hasattr(py_obj, '__pygsti_reduce__'):
+        red = py_obj.__pygsti_reduce__()  # returns class, construtor_args, state
+        assert(red[0] is py_obj.__class__), "No support for weird reducing!"
+        init_args = red[1] if len(red) > 1 else []
+        state = red[2] if len(red) > 2 else {}
+        if state is None: state = {}
+        state.update({'__init_args__': init_args})
+    elif class_hasattr(py_obj, '__pygsti_getstate__'):
+        state = py_obj.__pygsti_getstate__()  # must return a dict
+    elif class_hasattr(py_obj, '__getstate__'):
+        state = py_obj.__getstate__()
+    elif hasattr(py_obj, '__dict__'):
+        state = py_obj.__dict__  # take __dict__ as state
+    elif class_hasattr(py_obj, '__reduce__'):
+        red = py_obj.__reduce__()  # returns class, construtor_args, state
+        if red[0] is not py_obj.__class__:
+            state = None  # weird reducing can happen, for instance, for namedtuples - just punt
+        else:
+            init_args = red[1] if len(red) > 1 else []
+            state = red[2] if len(red) > 2 else {}
+            if state is None: state = {}
+            state.update({'__init_args__': init_args})
+    else:
+        state = None
+
+    if state is None:  # Note: __dict__ and __getstate__ may *return* None (python 2.7)
+        if hasattr(py_obj, '_asdict'):  # named tuples
+            state = {'__init_args__': list(py_obj._asdict().values())}
+            # values will be ordered as per __init__ so no need for keys
+        else:
+            raise ValueError("Can't get state of %s object" % type(py_obj))
+    return state
+
+
 def encode_std_obj(py_obj, binary):
     """
     Helper to :func:`encode_obj` that encodes only "standard" (non-pyGSTi) types
@@ -41,7 +41,7 @@ def enable_old_object_unpickling(old_version="0.9.6"):
             s = state['_str'] if '_str' in state else state['str']
             c = _objs.Circuit(state['_tup'], stringrep=s)
             #OLD: self.__dict__.update(c.__dict__)
-            return c.__dict__  # now just return updated Circuit state
+            return c.__getstate__()  # now just return updated Circuit state
 
         class dummy_CompressedGateString(object):
             def __new__(cls):
@@ -200,7 +200,8 @@ def enable_old_object_unpickling(old_version="0.9.6"):
                 else: raise ValueError("Cannot determing labels from old Circuit state: %s" % str(state.keys()))
                 c = _objs.Circuit(labels, line_labels, editable=not state['_static'])
 
-            self.__dict__.update(c.__dict__)
+            for attr in _objs.Circuit.__slots__:  # Circuits have no __dict__
+                setattr(self, attr, getattr(c, attr))
 
         def Hack_CompressedCircuit_expand(self):
             """ Hacked version to rely on string rep & re-parse if it's there """
@@ -218,6 +219,7 @@ def enable_old_object_unpickling(old_version="0.9.6"):
         #_objs.basis.saved_Basis = _objs.basis.Basis
         #_objs.basis.Basis = dummy_Basis
         _objs.basis.Basis.__setstate__ = Basis_setstate
+        _objs.circuit.Circuit.saved_setstate = _objs.circuit.Circuit.__setstate__
         _objs.circuit.Circuit.__setstate__ = Circuit_setstate
         _objs.labeldicts.StateSpaceLabels.__setstate__ = StateSpaceLabels_setstate
         _objs.circuit.CompressedCircuit.saved_expand = _objs.circuit.CompressedCircuit.expand
@@ -296,7 +298,8 @@ def enable_old_object_unpickling(old_version="0.9.6"):
 
         del _sys.modules['pygsti.objects.povm'].LindbladParameterizedPOVM
 
-        delattr(_objs.Circuit, '__setstate__')
+        _objs.Circuit.__setstate__ = _objs.Circuit.saved_setstate
+        delattr(_objs.Circuit, 'saved_setstate')
         delattr(_objs.LindbladDenseOp, '__setstate__')
         delattr(_objs.modelmember.ModelMember, '__setstate__')
 
@@ -304,8 +307,9 @@ def enable_old_object_unpickling(old_version="0.9.6"):
         del _sys.modules['pygsti.baseobjs.dim']
         delattr(_objs.Basis, '__setstate__')
         delattr(_objs.labeldicts.StateSpaceLabels, '__setstate__')
-        if hasattr(_objs.Circuit, '__setstate__'):  # b/c above block may have already deleted this
-            delattr(_objs.Circuit, '__setstate__')
+        if hasattr(_objs.Circuit, 'saved_setstate'):  # b/c above block may have already restored this
+            _objs.Circuit.__setstate__ = _objs.Circuit.saved_setstate
+            delattr(_objs.Circuit, 'saved_setstate')
         _objs.circuit.CompressedCircuit.expand = _objs.circuit.CompressedCircuit.saved_expand
         delattr(_objs.circuit.CompressedCircuit, 'saved_expand')
         delattr(_objs.spamvec.SPAMVec, '__setstate__')
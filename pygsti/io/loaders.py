@@ -9,7 +9,12 @@
 #***************************************************************************************************
 
 import os as _os
+import json as _json
 import pathlib as _pathlib
+import hashlib as _hashlib
+import tempfile as _tempfile
+import itertools as _itertools
+import numpy as _np
 
 from . import stdinput as _stdinput
 from .. import objects as _objs
@@ -18,7 +23,7 @@ from . import metadir as _metadir
 
 def load_dataset(filename, cache=False, collisionAction="aggregate",
                  recordZeroCnts=True, ignoreZeroCountLines=True,
-                 withTimes="auto", verbosity=1):
+                 withTimes="auto", numProcs=1, verbosity=1, comm=None):
     """
     Load a DataSet from a file.  First tries to load file as a
     saved DataSet object, then as a standard text-formatted DataSet.
@@ -28,12 +33,14 @@ def load_dataset(filename, cache=False, collisionAction="aggregate",
     filename : string
         The name of the file
 
-    cache : bool, optional
-        When set to True, a pickle file with the name filename + ".cache"
-        is searched for and loaded instead of filename if it exists
-        and is newer than filename.  If no cache file exists or one
-        exists but it is older than filename, a cache file will be
-        written after loading from filename.
+    cache : bool or str, optional
+        When not False, the parsed DataSet is saved to (and, on subsequent
+        loads, read from) a cache file whose name contains a hash of the
+        contents of `filename` together with the parsing options below, so
+        that a cache file is only used for identical data and options.  If
+        a string is given, it is the directory holding the cache files;
+        otherwise the directory given by the `PYGSTI_CACHE_DIR` environment
+        variable, or "pygsti" within the user's cache directory, is used.
 
     collisionAction : {"aggregate", "keepseparate"}
         Specifies how duplicate operation sequences should be handled.  "aggregate"
@@ -44,10 +51,7 @@ def load_dataset(filename, cache=False, collisionAction="aggregate",
     recordZeroCnts : bool, optional
         Whether zero-counts are actually recorded (stored) in the returned
         DataSet.  If False, then zero counts are ignored, except for potentially
-        registering new outcome labels.  When reading from a cache file
-        (using `cache==True`) this argument is ignored: the presence of zero-
-        counts is dictated by the value of `recordZeroCnts` when the cache file
-        was created.
+        registering new outcome labels.
 
     ignoreZeroCountLines : bool, optional
         Whether circuits for which there are no counts should be ignored
@@ -59,63 +63,50 @@ def load_dataset(filename, cache=False, collisionAction="aggregate",
         per-circuit basis (so the dataset can contain both formats).  Typically
         you only need to set this to False when reading in a template file.
 
+    numProcs : int, optional
+        The number of processes used to parse a text-formatted data set file
+        (see :method:`StdInputParser.parse_datafile`).
+
     verbosity : int, optional
         If zero, no output is shown.  If greater than zero,
         loading progress is shown.
 
+    comm : mpi4py.MPI.Comm, optional
+        When not ``None``, an MPI communicator.  Only the root (rank 0)
+        processor reads the file (and any cache file), and the other
+        processors wait and then load its result.
+
     Returns
     -------
     DataSet
     """
 
-    printer = _objs.VerbosityPrinter.build_printer(verbosity)
-    try:
-        # a saved Dataset object is ok
-        ds = _objs.DataSet(fileToLoadFrom=filename)
-    except:
+    printer = _objs.VerbosityPrinter.build_printer(verbosity, comm)
 
-        #Parser functions don't take a VerbosityPrinter yet, and so
-        # always output to stdout (TODO)
-        bToStdout = (printer.verbosity > 0 and printer.filename is None)
-
-        if cache:
-            #bReadCache = False
-            cache_filename = filename + ".cache"
-            if _os.path.exists(cache_filename) and \
-               _os.path.getmtime(filename) < _os.path.getmtime(cache_filename):
-                try:
-                    printer.log("Loading from cache file: %s" % cache_filename)
-                    ds = _objs.DataSet(fileToLoadFrom=cache_filename)
-                    return ds
-                except: print("WARNING: Failed to load from cache file")  # pragma: no cover
-            else:
-                printer.log("Cache file not found or is tool old -- one will"
-                            + "be created after loading is completed")
+    def parse():
+        try:
+            # a saved Dataset object is ok
+            return _objs.DataSet(fileToLoadFrom=filename)
+        except:
+            #Parser functions don't take a VerbosityPrinter yet, and so
+            # always output to stdout (TODO)
+            bToStdout = (printer.verbosity > 0 and printer.filename is None)
 
             # otherwise must use standard dataset file format
             parser = _stdinput.StdInputParser()
-            ds = parser.parse_datafile(filename, bToStdout,
-                                       collisionAction=collisionAction,
-                                       recordZeroCnts=recordZeroCnts,
-                                       ignoreZeroCountLines=ignoreZeroCountLines,
-                                       withTimes=withTimes)
-
-            printer.log("Writing cache file (to speed future loads): %s"
-                        % cache_filename)
-            ds.save(cache_filename)
-        else:
-            # otherwise must use standard dataset file format
-            parser = _stdinput.StdInputParser()
-            ds = parser.parse_datafile(filename, bToStdout,
-                                       collisionAction=collisionAction,
-                                       recordZeroCnts=recordZeroCnts,
-                                       ignoreZeroCountLines=ignoreZeroCountLines,
-                                       withTimes=withTimes)
-        return ds
+            return parser.parse_datafile(filename, bToStdout,
+                                         collisionAction=collisionAction,
+                                         recordZeroCnts=recordZeroCnts,
+                                         ignoreZeroCountLines=ignoreZeroCountLines,
+                                         withTimes=withTimes, numProcs=numProcs)
+
+    options = {'collisionAction': collisionAction, 'recordZeroCnts': recordZeroCnts,
+               'ignoreZeroCountLines': ignoreZeroCountLines, 'withTimes': withTimes}
+    return _load_with_cache(filename, cache, 'dataset', options, parse, _objs.DataSet, printer, comm)
 
 
 def load_multidataset(filename, cache=False, collisionAction="aggregate",
-                      recordZeroCnts=True, verbosity=1):
+                      recordZeroCnts=True, verbosity=1, comm=None):
     """
     Load a MultiDataSet from a file.  First tries to load file as a
     saved MultiDataSet object, then as a standard text-formatted MultiDataSet.
@@ -125,12 +116,11 @@ def load_multidataset(filename, cache=False, collisionAction="aggregate",
     filename : string
         The name of the file
 
-    cache : bool, optional
-        When set to True, a pickle file with the name filename + ".cache"
-        is searched for and loaded instead of filename if it exists
-        and is newer than filename.  If no cache file exists or one
-        exists but it is older than filename, a cache file will be
-        written after loading from filename.
+    cache : bool or str, optional
+        When not False, the parsed MultiDataSet is saved to (and read from) a
+        cache file keyed by a hash of the contents of `filename` and the
+        parsing options.  A string gives the cache directory.  See
+        :function:`load_dataset`.
 
     collisionAction : {"aggregate", "keepseparate"}
         Specifies how duplicate operation sequences should be handled.  "aggregate"
@@ -141,65 +131,45 @@ def load_multidataset(filename, cache=False, collisionAction="aggregate",
     recordZeroCnts : bool, optional
         Whether zero-counts are actually recorded (stored) in the returned
         MultiDataSet.  If False, then zero counts are ignored, except for
-        potentially registering new outcome labels.  When reading from a cache
-        file (using `cache==True`) this argument is ignored: the presence of
-        zero-counts is dictated by the value of `recordZeroCnts` when the cache
-        file was created.
+        potentially registering new outcome labels.
 
     verbosity : int, optional
         If zero, no output is shown.  If greater than zero,
         loading progress is shown.
 
+    comm : mpi4py.MPI.Comm, optional
+        When not ``None``, an MPI communicator.  Only the root (rank 0)
+        processor reads the file (and any cache file), and the other
+        processors wait and then load its result.
+
 
     Returns
     -------
     MultiDataSet
     """
 
-    printer = _objs.VerbosityPrinter.build_printer(verbosity)
-    try:
-        # a saved MultiDataset object is ok
-        mds = _objs.MultiDataSet(fileToLoadFrom=filename)
-    except:
+    printer = _objs.VerbosityPrinter.build_printer(verbosity, comm)
 
-        #Parser functions don't take a VerbosityPrinter yet, and so
-        # always output to stdout (TODO)
-        bToStdout = (printer.verbosity > 0 and printer.filename is None)
-
-        if cache:
-            # bReadCache = False
-            cache_filename = filename + ".cache"
-            if _os.path.exists(cache_filename) and \
-               _os.path.getmtime(filename) < _os.path.getmtime(cache_filename):
-                try:
-                    printer.log("Loading from cache file: %s" % cache_filename)
-                    mds = _objs.MultiDataSet(fileToLoadFrom=cache_filename)
-                    return mds
-                except: print("WARNING: Failed to load from cache file")  # pragma: no cover
-            else:
-                printer.log("Cache file not found or is too old -- one will be"
-                            + "created after loading is completed")
+    def parse():
+        try:
+            # a saved MultiDataset object is ok
+            return _objs.MultiDataSet(fileToLoadFrom=filename)
+        except:
+            #Parser functions don't take a VerbosityPrinter yet, and so
+            # always output to stdout (TODO)
+            bToStdout = (printer.verbosity > 0 and printer.filename is None)
 
             # otherwise must use standard dataset file format
             parser = _stdinput.StdInputParser()
-            mds = parser.parse_multidatafile(filename, bToStdout,
-                                             collisionAction=collisionAction,
-                                             recordZeroCnts=recordZeroCnts)
-
-            printer.log("Writing cache file (to speed future loads): %s"
-                        % cache_filename)
-            mds.save(cache_filename)
+            return parser.parse_multidatafile(filename, bToStdout,
+                                              collisionAction=collisionAction,
+                                              recordZeroCnts=recordZeroCnts)
 
-        else:
-            # otherwise must use standard dataset file format
-            parser = _stdinput.StdInputParser()
-            mds = parser.parse_multidatafile(filename, bToStdout,
-                                             collisionAction=collisionAction,
-                                             recordZeroCnts=recordZeroCnts)
-    return mds
+    options = {'collisionAction': collisionAction, 'recordZeroCnts': recordZeroCnts}
+    return _load_with_cache(filename, cache, 'multidataset', options, parse, _objs.MultiDataSet, printer, comm)
 
 
-def load_tddataset(filename, cache=False, recordZeroCnts=True):
+def load_tddataset(filename, cache=False, recordZeroCnts=True, verbosity=1, comm=None):
     """
     Load time-dependent (time-stamped) data as a DataSet.
 
@@ -208,22 +178,132 @@ def load_tddataset(filename, cache=False, recordZeroCnts=True):
     filename : string
         The name of the file
 
-    cache : bool, optional
-        Reserved to perform caching similar to `load_dataset`.  Currently
-        this argument doesn't do anything.
+    cache : bool or str, optional
+        When not False, the parsed DataSet is saved to (and read from) a
+        cache file keyed by a hash of the contents of `filename` and the
+        parsing options.  A string gives the cache directory.  See
+        :function:`load_dataset`.
 
     recordZeroCnts : bool, optional
         Whether zero-counts are actually recorded (stored) in the returned
         DataSet.  If False, then zero counts are ignored, except for
         potentially registering new outcome labels.
 
+    verbosity : int, optional
+        If zero, no output is shown.  If greater than zero,
+        cache-related messages are shown.
+
+    comm : mpi4py.MPI.Comm, optional
+        When not ``None``, an MPI communicator.  Only the root (rank 0)
+        processor reads the file (and any cache file), and the other
+        processors wait and then load its result.
+
     Returns
     -------
     DataSet
     """
-    parser = _stdinput.StdInputParser()
-    tdds = parser.parse_tddatafile(filename, recordZeroCnts=recordZeroCnts)
-    return tdds
+    printer = _objs.VerbosityPrinter.build_printer(verbosity, comm)
+
+    def parse():
+        parser = _stdinput.StdInputParser()
+        return parser.parse_tddatafile(filename, recordZeroCnts=recordZeroCnts)
+
+    options = {'recordZeroCnts': recordZeroCnts}
+    return _load_with_cache(filename, cache, 'tddataset', options, parse, _objs.DataSet, printer, comm)
+
+
+def _get_cache_dir(cache):
+    """
+    The directory holding the cache files of the load_* functions, given their `cache` argument.
+    """
+    if isinstance(cache, (str, _pathlib.Path)):
+        return _pathlib.Path(cache)
+    if _os.environ.get('PYGSTI_CACHE_DIR', None):
+        return _pathlib.Path(_os.environ['PYGSTI_CACHE_DIR'])
+    user_cache_dir = _os.environ.get('XDG_CACHE_HOME', None) or _pathlib.Path.home() / '.cache'
+    return _pathlib.Path(user_cache_dir) / 'pygsti'
+
+
+def _get_cache_filename(filename, cache, kind, options):
+    """
+    The cache file for the object of type `kind` parsed from `filename` using the given parser `options`.
+
+    The name contains a hash of the file's contents and of the options, so a cache file is never
+    used for a modified (or different) file nor one parsed differently.
+    """
+    h = _hashlib.sha256()
+    with open(str(filename), 'rb') as f:
+        for block in iter(lambda: f.read(2**20), b''):
+            h.update(block)
+    h.update(repr((kind, sorted(options.items()))).encode('utf-8'))
+    return _get_cache_dir(cache) / ("%s.%s.cache" % (_pathlib.Path(filename).name, h.hexdigest()[0:32]))
+
+
+def _save_atomically(obj, path):
+    """
+    Save `obj` (using its `save` method) to `path` via a temporary file that is renamed into place,
+    so that concurrent readers never see a partially-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = _tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+    try:
+        with _os.fdopen(fd, 'wb') as f:
+            obj.save(f)
+        _os.replace(temp_path, str(path))
+    except:
+        _os.remove(temp_path)
+        raise
+
+
+def _load_with_cache(filename, cache, kind, options, parse_fn, cls, printer, comm):
+    """
+    Load the object returned by `parse_fn()`, reading it from (or writing it to) a cache file when
+    `cache` is not False.  Only the root processor of `comm` parses and accesses the cache; the
+    result (or the name of the cache file holding it) is broadcast to the other processors.  An
+    exception raised on the root processor is broadcast too, and re-raised on every processor.
+    """
+    if comm is not None and comm.Get_rank() != 0:
+        cache_filename, obj, exc = comm.bcast(None, root=0)
+        if exc is not None: raise exc
+        return cls(fileToLoadFrom=cache_filename) if (obj is None) else obj
+
+    try:
+        obj, cache_filename = _load_or_parse(filename, cache, kind, options, parse_fn, cls, printer)
+    except Exception as e:
+        if comm is not None: comm.bcast((None, None, e), root=0)  # so the other ranks don't wait forever
+        raise
+
+    if comm is not None:  # other ranks load the cache file when there is one, rather than unpickling `obj`
+        comm.bcast((str(cache_filename), None, None) if (cache_filename is not None) else (None, obj, None), root=0)
+    return obj
+
+
+def _load_or_parse(filename, cache, kind, options, parse_fn, cls, printer):
+    """
+    The root-processor part of :function:`_load_with_cache`: returns the loaded (or parsed) object
+    and the name of the cache file holding it (None if there isn't one).
+    """
+    obj = None
+    cache_filename = _get_cache_filename(filename, cache, kind, options) if cache else None
+    if cache_filename is not None and cache_filename.exists():
+        try:
+            printer.log("Loading from cache file: %s" % cache_filename)
+            obj = cls(fileToLoadFrom=str(cache_filename))
+        except Exception:  # pragma: no cover
+            printer.warning("Failed to load from cache file: %s" % cache_filename)
+    elif cache_filename is not None:
+        printer.log("Cache file not found -- one will be created after loading is completed")
+
+    if obj is None:
+        obj = parse_fn()
+        if cache_filename is not None:
+            try:
+                _save_atomically(obj, cache_filename)
+                printer.log("Wrote cache file (to speed future loads): %s" % cache_filename)
+            except OSError as e:  # e.g. a read-only cache directory: just don't cache
+                printer.warning("Could not write cache file %s: %s" % (cache_filename, str(e)))
+                cache_filename = None
+    return obj, cache_filename
 
 
 def load_model(filename):
@@ -265,7 +345,8 @@ def load_circuit_dict(filename):
 def load_circuit_list(filename, readRawStrings=False, line_labels='auto', num_lines=None):
     """
     Load a operation sequence list from a file, formatted
-    using the standard text-format.
+    using the standard text-format or the binary format written
+    by :function:`write_binary_circuit_list`.
 
     Parameters
     ----------
@@ -292,6 +373,9 @@ def load_circuit_list(filename, readRawStrings=False, line_labels='auto', num_li
     -------
     list of Circuit objects
     """
+    if _is_binary_circuit_list(filename):  # binary files always contain the circuits' line labels
+        return _load_binary_circuit_list(filename, readRawStrings)
+
     if readRawStrings:
         rawList = []
         with open(str(filename), 'r') as circuitlist:
@@ -325,7 +409,76 @@ def load_protocol_from_dir(dirname, comm=None):
     return _metadir.cls_from_meta_json(dirname).from_dir(dirname)
 
 
-def load_edesign_from_dir(dirname, comm=None):
+def _is_binary_circuit_list(filename):
+    """ Whether `filename` is a binary circuit-list file (a .npz, i.e. zip, file) rather than a text file """
+    with open(str(filename), 'rb') as f:
+        return f.read(4) == b'PK\x03\x04'
+
+
+def _load_binary_circuit_list(filename, readRawStrings=False):
+    """
+    Load a circuit list from a file written by :function:`write_binary_circuit_list`.
+
+    The distinct (segment, power) entries are parsed once each, and the
+    circuits' layers are assembled from them using vectorized operations
+    (see :class:`CircuitArray`).
+    """
+    with _np.load(str(filename), allow_pickle=False) as f:
+        if int(f['version']) > 1:
+            raise ValueError("%s has unsupported binary circuit-list version %d" % (filename, int(f['version'])))
+        segments = str(f['segments']).split('\n')
+        segment_ids = f['segment_ids'].astype(_np.int64); powers = f['powers'].astype(_np.int64)
+        entry_counts = f['entry_counts']; line_codes = f['line_codes']
+        line_info = _json.loads(str(f['line_labels']))
+
+    entry_offsets = _np.zeros(len(entry_counts) + 1, _np.int64)
+    _np.cumsum(entry_counts, out=entry_offsets[1:])
+    if len(segment_ids) == 0: return []
+
+    #Get the distinct entries, i.e. (segment, power) pairs, and the string of each
+    keys, entry_inds = _np.unique(segment_ids * (powers.max() + 1) + powers, return_inverse=True)
+    entry_segs, entry_powers = divmod(keys, powers.max() + 1)
+    entry_strs = [segments[i] if p == 0 else "(%s)^%d" % (segments[i], p)
+                  for i, p in zip(entry_segs.tolist(), entry_powers.tolist())]
+    line_suffixes = [sfx for ll, sfx in line_info]
+    strs = [''.join([entry_strs[i] for i in entry_inds[entry_offsets[k]:entry_offsets[k + 1]].tolist()])
+            + line_suffixes[line_codes[k]] for k in range(len(entry_counts))]
+    if readRawStrings: return strs
+
+    #Get the layer labels of each distinct entry (as text-file circuits would have them)
+    expand = _objs.Circuit.default_expand_subcircuits
+    parsed = _stdinput.StdInputParser().parse_circuits(
+        [segments[i] if (p == 0 or expand) else s for i, p, s in zip(entry_segs.tolist(), entry_powers.tolist(),
+                                                                     entry_strs)])
+    labels = []; label_index = {}; entry_codes = []; entry_lengths = []
+    for (lbls, _), p in zip(parsed, entry_powers.tolist()):
+        lbls = [x if isinstance(x, _objs.Label) else _objs.Label(x) for x in lbls]
+        if expand:
+            lbls = list(_itertools.chain(*[x.expand_subcircuits() for x in lbls])) * max(p, 1)
+        for lbl in lbls:
+            code = label_index.get((lbl, lbl.time), None)
+            if code is None:
+                code = label_index[(lbl, lbl.time)] = len(labels)
+                labels.append(lbl)
+            entry_codes.append(code)
+        entry_lengths.append(len(lbls))
+
+    #Assemble the circuits' layer codes from those of the entries
+    entry_lengths = _np.array(entry_lengths, _np.int64)
+    entry_starts = _np.cumsum(entry_lengths) - entry_lengths
+    codes = _np.array(entry_codes, _np.int64)[_objs.circuitarray._segment_indices(entry_starts[entry_inds],
+                                                                                  entry_lengths[entry_inds])]
+    circuit_ends = _np.concatenate(([0], _np.cumsum(entry_lengths[entry_inds])))
+    offsets = circuit_ends[entry_offsets]
+
+    circuits = _objs.CircuitArray.from_arrays(labels, codes, offsets, [ll for ll, sfx in line_info],
+                                              line_codes).to_circuits()
+    for c, s in zip(circuits, strs):
+        c._str = s
+    return circuits
+
+
+def load_edesign_from_dir(dirname, comm=None, max_loaded_children=None):
     """
     Load a :class:`ExperimentDesign` from a directory on disk.
 
@@ -337,15 +490,25 @@ def load_edesign_from_dir(dirname, comm=None):
     comm : mpi4py.MPI.Comm, optional
         When not ``None``, an MPI communicator used to synchronize file access.
 
+    max_loaded_children : int, optional
+        If not None, the maximum number of child nodes (per node) that are
+        kept in memory.  Child nodes are loaded from disk when they are first
+        accessed, and when this limit is reached the least-recently-used child
+        is dropped (to be re-loaded from disk if it's accessed again).  Any
+        unsaved changes to a dropped child are lost, so only use this when
+        inspecting (not modifying) a large tree.
+
     Returns
     -------
     ExperimentDesign
     """
     dirname = _pathlib.Path(dirname)
-    return _metadir.cls_from_meta_json(dirname / 'edesign').from_dir(dirname)
+    ret = _metadir.cls_from_meta_json(dirname / 'edesign').from_dir(dirname)
+    if max_loaded_children is not None: ret._set_max_loaded_children(max_loaded_children)
+    return ret
 
 
-def load_data_from_dir(dirname, comm=None):
+def load_data_from_dir(dirname, comm=None, max_loaded_children=None):
     """
     Load a :class:`ProtocolData` from a directory on disk.
 
@@ -357,15 +520,27 @@ def load_data_from_dir(dirname, comm=None):
     comm : mpi4py.MPI.Comm, optional
         When not ``None``, an MPI communicator used to synchronize file access.
 
+    max_loaded_children : int, optional
+        If not None, the maximum number of child nodes (per node) that are
+        kept in memory.  Child nodes are loaded from disk when they are first
+        accessed, and when this limit is reached the least-recently-used child
+        is dropped (to be re-loaded from disk if it's accessed again).  Any
+        unsaved changes to a dropped child are lost, so only use this when
+        inspecting (not modifying) a large tree.
+
     Returns
     -------
     ProtocolData
     """
     dirname = _pathlib.Path(dirname)
-    return _metadir.cls_from_meta_json(dirname / 'data').from_dir(dirname)
+    ret = _metadir.cls_from_meta_json(dirname / 'data').from_dir(dirname)
+    if max_loaded_children is not None:
+        ret._set_max_loaded_children(max_loaded_children)
+        ret.edesign._set_max_loaded_children(max_loaded_children)
+    return ret
 
 
-def load_results_from_dir(dirname, name=None, preloaded_data=None, comm=None):
+def load_results_from_dir(dirname, name=None, preloaded_data=None, comm=None, max_loaded_children=None):
     """
     Load a :class:`ProtocolResults` or :class:`ProtocolsResultsDir` from a
     directory on disk (depending on whether `name` is given).
@@ -390,6 +565,14 @@ def load_results_from_dir(dirname, name=None, preloaded_data=None, comm=None):
     comm : mpi4py.MPI.Comm, optional
         When not ``None``, an MPI communicator used to synchronize file access.
 
+    max_loaded_children : int, optional
+        If not None, the maximum number of child nodes (per node) that are
+        kept in memory.  Child nodes are loaded from disk when they are first
+        accessed, and when this limit is reached the least-recently-used child
+        is dropped (to be re-loaded from disk if it's accessed again).  Any
+        unsaved changes to a dropped child are lost, so only use this when
+        inspecting (not modifying) a large tree.  Only used when `name` is None.
+
     Returns
     -------
     ProtocolResults or ProtocolResultsDir
@@ -400,6 +583,10 @@ def load_results_from_dir(dirname, name=None, preloaded_data=None, comm=None):
     if name is None:  # then it's a directory object
         cls = _metadir.cls_from_meta_json(results_dir) if (results_dir / 'meta.json').exists() \
             else _ProtocolResultsDir  # default if no meta.json (if only a results obj has been written inside dir)
-        return cls.from_dir(dirname)
+        ret = cls.from_dir(dirname)
+        if max_loaded_children is not None:
+            for node in (ret, ret.data, ret.data.edesign):
+                node._set_max_loaded_children(max_loaded_children)
+        return ret
     else:  # it's a ProtocolResults object
         return _metadir.cls_from_meta_json(results_dir / name).from_dir(dirname, name, preloaded_data)
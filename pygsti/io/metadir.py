@@ -8,12 +8,18 @@
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import os as _os
 import json as _json
+import uuid as _uuid
 import pickle as _pickle
+import hashlib as _hashlib
 import pathlib as _pathlib
 import importlib as _importlib
+import functools as _functools
+import concurrent.futures as _futures
 
 from ..objects.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
+from .. import objects as _objs
 from . import loaders as _load
 from . import writers as _write
 
@@ -57,6 +63,106 @@ def class_for_name(module_and_class_name):
     return c
 
 
+# ****************** Atomic file writing *********************
+_MAX_WRITER_THREADS = 4  # maximum number of threads used to write the auxiliary files of a directory
+_AUXFILE_DIGESTS_KEY = 'auxfile_digests'  # meta.json key holding the content digests of the auxiliary files
+
+
+def _temp_path_for(pth):
+    """ A unique (hidden) temporary file name in the same directory as `pth` """
+    return pth.parent / ('.%s.%s.tmp' % (pth.name, _uuid.uuid4().hex[0:12]))
+
+
+def write_file_atomically(filename, write_function, *args):
+    """
+    Write a file using `write_function`, so that it is either fully written or untouched.
+
+    The file is written by calling `write_function(temp_filename, *args)`,
+    where `temp_filename` is a temporary file in the same directory as
+    `filename`, and this file is then renamed to `filename` (an atomic
+    operation).  This way, an interrupted write never leaves a partially
+    written file behind.
+
+    Parameters
+    ----------
+    filename : str or Path
+        The name of the file to write.
+
+    write_function : function
+        A function whose first argument is the name of the file to write
+        and whose remaining arguments are given by `args`.
+
+    args : tuple
+        Additional arguments to `write_function`.
+
+    Returns
+    -------
+    None
+    """
+    pth = _pathlib.Path(filename)
+    tmp_pth = _temp_path_for(pth)
+    try:
+        write_function(str(tmp_pth), *args)
+        _os.replace(str(tmp_pth), str(pth))
+    except BaseException:
+        if tmp_pth.exists(): tmp_pth.unlink()
+        raise
+
+
+def _write_bytes_atomically(pth, data):
+    """ Like :function:`write_file_atomically` but for already-serialized `data` (bytes) """
+    tmp_pth = _temp_path_for(pth)
+    try:
+        with open(tmp_pth, 'wb') as f:
+            f.write(data)
+        _os.replace(str(tmp_pth), str(pth))
+    except BaseException:
+        if tmp_pth.exists(): tmp_pth.unlink()
+        raise
+
+
+def _json_bytes(val):
+    return _json.dumps(val).encode('utf-8')
+
+
+def _pickle_bytes(val):
+    return _pickle.dumps(val)
+
+
+def _circuit_list_bytes(circuit_list):
+    """ The contents of the file written by :function:`writers.write_circuit_list` (with no header) """
+    if len(circuit_list) > 0 and not isinstance(circuit_list[0], _objs.Circuit):
+        raise ValueError("Argument circuit_list must be a list of Circuit objects!")
+    return ''.join([circuit.str + '\n' for circuit in circuit_list]).encode('utf-8')
+
+
+def _write_serialized_if_changed(pth, serialize_function, val, old_digest):
+    """
+    Serialize `val` (in memory) using `serialize_function` and write the resulting bytes
+    atomically to `pth`, unless they match `old_digest`, the content digest recorded when
+    `pth` was last written.  Returns the `(filename, digest)` of the (new) file contents.
+    """
+    data = serialize_function(val)
+    digest = _hashlib.sha256(data).hexdigest()
+    if digest != old_digest or not pth.is_file() or pth.stat().st_size != len(data):
+        _write_bytes_atomically(pth, data)
+    return pth.name, digest
+
+
+def _run_write_tasks(tasks):
+    """
+    Run `tasks`, a list of functions (taking no arguments) that each write a
+    different file or directory, using a pool of threads when there's more than
+    one.  Returns the list of the tasks' return values.
+    """
+    if len(tasks) <= 1:
+        return [task() for task in tasks]
+
+    with _futures.ThreadPoolExecutor(max_workers=min(len(tasks), _MAX_WRITER_THREADS)) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]  # re-raises any exception raised by a task
+
+
 # ****************** Serialization into a directory with a meta.json *********************
 def _get_auxfile_ext(typ):
     #get expected extension
@@ -121,7 +227,7 @@ def load_meta_based_dir(root_dir, auxfile_types_member='auxfile_types',
         meta = _json.load(f)
 
     for key, val in meta.items():
-        if key in ignore_meta: continue
+        if key in ignore_meta or key == _AUXFILE_DIGESTS_KEY: continue  # digests are bookkeeping, not members
         ret[key] = val
 
     for key, typ in meta[auxfile_types_member].items():
@@ -188,6 +294,13 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
     and "auxiliary" files in formats given by `auxfile_types` (which itself is
     saved in meta.json).
 
+    Each file is written atomically (see :function:`write_file_atomically`),
+    and independent auxiliary files and sub-directories (protocol objects) are
+    written concurrently by a pool of threads.  The SHA-256 digest of each
+    auxiliary file is recorded in 'meta.json', so that a member whose serialized
+    contents match the recorded digest isn't rewritten (and existing files are
+    never read back to check this).  The 'meta.json' file is written last.
+
     Parameters
     ----------
     root_dir : str
@@ -220,6 +333,16 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
     if auxfile_types is None:
         auxfile_types = valuedict['auxfile_types']
 
+    meta_pth = root_dir / 'meta.json'
+    old_meta_data = None; old_digests = {}
+    if meta_pth.is_file():
+        with open(meta_pth, 'rb') as f:
+            old_meta_data = f.read()
+        try:
+            old_digests = _json.loads(old_meta_data.decode('utf-8')).get(_AUXFILE_DIGESTS_KEY, {})
+        except ValueError:
+            pass  # an unreadable meta.json => (re)write all files
+
     meta = {}
     if init_meta: meta.update(init_meta)
     meta['auxfile_types'] = auxfile_types
@@ -231,6 +354,11 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
     #Wait to write meta.json until the end, since
     # aux-types may utilize it too.
 
+    def file_task(pth, serialize_function, val):
+        return _functools.partial(_write_serialized_if_changed, pth, serialize_function, val,
+                                  old_digests.get(pth.name, None))
+
+    write_tasks = []  # writes of individual (independent) files & directories, run in parallel below
     for auxnm, typ in auxfile_types.items():
         val = valuedict[auxnm]
         ext = _get_auxfile_ext(typ)
@@ -238,21 +366,21 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
         if typ == 'text-circuit-lists':
             for i, circuit_list in enumerate(val):
                 pth = root_dir / (auxnm + str(i) + ext)
-                _write.write_circuit_list(pth, circuit_list)
+                write_tasks.append(file_task(pth, _circuit_list_bytes, circuit_list))
 
         elif typ == 'protocolobj':
-            val.write(root_dir / (auxnm + ext))
+            write_tasks.append(_functools.partial(val.write, root_dir / (auxnm + ext)))
 
         elif typ == 'list-of-protocolobjs':
             for i, obj in enumerate(val):
                 pth = root_dir / (auxnm + str(i) + ext)
-                obj.write(pth)
+                write_tasks.append(_functools.partial(obj.write, pth))
 
         elif typ == 'dict-of-protocolobjs':
             meta[auxnm] = list(val.keys())  # just save a list of the keys in the metadata
             for k, obj in val.items():
                 obj_dirname = auxnm + "_" + k + ext  # keys must be strings
-                obj.write(root_dir / obj_dirname)
+                write_tasks.append(_functools.partial(obj.write, root_dir / obj_dirname))
 
         else:
             # standard path cases
@@ -261,20 +389,21 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
             if val is None:   # None values don't get written
                 pass
             elif typ == 'text-circuit-list':
-                _write.write_circuit_list(pth, val)
+                write_tasks.append(file_task(pth, _circuit_list_bytes, val))
             elif typ == 'json':
-                with open(pth, 'w') as f:
-                    _json.dump(val, f)
+                write_tasks.append(file_task(pth, _json_bytes, val))
             elif typ == 'pickle':
-                with open(pth, 'wb') as f:
-                    _pickle.dump(val, f)
+                write_tasks.append(file_task(pth, _pickle_bytes, val))
             elif typ in ('none', 'reset'):
                 pass
             else:
                 raise ValueError("Invalid aux-file type: %s" % typ)
 
-    with open(root_dir / 'meta.json', 'w') as f:
-        _json.dump(meta, f)
+    #Protocol-object tasks write their own directories (and return None)
+    meta[_AUXFILE_DIGESTS_KEY] = dict([r for r in _run_write_tasks(write_tasks) if r is not None])
+    meta_data = _json_bytes(meta)
+    if meta_data != old_meta_data:
+        _write_bytes_atomically(meta_pth, meta_data)
 
 
 def cls_from_meta_json(dirname):
@@ -316,8 +445,7 @@ def obj_to_meta_json(obj, dirname):
     None
     """
     meta = {'type': full_class_name(obj)}
-    with open(_pathlib.Path(dirname) / 'meta.json', 'w') as f:
-        _json.dump(meta, f)
+    _write_bytes_atomically(_pathlib.Path(dirname) / 'meta.json', _json_bytes(meta))
 
 
 def write_obj_to_meta_based_dir(obj, dirname, auxfile_types_member):
@@ -401,6 +529,7 @@ def write_dict_to_json_or_pkl_files(d, dirname):
     """
     dirname = _pathlib.Path(dirname)
     dirname.mkdir(exist_ok=True)
+    file_tasks = []
     for key, val in d.items():
         #TODO: fix this - as we can write some things to json that don't get read back correctly,
         # e.g. dicts with integer keys
@@ -409,5 +538,6 @@ def write_dict_to_json_or_pkl_files(d, dirname):
         #        _json.dump(val, f)
         #except:
         #try to remove partial json file??
-        with open(dirname / (key + '.pkl'), 'wb') as f:
-            _pickle.dump(val, f)
+        file_tasks.append(_functools.partial(_write_serialized_if_changed, dirname / (key + '.pkl'),
+                                             _pickle_bytes, val, None))  # (no digests are kept for these)
+    _run_write_tasks(file_tasks)
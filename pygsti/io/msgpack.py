@@ -8,32 +8,367 @@
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import io as _io
+import struct as _struct
+import types as _types
+import uuid as _uuid
+import collections as _collections
+import numpy as _np
 import msgpack as _msgpack
 msgpack_uses_binary_strs = _msgpack.version < (1, 0, 0)  # msgpack only used binary strings in pre 1.0 versions
 
+from . import jsoncodec as _jsoncodec
 from .jsoncodec import encode_obj
 from .jsoncodec import decode_obj
+from .. import objects as _objs  # (pygsti.objects imports this module, so only use it within functions)
+
+#msgpack extension types, used in place of the (much larger and slower to create) JSON-compatible encodings of
+# arrays, labels, circuits and homogeneous lists.  Objects that can't be written this way are encoded as by
+# :func:`encode_obj`, so files written by earlier versions (without extension types) can still be loaded.
+EXT_NDARRAY = 1  # a numpy array: a header (dtype & shape) followed by the array's raw data
+EXT_LABEL = 2  # a simple Label (LabelStr, LabelTup or a LabelTupTup of these)
+EXT_CIRCUIT = 3  # a static Circuit of simple labels (and no auxiliary information)
+EXT_CIRCUIT_LIST = 4  # a list of such circuits, stored as a label vocabulary + integer codes (as a CircuitArray)
+EXT_NUMBER_LIST = 5  # a list of all-floats or all-ints, stored as a (float64 or int64) array
+EXT_TUPLE_LIST = 6  # a list of tuples of strings (e.g. outcome labels)
+
+_BUFFER_SIZE = 1 << 16  # the streaming encoder writes its output in chunks of about this many bytes
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
 
 
 def dumps(obj, **kwargs):
     """ An overload of msgpack.dumps that works with pyGSTi types """
-    enc = encode_obj(obj, msgpack_uses_binary_strs)
-    return _msgpack.packb(enc, **kwargs)
+    f = _io.BytesIO()
+    dump(obj, f, **kwargs)
+    return f.getvalue()
 
 
 def dump(obj, f, **kwargs):
-    """ An overload of msgpack.dump that works with pyGSTi types """
-    enc = encode_obj(obj, msgpack_uses_binary_strs)
-    _msgpack.pack(enc, f, **kwargs)
+    """
+    An overload of msgpack.dump that works with pyGSTi types.
+
+    The object is written to `f` as it is encoded (see :class:`StreamEncoder`),
+    so the encoded form of the entire object is never held in memory.
+    """
+    StreamEncoder(f.write, msgpack_uses_binary_strs, **kwargs).encode(obj)
 
 
 def loads(s, **kwargs):
     """ An overload of msgpack.loads that works with pyGSTi types """
+    kwargs.setdefault('ext_hook', ext_hook)
     decoded_msgpack = _msgpack.unpackb(s, **kwargs)  # load normal MSGPACK
     return decode_obj(decoded_msgpack, msgpack_uses_binary_strs)  # makes pygsti objects
 
 
 def load(f, **kwargs):
     """ An overload of msgpack.load that works with pyGSTi types """
+    kwargs.setdefault('ext_hook', ext_hook)
     decoded_msgpack = _msgpack.unpack(f, **kwargs)  # load normal MSGPACK
     return decode_obj(decoded_msgpack, msgpack_uses_binary_strs)  # makes pygsti objects
+
+
+class StreamEncoder(object):
+    """
+    Encodes objects into msgpack format, writing the output as it's created.
+
+    The output is the msgpack form of what :func:`encode_obj` creates, except
+    that numpy arrays, simple labels and circuits, and homogeneous lists are
+    written as msgpack extension types (see :func:`ext_hook`).  Unlike
+    `msgpack.packb(encode_obj(obj))`, the (large) tree of JSON-compatible
+    objects is never created: containers are written element by element and
+    array data is written directly from the arrays' memory.
+    """
+
+    def __init__(self, write, binary, **packer_kwargs):
+        """
+        Create a new StreamEncoder.
+
+        Parameters
+        ----------
+        write : function
+            A function taking a bytes-like object that writes it to the output,
+            e.g. the `write` method of a file opened in binary mode.
+
+        binary : bool
+            Whether binary-mode strings are used (see :func:`encode_obj`).
+
+        packer_kwargs : dict
+            Additional arguments to `msgpack.Packer`.
+        """
+        self._write = write
+        self._binary = binary
+        self._packer = _msgpack.Packer(autoreset=False, **packer_kwargs)
+        self._ext_encoders = _get_ext_encoders()
+
+    def encode(self, obj):
+        """
+        Encode `obj` and write it to the output.
+
+        Parameters
+        ----------
+        obj : object
+            The object to encode.
+
+        Returns
+        -------
+        None
+        """
+        self._encode(obj)
+        self._flush()
+
+    def _flush(self):
+        self._write(self._packer.bytes())
+        self._packer.reset()
+
+    def _pack(self, obj):
+        self._packer.pack(obj)
+        if len(self._packer.getbuffer()) >= _BUFFER_SIZE: self._flush()
+
+    def _pack_ext(self, code, *chunks):
+        """ Write an extension type whose data is the concatenation of the bytes-like `chunks` (without copying) """
+        self._flush()
+        self._write(_struct.pack(">BIb", 0xc9, sum([len(chunk) for chunk in chunks]), code))  # msgpack "ext 32"
+        for chunk in chunks:
+            self._write(chunk)
+
+    def _encode(self, py_obj):
+        """ Write what :func:`encode_obj` would create """
+        typ = type(py_obj)
+        if typ in self._ext_encoders:
+            data = self._ext_encoders[typ](py_obj)
+            if data is not None:
+                self._pack_ext(*data)
+                return
+
+        if isinstance(py_obj, type) or not typ.__module__.startswith('pygsti'):
+            self._encode_std(py_obj)  # includes pyGSTi classes, which aren't recursive
+            return
+
+        # Pygsti object encoding (see `encode_obj`)
+        state = _jsoncodec.get_pygsti_state(py_obj)
+        encode_std_base = bool('__init_args__' not in state) and _has_std_encoding(py_obj, self._binary)
+        self._packer.pack_map_header(len(state) + (2 if encode_std_base else 1))
+        for k, v in state.items():
+            self._pack(k)
+            self._encode(v)
+        self._pack('__pygstiobj__')
+        self._pack((typ.__module__, typ.__name__))
+        if encode_std_base:
+            self._pack('__std_base__')
+            self._encode_std(py_obj, allow_ext=False)  # `decode_std_base` needs the standard encoding
+
+    def _encode_std(self, py_obj, allow_ext=True):
+        """ Write what :func:`encode_std_obj` would create """
+        if isinstance(py_obj, (tuple, list, set)):
+            if allow_ext and type(py_obj) is list:
+                data = _encode_packed_list(py_obj)
+                if data is not None:
+                    self._pack_ext(*data)
+                    return
+            self._packer.pack_map_header(1)
+            self._pack('__tuple__' if isinstance(py_obj, tuple) else
+                       ('__list__' if isinstance(py_obj, list) else '__set__'))
+            self._packer.pack_array_header(len(py_obj))
+            for v in py_obj:
+                self._encode(v)
+        elif isinstance(py_obj, dict):  # includes OrderedDicts & Counters
+            if isinstance(py_obj, _collections.OrderedDict): key = '__odict__'
+            elif isinstance(py_obj, _collections.Counter): key = '__counter__'; py_obj = dict(py_obj)
+            else: key = '__ndict__'
+            self._packer.pack_map_header(1)
+            self._pack(key)
+            self._packer.pack_array_header(len(py_obj))
+            for k, v in py_obj.items():
+                self._packer.pack_array_header(2)
+                self._encode(k)
+                self._encode(v)
+        elif isinstance(py_obj, slice):
+            self._packer.pack_map_header(1)
+            self._pack('__slice__')
+            self._packer.pack_array_header(3)
+            for v in (py_obj.start, py_obj.stop, py_obj.step):
+                self._encode(v)
+        elif type(py_obj).__module__ == 'plotly.graph_objs._figure' and type(py_obj).__name__ == "Figure" \
+                and hasattr(py_obj, 'to_dict'):
+            self._packer.pack_map_header(1)
+            self._pack('__plotlyfig__')
+            self._encode_std(py_obj.to_dict())
+        else:
+            self._pack(encode_obj(py_obj, self._binary))  # not a container
+
+
+def _has_std_encoding(py_obj, binary):
+    """ Whether :func:`encode_std_obj` encodes `py_obj` as something other than itself """
+    return isinstance(py_obj, (tuple, list, set, slice, range, dict, _uuid.UUID, complex, _np.ndarray,
+                               _np.bool_, _np.number, _types.FunctionType)) \
+        or (not binary and isinstance(py_obj, bytes)) or (binary and isinstance(py_obj, str))
+
+
+def _packb(obj):
+    return _msgpack.packb(obj, use_bin_type=True)
+
+
+def _unpackb(data):
+    return _msgpack.unpackb(data, raw=False, use_list=True)
+
+
+def _encode_ndarray(a):
+    if a.dtype.kind in ('V', 'O'): return None  # structured & object arrays are encoded as by `encode_obj`
+    header = _packb([a.dtype.str, list(a.shape)])
+    data = _np.ascontiguousarray(a).reshape(-1).view(_np.uint8)
+    return EXT_NDARRAY, _packb(len(header)), header, memoryview(data)
+
+
+def _decode_ndarray(data):
+    unpacker = _msgpack.Unpacker(raw=False)
+    unpacker.feed(data[0:9])  # the header's length (as a msgpack int) is at most 9 bytes
+    header_len = unpacker.unpack(); start = unpacker.tell()
+    dtype, shape = _unpackb(data[start:start + header_len])
+    # copy so that, as before, decoded arrays are writeable and don't hold onto `data`
+    return _np.frombuffer(data, _np.dtype(dtype), offset=start + header_len).reshape(shape).copy()
+
+
+def _label_to_native(lbl):
+    """ A (msgpack-able) list describing the simple label `lbl`, or None if `lbl` isn't simple """
+    typ = type(lbl)
+    if type(lbl.time) is not float:
+        return None
+    if typ is _objs.label.LabelStr:
+        return [0, lbl[:], lbl.time]
+    if typ is _objs.label.LabelTup:
+        if not all([type(x) in (str, int) for x in lbl]): return None
+        return [1, list(lbl), lbl.time]
+    if typ is _objs.label.LabelTupTup:
+        components = [_label_to_native(c) for c in lbl]
+        if None in components: return None
+        return [2, components, lbl.time]
+    return None
+
+
+def _label_from_native(native):
+    kind, value, time = native
+    if kind == 0: return _objs.label.LabelStr(value, time)
+    if kind == 1: return _objs.label.LabelTup(tuple(value), time)
+    return _objs.label.LabelTupTup(tuple([_label_from_native(c) for c in value]), time)
+
+
+def _encode_label(lbl):
+    native = _label_to_native(lbl)
+    return None if (native is None) else (EXT_LABEL, _packb(native))
+
+
+def _is_simple_circuit(c):
+    """ Whether `c` is a static Circuit with no state other than its labels, line labels & string """
+    return type(c) is _objs.Circuit and c._static and c._name == '' and c._times is None and not c._auxinfo \
+        and c._alignmarks == () and all([type(x) in (str, int) for x in c._line_labels])
+
+
+def _encode_circuit(c):
+    if not _is_simple_circuit(c): return None
+    layers = [_label_to_native(lbl) for lbl in c._labels]
+    if None in layers: return None
+    return EXT_CIRCUIT, _packb([layers, list(c._line_labels), c._str])
+
+
+def _decode_circuit(data):
+    layers, line_labels, s = _unpackb(data)
+    return _objs.Circuit(tuple(map(_label_from_native, layers)), tuple(line_labels), None, False, s,
+                         check=False, expand_subcircuits=False)
+
+
+def _encode_circuit_list(circuits):
+    if not all([_is_simple_circuit(c) for c in circuits]): return None
+    labelIndex = {}; labels = []  # vocabulary, keyed by id since labels are interned but equality ignores time
+    lineIndex = {}; line_label_tuples = []
+    codes = []; lengths = []; line_codes = []
+    for c in circuits:
+        for lbl in c._labels:
+            code = labelIndex.get(id(lbl), None)
+            if code is None:
+                code = labelIndex[id(lbl)] = len(labels); labels.append(lbl)
+            codes.append(code)
+        lengths.append(len(c._labels))
+        code = lineIndex.get(c._line_labels, None)
+        if code is None:
+            code = lineIndex[c._line_labels] = len(line_label_tuples); line_label_tuples.append(c._line_labels)
+        line_codes.append(code)
+
+    native_labels = [_label_to_native(lbl) for lbl in labels]
+    if None in native_labels: return None
+    offsets = _np.concatenate(([0], _np.cumsum(lengths, dtype=_np.int64)))
+    return EXT_CIRCUIT_LIST, _packb([native_labels, _np.array(codes, _np.int32).tobytes(), offsets.tobytes(),
+                                     [list(ll) for ll in line_label_tuples],
+                                     _np.array(line_codes, _np.int32).tobytes(), [c._str for c in circuits]])
+
+
+def _decode_circuit_list(data):
+    native_labels, codes, offsets, line_label_tuples, line_codes, strs = _unpackb(data)
+    circuits = _objs.CircuitArray.from_arrays([_label_from_native(x) for x in native_labels],
+                                              _np.frombuffer(codes, _np.int32), _np.frombuffer(offsets, _np.int64),
+                                              line_label_tuples, _np.frombuffer(line_codes, _np.int32)).to_circuits()
+    for c, s in zip(circuits, strs):
+        c._str = s
+    return circuits
+
+
+def _encode_packed_list(lst):
+    """ Encode a homogeneous list of numbers, tuples of strings or circuits (returns None for other lists) """
+    if len(lst) == 0: return None
+    typ = type(lst[0])
+    if not all([type(x) is typ for x in lst]): return None
+    if typ is float:
+        return EXT_NUMBER_LIST, b'f', memoryview(_np.array(lst, _np.float64).view(_np.uint8))
+    if typ is int:
+        if not (_INT64_MIN <= min(lst) and max(lst) <= _INT64_MAX): return None
+        return EXT_NUMBER_LIST, b'i', memoryview(_np.array(lst, _np.int64).view(_np.uint8))
+    if typ is tuple:
+        if not all([type(x) is str for tup in lst for x in tup]): return None
+        return EXT_TUPLE_LIST, _packb(lst)
+    if typ is _objs.Circuit:
+        return _encode_circuit_list(lst)
+    return None
+
+
+def _decode_number_list(data):
+    return _np.frombuffer(data, _np.float64 if data[0:1] == b'f' else _np.int64, offset=1).tolist()
+
+
+def _decode_tuple_list(data):
+    return [tuple(x) for x in _unpackb(data)]
+
+
+_ext_encoders = {}  # type => encoding function (created when first needed)
+_ext_decoders = {EXT_NDARRAY: _decode_ndarray, EXT_LABEL: lambda data: _label_from_native(_unpackb(data)),
+                 EXT_CIRCUIT: _decode_circuit, EXT_CIRCUIT_LIST: _decode_circuit_list,
+                 EXT_NUMBER_LIST: _decode_number_list, EXT_TUPLE_LIST: _decode_tuple_list}
+
+
+def _get_ext_encoders():
+    if len(_ext_encoders) == 0:
+        _ext_encoders.update({_np.ndarray: _encode_ndarray, _objs.label.LabelStr: _encode_label,
+                              _objs.label.LabelTup: _encode_label, _objs.label.LabelTupTup: _encode_label,
+                              _objs.Circuit: _encode_circuit})
+    return _ext_encoders
+
+
+def ext_hook(code, data):
+    """
+    Decodes the msgpack extension types written by :func:`dump` and :func:`dumps`.
+
+    This is used as the `ext_hook` argument of `msgpack.unpack`.
+
+    Parameters
+    ----------
+    code : int
+        The extension type code.
+
+    data : bytes
+        The extension type's data.
+
+    Returns
+    -------
+    object
+    """
+    if code in _ext_decoders:
+        return _ext_decoders[code](data)
+    return _msgpack.ExtType(code, data)
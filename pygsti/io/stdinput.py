@@ -16,6 +16,9 @@ import numpy as _np
 import ast as _ast
 import warnings as _warnings
 from scipy.linalg import expm as _expm
+import io as _io
+import uuid as _uuid
+import concurrent.futures as _futures
 from collections import OrderedDict as _OrderedDict
 
 from .. import objects as _objs
@@ -91,6 +94,37 @@ class StdInputParser(object):
         # print "DB: stack = ",self.exprStack
         return circuit_tuple, circuit_labels
 
+    def parse_circuits(self, strings, lookup={}, create_subcircuits=True):
+        """
+        Parse a list of operation sequences (strings in grammar).
+
+        This is faster than calling :method:`parse_circuit` on each string, as
+        parts of the strings (e.g. fiducials, germ powers and layers) that
+        occur many times are only parsed once.
+
+        Parameters
+        ----------
+        strings : list of strings
+            The strings to parse.
+
+        lookup : dict, optional
+            A dictionary with keys == reflbls and values == tuples of operation labels
+            which can be used for substitutions using the S<reflbl> syntax.
+
+        create_subcircuits : bool, optional
+            Whether to create sub-circuit-labels when parsing
+            string representations or to just expand these into non-subcircuit
+            labels.
+
+        Returns
+        -------
+        list
+            A list of `(circuit_tuple, circuit_labels)` tuples, as returned by
+            :method:`parse_circuit`, one per string.
+        """
+        self._circuit_parser.lookup = lookup
+        return self._circuit_parser.parse_circuits(strings, create_subcircuits)
+
     def parse_dataline(self, s, lookup={}, expectedCounts=-1, create_subcircuits=True):
         """
         Parse a data line (dataline in grammar)
@@ -209,19 +243,19 @@ class StdInputParser(object):
         list of Circuits
             The circuits read from the file.
         """
-        circuit_list = []
         with open(filename, 'r') as stringfile:
-            for line in stringfile:
-                line = line.strip()
-                if len(line) == 0 or line[0] == '#': continue
-                layer_lbls, line_lbls = self.parse_circuit(line)
-                if line_lbls is None:
-                    line_lbls = line_labels  # default to the passed-in argument
-                    nlines = num_lines
-                else: nlines = None  # b/c we've got a valid line_lbls
-
-                circuit_list.append(_objs.Circuit(layer_lbls, stringrep=line.strip(),
-                                                  line_labels=line_lbls, num_lines=nlines, check=False))
+            lines = [line.strip() for line in stringfile]
+        lines = [line for line in lines if len(line) > 0 and line[0] != '#']
+
+        circuit_list = []
+        for line, (layer_lbls, line_lbls) in zip(lines, self.parse_circuits(lines)):
+            if line_lbls is None:
+                line_lbls = line_labels  # default to the passed-in argument
+                nlines = num_lines
+            else: nlines = None  # b/c we've got a valid line_lbls
+
+            circuit_list.append(_objs.Circuit(layer_lbls, stringrep=line,
+                                              line_labels=line_lbls, num_lines=nlines, check=False))
         return circuit_list
 
     def parse_dictfile(self, filename):
@@ -250,7 +284,7 @@ class StdInputParser(object):
 
     def parse_datafile(self, filename, showProgress=True,
                        collisionAction="aggregate", recordZeroCnts=True,
-                       ignoreZeroCountLines=True, withTimes="auto"):
+                       ignoreZeroCountLines=True, withTimes="auto", numProcs=1):
         """
         Parse a data set file into a DataSet object.
 
@@ -282,6 +316,13 @@ class StdInputParser(object):
             "auto", then this format is allowed but not required.  Typically
             you only need to set this to False when reading in a template file.
 
+        numProcs : int, optional
+            The number of processes used to parse the file.  When greater than
+            1, the data lines are split into byte-range chunks (on line
+            boundaries) which are parsed in a process pool and then merged into
+            a single static DataSet.  The result is the same as when
+            `numProcs == 1`, which parses the file line-by-line in this process.
+
         Returns
         -------
         DataSet
@@ -320,126 +361,247 @@ class StdInputParser(object):
         finally:
             _os.chdir(orig_cwd)
 
+        if numProcs > 1:
+            return self._parse_datafile_parallel(filename, showProgress, collisionAction, recordZeroCnts,
+                                                 ignoreZeroCountLines, withTimes, numProcs, lookupDict,
+                                                 outcomeLabels, fillInfo, nDataCols,
+                                                 "\n".join(preamble_comments))
+
         #Read data lines of data file
         dataset = _objs.DataSet(outcomeLabels=outcomeLabels, collisionAction=collisionAction,
                                 comment="\n".join(preamble_comments))
         nLines = 0
-        with open(filename, 'r') as datafile:
-            nLines = sum(1 for line in datafile)
+        if showProgress:  # the line count is only needed to display progress
+            with open(filename, 'r') as datafile:
+                nLines = sum(1 for line in datafile)
         nSkip = int(nLines / 100.0)
         if nSkip == 0: nSkip = 1
 
         display_progress = get_display_progress_fn(showProgress)
         warnings = []  # to display *after* display progress
+
+        with open(filename, 'r') as inputfile:
+            def progress_lines():
+                for (iLine, line) in enumerate(inputfile):
+                    if iLine % nSkip == 0 or iLine + 1 == nLines: display_progress(iLine + 1, nLines, filename)
+                    yield line
+
+            for circuit, countDict, seriesItem, aux in self._parse_datafile_lines(
+                    progress_lines(), filename, 0, lookupDict, fillInfo, nDataCols, withTimes,
+                    ignoreZeroCountLines, not _objs.Circuit.default_expand_subcircuits, warnings):
+                if seriesItem is None:
+                    dataset.add_count_dict(circuit, countDict, aux=aux, recordZeroCnts=recordZeroCnts,
+                                           update_ol=False)  # for performance - to this once at the end.
+                else:
+                    dataset.add_raw_series_data(circuit, seriesItem['outcomes'], seriesItem['times'],
+                                                seriesItem.get('repetitions', None), recordZeroCnts=recordZeroCnts,
+                                                aux=aux, update_ol=False)  # for performance - to this once at the end.
+
+        dataset.update_ol()  # because we set update_ol=False above, we need to do this
+        if warnings:
+            _warnings.warn('\n'.join(warnings))  # to be displayed at end, after potential progress updates
+
+        dataset.done_adding_data()
+        return dataset
+
+    def _parse_datafile_lines(self, lines, filename, iLineStart, lookupDict, fillInfo, nDataCols,
+                              withTimes, ignoreZeroCountLines, create_subcircuits, warnings):
+        """
+        Parses the data lines of a data set file (everything after the preamble).
+
+        This is a generator, used by both the serial and parallel versions of
+        :method:`parse_datafile`, which yields a `(circuit, countDict, seriesItem, aux)`
+        tuple for each circuit in `lines`.  For a circuit line containing count data,
+        `countDict` is an :class:`OutcomeLabelDict` and `seriesItem` is None.  For a
+        time-series circuit, `countDict` is None and `seriesItem` is a dictionary
+        with `'outcomes'`, `'times'` and (optionally) `'repetitions'` lists.  `aux`
+        is the parsed comment or auxiliary-data dictionary of the circuit (or None).
+        Lines are numbered, in error messages and in the messages appended to
+        `warnings`, starting from `iLineStart`.
+        """
         looking_for = "circuit_line"; current_item = {}
 
-        def parse_comment(comment, filename, iLine):
-            commentDict = {}
-            comment = comment.strip()
-            if len(comment) == 0: return {}
-            try:
-                if comment.startswith("{") and comment.endswith("}"):
-                    commentDict = _ast.literal_eval(comment)
-                else:  # put brackets around it
-                    commentDict = _ast.literal_eval("{ " + comment + " }")
-                #commentDict = _json.loads("{ " + comment + " }")
-                #Alt: safer(?) & faster, but need quotes around all keys & vals
-            except:
-                commentDict = {}
-                warnings.append("%s Line %d: Could not parse comment '%s'"
-                                % (filename, iLine, comment))
-            return commentDict
+        for (iLine, line) in enumerate(lines, start=iLineStart):
+            line = line.strip()
+            if '#' in line:
+                i = line.index('#')
+                dataline, comment = line[:i], line[i + 1:]
+            else:
+                dataline, comment = line, ""
 
-        with open(filename, 'r') as inputfile:
-            for (iLine, line) in enumerate(inputfile):
-                if iLine % nSkip == 0 or iLine + 1 == nLines: display_progress(iLine + 1, nLines, filename)
+            if looking_for == "circuit_line":
+                if len(dataline) == 0: continue
+                try:
+                    circuitTuple, circuitStr, circuitLbls, valueList = \
+                        self.parse_dataline(dataline, lookupDict, nDataCols, create_subcircuits=create_subcircuits)
 
-                line = line.strip()
-                if '#' in line:
-                    i = line.index('#')
-                    dataline, comment = line[:i], line[i + 1:]
-                else:
-                    dataline, comment = line, ""
+                    commentDict = _parse_comment(comment, filename, iLine, warnings)
 
-                if looking_for == "circuit_line":
-                    if len(dataline) == 0: continue
-                    try:
-                        circuitTuple, circuitStr, circuitLbls, valueList = \
-                            self.parse_dataline(dataline, lookupDict, nDataCols,
-                                                create_subcircuits=not _objs.Circuit.default_expand_subcircuits)
-
-                        commentDict = parse_comment(comment, filename, iLine)
-
-                    except ValueError as e:
-                        raise ValueError("%s Line %d: %s" % (filename, iLine, str(e)))
-
-                    if circuitLbls is None: circuitLbls = "auto"  # if line labels weren't given just use defaults
-                    circuit = _objs.Circuit(circuitTuple, stringrep=circuitStr,
-                                            line_labels=circuitLbls, expand_subcircuits=False, check=False)
-                    #Note: don't expand subcircuits because we've already directed parse_dataline to expand if needed
-
-                    if withTimes is True and len(valueList) > 0:
-                        raise ValueError(("%s Line %d: Circuit line cannot contain count information when "
-                                          "'withTimes=True'") % (filename, iLine))
-
-                    if withTimes is False or len(valueList) > 0:
-                        bBad = ('BAD' in valueList)  # supresses warnings
-                        countDict = _objs.labeldicts.OutcomeLabelDict()
-                        self._fillDataCountDict(countDict, fillInfo, valueList)
-                        if all([(abs(v) < 1e-9) for v in list(countDict.values())]):
-                            if ignoreZeroCountLines is True:
-                                if not bBad:
-                                    s = circuitStr if len(circuitStr) < 40 else circuitStr[0:37] + "..."
-                                    warnings.append("Dataline for circuit '%s' has zero counts and will be ignored" % s)
-                                continue  # skip lines in dataset file with zero counts (no experiments done)
-                            else:
-                                #if not bBad:
-                                #    s = circuitStr if len(circuitStr) < 40 else circuitStr[0:37] + "..."
-                                #    warnings.append("Dataline for circuit '%s' has zero counts." % s)
-                                # don't make a fuss if we don't ignore the lines (needed for
-                                # fill_in_empty_dataset_with_fake_data).
-                                pass
-
-                        dataset.add_count_dict(circuit, countDict, aux=commentDict, recordZeroCnts=recordZeroCnts,
-                                               update_ol=False)  # for performance - to this once at the end.
-                    else:
-                        current_item['circuit'] = circuit
-                        looking_for = "circuit_data"
-
-                elif looking_for == "circuit_data":
-                    if len(line) == 0:
-                        #add current item & look for next one
-                        dataset.add_raw_series_data(current_item['circuit'], current_item['outcomes'],
-                                                    current_item['times'], current_item.get('repetitions', None),
-                                                    recordZeroCnts=recordZeroCnts, aux=current_item.get('aux', None),
-                                                    update_ol=False)  # for performance - to this once at the end.
-                        current_item.clear()
-                        looking_for = "circuit_line"
-                    else:
-                        parts = dataline.split()
-                        if parts[0] == 'times:':
-                            current_item['times'] = [float(x) for x in parts[1:]]
-                        elif parts[0] == 'outcomes:':
-                            current_item['outcomes'] = parts[1:]  # no conversion needed
-                        elif parts[0] == 'repetitions:':
-                            current_item['repetitions'] = [int(x) for x in parts[1:]]
-                        elif parts[0] == 'aux:':
-                            current_item['aux'] = parse_comment(" ".join(parts[1:]), filename, iLine)
+                except ValueError as e:
+                    raise ValueError("%s Line %d: %s" % (filename, iLine, str(e)))
+
+                if circuitLbls is None: circuitLbls = "auto"  # if line labels weren't given just use defaults
+                circuit = _objs.Circuit(circuitTuple, stringrep=circuitStr,
+                                        line_labels=circuitLbls, expand_subcircuits=False, check=False)
+                #Note: don't expand subcircuits because we've already directed parse_dataline to expand if needed
+
+                if withTimes is True and len(valueList) > 0:
+                    raise ValueError(("%s Line %d: Circuit line cannot contain count information when "
+                                      "'withTimes=True'") % (filename, iLine))
+
+                if withTimes is False or len(valueList) > 0:
+                    bBad = ('BAD' in valueList)  # supresses warnings
+                    countDict = _objs.labeldicts.OutcomeLabelDict()
+                    self._fillDataCountDict(countDict, fillInfo, valueList)
+                    if all([(abs(v) < 1e-9) for v in list(countDict.values())]):
+                        if ignoreZeroCountLines is True:
+                            if not bBad:
+                                s = circuitStr if len(circuitStr) < 40 else circuitStr[0:37] + "..."
+                                warnings.append("Dataline for circuit '%s' has zero counts and will be ignored" % s)
+                            continue  # skip lines in dataset file with zero counts (no experiments done)
                         else:
-                            raise ValueError("Invalid circuit data-line prefix: '%s'" % parts[0])
+                            #if not bBad:
+                            #    s = circuitStr if len(circuitStr) < 40 else circuitStr[0:37] + "..."
+                            #    warnings.append("Dataline for circuit '%s' has zero counts." % s)
+                            # don't make a fuss if we don't ignore the lines (needed for
+                            # fill_in_empty_dataset_with_fake_data).
+                            pass
+
+                    yield circuit, countDict, None, commentDict
+                else:
+                    current_item['circuit'] = circuit
+                    looking_for = "circuit_data"
+
+            elif looking_for == "circuit_data":
+                if len(line) == 0:
+                    #yield current item & look for next one
+                    yield current_item.pop('circuit'), None, current_item, current_item.get('aux', None)
+                    current_item = {}
+                    looking_for = "circuit_line"
+                else:
+                    parts = dataline.split()
+                    if parts[0] == 'times:':
+                        current_item['times'] = [float(x) for x in parts[1:]]
+                    elif parts[0] == 'outcomes:':
+                        current_item['outcomes'] = parts[1:]  # no conversion needed
+                    elif parts[0] == 'repetitions:':
+                        current_item['repetitions'] = [int(x) for x in parts[1:]]
+                    elif parts[0] == 'aux:':
+                        current_item['aux'] = _parse_comment(" ".join(parts[1:]), filename, iLine, warnings)
+                    else:
+                        raise ValueError("Invalid circuit data-line prefix: '%s'" % parts[0])
 
         if looking_for == "circuit_data" and current_item:
-            #add final circuit info (no blank line at end of file)
-            dataset.add_raw_series_data(current_item['circuit'], current_item['outcomes'],
-                                        current_item['times'], current_item.get('repetitions', None),
-                                        recordZeroCnts=recordZeroCnts, aux=current_item.get('aux', None),
-                                        update_ol=False)  # for performance - to this once at the end.
+            #yield final circuit info (no blank line at end of file)
+            yield current_item.pop('circuit'), None, current_item, current_item.get('aux', None)
+
+    def _parse_datafile_parallel(self, filename, showProgress, collisionAction, recordZeroCnts,
+                                 ignoreZeroCountLines, withTimes, numProcs, lookupDict,
+                                 outcomeLabels, fillInfo, nDataCols, comment):
+        """
+        Parses the data lines of `filename` in `numProcs` processes (see :method:`parse_datafile`).
+
+        The file is split into byte-range chunks, each of which is parsed by
+        :function:`_parse_datafile_chunk` into columnar arrays.  These partial
+        results are then merged, in file order, into a static DataSet using the
+        same collision semantics as :method:`DataSet.add_count_dict` and
+        :method:`DataSet.add_raw_series_data`.
+        """
+        offsets, lineNumbers = _datafile_chunk_offsets(filename, 4 * numProcs)  # extra chunks balance the load
+        create_subcircuits = not _objs.Circuit.default_expand_subcircuits
+        chunk_args = [(filename, offsets[i], offsets[i + 1], lineNumbers[i], lookupDict, fillInfo, nDataCols,
+                       withTimes, recordZeroCnts, ignoreZeroCountLines, create_subcircuits)
+                      for i in range(len(offsets) - 1)]
+
+        display_progress = get_display_progress_fn(showProgress)
+        partials = []
+        with _futures.ProcessPoolExecutor(max_workers=numProcs) as executor:
+            for i, partial in enumerate(executor.map(_parse_datafile_chunk, chunk_args)):
+                display_progress(i + 1, len(chunk_args), filename)
+                partials.append(partial)
+
+        warnings = []  # to display *after* display progress
+        for partial in partials:
+            for msg in partial['pyWarnings']: _warnings.warn(msg)  # warnings issued within the worker processes
+            warnings.extend(partial['warnings'])
+
+        #Merge: global outcome label indices are assigned in order of first appearance, as when adding
+        # data serially, starting from any labels given by the 'Columns' directive.
+        olIndex = _OrderedDict()
+        for ol in (outcomeLabels if outcomeLabels is not None else []):
+            olIndex[_objs.labeldicts.OutcomeLabelDict.to_outcome(ol)] = len(olIndex)
+
+        rows = _OrderedDict()  # circuit -> list of (global) record indices whose data make up the row
+        rowLens = {}; rowMaxTimes = {}  # needed for 'aggregate' time stamps
+        recTimes = []  # the time stamp of each count record (nan for series records, which have their own)
+        auxInfo = _OrderedDict()
+        oli_parts = []; time_parts = []; rep_parts = []; start_parts = []
+        bHaveReps = any([partial['hasReps'] for partial in partials])
+        iElOffset = 0; iRec = 0
+
+        for partial in partials:
+            remap = _np.array([olIndex.setdefault(ol, len(olIndex)) for ol in partial['outcomeLabels']], 'i')
+            oli_parts.append(remap[partial['oli']] if len(remap) > 0 else partial['oli'])
+            time_parts.append(partial['time'])
+            rep_parts.append(partial['reps'])
+            start_parts.append(partial['offsets'][:-1] + iElOffset)
+            recLens = _np.diff(partial['offsets'])
+            records = zip(partial['circuits'], partial['isSeries'], partial['maxTimes'], partial['aux'], recLens)
+
+            for circuit, isSeries, maxTime, aux, recLen in records:
+                if collisionAction == "keepseparate" and circuit in rows:
+                    i = 0; tagged_circuit = circuit
+                    while tagged_circuit in rows:
+                        i += 1; tagged_circuit = circuit + _objs.Circuit(("#%d" % i,), line_labels=circuit.line_labels)
+                    circuit = tagged_circuit
+
+                if not isSeries and collisionAction == "aggregate" and circuit in rows:
+                    t = int(rowMaxTimes[circuit]) + 1 if rowLens[circuit] > 0 else 0
+                    rows[circuit].append(iRec)
+                    rowLens[circuit] += recLen
+                    if recLen > 0: rowMaxTimes[circuit] = t
+                else:  # new circuit or overwrite existing data
+                    t = _np.nan if isSeries else 0
+                    rows[circuit] = [iRec]
+                    rowLens[circuit] = recLen
+                    rowMaxTimes[circuit] = maxTime if isSeries else 0
+                recTimes.append(t)
+                if aux is not None: auxInfo[circuit] = aux
+                iRec += 1
+            iElOffset += len(partial['oli'])
+
+        #Gather the elements of each row's records (in row order) into the static arrays
+        all_oli = _np.concatenate(oli_parts) if oli_parts else _np.empty(0, 'i')
+        all_time = _np.concatenate(time_parts) if time_parts else _np.empty(0, 'd')
+        all_reps = _np.concatenate(rep_parts) if rep_parts else _np.empty(0, 'd')
+        recStarts = _np.concatenate(start_parts) if start_parts else _np.empty(0, _np.int64)
+        recLens = _np.concatenate([_np.diff(partial['offsets']) for partial in partials]) \
+            if partials else _np.empty(0, _np.int64)
+        recTimes = _np.array(recTimes, 'd')
+
+        order = _np.array([i for recs in rows.values() for i in recs], _np.int64)
+        orderedLens = recLens[order]
+        nEls = int(orderedLens.sum())
+        recOutStarts = _np.cumsum(orderedLens) - orderedLens
+        indices = _np.arange(nEls, dtype=_np.int64) + _np.repeat(recStarts[order] - recOutStarts, orderedLens)
+        elTimes = _np.repeat(recTimes[order], orderedLens)
+        bSeriesEl = _np.isnan(elTimes)
+        elTimes[bSeriesEl] = all_time[indices[bSeriesEl]]
+
+        cirIndex = _OrderedDict(); curIndx = 0
+        for circuit in rows:
+            cirIndex[circuit] = slice(curIndx, curIndx + int(rowLens[circuit]))
+            curIndx += int(rowLens[circuit])
 
-        dataset.update_ol()  # because we set update_ol=False above, we need to do this
         if warnings:
             _warnings.warn('\n'.join(warnings))  # to be displayed at end, after potential progress updates
 
-        dataset.done_adding_data()
+        dataset = _objs.DataSet(all_oli[indices].astype(_objs.dataset.Oindex_type),
+                                elTimes.astype(_objs.dataset.Time_type),
+                                all_reps[indices].astype(_objs.dataset.Repcount_type) if bHaveReps else None,
+                                circuitIndices=cirIndex, outcomeLabelIndices=olIndex, bStatic=True,
+                                collisionAction=collisionAction, comment=comment, auxInfo=auxInfo)
+        dataset.uuid = _uuid.uuid4()  # as set by DataSet.done_adding_data
         return dataset
 
     def _extractLabelsFromColLabels(self, colLabels):
@@ -831,6 +993,134 @@ class StdInputParser(object):
         return dataset
 
 
+def _parse_comment(comment, filename, iLine, warnings):
+    """
+    Parse the (dictionary-like) comment of a data set file line, appending a
+    message to `warnings` if it cannot be parsed.
+    """
+    commentDict = {}
+    comment = comment.strip()
+    if len(comment) == 0: return {}
+    try:
+        if comment.startswith("{") and comment.endswith("}"):
+            commentDict = _ast.literal_eval(comment)
+        else:  # put brackets around it
+            commentDict = _ast.literal_eval("{ " + comment + " }")
+        #commentDict = _json.loads("{ " + comment + " }")
+        #Alt: safer(?) & faster, but need quotes around all keys & vals
+    except:
+        commentDict = {}
+        warnings.append("%s Line %d: Could not parse comment '%s'"
+                        % (filename, iLine, comment))
+    return commentDict
+
+
+_SERIES_DATALINE_PREFIXES = (b'times:', b'outcomes:', b'repetitions:', b'aux:')
+
+
+def _datafile_chunk_offsets(filename, nChunks):
+    """
+    Split a data set file into (at most) `nChunks` byte ranges of roughly equal
+    size that begin on line boundaries.  A chunk never begins within the
+    data lines (times, outcomes, etc.) that follow a time-series circuit line.
+
+    Returns
+    -------
+    offsets : list
+        The byte offsets of the chunk boundaries, beginning with 0 and ending
+        with the file size.
+    lineNumbers : list
+        The (0-based) line number at which each chunk begins.
+    """
+    fileSize = _os.path.getsize(filename)
+    offsets = [0]
+    with open(filename, 'rb') as f:
+        for i in range(1, nChunks):
+            target = i * fileSize // nChunks
+            if target <= offsets[-1]: continue
+            f.seek(target - 1)
+            f.readline()  # move to the beginning of the next line
+            while True:  # keep time-series data lines with their circuit
+                pos = f.tell(); parts = f.readline().split(None, 1)
+                if len(parts) == 0 or parts[0] not in _SERIES_DATALINE_PREFIXES: break
+            if pos >= fileSize: break
+            if pos > offsets[-1]: offsets.append(pos)
+        offsets.append(fileSize)
+
+        lineNumbers = [0]; f.seek(0)
+        for start, end in zip(offsets[:-2], offsets[1:-1]):
+            nLines = 0; nRemaining = end - start
+            while nRemaining > 0:
+                block = f.read(min(nRemaining, 2**24))
+                nLines += block.count(b'\n'); nRemaining -= len(block)
+            lineNumbers.append(lineNumbers[-1] + nLines)
+    return offsets, lineNumbers
+
+
+def _parse_datafile_chunk(args):
+    """
+    Parse the lines of a data set file between two byte offsets into columnar
+    arrays.  This is the process-pool worker used by
+    :method:`StdInputParser.parse_datafile` when `numProcs > 1`.
+
+    Returns
+    -------
+    dict
+        A dictionary with one entry per parsed circuit in each of its
+        `'circuits'`, `'isSeries'`, `'maxTimes'` and `'aux'` lists, and the
+        concatenated (outcome-index, time, repetition) data of these circuits in
+        its `'oli'`, `'time'` and `'reps'` arrays, delimited by `'offsets'`.
+        Outcome indices refer to the `'outcomeLabels'` list, which is ordered by
+        first appearance.
+    """
+    (filename, start, end, iLineStart, lookupDict, fillInfo, nDataCols, withTimes,
+     recordZeroCnts, ignoreZeroCountLines, create_subcircuits) = args
+    parser = StdInputParser()
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    olIndex = _OrderedDict()
+    circuits = []; isSeries = []; maxTimes = []; auxs = []
+    oli = []; times = []; reps = []; offsets = [0]
+    warnings = []
+    hasReps = False
+
+    def add_record(circuit, outcomeLabels, timeStamps, repCounts, aux, bSeries):
+        nonlocal hasReps
+        olis = [olIndex.setdefault(ol, len(olIndex)) for ol in outcomeLabels]  # register even zero-count labels
+        if repCounts is None:
+            repCounts = [1] * len(olis)
+        else:
+            hasReps = True
+            if not recordZeroCnts:
+                keep = [i for i, r in enumerate(repCounts) if r != 0]
+                olis = [olis[i] for i in keep]; timeStamps = [timeStamps[i] for i in keep]
+                repCounts = [repCounts[i] for i in keep]
+        assert(len(olis) == len(timeStamps)), "Outcome-label and time stamp lists must have the same length!"
+        circuits.append(circuit); isSeries.append(bSeries); auxs.append(aux)
+        maxTimes.append(max(timeStamps) if len(timeStamps) > 0 else _np.nan)
+        oli.extend(olis); times.extend(timeStamps); reps.extend(repCounts)
+        offsets.append(len(oli))
+
+    with _warnings.catch_warnings(record=True) as caught:
+        _warnings.simplefilter("always")
+        for circuit, countDict, seriesItem, aux in parser._parse_datafile_lines(
+                _io.TextIOWrapper(_io.BytesIO(data)), filename, iLineStart, lookupDict, fillInfo, nDataCols,
+                withTimes, ignoreZeroCountLines, create_subcircuits, warnings):
+            if seriesItem is None:
+                add_record(circuit, list(countDict.keys()), [0] * len(countDict), list(countDict.values()), aux, False)
+            else:
+                add_record(circuit, [_objs.labeldicts.OutcomeLabelDict.to_outcome(ol) for ol in seriesItem['outcomes']],
+                           seriesItem['times'], seriesItem.get('repetitions', None), aux, True)
+
+    return {'circuits': circuits, 'isSeries': isSeries, 'maxTimes': maxTimes, 'aux': auxs,
+            'outcomeLabels': list(olIndex.keys()), 'oli': _np.array(oli, _np.int64),
+            'time': _np.array(times, 'd'), 'reps': _np.array(reps, 'd'),
+            'offsets': _np.array(offsets, _np.int64), 'hasReps': hasReps,
+            'warnings': warnings, 'pyWarnings': [str(w.message) for w in caught]}
+
+
 def _evalElement(el, bComplex):
     myLocal = {'pi': _np.pi, 'sqrt': _np.sqrt}
     exec("element = %s" % el, {"__builtins__": None}, myLocal)
@@ -8,6 +8,8 @@
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import re as _re
+import json as _json
 import warnings as _warnings
 import numpy as _np
 import pathlib as _pathlib
@@ -69,7 +71,7 @@ def _outcome_to_str(x):
 
 
 def write_dataset(filename, dataset, circuit_list=None,
-                  outcomeLabelOrder=None, fixedColumnMode=True, withTimes="auto"):
+                  outcomeLabelOrder=None, fixedColumnMode="auto", withTimes="auto"):
     """
     Write a text-formatted dataset file.
 
@@ -89,12 +91,14 @@ def write_dataset(filename, dataset, circuit_list=None,
         A list of the outcome labels in dataset which specifies
         the column order in the output file.
 
-    fixedColumnMode : bool, optional
+    fixedColumnMode : bool or "auto", optional
         When `True`, a file is written with column headers indicating which
         outcome each column of counts corresponds to.  If a row doesn't have
         any counts for an outcome, `'--'` is used in its place.  When `False`,
         each row's counts are written in an expanded form that includes the
         outcome labels (each "count" has the format <outcomeLabel>:<count>).
+        `"auto"` uses the expanded form for sparse DataSets (so that only the
+        observed outcomes of each row are written) and columns otherwise.
 
     withTimes : bool or "auto", optional
         Whether to include (save) time-stamp information in output.  This
@@ -118,6 +122,10 @@ def write_dataset(filename, dataset, circuit_list=None,
         assert(all([ol in outcomeLabels for ol in outcomeLabelOrder]))
         assert(all([ol in outcomeLabelOrder for ol in outcomeLabels]))
         outcomeLabels = outcomeLabelOrder
+    outcomePositions = {ol: i for i, ol in enumerate(outcomeLabels)}
+
+    if fixedColumnMode == "auto":
+        fixedColumnMode = not getattr(dataset, 'sparse', False)
 
     headerString = ""
     if hasattr(dataset, 'comment') and dataset.comment is not None:
@@ -152,10 +160,10 @@ def write_dataset(filename, dataset, circuit_list=None,
                 if dataRow.aux: output.write(" # %s" % str(repr(dataRow.aux)))  # write aux info
                 output.write('\n')  # finish the line
 
-            elif trivial_times:  # use expanded label:count format
+            elif trivial_times:  # use expanded label:count format (only a row's present outcomes)
                 output.write(circuit_to_write.str + "  "
                              + "  ".join([("%s:%g" % (_outcome_to_str(ol), counts[ol]))
-                                          for ol in outcomeLabels if ol in counts]))
+                                          for ol in sorted(counts.keys(), key=outcomePositions.__getitem__)]))
                 if dataRow.aux: output.write(" # %s" % str(repr(dataRow.aux)))  # write aux info
                 output.write('\n')  # finish the line
 
@@ -266,6 +274,85 @@ def write_circuit_list(filename, circuit_list, header=None):
             output.write(circuit.str + '\n')
 
 
+BINARY_CIRCUIT_LIST_VERSION = 1
+_circuit_group_regex = _re.compile(r"\(([^()]+)\)\^(\d+)")  # a parenthesized & exponentiated sub-circuit
+
+
+def _split_layers_string(s):
+    """
+    Split the layers-part of a circuit string into a list of `(segment, power)`
+    pairs, where `power` is 0 for a "plain" segment (a sequence of layers) and
+    otherwise the exponent of the parenthesized segment "(segment)^power".
+    The entire string is a single plain segment if it can't be split safely.
+    """
+    if 'rho' in s or 'M' in s: return [(s, 0)]  # preps & POVMs are parsed specially at the ends of strings
+
+    parts = []; last = 0
+    for match in _circuit_group_regex.finditer(s):
+        if match.start() > last: parts.append((s[last:match.start()], 0))
+        power = int(match.group(2))
+        if power == 0: return [(s, 0)]  # (power 0 is reserved for plain segments)
+        parts.append((match.group(1), power))
+        last = match.end()
+    if last < len(s): parts.append((s[last:], 0))
+
+    if any([(power == 0 and ('(' in seg or ')' in seg or seg.startswith('^')))
+            or seg.count('[') != seg.count(']') or seg.count('{') != seg.count('}') for seg, power in parts]):
+        return [(s, 0)]  # nested parenthesis, sub-circuits within layers, etc.
+    return parts
+
+
+def write_binary_circuit_list(filename, circuit_list):
+    """
+    Write a circuit list to a compact binary file.
+
+    Each circuit is stored as a short sequence of references into a
+    dictionary of the distinct sub-circuits (e.g. fiducials and germs) that
+    appear in the circuits' string representations, each with an exponent
+    (e.g. a germ power).  Since GST and RB circuit lists are built from
+    comparatively few such parts, such a file is much smaller than the text
+    file written by :function:`write_circuit_list` and much faster to read.
+    The file is read by :function:`load_circuit_list` (which detects the
+    format automatically), and the loaded circuits are identical to those
+    loaded from a text file (including their string representations).
+
+    Parameters
+    ----------
+    filename : string
+        The filename to write.  This is a (compressed) numpy .npz file.
+
+    circuit_list : list of Circuits
+        The list of circuits to write.
+
+    Returns
+    -------
+    None
+    """
+    if len(circuit_list) > 0 and not isinstance(circuit_list[0], _objs.Circuit):
+        raise ValueError("Argument circuit_list must be a list of Circuit objects!")
+
+    segments = {}  # segment string => index
+    lines = {}  # (line labels, '@'-part of circuit string) => index
+    segment_ids = []; powers = []; entry_counts = []; line_codes = []
+    for circuit in circuit_list:
+        layers_str, at, lines_str = circuit.str.partition('@')
+        parts = _split_layers_string(layers_str)
+        for seg, power in parts:
+            segment_ids.append(segments.setdefault(seg, len(segments)))
+            powers.append(power)
+        entry_counts.append(len(parts))
+        line_codes.append(lines.setdefault((circuit.line_labels, at + lines_str), len(lines)))
+
+    with open(str(filename), 'wb') as f:  # (an open file so numpy doesn't append '.npz' to `filename`)
+        _np.savez_compressed(f, version=_np.array(BINARY_CIRCUIT_LIST_VERSION),
+                             segments=_np.array('\n'.join(segments.keys())),
+                             segment_ids=_np.array(segment_ids, _np.int32),
+                             powers=_np.array(powers, _np.int32),
+                             entry_counts=_np.array(entry_counts, _np.int32),
+                             line_labels=_np.array(_json.dumps([[list(ll), s] for ll, s in lines.keys()])),
+                             line_codes=_np.array(line_codes, _np.int32))
+
+
 def write_model(mdl, filename, title=None):
     """
     Write a text-formatted model file.
@@ -14,6 +14,7 @@
 #Import Objects at package level
 from .confidenceregionfactory import ConfidenceRegionFactory
 from .dataset import DataSet
+from .datasetbuilder import DataSetBuilder
 from .evaltree import EvalTree
 from .matrixevaltree import MatrixEvalTree
 from .mapevaltree import MapEvalTree
@@ -75,6 +76,7 @@ from .circuitstructure import CircuitStructure
 from .circuitstructure import LsGermsStructure
 from .circuitstructure import LsGermsSerialStructure
 from .circuit import Circuit
+from .circuitarray import CircuitArray
 from .multidataset import MultiDataSet
 from .datacomparator import DataComparator
 from .compilationlibrary import CompilationLibrary
@@ -128,6 +128,9 @@ def _accumulate_explicit_sslbls(obj):
             if obj.sslbls is not None:  # don't know how to interpet None sslbls
                 return set(obj.sslbls)
     else:  # things that aren't labels we assume are iterable
+        if isinstance(obj, tuple):  # e.g. circuit layers, which often repeat the same few labels
+            try: obj = set(obj)
+            except TypeError: pass  # unhashable (e.g. list) elements
         for lbl in obj:
             ret.update(_accumulate_explicit_sslbls(lbl))
     return ret
@@ -167,9 +170,37 @@ class Circuit(object):
     created with 'editable=True', a rich set of operations may be used to
     construct the circuit in place, after which `done_editing()` should be
     called so that the Circuit can be properly hashed as needed.
+
+    Because a typical analysis holds very many (static) circuits, Circuit
+    objects use `__slots__` rather than a per-instance dictionary, the hash of
+    a static circuit is computed once and cached and `auxinfo` is only
+    allocated when it is first used.  (Layer labels, like all :class:`Label`
+    objects, are interned, so equal labels are shared between circuits.)
     """
+    __slots__ = ('_labels', '_line_labels', '_static', '_name', '_str', '_times', '_auxinfo',
+                 '_alignmarks', '_hash')
+
     default_expand_subcircuits = True
 
+    @classmethod
+    def _fastinit(cls, labels, line_labels, stringrep=None, name=''):
+        """
+        Create a static circuit from a tuple of :class:`Label` objects and a
+        tuple of line labels, without any of the checks or conversions that
+        `__init__` performs (so only use this when these are known to be valid).
+        """
+        ret = cls.__new__(cls)
+        ret._labels = labels
+        ret._line_labels = line_labels
+        ret._static = True
+        ret._name = name
+        ret._str = stringrep
+        ret._times = None
+        ret._auxinfo = None
+        ret._alignmarks = ()
+        ret._hash = None
+        return ret
+
     @classmethod
     def fromtup(cls, tup):
         if '@' in tup:
@@ -357,8 +388,9 @@ class Circuit(object):
         self._name = name  # can be None
         self._str = stringrep if self._static else None  # can be None (lazy generation)
         self._times = None  # for FUTURE expansion
-        self.auxinfo = {}  # for FUTURE expansion / user metadata
+        self._auxinfo = None  # for FUTURE expansion / user metadata (allocated when first accessed)
         self._alignmarks = ()  # layer indices *before* which there is an alignment mark
+        self._hash = None  # cached hash of a static circuit (computed when first needed)
 
         # # Special case: layer_labels can be a single CircuitLabel or Circuit
         # # (Note: a Circuit would work just fine, as a list of layers, but this performs some extra checks)
@@ -395,6 +427,34 @@ class Circuit(object):
         eff_line_labels = None if self._line_labels == ('*',) else self._line_labels  # special case
         return _CircuitLabel(self._name, self._labels, eff_line_labels, nreps)
 
+    def __getstate__(self):
+        return {'_labels': self._labels, '_line_labels': self._line_labels, '_static': self._static,
+                '_name': self._name, '_str': self._str, '_times': self._times,
+                'auxinfo': self._auxinfo if (self._auxinfo is not None) else {},
+                '_alignmarks': self._alignmarks}
+
+    def __setstate__(self, state_dict):
+        self._labels = state_dict['_labels']
+        self._line_labels = state_dict['_line_labels']
+        self._static = state_dict['_static']
+        self._name = state_dict.get('_name', '')
+        self._str = state_dict.get('_str', None)
+        self._times = state_dict.get('_times', None)
+        self._auxinfo = state_dict.get('auxinfo', None) or None
+        self._alignmarks = state_dict.get('_alignmarks', ())
+        self._hash = None
+
+    @property
+    def auxinfo(self):
+        """ A dictionary of auxiliary user meta-data (created when first accessed). """
+        if self._auxinfo is None:
+            self._auxinfo = {}
+        return self._auxinfo
+
+    @auxinfo.setter
+    def auxinfo(self, value):
+        self._auxinfo = value
+
     @property
     def line_labels(self):
         return self._line_labels
@@ -413,6 +473,7 @@ class Circuit(object):
             else:
                 self.delete_lines(tuple(removed_not_idling))
         self._line_labels = tuple(value)
+        self._hash = None  # line labels are part of the hashed value
 
     @property
     def name(self):
@@ -478,12 +539,14 @@ class Circuit(object):
         self._str = value
 
     def __hash__(self):
-        if not self._static:
-            _warnings.warn(("Editable circuit is being converted to read-only"
-                            " mode in order to hash it.  You should call"
-                            " circuit.done_editing() beforehand."))
-            self.done_editing()
-        return hash(self.tup)
+        if self._hash is None:
+            if not self._static:
+                _warnings.warn(("Editable circuit is being converted to read-only"
+                                " mode in order to hash it.  You should call"
+                                " circuit.done_editing() beforehand."))
+                self.done_editing()
+            self._hash = hash(self.tup)
+        return self._hash
         #if self._line_labels in (('*',),()): #No line labels
         #    return hash(self._labels)
         #else:
@@ -543,8 +606,15 @@ class Circuit(object):
         return self.__mul__(x)
 
     def __eq__(self, x):
+        if x is self: return True
         if x is None: return False
         if isinstance(x, Circuit):
+            if self._static and x._static:  # fast path: compare cached hashes & (interned) labels directly
+                if self._hash is not None and x._hash is not None and self._hash != x._hash:
+                    return False
+                if self._labels != x._labels: return False
+                return self._line_labels == x._line_labels or \
+                    (self._line_labels in (('*',), ()) and x._line_labels in (('*',), ()))  # as in .tup
             return self.tup == x.tup
         else:
             return self.tup == tuple(x)
@@ -994,12 +1064,13 @@ class Circuit(object):
         None
         """
         #assert(not self._static),"Cannot edit a read-only circuit!"
-        # Actually, this is OK even for static circuits because it won't affect the hashed value (labels only)
+        # Actually, this is OK even for static circuits, though the line labels are part of the hashed value
         if insertBefore is None:
             i = len(self.line_labels)
         else:
             i = self.line_labels.index(insertBefore)
         self._line_labels = self.line_labels[0:i] + tuple(line_labels) + self.line_labels[i:]
+        self._hash = None  # line labels are part of the hashed value
 
     def append_idling_lines(self, line_labels):
         """
@@ -1968,9 +2039,10 @@ class Circuit(object):
         -------
         None
         """
-        # OK even for static circuits because it won't affect the hashed value (labels only)
+        # OK even for static circuits, though the line labels are part of the hashed value
         assert(set(order) == set(self.line_labels)), "The line labels must be the same!"
         self._line_labels = tuple(order)
+        self._hash = None
 
     def is_line_idling(self, line_label, idle_layer_labels=None):
         """
@@ -2051,7 +2123,7 @@ class Circuit(object):
         None
         """
         #assert(not self._static),"Cannot edit a read-only circuit!"
-        # Actually, this is OK even for static circuits because it won't affect the hashed value (labels only)
+        # Actually, this is OK even for static circuits, though the line labels are part of the hashed value
 
         if idle_layer_labels:
             assert(all([toLabel(x).sslbls is None for x in idle_layer_labels])), "Idle layer labels must be *global*"
@@ -2071,6 +2143,7 @@ class Circuit(object):
         # to remove in self._labels (as all the lines are idling)
         self._line_labels = tuple([x for x in self.line_labels
                                    if x in all_sslbls])  # preserve order
+        self._hash = None  # line labels are part of the hashed value
 
     def replace_with_idling_line(self, line_label, clear_straddlers=True):
         """
@@ -3148,6 +3221,7 @@ class Circuit(object):
         if not self._static:
             self._static = True
             self._labels = tuple([_Label(layer_lbl) for layer_lbl in self._labels])
+            self._hash = None
 
 
 class CompressedCircuit(object):
@@ -0,0 +1,477 @@
+""" Defines the CircuitArray class """
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import numpy as _np
+import numbers as _numbers
+import itertools as _itertools
+
+from . import circuit as _cir
+
+Code_type = _np.int32  # type of layer-label codes
+Offset_type = _np.int64  # type of the offsets of circuits within the code array
+
+_HASH_MULTIPLIER = _np.uint64(1000003)  # for the polynomial hash of code sequences
+_HASH_LINES_MULTIPLIER = _np.uint64(0x9E3779B97F4A7C15)
+
+
+def _segment_indices(starts, lengths):
+    """
+    The indices of the concatenation of the segments `[start, start+length)`
+    of some array, given arrays of segment `starts` and `lengths`.
+    """
+    lengths = _np.asarray(lengths, Offset_type)
+    if len(lengths) == 0:
+        return _np.zeros(0, Offset_type)
+    outStarts = _np.cumsum(lengths) - lengths  # start of each segment in the output
+    total = int(outStarts[-1] + lengths[-1])
+    return _np.repeat(_np.asarray(starts, Offset_type) - outStarts, lengths) + _np.arange(total, dtype=Offset_type)
+
+
+def _offsets_from_lengths(lengths):
+    """ Offsets (of length len(lengths)+1) of consecutive segments with the given `lengths` """
+    offsets = _np.zeros(len(lengths) + 1, Offset_type)
+    _np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+class CircuitArray(object):
+    """
+    An array of (static) circuits stored as integer codes.
+
+    The layer labels of all the circuits are stored in a single vocabulary
+    (:attr:`labels`) and each circuit is a contiguous segment of a single,
+    flat array of integer layer codes (:attr:`codes`) delimited by
+    :attr:`offsets`.  Each circuit's line labels are likewise stored as an
+    index into a vocabulary of line-label tuples.
+
+    This allows bulk operations on long lists of circuits, e.g. translating
+    layer labels via an alias dictionary, concatenating circuits (such as
+    placing fiducials around germ powers), filtering circuits to a subset of
+    the qubits, and hashing or de-duplicating circuits, to be performed as
+    numpy array operations instead of per-circuit Python loops.
+
+    A CircuitArray can be used like a (read-only) list of :class:`Circuit`
+    objects: indexing it with an integer or iterating over it creates (and
+    caches) the corresponding :class:`Circuit` objects as they are needed.
+    """
+
+    def __init__(self, circuits=(), line_labels="auto"):
+        """
+        Create a new CircuitArray.
+
+        Parameters
+        ----------
+        circuits : list, optional
+            A list of :class:`Circuit` objects, tuples of layer labels, or
+            strings in standard-text-format.
+
+        line_labels : "auto" or tuple, optional
+            The line labels to use when creating circuits from *non-Circuit*
+            elements of `circuits` (see :func:`pygsti.construction.circuit_list`).
+        """
+        self.labels = []  # the layer-label vocabulary
+        self.line_label_tuples = []  # the line-labels vocabulary
+        self._labelIndex = {}
+        self._lineLabelIndex = {}
+
+        codes = []; lengths = []; line_codes = []; circuitObjs = []
+        for c in circuits:
+            if not isinstance(c, _cir.Circuit):
+                c = _cir.Circuit(None, line_labels, stringrep=c) if isinstance(c, str) \
+                    else _cir.Circuit(c, line_labels)
+            if not c._static:
+                c = c.copy(editable=False)
+            codes.extend([self._get_code(lbl) for lbl in c._labels])
+            lengths.append(len(c._labels))
+            line_codes.append(self._get_line_code(c.line_labels))
+            circuitObjs.append(c)
+
+        self.codes = _np.array(codes, Code_type)
+        self.offsets = _offsets_from_lengths(lengths)
+        self.line_codes = _np.array(line_codes, Code_type)
+        self._circuits = circuitObjs  # already-materialized circuits (or None)
+
+    @classmethod
+    def from_arrays(cls, labels, codes, offsets, line_label_tuples, line_codes):
+        """
+        Create a CircuitArray directly from its vocabularies and code arrays.
+
+        Parameters
+        ----------
+        labels : list
+            The layer-label vocabulary: a list of distinct :class:`Label` objects.
+
+        codes : numpy.ndarray
+            The flat array of indices into `labels` holding the layers of all
+            the circuits.
+
+        offsets : numpy.ndarray
+            An array of length N+1 (for N circuits) such that the layers of the
+            i-th circuit are `codes[offsets[i]:offsets[i+1]]`.
+
+        line_label_tuples : list
+            The line-labels vocabulary: a list of distinct tuples of line labels.
+
+        line_codes : numpy.ndarray
+            The index into `line_label_tuples` of each circuit's line labels.
+
+        Returns
+        -------
+        CircuitArray
+        """
+        ret = cls.__new__(cls)
+        ret.labels = list(labels)
+        ret.line_label_tuples = [tuple(ll) for ll in line_label_tuples]
+        ret._labelIndex = {(lbl, lbl.time): i for i, lbl in enumerate(ret.labels)}
+        ret._lineLabelIndex = {ll: i for i, ll in enumerate(ret.line_label_tuples)}
+        ret.codes = _np.asarray(codes, Code_type)
+        ret.offsets = _np.asarray(offsets, Offset_type)
+        ret.line_codes = _np.asarray(line_codes, Code_type)
+        ret._circuits = [None] * len(ret.line_codes)
+        assert(len(ret.offsets) == len(ret.line_codes) + 1), "Offsets & line codes have inconsistent lengths!"
+        return ret
+
+    def _get_code(self, lbl):
+        key = (lbl, lbl.time)  # Label equality ignores time, but we don't want to lose it
+        code = self._labelIndex.get(key, None)
+        if code is None:
+            code = self._labelIndex[key] = len(self.labels)
+            self.labels.append(lbl)
+        return code
+
+    def _get_line_code(self, line_labels):
+        code = self._lineLabelIndex.get(line_labels, None)
+        if code is None:
+            code = self._lineLabelIndex[line_labels] = len(self.line_label_tuples)
+            self.line_label_tuples.append(line_labels)
+        return code
+
+    def __len__(self):
+        return len(self.line_codes)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, (_numbers.Integral, _np.integer)):
+            i = int(key)
+            if i < 0: i += len(self)
+            c = self._circuits[i]
+            if c is None:
+                c = self._circuits[i] = self._materialize(i)
+            return c
+        elif isinstance(key, slice):
+            return self.take(_np.arange(len(self))[key])
+        else:
+            key = _np.asarray(key)
+            return self.take(_np.flatnonzero(key) if key.dtype == bool else key)
+
+    def _materialize(self, i):
+        """ Create the Circuit object at index `i` """
+        lbls = self.labels
+        layers = tuple([lbls[k] for k in self.codes[self.offsets[i]:self.offsets[i + 1]].tolist()])
+        return _cir.Circuit._fastinit(layers, self.line_label_tuples[self.line_codes[i]])
+
+    @property
+    def lengths(self):
+        """ The number of layers in each circuit, as an array. """
+        return _np.diff(self.offsets)
+
+    def to_circuits(self):
+        """
+        Get the circuits of this array as a list of :class:`Circuit` objects.
+
+        Returns
+        -------
+        list
+        """
+        return [self[i] for i in range(len(self))]
+
+    def take(self, indices):
+        """
+        Get the sub-array of the circuits at the given indices.
+
+        Parameters
+        ----------
+        indices : array-like
+            The (integer) indices of the circuits to take, possibly repeated.
+
+        Returns
+        -------
+        CircuitArray
+            Shares this array's vocabularies.
+        """
+        indices = _np.asarray(indices, Offset_type).reshape(-1)
+        lengths = self.lengths[indices]
+        ret = CircuitArray.from_arrays(self.labels, self.codes[_segment_indices(self.offsets[indices], lengths)],
+                                       _offsets_from_lengths(lengths), self.line_label_tuples,
+                                       self.line_codes[indices])
+        ret._circuits = [self._circuits[i] for i in indices.tolist()]  # keep already-materialized circuits
+        return ret
+
+    def translate(self, aliasDict):
+        """
+        Replace layer labels according to an alias dictionary.
+
+        This performs the same operation as
+        :func:`pygsti.construction.translate_circuit_list`, but only looks up
+        each distinct layer label once.
+
+        Parameters
+        ----------
+        aliasDict : dict
+            A dictionary whose keys are single layer labels and whose values are
+            lists or tuples of the new layer labels that should replace that key.
+            If `aliasDict is None` then this array is returned.
+
+        Returns
+        -------
+        CircuitArray
+        """
+        if aliasDict is None: return self
+        ret = CircuitArray.from_arrays(self.labels, (), (0,), self.line_label_tuples, ())
+        replacements = [[ret._get_code(_cir.toLabel(l)) for l in aliasDict.get(lbl, (lbl,))] for lbl in self.labels]
+        repLengths = _np.array([len(r) for r in replacements], Offset_type)
+        repOffsets = _offsets_from_lengths(repLengths)
+        repCodes = _np.array(list(_itertools.chain(*replacements)), Code_type)
+
+        #Each original layer is replaced by a segment of `repCodes`
+        layerLengths = repLengths[self.codes]
+        ret.codes = repCodes[_segment_indices(repOffsets[self.codes], layerLengths)]
+        cumLengths = _np.concatenate(([0], _np.cumsum(layerLengths)))
+        ret.offsets = cumLengths[self.offsets].astype(Offset_type)
+        ret.line_codes = self.line_codes.copy()
+        ret._circuits = [None] * len(self)
+        return ret
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """
+        Element-wise concatenation of circuit arrays.
+
+        The i-th circuit of the result is the concatenation (as by `+`) of the
+        i-th circuits of each of the `arrays`.  Arrays of length 1 are
+        broadcast, so that, e.g., the same prefix can be added to every
+        circuit of an array.
+
+        Parameters
+        ----------
+        arrays : list of CircuitArrays
+            The arrays to concatenate, each of which must have either the
+            same length N or length 1.
+
+        Returns
+        -------
+        CircuitArray
+        """
+        assert(len(arrays) > 0), "Must concatenate at least one array!"
+        n = max([len(a) for a in arrays])
+        assert(all([len(a) in (1, n) for a in arrays])), "Cannot broadcast arrays of lengths %s" % \
+            str([len(a) for a in arrays])
+
+        #Merge vocabularies: codes of the k-th array are remapped into the first array's (extended) vocabularies
+        ret = CircuitArray.from_arrays(arrays[0].labels, (), (0,), arrays[0].line_label_tuples, ())
+        allCodes = []; codeOffset = 0
+        starts = _np.empty((n, len(arrays)), Offset_type)
+        lengths = _np.empty((n, len(arrays)), Offset_type)
+        lineCodes = []
+        for k, a in enumerate(arrays):
+            codeMap = _np.array([ret._get_code(lbl) for lbl in a.labels], Code_type)
+            allCodes.append(codeMap[a.codes])
+            lineMap = _np.array([ret._get_line_code(ll) for ll in a.line_label_tuples], Code_type)
+            lineCodes.append(_np.broadcast_to(lineMap[a.line_codes], (n,)))
+            starts[:, k] = codeOffset + a.offsets[:-1]
+            lengths[:, k] = a.lengths
+            codeOffset += len(a.codes)
+        ret.codes = _np.concatenate(allCodes)[_segment_indices(starts.ravel(), lengths.ravel())]
+        ret.offsets = _offsets_from_lengths(lengths.sum(axis=1))
+
+        #Line labels are combined as in Circuit.__add__, once per distinct combination of line-label codes
+        lineCombos = _np.stack(lineCodes, axis=1)
+        uniqueCombos, inverse = _np.unique(lineCombos, axis=0, return_inverse=True)
+        comboCodes = []
+        for combo in uniqueCombos:
+            line_labels = ret.line_label_tuples[combo[0]]
+            for code in combo[1:]:
+                line_labels = line_labels + tuple([l for l in ret.line_label_tuples[code] if l not in line_labels])
+            comboCodes.append(ret._get_line_code(line_labels))
+        ret.line_codes = _np.array(comboCodes, Code_type)[inverse.reshape(-1)]
+        ret._circuits = [None] * n
+        return ret
+
+    @classmethod
+    def product(cls, arrays):
+        """
+        Concatenations of all the combinations of one circuit from each array.
+
+        The circuits of the result are ordered as `itertools.product` orders
+        the combinations, e.g. the result of `product([preps, germPowers,
+        effects])` holds `prep + germPower + effect` for each prep (slowest
+        varying) germ power and effect (fastest varying).
+
+        Parameters
+        ----------
+        arrays : list of CircuitArrays
+            The arrays to combine.
+
+        Returns
+        -------
+        CircuitArray
+        """
+        grids = _np.meshgrid(*[_np.arange(len(a)) for a in arrays], indexing='ij')
+        return cls.concatenate([a.take(grid.ravel()) for a, grid in zip(arrays, grids)])
+
+    def filter(self, sslbls_to_keep, new_sslbls=None, drop=False, idle=()):
+        """
+        Remove the labels whose state-space labels are not all in `sslbls_to_keep`.
+
+        This performs the same operation as
+        :func:`pygsti.construction.filter_circuits`, but filters each distinct
+        layer label only once.
+
+        Parameters
+        ----------
+        sslbls_to_keep : list
+            A list of state space labels specifying which operation labels should
+            be retained.
+
+        new_sslbls : list, optional
+            If not None, a list of the same length as `sslbls_to_keep` specifying
+            a new set of state space labels to replace those in `sslbls_to_keep`.
+
+        drop : bool, optional
+            If True, then non-empty circuits which become empty after filtering
+            are not included in (i.e. dropped from) the returned array, nor are
+            circuits that cannot be filtered because a layer partially
+            intersects `sslbls_to_keep`.
+
+        idle : string or Label, optional
+            The operation label to be used when there are no kept components of a
+            layer of a circuit.
+
+        Returns
+        -------
+        CircuitArray
+        """
+        from ..construction import circuitconstruction as _cc  # b/c construction depends on objects
+        ret = CircuitArray.from_arrays([], (), (0,), [tuple(sslbls_to_keep)], ())
+        replacements = []; valid = []
+        for lbl in self.labels:
+            filtered = _cc.filter_circuit(_cir.Circuit((lbl,), check=False, expand_subcircuits=False),
+                                          sslbls_to_keep, new_sslbls, idle)
+            valid.append(filtered is not None)
+            replacements.append([ret._get_code(l) for l in filtered] if (filtered is not None) else [])
+        repLengths = _np.array([len(r) for r in replacements], Offset_type)
+        repOffsets = _offsets_from_lengths(repLengths)
+        repCodes = _np.array(list(_itertools.chain(*replacements)), Code_type)
+
+        layerLengths = repLengths[self.codes]
+        codes = repCodes[_segment_indices(repOffsets[self.codes], layerLengths)]
+        cumLengths = _np.concatenate(([0], _np.cumsum(layerLengths)))
+        offsets = cumLengths[self.offsets].astype(Offset_type)
+
+        circuitIndex = _np.repeat(_np.arange(len(self)), self.lengths)
+        invalid = _np.zeros(len(self), bool)
+        invalid[circuitIndex[~_np.array(valid, bool)[self.codes]]] = True
+        ret.codes, ret.offsets = codes, offsets
+        ret.line_codes = _np.zeros(len(self), Code_type)
+        ret._circuits = [None] * len(self)
+        if drop:
+            emptied = (_np.diff(offsets) == 0) & (self.lengths > 0)
+            return ret.take(_np.flatnonzero(~(invalid | emptied)))
+        if _np.any(invalid):
+            raise ValueError("Cannot filter circuit %s: a layer acts on both kept and non-kept state space labels"
+                             % self[int(_np.flatnonzero(invalid)[0])].str)
+        return ret
+
+    def _line_ids(self):
+        """ Integer ids of the line-label tuples, equal for tuples that are equivalent in a circuit """
+        ids = {}
+        return _np.array([ids.setdefault(('*',) if (ll == ()) else ll, len(ids))  # ('*',) == () (see Circuit.tup)
+                          for ll in self.line_label_tuples], Offset_type)
+
+    def hash_codes(self):
+        """
+        Integer hash values of the circuits in this array.
+
+        Equal circuits of this array have equal hash values (and unequal
+        circuits almost surely have unequal ones).  Hash values are only
+        comparable between circuits of the same array.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of `numpy.uint64` values.
+        """
+        lengths = self.lengths
+        n = len(self)
+        if len(self.codes) > 0:
+            positions = _np.arange(len(self.codes)) - _np.repeat(self.offsets[:-1], lengths)
+            powers = _np.empty(int(lengths.max()), _np.uint64)
+            powers[0] = 1
+            with _np.errstate(over='ignore'):
+                powers[1:] = _HASH_MULTIPLIER
+                powers = _np.cumprod(powers)  # wraps modulo 2^64
+                terms = (self.codes.astype(_np.uint64) + _np.uint64(1)) * powers[positions]
+            nonempty = lengths > 0
+            sums = _np.zeros(n, _np.uint64)
+            sums[nonempty] = _np.add.reduceat(terms, self.offsets[:-1][nonempty])
+        else:
+            sums = _np.zeros(n, _np.uint64)
+
+        lineIds = self._line_ids().astype(_np.uint64)
+        with _np.errstate(over='ignore'):
+            return sums * _HASH_MULTIPLIER + lengths.astype(_np.uint64) \
+                + (lineIds[self.line_codes] + _np.uint64(1)) * _HASH_LINES_MULTIPLIER
+
+    def unique_indices(self):
+        """
+        The indices of the first occurrence of each distinct circuit.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted indices, so that `self.take(self.unique_indices())` holds
+            the distinct circuits of this array in their original order.
+        """
+        hashes = self.hash_codes()
+        _, first, inverse = _np.unique(hashes, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        #Verify that circuits with equal hashes are equal (they almost surely are)
+        reps = first[inverse]  # the first circuit with the same hash as each circuit
+        lengths = self.lengths
+        same = (lengths[reps] == lengths)
+        lineIds = self._line_ids()
+        same &= (lineIds[self.line_codes[reps]] == lineIds[self.line_codes])
+        if _np.all(same):
+            mismatch = self.codes[_segment_indices(self.offsets[reps], lengths)] != self.codes
+            same = _np.bincount(_np.repeat(_np.arange(len(self)), lengths), weights=mismatch,
+                                minlength=len(self)) == 0
+        if _np.all(same):
+            return _np.sort(first)
+
+        #Hash collision: fall back to comparing circuits exactly
+        seen = set(); indices = []
+        for i in range(len(self)):
+            key = (tuple(self.codes[self.offsets[i]:self.offsets[i + 1]]), lineIds[self.line_codes[i]])
+            if key not in seen:
+                seen.add(key); indices.append(i)
+        return _np.array(indices, Offset_type)
+
+    def __getstate__(self):
+        return {'labels': self.labels, 'codes': self.codes, 'offsets': self.offsets,
+                'line_label_tuples': self.line_label_tuples, 'line_codes': self.line_codes}
+
+    def __setstate__(self, state_dict):
+        ret = CircuitArray.from_arrays(state_dict['labels'], state_dict['codes'], state_dict['offsets'],
+                                       state_dict['line_label_tuples'], state_dict['line_codes'])
+        self.__dict__.update(ret.__dict__)
@@ -410,8 +410,9 @@ class LsGermsStructure(CircuitStructure):
                                                range(len(self.effectStrs))))
         if dsfilter:
             inds_to_remove = []
-            for k, (i, j) in enumerate(fidpairs):
-                el = self.prepStrs[i] + basestr + self.effectStrs[j]
+            els = _gstrc.list_fiducial_pair_circuits(basestr, [(self.prepStrs[i], self.effectStrs[j])
+                                                               for i, j in fidpairs])
+            for k, ((i, j), el) in enumerate(zip(fidpairs, els)):
                 trans_el = _gstrc.translate_circuit(el, self.aliases)
                 if trans_el not in dsfilter:
                     missing_list.append((self.prepStrs[i], germ, L, self.effectStrs[j], el))
@@ -591,9 +592,11 @@ class LsGermsStructure(CircuitStructure):
             fidpairs = list(_itertools.product(range(len(self.prepStrs)),
                                                range(len(self.effectStrs))))
 
-        elements = [(j, i, self.prepStrs[i] + baseStr + self.effectStrs[j])
-                    for i, j in fidpairs]  # note preps are *cols* not rows
+        from ..construction import circuitconstruction as _gstrc  # maybe move used routines to a circuittools.py?
+
         real_fidpairs = [(self.prepStrs[i], self.effectStrs[j]) for i, j in fidpairs]  # strings, not just indices
+        elements = [(j, i, opstr) for (i, j), opstr in
+                    zip(fidpairs, _gstrc.list_fiducial_pair_circuits(baseStr, real_fidpairs))]  # preps are *cols*
 
         return CircuitPlaquette(baseStr, len(self.effectStrs),
                                 len(self.prepStrs), elements,
@@ -769,8 +772,8 @@ class LsGermsSerialStructure(CircuitStructure):
 
         if dsfilter:  # and len(dsfilter) < 8000: # TEST DEBUG
             inds_to_remove = []
-            for k, (prepStr, effectStr) in enumerate(fidpairs):
-                el = prepStr + basestr + effectStr
+            els = _gstrc.list_fiducial_pair_circuits(basestr, fidpairs)
+            for k, ((prepStr, effectStr), el) in enumerate(zip(fidpairs, els)):
                 trans_el = _gstrc.translate_circuit(el, self.aliases)
                 if trans_el not in dsfilter:
                     missing_list.append((prepStr, germ, L, effectStr, el))
@@ -957,9 +960,11 @@ class LsGermsSerialStructure(CircuitStructure):
                                           list(range(self.nMinorCols))))
         assert(len(ji_list) >= len(fidpairs)), "Number of minor rows/cols is too small!"
 
-        elements = [(j, i, prepStr + baseStr + effectStr)
-                    for (j, i), (prepStr, effectStr) in
-                    zip(ji_list[0:len(fidpairs)], fidpairs)]  # note preps are *cols* not rows
+        from ..construction import circuitconstruction as _gstrc  # maybe move used routines to a circuittools.py?
+
+        elements = [(j, i, opstr) for (j, i), opstr in
+                    zip(ji_list[0:len(fidpairs)],
+                        _gstrc.list_fiducial_pair_circuits(baseStr, fidpairs))]  # note preps are *cols* not rows
 
         return CircuitPlaquette(baseStr, self.nMinorRows,
                                 self.nMinorCols, elements,
@@ -9,7 +9,6 @@
 #***************************************************************************************************
 
 import numpy as _np
-import scipy.stats as _stats
 import warnings as _warnings
 import itertools as _itertools
 import collections as _collections
@@ -93,6 +92,7 @@ class ConfidenceRegionFactory(object):
             "'nonMarkRadiusSq' must be non-None when 'hessian' is specified"
         self.hessian = hessian
         self.nonMarkRadiusSq = nonMarkRadiusSq
+        self.hessian_neglected_weight = None
 
         self.hessian_projection_parameters = _collections.OrderedDict()
         self.inv_hessian_projections = _collections.OrderedDict()
@@ -171,7 +171,7 @@ class ConfidenceRegionFactory(object):
         assert(self.parent is not None)  # Estimate
         return self.parent.models[self.model_lbl]
 
-    def compute_hessian(self, comm=None, memLimit=None, approximate=False):
+    def compute_hessian(self, comm=None, memLimit=None, approximate=False, numThreads=1):
         """
         Computes the Hessian for this factory.
 
@@ -185,10 +185,21 @@ class ConfidenceRegionFactory(object):
             A rough memory limit in bytes which restricts the amount of intermediate
             values that are computed and stored.
 
-        approximate : bool, optional
+        approximate : bool or "corrected", optional
             Whether to compute the true Hessian or just an approximation of it.
             See :function:`logl_approximate_hessian`.  Setting to True can
-            significantly reduce the run time.
+            significantly reduce the run time.  The value `"corrected"`
+            (only available for the log-likelihood objective) computes the
+            approximate Hessian and then adds the exact second-derivative
+            terms for the circuits where they are largest - see
+            :function:`logl_corrected_approximate_hessian`.  In this case the
+            fraction of the second-derivative weight that was neglected is
+            stored in `self.hessian_neglected_weight`.
+
+        numThreads : int, optional
+            The number of threads used to compute blocks of the (exact part of
+            the) log-likelihood Hessian concurrently when `comm` is None.  See
+            :function:`logl_hessian`.
 
         Returns
         -------
@@ -231,13 +242,23 @@ class ConfidenceRegionFactory(object):
 
         MIN_NON_MARK_RADIUS = 1e-8  # must be >= 0
 
+        self.hessian_neglected_weight = None
         if obj == 'logl':
-            hessian_fn = _tools.logl_approximate_hessian if approximate \
-                else _tools.logl_hessian
-            hessian = hessian_fn(model, dataset, circuit_list,
-                                 minProbClip, probClipInterval, radius,
-                                 comm=comm, memLimit=memLimit, verbosity=vb,
-                                 opLabelAliases=aliases)
+            if approximate == "corrected":
+                hessian, self.hessian_neglected_weight = _tools.logl_corrected_approximate_hessian(
+                    model, dataset, circuit_list, minProbClip, probClipInterval, radius,
+                    comm=comm, memLimit=memLimit, verbosity=vb, opLabelAliases=aliases,
+                    returnNeglectedWeight=True, numThreads=numThreads)
+            elif approximate:
+                hessian = _tools.logl_approximate_hessian(model, dataset, circuit_list,
+                                                          minProbClip, probClipInterval, radius,
+                                                          comm=comm, memLimit=memLimit, verbosity=vb,
+                                                          opLabelAliases=aliases)
+            else:
+                hessian = _tools.logl_hessian(model, dataset, circuit_list,
+                                              minProbClip, probClipInterval, radius,
+                                              comm=comm, memLimit=memLimit, verbosity=vb,
+                                              opLabelAliases=aliases, numThreads=numThreads)
 
             nonMarkRadiusSq = max(2 * (_tools.logl_max(model, dataset)
                                        - _tools.logl(model, dataset,
@@ -245,6 +266,7 @@ class ConfidenceRegionFactory(object):
                                   - (nDataParams - nModelParams), MIN_NON_MARK_RADIUS)
 
         elif obj == 'chi2':
+            assert(approximate != "corrected"), "A corrected approximate Hessian is only available for 'logl'"
             chi2, hessian = _tools.chi2(model, dataset, circuit_list,
                                         False, True, minProbClipForWeighting,
                                         probClipInterval, memLimit=memLimit,
@@ -636,6 +658,7 @@ class ConfidenceRegionFactoryView(object):
         #  C1 == Single DOF case: constant for a single-DOF likelihood, (or a profile likelihood in our case)
         #  Ck == Total DOF case: constant for a region of the likelihood as a function of *all non-gauge* model
         #        parameters
+        import scipy.stats as _stats  # (imported here b/c importing scipy.stats is slow)
         self.nonMarkRadiusSq = nonMarkRadiusSq
         if nonMarkRadiusSq == 0.0:  # use == to test for *exact* zero floating pt value as herald
             C1 = _stats.chi2.ppf(confidenceLevel / 100.0, 1)
@@ -9,9 +9,7 @@
 #***************************************************************************************************
 
 import numpy as _np
-import scipy as _scipy
 import copy as _copy
-from scipy import stats as _stats
 import collections as _collections
 from .multidataset import MultiDataSet as _MultiDataSet
 from .hypothesistest import HypothesisTest as _HypothesisTest
@@ -82,6 +80,33 @@ def loglikelihoodRatio(nListList):
     return -2 * (lC - lS)
 
 
+def loglikelihoodRatios(counts):
+    """
+    Calculates the log-likelihood ratios (see :func:`loglikelihoodRatio`) of
+    many dice at once.
+
+    Parameters
+    ----------
+    counts : numpy.ndarray
+        An array of shape `(num_contexts, num_dice, num_outcomes)` whose
+        `[i, k, :]` elements are the observed counts of the outcomes of die `k`
+        in context `i`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The log-likelihood ratio of each die (an array of length `num_dice`).
+    """
+    def maxloglikelihoods(nList):  # the log-likelihoods of the observed frequencies, summed over the last axis
+        total = _np.sum(nList, axis=-1, keepdims=True)
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            terms = _np.where(nList > 0, nList * _np.log(nList / total), 0.)  # (where nList == 0, xlogy(...) == 0)
+        return _np.sum(terms, axis=-1)
+
+    counts = _np.asarray(counts, 'd')
+    return -2 * (maxloglikelihoods(_np.sum(counts, axis=0)) - _np.sum(maxloglikelihoods(counts), axis=0))
+
+
 def JensenShannonDivergence(nListList):
     """
     Calculates the Jensen-Shannon divergence (JSD) between between different
@@ -129,6 +154,7 @@ def pval(llrval, dof):
         the chi^2_k distribution. The validity of this approximation
         is due to Wilks' theorem.
     """
+    import scipy.stats as _stats  # (imported here b/c importing scipy.stats is slow)
     return 1 - _stats.chi2.cdf(llrval, dof)
 
 
@@ -218,7 +244,8 @@ def compute_llr_threshold(significance, dof):
         function, evaluated at x, for the chi^2_k distribution. This
         formula is based on Wilks' theorem.
     """
-    return _scipy.stats.chi2.isf(significance, dof)
+    import scipy.stats as _stats  # (imported here b/c importing scipy.stats is slow)
+    return _stats.chi2.isf(significance, dof)
 
 
 def tvd(nListList):
@@ -248,6 +275,27 @@ def tvd(nListList):
     return 0.5 * _np.sum(_np.abs(nListList[0][i] / N0 - nListList[1][i] / N1) for i in range(num_outcomes))
 
 
+def tvds_of_counts(counts):
+    """
+    Calculates the total variation distances (see :func:`tvd`) of many dice at
+    once, for *two* contexts.
+
+    Parameters
+    ----------
+    counts : numpy.ndarray
+        An array of shape `(2, num_dice, num_outcomes)` whose `[i, k, :]`
+        elements are the observed counts of the outcomes of die `k` in context `i`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The observed TVD of each die (an array of length `num_dice`).
+    """
+    assert(len(counts) == 2), "Can only compute the TVD between two sets of outcomes!"
+    freqs = _np.asarray(counts, 'd') / _np.sum(counts, axis=2, keepdims=True)
+    return 0.5 * _np.sum(_np.abs(freqs[0] - freqs[1]), axis=1)
+
+
 class DataComparator():
     """
     This object can be used to implement all of the "context dependence detection" methods described
@@ -344,45 +392,35 @@ class DataComparator():
         else:
             raise ValueError("The `dataset_list_or_multidataset` must be a list of DataSets of a MultiDataSet!")
 
+        # The counts of every (dataset, circuit, outcome), with outcomes in order of their index
+        circuits = list(circuits)
+        if isinstance(dataset_list_or_multidataset, _MultiDataSet):
+            counts = dataset_list_or_multidataset.get_counts_array(circuits)
+        else:
+            counts = _np.array([ds.get_counts_array(circuits) for ds in dsList])
+
+        keep = _np.ones(len(circuits), bool)
         if allow_bad_circuits:
-            trimmedcircuits = []
-            for circuit in circuits:
-                if min([ds[circuit].total for ds in dsList]) > 0:
-                    trimmedcircuits.append(circuit)
-            circuits = trimmedcircuits
+            keep &= _np.min(_np.sum(counts, axis=2), axis=0) > 0
 
         if op_exclusions is not None:
-            circuits_exc_temp = []
-            for circuit in circuits:
-                if is_circuit_allowed_by_exclusion(op_exclusions, circuit):
-                    circuits_exc_temp.append(circuit)
-            circuits = list(circuits_exc_temp)
+            keep &= _np.array([is_circuit_allowed_by_exclusion(op_exclusions, circuit) for circuit in circuits], bool)
 
         if op_inclusions is not None:
-            circuits_inc_temp = []
-            for circuit in circuits:
-                if is_circuit_allowed_by_inclusion(op_inclusions, circuit):
-                    circuits_inc_temp.append(circuit)
-            circuits = list(circuits_inc_temp)
-
-        llrs = {}
-        pVals = {}
-        jsds = {}
+            keep &= _np.array([is_circuit_allowed_by_inclusion(op_inclusions, circuit) for circuit in circuits], bool)
+
+        circuits = [circuit for circuit, k in zip(circuits, keep) if k]
+        counts = counts[:, keep, :]
+
         dof = (len(dsList) - 1) * (len(dsList[0].olIndex) - 1)
-        total_counts = []
+        total_counts = _np.sum(counts, axis=(0, 2))
+        llrs_array = loglikelihoodRatios(counts)
+        llrs = dict(zip(circuits, llrs_array))
+        jsds = dict(zip(circuits, llrs_array / (2 * total_counts)))
+        pVals = dict(zip(circuits, pval(llrs_array, dof)))
 
         if len(dataset_list_or_multidataset) == 2:
-            tvds = {}
-
-        for circuit in circuits:
-            datalineList = [ds[circuit] for ds in dsList]
-            nListList = _np.array([list(dataline.allcounts.values()) for dataline in datalineList])
-            total_counts.append(_np.sum(nListList))
-            llrs[circuit] = loglikelihoodRatio(nListList)
-            jsds[circuit] = JensenShannonDivergence(nListList)
-            pVals[circuit] = pval(llrs[circuit], dof)
-            if len(dataset_list_or_multidataset) == 2:
-                tvds[circuit] = tvd(nListList)
+            tvds = dict(zip(circuits, tvds_of_counts(counts)))
 
         self.dataset_list_or_multidataset = dataset_list_or_multidataset
         self.pVals = pVals
@@ -16,6 +16,7 @@ import uuid as _uuid
 #from scipy.integrate import quad as _quad
 #from scipy.interpolate import interp1d as _interp1d
 
+import os as _os
 import pickle as _pickle
 import copy as _copy
 import warnings as _warnings
@@ -177,14 +178,17 @@ class DataSetRow(object):
         Returns the a list containing the unique data collection times
         at which there is at least one measurement result.
         """
-        times = []
-        last_time = None
-        for t in self.time:
-            if t != last_time:
-                times.append(t)
-                last_time = t
+        return list(self.time[self._get_time_bin_starts()])
 
-        return times
+    def _get_time_bin_starts(self):
+        """
+        Returns a boolean array that is True at the first element of each run of
+        equal time stamps (i.e. where a new data-collection time begins).
+        """
+        newTime = _np.empty(len(self.time), bool)
+        newTime[0:1] = True
+        newTime[1:] = self.time[1:] != self.time[:-1]
+        return newTime
 
     def get_timeseries_for_outcomes(self):
         """
@@ -202,51 +206,15 @@ class DataSetRow(object):
             measurement outcome was observed at the unique data collection
             times in `times`.
         """
-        times = []
-        last_time = None
-        seriesDict = {self.dataset.olIndex[ol]: [] for ol in self.dataset.get_outcome_labels()}
-
-        #REMOVED: (though this gives slightly different behavior)
-        #for outcome_label in self.outcomes:
-        #    if outcome_label not in seriesDict.keys():
-        #        seriesDict[outcome_label] = []
-
-        if self.reps is None:
-            reps = _np.ones(len(self.time), int)
-        else: reps = self.reps
-
-        # An alternate implementation that appears to be (surprisingly?) slower...
-        ##Get time bin locations
-        #time_bins_borders = []
-        #last_time = None
-        #for i, t in enumerate(self.time):
-        #    if t != last_time:
-        #        time_bins_borders.append(i)
-        #        last_time = t
-        #time_bins_borders.append(len(self.time))
-        #nTimes = len(time_bins_borders) - 1
-        #
-        #seriesDict = {self.dataset.olIndex[ol]: _np.zeros(nTimes, int) for ol in self.dataset.get_outcome_labels()}
-        #
-        #for i in range(nTimes):
-        #    slc = slice(time_bins_borders[i],time_bins_borders[i+1])
-        #    times.append( self.time[slc.start] )
-        #    for oli, rep in zip(self.oli[slc], reps[slc]):
-        #        seriesDict[oli][i] += rep
-
-        for t, oli, rep in zip(self.time, self.oli, reps):
+        newTime = self._get_time_bin_starts()
+        nTimes = int(_np.count_nonzero(newTime))
+        nOutcomes = self.dataset.olIndex_max + 1
+        timeIndices = _np.cumsum(newTime) - 1  # the data-collection-time index of each element
 
-            if t != last_time:
-                times.append(t)
-                last_time = t
-
-                for sd_oli in seriesDict.keys():
-                    if sd_oli == oli: seriesDict[sd_oli].append(rep)
-                    else: seriesDict[sd_oli].append(0)
-            else:
-                seriesDict[oli][-1] += rep
-
-        return times, {ol: seriesDict[oli] for ol, oli in self.dataset.olIndex.items()}
+        #Sum repetitions over (time, outcome) bins in a single pass
+        cnts = _np.bincount(timeIndices * nOutcomes + _np.asarray(self.oli, _np.int64), self.reps,
+                            minlength=nTimes * nOutcomes).reshape((nTimes, nOutcomes))
+        return list(self.time[newTime]), {ol: cnts[:, oli].tolist() for ol, oli in self.dataset.olIndex.items()}
 
     def get_timeseries(self):
         """
@@ -297,23 +265,12 @@ class DataSetRow(object):
         reps : list
             The total number of counts at each time step.
         """
-        times = []
-        reps = []
-        last_time = None
-
         if self.reps is None:
             return list(self.time), list(_np.ones(len(self.time), int))
 
-        else:
-            for t, rep in zip(self.time, self.reps):
-                if t != last_time:
-                    times.append(t)
-                    last_time = t
-                    reps.append(rep)
-                else:
-                    reps[-1] += rep
-
-            return times, reps
+        newTime = self._get_time_bin_starts()
+        reps = _np.bincount(_np.cumsum(newTime) - 1, self.reps, minlength=_np.count_nonzero(newTime))
+        return list(self.time[newTime]), list(reps)
 
     def get_number_of_times(self):
         """
@@ -379,6 +336,7 @@ class DataSetRow(object):
                 # and caching *all* of the counts just to extract the one being asked for now.
                 outcome_label = _ld.OutcomeLabelDict.to_outcome(indexOrOutcomeLabel)
                 if outcome_label not in self.dataset.olIndex:
+                    if self.dataset.sparse: return 0  # an unobserved outcome
                     raise KeyError("%s is not an index, timestamp, or outcome label!"
                                    % str(indexOrOutcomeLabel))
                 return self._get_single_count(outcome_label)
@@ -391,7 +349,7 @@ class DataSetRow(object):
                     # if outcome label isn't in counts but *is* in the dataset's
                     # outcome labels then return 0 (~= return self.allcounts[...])
                     key = _ld.OutcomeLabelDict.to_outcome(indexOrOutcomeLabel)
-                    if key in self.dataset.get_outcome_labels(): return 0
+                    if self.dataset.sparse or key in self.dataset.olIndex: return 0
                     raise KeyError("%s is not an index, timestamp, or outcome label!"
                                    % str(indexOrOutcomeLabel))
 
@@ -428,16 +386,11 @@ class DataSetRow(object):
             tslc = _np.where(_np.isclose(self.time, timestamp))[0]
         else: tslc = slice(None)
 
+        i = self.dataset.olIndex[outcome_label]
         if self.reps is None:
-            i = self.dataset.olIndex[outcome_label]
             return float(_np.count_nonzero(_np.equal(self.oli[tslc], i)))
         else:
-            i = self.dataset.olIndex[outcome_label]
-            inds = _np.nonzero(_np.equal(self.oli[tslc], i))[0]
-            if len(inds) > 0:
-                return float(sum(self.reps[tslc][inds]))
-            else:
-                return 0.0
+            return float(_np.sum(self.reps[tslc][_np.equal(self.oli[tslc], i)]))
 
     def _get_counts(self, timestamp=None, all_outcomes=False):
         """
@@ -448,21 +401,21 @@ class DataSetRow(object):
         #Note: when all_outcomes == False we don't add outcome labels that
         # aren't present for any of this row's elements (i.e. the #summed
         # is zero)
-        cntDict = _ld.OutcomeLabelDict()
         if timestamp is not None:
             tslc = _np.where(_np.isclose(self.time, timestamp))[0]
         else: tslc = slice(None)
 
-        if self.reps is None:
-            for ol, i in self.dataset.olIndex.items():
-                cnt = float(_np.count_nonzero(_np.equal(self.oli[tslc], i)))
-                if all_outcomes or cnt > 0: cntDict[ol] = cnt
+        oli = _np.asarray(self.oli[tslc], _np.int64)
+        reps = None if (self.reps is None) else self.reps[tslc]
+        nOutcomes = self.dataset.olIndex_max + 1
+        if len(oli) < nOutcomes:  # (many outcome labels) only tally the outcomes that are present
+            olis, inv = _np.unique(oli, return_inverse=True)
+            cnts = _np.bincount(inv, reps, minlength=len(olis))
         else:
-            for ol, i in self.dataset.olIndex.items():
-                inds = _np.nonzero(_np.equal(self.oli[tslc], i))[0]
-                if all_outcomes or len(inds) > 0:
-                    cntDict[ol] = float(sum(self.reps[tslc][inds]))
-        return cntDict
+            present = _np.bincount(oli, minlength=nOutcomes)
+            olis = _np.flatnonzero(present)
+            cnts = present[olis] if (reps is None) else _np.bincount(oli, reps, minlength=nOutcomes)[olis]
+        return self.dataset._build_count_dict(olis, cnts, all_outcomes)
 
     @property
     def counts(self):
@@ -523,43 +476,51 @@ class DataSetRow(object):
         timestamps : list or array, optional
             If not None, an array of time stamps to extract counts for,
             which will also be returned as `times`.  Times at which
-            there is no data will be returned as zero-counts.
+            there is no data will be returned as zero-counts.  These
+            need not be sorted: `counts[i]` always corresponds to
+            `timestamps[i]`.
 
         Returns
         -------
         times, counts : numpy.ndarray
+            When `timestamps` is None, `times` holds the distinct time stamps
+            of this row's data in increasing order.  Rows whose data is not
+            stored in time order (possible for non-static data sets) are
+            sorted by time first.
         """
         if outcomelabel == 'all':
-            olis = list(self.dataset.olIndex.values())
+            times = self.time
+            reps = self.reps
         else:
             outcomelabel = _ld.OutcomeLabelDict.to_outcome(outcomelabel)
-            olis = [self.dataset.olIndex[outcomelabel]]
-
-        times = []
-        counts = []
-        last_t = -1e100
-        tsIndx = 0
-        for i, (t, oli) in enumerate(zip(self.time, self.oli)):
-
-            if timestamps is not None:
-                while tsIndx < len(timestamps) and t > timestamps[tsIndx] \
-                        and not _np.isclose(t, timestamps[tsIndx], rtol=0., atol=1e-12):
-                    times.append(timestamps[tsIndx])
-                    counts.append(0)
-                    tsIndx += 1
-
-            if oli in olis and (timestamps is None or _np.isclose(t, timestamps[tsIndx], rtol=0., atol=1e-12)):
-                if not _np.isclose(t, last_t, rtol=0., atol=1e-12):
-                    times.append(t); tsIndx += 1
-                    counts.append(0)
-                    last_t = t
-                counts[-1] += 1 if (self.reps is None) else self.reps[i]
-
-        if timestamps is not None:
-            while tsIndx < len(timestamps):
-                times.append(timestamps[tsIndx])
-                counts.append(0)
-                tsIndx += 1
+            mask = _np.equal(self.oli, self.dataset.olIndex[outcomelabel])
+            times = self.time[mask]
+            reps = self.reps[mask] if (self.reps is not None) else None
+
+        if _np.any(_np.diff(times) < 0):  # binning below requires time-ordered data
+            order = _np.argsort(times, kind='stable')
+            times = times[order]
+            reps = reps[order] if (reps is not None) else None
+
+        if timestamps is None:
+            # bin the data by (consecutive) time stamp
+            newTime = _np.concatenate(([True], _np.abs(_np.diff(times)) > 1e-12)) if len(times) > 0 \
+                else _np.empty(0, bool)
+            counts = _np.bincount(_np.cumsum(newTime) - 1, reps, minlength=_np.count_nonzero(newTime))
+            times = times[newTime]
+        else:
+            # bin the data by the `timestamps` its time stamps are close to, ignoring other data
+            timestamps = _np.asarray(timestamps, self.dataset.timeType)
+            tsOrder = _np.argsort(timestamps, kind='stable')  # searchsorted needs sorted time stamps
+            iSorted = _np.searchsorted(timestamps, times - 1e-12, sorter=tsOrder)
+            bInRange = iSorted < len(timestamps)
+            iTimes = _np.zeros(len(times), _np.int64)
+            iTimes[bInRange] = tsOrder[iSorted[bInRange]]
+            bMatch = _np.zeros(len(times), bool)
+            bMatch[bInRange] = _np.abs(timestamps[iTimes[bInRange]] - times[bInRange]) <= 1e-12
+            counts = _np.bincount(iTimes[bMatch], reps[bMatch] if (reps is not None) else None,
+                                  minlength=len(timestamps))
+            times = timestamps
 
         return _np.array(times, self.dataset.timeType), \
             _np.array(counts, self.dataset.repType)
@@ -629,6 +590,14 @@ def _round_int_repcnt(nreps):
         return int(round(nreps))
 
 
+def _slices_to_indices(slices):
+    """ The indices of all the elements of the given list of slices (all with step 1), concatenated """
+    starts = _np.array([slc.start for slc in slices], _np.int64)
+    lengths = _np.array([slc.stop - slc.start for slc in slices], _np.int64)
+    offsets = _np.cumsum(lengths) - lengths
+    return _np.arange(_np.sum(lengths), dtype=_np.int64) + _np.repeat(starts - offsets, lengths)
+
+
 class DataSet(object):
     """
     The DataSet class associates circuits with counts or time series of
@@ -655,7 +624,7 @@ class DataSet(object):
                  circuits=None, circuitIndices=None,
                  outcomeLabels=None, outcomeLabelIndices=None,
                  bStatic=False, fileToLoadFrom=None, collisionAction="aggregate",
-                 comment=None, auxInfo=None):
+                 comment=None, auxInfo=None, sparse=False):
         """
         Initialize a DataSet.
 
@@ -728,6 +697,15 @@ class DataSet(object):
             Keys should be the circuits in this DataSet and value should
             be Python dictionaries.
 
+        sparse : bool, optional
+            When True, create a *sparse* DataSet, appropriate for data with very
+            many (e.g. 2^n for n qubits) possible outcomes, most of which are
+            never observed.  A sparse DataSet never stores zero counts (as if
+            `recordZeroCnts=False` were always given), and so only registers
+            the outcome labels that are actually observed.  Counts of outcome
+            labels that aren't registered are taken to be zero rather than
+            being an error.
+
         Returns
         -------
         DataSet
@@ -735,6 +713,7 @@ class DataSet(object):
         """
         # uuid for efficient hashing (set when done adding data or loading from file)
         self.uuid = None
+        self._lazy_circuits = None  # encoded circuits of a (columnar) DataSet whose cirIndex is built on demand
 
         #Optionally load from a file
         if fileToLoadFrom is not None:
@@ -808,7 +787,10 @@ class DataSet(object):
 
             if len(self.cirIndex) > 0:
                 maxOlIndex = self.olIndex_max
-                if bStatic:
+                if bStatic and isinstance(self.oliData, _np.ndarray):
+                    binIndices = _slices_to_indices(list(self.cirIndex.values()))
+                    assert(len(binIndices) == 0 or _np.amax(self.oliData[binIndices]) <= maxOlIndex)
+                elif bStatic:
                     assert(max([_np.amax(self.oliData[i]) if (len(self.oliData[i]) > 0) else 0
                                 for i in self.cirIndex.values()]) <= maxOlIndex)
                     # self.oliData.shape[0] > maxIndex doesn't make sense since cirIndex holds slices
@@ -842,6 +824,9 @@ class DataSet(object):
         # comment
         self.comment = comment
 
+        # whether zero counts are dropped (so only observed outcomes are registered)
+        self.sparse = sparse
+
         # self.ffdata : fourier filtering data
         self.ffdata = {}
 
@@ -861,11 +846,32 @@ class DataSet(object):
             self.cnt_cache = {opstr: _ld.OutcomeLabelDict() for opstr in self.cirIndex}
         else:
             self.cnt_cache = None
+        self.cntmx_cache = None  # (circuit-row-index, count matrix) computed by to_count_matrix when static
+
+    @property
+    def cirIndex(self):
+        """
+        Ordered dictionary mapping circuits to their data (slices into the oli,
+        time & rep arrays when static, integer list indices otherwise).  When
+        loaded from a columnar directory, the circuits are only built upon the
+        first access of this property.
+        """
+        if self._lazy_circuits is not None:
+            self._cirIndex = self._build_lazy_cirIndex(*self._lazy_circuits)
+            self._lazy_circuits = None
+        return self._cirIndex
+
+    @cirIndex.setter
+    def cirIndex(self, value):
+        self._cirIndex = value
+        self._lazy_circuits = None
 
     def __iter__(self):
         return self.cirIndex.__iter__()  # iterator over circuits
 
     def __len__(self):
+        if self._lazy_circuits is not None:
+            return len(self._lazy_circuits[-1])  # number of circuit slices (don't build the circuits)
         return len(self.cirIndex)
 
     def __contains__(self, circuit):
@@ -1043,6 +1049,221 @@ class DataSet(object):
         """
         return list(self.olIndex.keys())
 
+    def to_count_matrix(self, circuits, lookup, outcomes_lookup, nElements):
+        """
+        Get the counts of many circuits as arrays aligned with the "final
+        element" indices of an evaluation tree.
+
+        This is a vectorized equivalent of querying `self[circuit].counts`
+        for each circuit and placing the counts of the outcomes in
+        `outcomes_lookup[i]` into `counts[lookup[i]]`.  For a static DataSet,
+        the (sparse) per-circuit, per-outcome counts of the entire DataSet are
+        computed the first time this method is called and cached for later calls.
+
+        Parameters
+        ----------
+        circuits : list of Circuits
+            The circuits to get counts for (as they should be queried from this
+            DataSet, i.e. with any operation label aliases already applied).
+
+        lookup : dict
+            A dictionary whose keys are integer indices into `circuits` and
+            whose values are slices and/or integer-arrays into the returned
+            arrays, as returned by :method:`Model.bulk_evaltree`.
+
+        outcomes_lookup : dict
+            A dictionary whose keys are integer indices into `circuits` and
+            whose values are lists of outcome labels, giving the outcome of
+            each element in the corresponding `lookup` value.
+
+        nElements : int
+            The length of the returned arrays, usually the number of final
+            elements of the evaluation tree that `lookup` refers to (i.e.
+            `evalTree.num_final_elements()`).  The `lookup` values must
+            together cover every one of these elements.
+
+        Returns
+        -------
+        counts : numpy.ndarray
+            A 1D array of counts, such that `counts[lookup[i]]` holds the counts
+            of the outcomes `outcomes_lookup[i]` of `circuits[i]` (zero for
+            outcomes without data).
+        totals : numpy.ndarray
+            A 1D array, the same shape as `counts`, such that `totals[lookup[i]]`
+            holds the total number of counts of `circuits[i]`.
+        """
+        rowIndex, keys, cnts, _ = self._get_sparse_counts()
+        nCols = self.olIndex_max + 2
+        rowTotals = _np.bincount(keys // nCols, cnts, minlength=len(rowIndex))
+
+        #Map each final element to a (circuit row, outcome column) pair.  Outcomes
+        # not in this DataSet get column -1, which never matches a key (see _get_sparse_counts).
+        nEls = nElements
+        rows = _np.full(nEls, -1, _np.int64)  # -1 marks elements not (yet) covered by `lookup`
+        cols = _np.empty(nEls, _np.int64)
+        for i, circuit in enumerate(circuits):
+            if not isinstance(circuit, _cir.Circuit):
+                circuit = _cir.Circuit.fromtup(circuit)
+            rows[lookup[i]] = rowIndex[circuit]
+            cols[lookup[i]] = [self.olIndex.get(ol, -1) for ol in outcomes_lookup[i]]
+        assert(_np.all(rows >= 0)), "`lookup` does not cover all %d elements!" % nEls
+
+        elKeys = rows * nCols + cols
+        if len(keys) == 0:
+            return _np.zeros(nEls, 'd'), rowTotals[rows]
+        pos = _np.minimum(_np.searchsorted(keys, elKeys), len(keys) - 1)
+        return _np.where(keys[pos] == elKeys, cnts[pos], 0.0), rowTotals[rows]
+
+    def _get_count_matrix(self):
+        """
+        Returns a `(rowIndex, countMatrix)` tuple, where `rowIndex` maps each
+        circuit to a row of the 2D `countMatrix`, whose columns are indexed by
+        outcome label index (with one additional all-zeros final column).
+        """
+        rowIndex, keys, cnts, _ = self._get_sparse_counts()
+        cntMx = _np.zeros((len(rowIndex), self.olIndex_max + 2), 'd')  # +1 for the "missing outcome" column
+        cntMx.flat[keys] = cnts  # keys are flat indices into cntMx
+        return rowIndex, cntMx
+
+    def _get_sparse_counts(self):
+        """
+        Returns a `(rowIndex, keys, cnts, present)` tuple describing the counts
+        of all the circuits in a way that scales with the amount of data rather
+        than the number of outcome labels.  `rowIndex` maps each circuit to a
+        row index, and the sorted `keys` array holds `row * (olIndex_max + 2) + oli`
+        for each distinct (row, outcome label index) pair that has data.  The
+        corresponding elements of `cnts` and `present` give the total count
+        and the number of data bins of each such pair.
+        """
+        if self.cntmx_cache is not None:
+            return self.cntmx_cache
+
+        nCols = self.olIndex_max + 2  # +1 so that a "missing outcome" (index -1) never matches a key
+        rowIndex = {circuit: i for i, circuit in enumerate(self.cirIndex.keys())}
+        rowIds, olis, reps, _ = self._get_row_bins()
+        binKeys = rowIds * nCols + olis
+
+        if len(rowIndex) * nCols <= 4 * len(binKeys):  # few outcome labels, so a dense bincount is cheapest
+            present = _np.bincount(binKeys, minlength=len(rowIndex) * nCols)
+            keys = _np.flatnonzero(present)
+            cnts = present[keys] if (reps is None) else _np.bincount(binKeys, reps, minlength=len(present))[keys]
+            present = present[keys]
+        else:
+            keys, inv = _np.unique(binKeys, return_inverse=True)
+            present = _np.bincount(inv, minlength=len(keys))
+            cnts = present if (reps is None) else _np.bincount(inv, reps, minlength=len(keys))
+
+        ret = (rowIndex, keys, cnts.astype('d'), present)
+        if self.bStatic:
+            self.cntmx_cache = ret  # data can't change, so cache
+        return ret
+
+    def _get_row_bins(self):
+        """
+        Returns `(rowIds, olis, reps, times)` arrays giving the row (the index of
+        the circuit within `cirIndex`), outcome label index, repetition count
+        (`reps` is None when there are no repetition counts) and time stamp of
+        every data bin.
+        """
+        if self.bStatic:
+            #Gather the (possibly non-contiguous) data bins of each circuit: bin j of circuit k is at starts[k] + j
+            slices = list(self.cirIndex.values())
+            lengths = _np.array([slc.stop - slc.start for slc in slices], _np.int64)
+            binIndices = _slices_to_indices(slices)
+            olis = self.oliData[binIndices]
+            reps = self.repData[binIndices] if (self.repData is not None) else None
+            times = self.timeData[binIndices]
+        else:
+            indices = list(self.cirIndex.values())
+            lengths = _np.array([len(self.oliData[i]) for i in indices], _np.int64)
+            olis = _np.concatenate([self.oliData[i] for i in indices]) if indices else _np.empty(0, self.oliType)
+            reps = None if (self.repData is None) else \
+                (_np.concatenate([self.repData[i] for i in indices]) if indices else _np.empty(0, self.repType))
+            times = _np.concatenate([self.timeData[i] for i in indices]) if indices else _np.empty(0, self.timeType)
+        rowIds = _np.repeat(_np.arange(len(lengths), dtype=_np.int64), lengths)
+        return rowIds, olis.astype(_np.int64), reps, times
+
+    def _build_count_dict(self, olis, cnts, all_outcomes=False, cntDict=None):
+        """
+        Fills (a new, if `cntDict` is None) OutcomeLabelDict from the (sorted)
+        outcome label indices `olis` that have data bins and their counts
+        `cnts` (lists or arrays).  Outcomes without any data bins are only
+        included (with zero counts) when `all_outcomes` is True.
+        """
+        if cntDict is None: cntDict = _ld.OutcomeLabelDict()
+        olis = olis.tolist() if isinstance(olis, _np.ndarray) else olis
+        cnts = cnts.astype('d').tolist() if isinstance(cnts, _np.ndarray) else cnts
+        if all_outcomes:
+            values = dict(zip(olis, cnts))
+            for ol, i in self.olIndex.items():
+                cntDict.setitem_unsafe(ol, values.get(i, 0.0))
+        else:
+            if len(self.ol) != len(self.olIndex): self.update_ol()  # outcome labels were added w/update_ol=False
+            for i, value in zip(olis, cnts):
+                cntDict.setitem_unsafe(self.ol[i], value)
+        return cntDict
+
+    def get_counts_array(self, circuits=None):
+        """
+        Get the counts of many circuits as a 2D array, computed for all the
+        circuits at once.
+
+        Parameters
+        ----------
+        circuits : list, optional
+            The circuits (tuples or Circuits) to get counts for.  If None, all
+            the circuits of this DataSet are used (in order).
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape `(len(circuits), num_outcome_indices)` whose
+            `[i, j]` element is the count of the outcome with index `j` (see
+            `olIndex`) for the `i`-th circuit.
+        """
+        rowIndex, cntMx = self._get_count_matrix()
+        if circuits is None:
+            return cntMx[:, 0:-1].copy()  # (last column is zeros for missing outcomes)
+        rows = [rowIndex[c if isinstance(c, _cir.Circuit) else _cir.Circuit(c)] for c in circuits]
+        return cntMx[rows, 0:-1]
+
+    def get_all_row_counts(self, all_outcomes=False):
+        """
+        Get the counts of every circuit, computed for all the circuits at once.
+
+        This is much faster than accessing the `counts` of each row separately.
+        For static DataSets, the per-row count caches are filled so that
+        subsequent `counts` accesses of rows don't recompute anything.
+
+        Parameters
+        ----------
+        all_outcomes : bool, optional
+            Whether to include (zero) counts for the outcome labels of this
+            DataSet that don't appear in a given row.
+
+        Returns
+        -------
+        OrderedDict
+            A dictionary whose keys are circuits and values are
+            :class:`OutcomeLabelDict` objects of counts.
+        """
+        rowIndex, keys, cnts, _ = self._get_sparse_counts()
+        nCols = self.olIndex_max + 2
+        rows = keys // nCols
+        bounds = _np.searchsorted(rows, _np.arange(len(rowIndex) + 1)).tolist()  # row i is keys[bounds[i]:bounds[i+1]]
+        olis = (keys - rows * nCols).tolist()
+        cnts = cnts.tolist()
+
+        bFillCache = self.bStatic and not all_outcomes
+        ret = _OrderedDict()
+        for i, circuit in enumerate(self.cirIndex.keys()):
+            cntDict = None
+            if bFillCache:
+                cntDict = self.cnt_cache[circuit]; cntDict.clear()
+            b0, b1 = bounds[i], bounds[i + 1]
+            ret[circuit] = self._build_count_dict(olis[b0:b1], cnts[b0:b1], all_outcomes, cntDict)
+        return ret
+
     def get_gate_labels(self, prefix='G'):
         """
         Get a list of all the distinct operation labels used
@@ -1104,23 +1325,33 @@ class DataSet(object):
         if circuitList is None:
             circuitList = list(self.keys())
 
-        nDOF = 0
-        Nout = len(self.olIndex)
-        for opstr in circuitList:
-            dsRow = self[opstr]
-            cur_t = dsRow.time[0]
-            cur_outcomes = set()  # holds *distinct* outcomes at current time
-            for ol, t, rep in dsRow:
-                if aggregate_times or t == cur_t:
-                    cur_outcomes.add(ol)
-                else:
-                    #assume final outcome at each time is constrained
-                    nOutcomes = Nout if method == 'all_outcomes-1' else len(cur_outcomes)
-                    nDOF += nOutcomes - 1; cur_outcomes = set([ol])
-                    cur_t = t
-            nOutcomes = Nout if method == 'all_outcomes-1' else len(cur_outcomes)
-            nDOF += nOutcomes - 1  # last time stamp
-        return nDOF
+        #Data is tallied in "blocks" - the data of each row or (if not aggregate_times) each run of
+        # equal time stamps within a row - each contributing (number of outcomes - 1) degrees of freedom
+        nCols = self.olIndex_max + 2
+        if aggregate_times:
+            rowIndex, keys, _, _ = self._get_sparse_counts()
+            nRows = len(rowIndex)
+            nPresent = _np.bincount(keys // nCols, minlength=nRows)  # distinct outcomes of each row
+            nBlocks = (nPresent > 0).astype(_np.int64)
+        else:
+            rowIndex = {circuit: i for i, circuit in enumerate(self.cirIndex.keys())}
+            nRows = len(rowIndex)
+            rowIds, olis, _, times = self._get_row_bins()
+            newBlock = _np.ones(len(rowIds), bool)
+            newBlock[1:] = (rowIds[1:] != rowIds[:-1]) | (times[1:] != times[:-1])
+            blockRows = rowIds[newBlock]
+            blockIds = _np.cumsum(newBlock) - 1
+            blockPresent = _np.bincount(_np.unique(blockIds * nCols + olis) // nCols, minlength=len(blockRows))
+            nPresent = _np.bincount(blockRows, blockPresent, minlength=nRows).astype(_np.int64)
+            nBlocks = _np.bincount(blockRows, minlength=nRows)
+
+        #assume final outcome of each block is constrained
+        if method == 'all_outcomes-1':
+            rowDOF = nBlocks * (len(self.olIndex) - 1)
+        else:
+            rowDOF = nPresent - nBlocks
+        rows = [rowIndex[c if isinstance(c, _cir.Circuit) else _cir.Circuit(c)] for c in circuitList]
+        return int(_np.sum(rowDOF[rows]))
 
     def _keepseparate_update_circuit(self, circuit):
         if not isinstance(circuit, _cir.Circuit):
@@ -1165,7 +1396,8 @@ class DataSet(object):
         recordZeroCnts : bool, optional
             Whether zero-counts are actually recorded (stored) in this DataSet.
             If False, then zero counts are ignored, except for potentially
-            registering new outcome labels.
+            registering new outcome labels.  A sparse DataSet never records
+            (or registers the outcome labels of) zero counts.
 
         aux : dict, optional
             A dictionary of auxiliary meta information to be included with
@@ -1247,7 +1479,8 @@ class DataSet(object):
             Whether zero-counts (elements of `repCountList` that are zero) are
             actually recorded (stored) in this DataSet.  If False, then zero
             counts are ignored, except for potentially registering new outcome
-            labels.
+            labels.  A sparse DataSet never records (or registers the outcome
+            labels of) zero counts.
 
         aux : dict, optional
             A dictionary of auxiliary meta information to be included with
@@ -1271,6 +1504,13 @@ class DataSet(object):
         # if "keepseparate" mode, add tag onto end of circuit
         circuit = self._keepseparate_update_circuit(circuit)
 
+        if self.sparse and repCountList is not None and not all(repCountList):
+            # drop zero counts *before* registering outcome labels, so only observed outcomes are registered
+            nonzero = [i for i, rep in enumerate(repCountList) if rep != 0]
+            outcomeLabelList = [outcomeLabelList[i] for i in nonzero]
+            timeStampList = [timeStampList[i] for i in nonzero]
+            repCountList = [repCountList[i] for i in nonzero]
+
         if unsafe:
             tup_outcomeLabelList = outcomeLabelList
         else:
@@ -1415,7 +1655,8 @@ class DataSet(object):
         recordZeroCnts : bool, optional
             Whether zero-counts are actually recorded (stored) in the returned
             (merged) DataSet.  If False, then zero counts are ignored, except for
-            potentially registering new outcome labels.
+            potentially registering new outcome labels.  Zero counts are never
+            recorded when this DataSet is sparse (the merged DataSet is sparse too).
 
         Returns
         -------
@@ -1423,103 +1664,123 @@ class DataSet(object):
             The DataSet with outcomes merged according to the rules given in label_merge_dict.
         """
 
-        #static_self = self.copy()
-        #static_self.done_adding_data()  # makes static, so we can assume this below
+        return self._merge_outcomes([label_merge_dict], recordZeroCnts)[0]
+
+    def merge_outcomes_many(self, label_merge_dicts, recordZeroCnts=True):
+        """
+        Creates several DataSets, each merging certain outcomes of this DataSet,
+        in a single pass over its data.
+
+        This gives the same DataSets as calling :method:`merge_outcomes` for
+        each element of `label_merge_dicts`, but the work of grouping the data
+        by circuit and time is shared, so it's much faster when, e.g.,
+        marginalizing multi-qubit data onto many different subsets of qubits.
 
-        # strings -> tuple outcome labels in keys and values of label_merge_dict
+        Parameters
+        ----------
+        label_merge_dicts : list of dicts
+            The label-merge dictionaries (see :method:`merge_outcomes`), one per
+            returned DataSet.
+
+        recordZeroCnts : bool, optional
+            Whether zero-counts are actually recorded (stored) in the returned
+            (merged) DataSets.  Zero counts are never recorded when this DataSet
+            is sparse.
+
+        Returns
+        -------
+        list
+            A list of :class:`DataSet` objects corresponding to `label_merge_dicts`.
+        """
+        return self._merge_outcomes(label_merge_dicts, recordZeroCnts)
+
+    def _merge_outcomes(self, label_merge_dicts, recordZeroCnts, sortOutcomes=True, keepAux=False,
+                        dropZeroCnts=False):
+        """
+        Implements :method:`merge_outcomes_many`.  The data is grouped once
+        into blocks (runs of equal time stamps within each circuit's data), and
+        then for each merge dictionary the outcome indices are mapped through a
+        lookup array and the counts of each (block, new outcome) pair summed.
+        The new outcome labels (and so their indices) are sorted if `sortOutcomes`
+        is True, otherwise they're in the order of each dictionary's keys.  In
+        either case the merged counts within a block are stored in sorted
+        outcome-label order.  When `recordZeroCnts` is False, a merged count that
+        is zero is still stored if some of this DataSet's data was merged into it,
+        unless `dropZeroCnts` is True.  The auxiliary information of the circuits
+        is copied if `keepAux` is True.
+        """
+        if self.sparse: recordZeroCnts = False
         to_outcome = _ld.OutcomeLabelDict.to_outcome  # shorthand
-        label_merge_dict = {to_outcome(key): list(map(to_outcome, val))
-                            for key, val in label_merge_dict.items()}
-
-        merge_dict_old_outcomes = [outcome for sublist in label_merge_dict.values() for outcome in sublist]
-        if not set(self.get_outcome_labels()).issubset(merge_dict_old_outcomes):
-            raise ValueError(
-                "`label_merge_dict` must account for all the outcomes in original dataset."
-                " It's missing directives for:\n%s" %
-                '\n'.join(set(map(str, self.get_outcome_labels())) - set(map(str, merge_dict_old_outcomes)))
-            )
-
-        new_outcomes = sorted(list(label_merge_dict.keys()))
-        new_outcome_indices = _OrderedDict([(ol, i) for i, ol in enumerate(new_outcomes)])
-        nNewOutcomes = len(new_outcomes)
-
-        #Count the number of time steps so we allocate enough space
-        nSteps = 0
-        for key, dsrow in self.items():
-            cur_t = None
-            for t in dsrow.time:
-                if t != cur_t:
-                    nSteps += 1
-                    cur_t = t
-
-        #idea is that we create oliData, timeData, repData, and circuitIndices for the
-        # merged dataset rather than looping over insertion, as this is faster
-        oliData = _np.empty(nSteps * nNewOutcomes, self.oliType)
-        repData = _np.empty(nSteps * nNewOutcomes, self.repType)
-        timeData = _np.empty(nSteps * nNewOutcomes, self.timeType)
-
-        oli_map = {}  # maps old outcome label indices to new ones
-        for new_outcome, old_outcome_list in label_merge_dict.items():
-            new_index = new_outcome_indices[new_outcome]
-            for old_outcome in old_outcome_list:
-                oli_map[self.olIndex[old_outcome]] = new_index
-
-        #Future - when recordZeroCnts=False these may not need to be so large
-        new_olis = _np.array(range(nNewOutcomes), _np.int64)
-        new_cnts = _np.zeros(nNewOutcomes, self.repType)
-
-        if recordZeroCnts:
-            def add_cnts(t, cnts, offset):  # cnts is an array here
-                new_cnts[:] = 0
-                for nonzero_oli, cnt in cnts.items():
-                    new_cnts[nonzero_oli] = cnt
-                timeData[offset:offset + nNewOutcomes] = t
-                oliData[offset:offset + nNewOutcomes] = new_olis
-                repData[offset:offset + nNewOutcomes] = new_cnts  # a length-nNewOutcomes array
-                return nNewOutcomes
 
-        else:
-            def add_cnts(t, cnts, offset):  # cnts is a dict here
-                nNewCnts = len(cnts)
-                #new_olis = _np.empty(nNewCnts, _np.int64)
-                #new_cnts = _np.empty(nNewCnts, self.repType)
-                for ii, (nonzero_oli, cnt) in enumerate(cnts.items()):
-                    new_olis[ii] = nonzero_oli
-                    new_cnts[ii] = cnt
-                timeData[offset:offset + nNewCnts] = t
-                oliData[offset:offset + nNewCnts] = new_olis[0:nNewCnts]
-                repData[offset:offset + nNewCnts] = new_cnts[0:nNewCnts]
-                return nNewCnts  # return the number of added counts
-
-        k = 0  # beginning of current circuit data in 1D arrays: oliData, timeData, repData
-        circuitIndices = _OrderedDict()
-        for key, dsrow in self.items():
-
-            last_t = dsrow.time[0]
-
-            #Below code is faster version of: mapped_oli = [oli_map[x] for x in dsrow.oli]
-            mapped_oli = dsrow.oli.copy()
-            for from_oli, to_oli in oli_map.items():
-                mapped_oli[dsrow.oli == from_oli] = to_oli
-
-            reps = _np.ones(len(dsrow.time), self.timeType) if (self.repData is None) else dsrow.reps
-            cnts = _DefaultDict(lambda: 0)
-
-            i = 0  # offset to current timeslice
-            for oli, t, reps in zip(mapped_oli, dsrow.time, reps):
-                if t != last_t:
-                    i += add_cnts(last_t, cnts, k + i)
-                    last_t = t; cnts.clear()
-                cnts[oli] += reps
-            if len(cnts) > 0:
-                i += add_cnts(last_t, cnts, k + i)
-
-            circuitIndices[key] = slice(k, k + i)
-            k += i
-
-        merged_dataset = DataSet(oliData[0:k], timeData[0:k], repData[0:k], circuitIndices=circuitIndices,
-                                 outcomeLabelIndices=new_outcome_indices, bStatic=True)
-        return merged_dataset
+        rowIds, olis, reps, times = self._get_row_bins()
+        if reps is None: reps = _np.ones(len(olis), self.repType)
+        nRows = len(self.cirIndex)
+        newBlock = _np.ones(len(rowIds), bool)
+        newBlock[1:] = (rowIds[1:] != rowIds[:-1]) | (times[1:] != times[:-1])
+        blockIds = _np.cumsum(newBlock) - 1
+        blockRows = rowIds[newBlock]
+        blockTimes = times[newBlock]
+        nBlocks = len(blockRows)
+
+        merged_datasets = []
+        for label_merge_dict in label_merge_dicts:
+            # strings -> tuple outcome labels in keys and values of label_merge_dict
+            label_merge_dict = {to_outcome(key): list(map(to_outcome, val))
+                                for key, val in label_merge_dict.items()}
+
+            merge_dict_old_outcomes = [outcome for sublist in label_merge_dict.values() for outcome in sublist]
+            if not set(self.get_outcome_labels()).issubset(merge_dict_old_outcomes):
+                raise ValueError(
+                    "`label_merge_dict` must account for all the outcomes in original dataset."
+                    " It's missing directives for:\n%s" %
+                    '\n'.join(set(map(str, self.get_outcome_labels())) - set(map(str, merge_dict_old_outcomes)))
+                )
+
+            new_outcomes = sorted(label_merge_dict.keys()) if sortOutcomes else list(label_merge_dict.keys())
+            new_outcome_indices = _OrderedDict([(ol, i) for i, ol in enumerate(new_outcomes)])
+            nNewOutcomes = len(new_outcomes)
+            sorted_outcomes = sorted(new_outcomes)  # the order of the merged counts within a block
+            rank_to_oli = _np.array([new_outcome_indices[ol] for ol in sorted_outcomes], _np.int64)
+            new_outcome_ranks = {ol: i for i, ol in enumerate(sorted_outcomes)}
+
+            oli_map = _np.zeros(self.olIndex_max + 1, _np.int64)  # maps old outcome label indices to new ranks
+            for new_outcome, old_outcome_list in label_merge_dict.items():
+                for old_outcome in old_outcome_list:
+                    if old_outcome in self.olIndex:  # (other outcomes have no data)
+                        oli_map[self.olIndex[old_outcome]] = new_outcome_ranks[new_outcome]
+
+            #Sum the counts of each (block, new outcome) pair, identified by blockId * nNewOutcomes + new_rank
+            keys = blockIds * nNewOutcomes + oli_map[olis]
+            if recordZeroCnts or nBlocks * nNewOutcomes <= 4 * len(keys):  # a dense tally is cheap (or needed)
+                cnts = _np.bincount(keys, reps, minlength=nBlocks * nNewOutcomes)
+                if recordZeroCnts: binKeys = _np.arange(len(cnts))
+                elif dropZeroCnts: binKeys = _np.flatnonzero(cnts)
+                else: binKeys = _np.flatnonzero(_np.bincount(keys, minlength=nBlocks * nNewOutcomes))  # has data
+                cnts = cnts[binKeys]
+            elif len(keys) > 0:  # many outcomes: sort the keys and sum runs of equal keys
+                order = _np.argsort(keys, kind='stable')
+                sortedKeys = keys[order]
+                starts = _np.flatnonzero(_np.concatenate(([True], sortedKeys[1:] != sortedKeys[:-1])))
+                cnts = _np.add.reduceat(reps[order], starts)
+                binKeys = sortedKeys[starts]
+                if dropZeroCnts:
+                    nonzero = _np.flatnonzero(cnts)
+                    binKeys = binKeys[nonzero]; cnts = cnts[nonzero]
+            else:
+                binKeys = _np.empty(0, _np.int64); cnts = _np.empty(0, self.repType)
+
+            binBlocks = binKeys // nNewOutcomes
+            rowBounds = _np.searchsorted(blockRows[binBlocks], _np.arange(nRows + 1)).tolist()
+            circuitIndices = _OrderedDict([(circuit, slice(rowBounds[i], rowBounds[i + 1]))
+                                           for i, circuit in enumerate(self.cirIndex.keys())])
+            auxInfo = {circuit: aux.copy() for circuit, aux in self.auxInfo.items()} if keepAux else None
+            merged_dataset = DataSet(rank_to_oli[binKeys - binBlocks * nNewOutcomes].astype(self.oliType),
+                                     blockTimes[binBlocks], cnts.astype(self.repType),
+                                     circuitIndices=circuitIndices, outcomeLabelIndices=new_outcome_indices,
+                                     bStatic=True, auxInfo=auxInfo, sparse=self.sparse)
+            merged_dataset.uuid = _uuid.uuid4()
+            merged_datasets.append(merged_dataset)
+        return merged_datasets
 
     def add_auxiliary_info(self, circuit, aux):
         """
@@ -1698,7 +1959,7 @@ class DataSet(object):
         if self.bStatic:
             circuitIndices = []
             circuits = []
-            used_oli = set()
+            used_oli = _np.zeros(self.olIndex_max + 1, bool)
             for opstr in listOfCircuitsToKeep:
                 circuit = opstr if isinstance(opstr, _cir.Circuit) else _cir.Circuit(opstr)
 
@@ -1719,17 +1980,15 @@ class DataSet(object):
                 if missingAction != "raise": circuits.append(circuit)
                 i = self.cirIndex[circuit]
                 circuitIndices.append(i)
-                used_oli.update(self.oliData[i])
+                used_oli[self.oliData[i]] = True
 
             if missingAction == "raise": circuits = listOfCircuitsToKeep
             trunc_cirIndex = _OrderedDict(zip(circuits, circuitIndices))
-            trunc_olIndex = _OrderedDict([(self.ol[i], i) for i in sorted(used_oli)])
-            trunc_dataset = DataSet(self.oliData, self.timeData, self.repData,
-                                    circuitIndices=trunc_cirIndex,
-                                    outcomeLabelIndices=trunc_olIndex, bStatic=True)  # reference (don't copy) counts
+            trunc_olIndex = _OrderedDict([(self.ol[i], i) for i in map(int, _np.flatnonzero(used_oli))])
+            trunc_dataset = self._static_view(trunc_cirIndex, trunc_olIndex)  # reference (don't copy) counts
 
         else:
-            trunc_dataset = DataSet(outcomeLabels=[])  # let outcome labels be added automatically
+            trunc_dataset = DataSet(outcomeLabels=[], sparse=self.sparse)  # let outcome labels be added automatically
             for opstr in _lt.remove_duplicates(listOfCircuitsToKeep):
                 circuit = opstr if isinstance(opstr, _cir.Circuit) else _cir.Circuit(opstr)
                 if circuit in self.cirIndex:
@@ -1776,9 +2035,23 @@ class DataSet(object):
         Returns
         -------
         DataSet
-        """
+            When this DataSet is static and `aggregateToTime` is None, a
+            static *view* of this DataSet that shares its data arrays (no data
+            is copied).
+        """
+        if self.bStatic and aggregateToTime is None:
+            ds = self._time_slice_view(startTime, endTime)
+            if ds is not None:
+                if ds.repData is None:
+                    tot = sum([slc.stop - slc.start for slc in ds.cirIndex.values()])
+                else:
+                    tot = sum([ds.repData[slc].sum() for slc in ds.cirIndex.values()])
+                if tot == 0:
+                    _warnings.warn("No counts in the requested time range: empty DataSet created")
+                return ds
+
         tot = 0
-        ds = DataSet(outcomeLabelIndices=self.olIndex)
+        ds = DataSet(outcomeLabelIndices=self.olIndex, sparse=self.sparse)
         for opStr, dsRow in self.items():
 
             if dsRow.reps is None:
@@ -1811,6 +2084,37 @@ class DataSet(object):
         ds.done_adding_data()
         return ds
 
+    def _static_view(self, circuitIndices, outcomeLabelIndices=None):
+        """
+        Create a static DataSet holding the rows given by `circuitIndices`, a
+        dictionary of circuits and slices into this (static) DataSet's data
+        arrays.  The new DataSet references (doesn't copy) these arrays.
+        """
+        view = DataSet(self.oliData, self.timeData, self.repData, circuitIndices=circuitIndices,
+                       outcomeLabelIndices=self.olIndex if (outcomeLabelIndices is None) else outcomeLabelIndices,
+                       bStatic=True, collisionAction=self.collisionAction, sparse=self.sparse)
+        view.uuid = _uuid.uuid4()
+        return view
+
+    def _time_slice_view(self, startTime, endTime):
+        """
+        Create a static view of the [`startTime`,`endTime`) time window of this
+        (static) DataSet by narrowing each row's slice.  Returns None when
+        some row's time stamps aren't sorted, as then its window may not be
+        contiguous.
+        """
+        timeData = self.timeData
+        decreases = _np.flatnonzero(timeData[1:] < timeData[:-1])  # i where timeData[i+1] < timeData[i]
+        cirIndex = _OrderedDict()
+        for circuit, slc in self.cirIndex.items():
+            if len(decreases) > 0 and slc.stop - slc.start > 1:
+                k = _np.searchsorted(decreases, slc.start)
+                if k < len(decreases) and decreases[k] < slc.stop - 1:
+                    return None  # unsorted row
+            lo, hi = _np.searchsorted(timeData[slc], (startTime, endTime))
+            cirIndex[circuit] = slice(slc.start + int(lo), slc.start + int(hi))
+        return self._static_view(cirIndex)
+
     def process_circuits(self, processor_fn, aggregate=False):
         """
         Manipulate this DataSet's circuits (keys) according to `processor_fn`.
@@ -1834,39 +2138,46 @@ class DataSet(object):
         Returns
         -------
         None
-        """
-        if self.bStatic: raise ValueError("Cannot process_circuits on a static DataSet object")
 
-        to_delete = []
-        new_cirIndex = _OrderedDict()
-        for opstr, indx in self.cirIndex.items():
-            new_gstr = processor_fn(opstr)
-            if new_gstr is None:
-                to_delete.append(indx)
-            elif new_gstr not in new_cirIndex or not aggregate:
-                assert(isinstance(new_gstr, _cir.Circuit)), "`processor_fn` must return a Circuit!"
-                new_cirIndex[new_gstr] = indx
-            else:  # aggregate data from indx --> new_cirIndex[new_gstr]
-                # A subset of what is in add_raw_series_data(...), but we
-                # don't need to do many of the checks there since the
-                # incoming data is known to have no new outcome labels, etc.
-                assert(isinstance(new_gstr, _cir.Circuit)), "`processor_fn` must return a Circuit!"
-                iSrc, iDest = indx, new_cirIndex[new_gstr]
-                self.oliData[iDest] = _np.concatenate((self.oliData[iDest], self.oliData[iSrc]))
-                self.timeData[iDest] = _np.concatenate((self.timeData[iDest], self.timeData[iSrc]))
-                if self.repData is not None:
-                    self.repData[iDest] = _np.concatenate((self.repData[iDest], self.repData[iSrc]))
-                #FUTURE: just add counts for same timestamp & same outcome
-                #  label data? (and in add_raw_series_data(...) too).
-
-                # mark indx for deletion (don't do it yet, as this will
-                # mess up the values in new_cirIndex)
-                to_delete.append(indx)
+        Notes
+        -----
+        A static DataSet's data arrays aren't modified: circuits are renamed and
+        removed by rebuilding the circuit index, and new arrays are only created
+        when data is aggregated.
+        """
+        if self.bStatic:
+            self._process_static_circuits(processor_fn, aggregate)
+        else:
+            to_delete = []
+            new_cirIndex = _OrderedDict()
+            for opstr, indx in self.cirIndex.items():
+                new_gstr = processor_fn(opstr)
+                if new_gstr is None:
+                    to_delete.append(indx)
+                elif new_gstr not in new_cirIndex or not aggregate:
+                    assert(isinstance(new_gstr, _cir.Circuit)), "`processor_fn` must return a Circuit!"
+                    new_cirIndex[new_gstr] = indx
+                else:  # aggregate data from indx --> new_cirIndex[new_gstr]
+                    # A subset of what is in add_raw_series_data(...), but we
+                    # don't need to do many of the checks there since the
+                    # incoming data is known to have no new outcome labels, etc.
+                    assert(isinstance(new_gstr, _cir.Circuit)), "`processor_fn` must return a Circuit!"
+                    iSrc, iDest = indx, new_cirIndex[new_gstr]
+                    self.oliData[iDest] = _np.concatenate((self.oliData[iDest], self.oliData[iSrc]))
+                    self.timeData[iDest] = _np.concatenate((self.timeData[iDest], self.timeData[iSrc]))
+                    if self.repData is not None:
+                        self.repData[iDest] = _np.concatenate((self.repData[iDest], self.repData[iSrc]))
+                    #FUTURE: just add counts for same timestamp & same outcome
+                    #  label data? (and in add_raw_series_data(...) too).
+
+                    # mark indx for deletion (don't do it yet, as this will
+                    # mess up the values in new_cirIndex)
+                    to_delete.append(indx)
 
-        self.cirIndex = new_cirIndex
-        self._remove(to_delete)
+            self.cirIndex = new_cirIndex
+            self._remove(to_delete)
 
-        #Note: self.cnt_cache just remains None (a non-static DataSet)
+            #Note: self.cnt_cache just remains None (a non-static DataSet)
 
         #Process self.auxInfo
         auxInfo = _DefaultDict(dict)
@@ -1881,6 +2192,43 @@ class DataSet(object):
                 auxInfo[new_gstr].update(self.auxInfo[opstr])
         self.auxInfo = auxInfo
 
+    def _process_static_circuits(self, processor_fn, aggregate):
+        """
+        :method:`process_circuits` for a static DataSet.  Since the data arrays
+        may be shared with other (view) DataSets, they are never written to, and
+        only replaced - by arrays that gather each new circuit's data - when
+        the data of several circuits is aggregated.
+        """
+        new_cirIndex = _OrderedDict()
+        merged = {}  # new circuit -> slices of all the circuits it aggregates
+        for opstr, slc in self.cirIndex.items():
+            new_gstr = processor_fn(opstr)
+            if new_gstr is None:
+                continue
+            assert(isinstance(new_gstr, _cir.Circuit)), "`processor_fn` must return a Circuit!"
+            if new_gstr in new_cirIndex and aggregate:
+                merged.setdefault(new_gstr, [new_cirIndex[new_gstr]]).append(slc)
+            else:
+                new_cirIndex[new_gstr] = slc
+
+        if len(merged) > 0:
+            rows = [merged.get(circuit, [slc]) for circuit, slc in new_cirIndex.items()]
+            indices = _slices_to_indices([slc for row in rows for slc in row])
+            curIndx = 0
+            for circuit, row in zip(list(new_cirIndex.keys()), rows):
+                rowLen = sum([slc.stop - slc.start for slc in row])
+                new_cirIndex[circuit] = slice(curIndx, curIndx + rowLen)
+                curIndx += rowLen
+            self.oliData = self.oliData[indices]
+            self.timeData = self.timeData[indices]
+            if self.repData is not None:
+                self.repData = self.repData[indices]
+
+        self.cirIndex = new_cirIndex
+        self.cnt_cache = {opstr: _ld.OutcomeLabelDict() for opstr in self.cirIndex}
+        self.cntmx_cache = None
+        self.uuid = _uuid.uuid4()
+
     def remove(self, circuits, missingAction="raise"):
         """
         Remove (delete) the data for `circuits` from this :class:`DataSet`.
@@ -1966,7 +2314,7 @@ class DataSet(object):
             return self  # doesn't need to be copied since data can't change
         else:
             copyOfMe = DataSet(outcomeLabels=self.get_outcome_labels(),
-                               collisionAction=self.collisionAction)
+                               collisionAction=self.collisionAction, sparse=self.sparse)
             copyOfMe.cirIndex = _copy.deepcopy(self.cirIndex)
             copyOfMe.oliData = [el.copy() for el in self.oliData]
             copyOfMe.timeData = [el.copy() for el in self.timeData]
@@ -1978,6 +2326,7 @@ class DataSet(object):
             copyOfMe.timeType = self.timeType
             copyOfMe.repType = self.repType
             copyOfMe.cnt_cache = None
+            copyOfMe.cntmx_cache = None
             copyOfMe.auxInfo = self.auxInfo.copy()
             return copyOfMe
 
@@ -1985,7 +2334,7 @@ class DataSet(object):
         """ Make a non-static copy of this DataSet. """
         if self.bStatic:
             copyOfMe = DataSet(outcomeLabels=self.get_outcome_labels(),
-                               collisionAction=self.collisionAction)
+                               collisionAction=self.collisionAction, sparse=self.sparse)
             copyOfMe.cirIndex = _OrderedDict([(opstr, i) for i, opstr in enumerate(self.cirIndex.keys())])
             copyOfMe.oliData = []
             copyOfMe.timeData = []
@@ -2000,11 +2349,51 @@ class DataSet(object):
             copyOfMe.timeType = self.timeType
             copyOfMe.repType = self.repType
             copyOfMe.cnt_cache = None
+            copyOfMe.cntmx_cache = None
             copyOfMe.auxInfo = self.auxInfo.copy()
             return copyOfMe
         else:
             return self.copy()
 
+    def _is_compact(self):
+        """ Whether this static DataSet's data arrays hold exactly its rows, in order """
+        end = 0
+        for slc in self.cirIndex.values():
+            if slc.start != end: return False
+            end = slc.stop
+        return end == len(self.oliData)
+
+    def compact(self):
+        """
+        Get a static DataSet whose data arrays hold exactly this DataSet's data.
+
+        The static DataSets returned by :method:`truncate` and :method:`time_slice`
+        are *views* that reference (parts of) the data arrays of the DataSet
+        they're created from, and :method:`process_circuits` may leave unused
+        data in a static DataSet's arrays.  This method copies just the data
+        of such a DataSet into new, contiguous, arrays, e.g. before it's saved.
+        When this DataSet is not static or already compact, it is returned as is.
+
+        Returns
+        -------
+        DataSet
+        """
+        if not self.bStatic or self._is_compact():
+            return self
+        slices = list(self.cirIndex.values())
+        indices = _slices_to_indices(slices)
+        cirIndex = _OrderedDict(); curIndx = 0
+        for circuit, slc in zip(self.cirIndex.keys(), slices):
+            cirIndex[circuit] = slice(curIndx, curIndx + slc.stop - slc.start)
+            curIndx += slc.stop - slc.start
+        ds = DataSet(self.oliData[indices], self.timeData[indices],
+                     self.repData[indices] if (self.repData is not None) else None,
+                     circuitIndices=cirIndex, outcomeLabelIndices=self.olIndex, bStatic=True,
+                     collisionAction=self.collisionAction, comment=self.comment, auxInfo=self.auxInfo,
+                     sparse=self.sparse)
+        ds.uuid = self.uuid  # same data, so the same uuid
+        return ds
+
     def done_adding_data(self):
         """
         Promotes a non-static DataSet to a static (read-only) DataSet.  This
@@ -2051,10 +2440,13 @@ class DataSet(object):
                 self.repData = _np.empty((0,), self.repType)
 
         self.cnt_cache = {opstr: _ld.OutcomeLabelDict() for opstr in self.cirIndex}
+        self.cntmx_cache = None
         self.bStatic = True
         self.uuid = _uuid.uuid4()
 
     def __getstate__(self):
+        if self.bStatic and not self._is_compact():
+            return self.compact().__getstate__()  # don't pickle the data of other (viewed) DataSets
         toPickle = {'cirIndexKeys': list(map(_cir.CompressedCircuit, self.cirIndex.keys())),
                     'cirIndexVals': list(self.cirIndex.values()),
                     'olIndex': self.olIndex,
@@ -2070,7 +2462,8 @@ class DataSet(object):
                     'collisionAction': self.collisionAction,
                     'uuid': self.uuid,
                     'auxInfo': self.auxInfo,
-                    'comment': self.comment}
+                    'comment': self.comment,
+                    'sparse': self.sparse}
         return toPickle
 
     def __setstate__(self, state_dict):
@@ -2125,7 +2518,9 @@ class DataSet(object):
             if bStatic:  # always empty - don't save this, just init
                 self.cnt_cache = {opstr: _ld.OutcomeLabelDict() for opstr in self.cirIndex}
             else: self.cnt_cache = None
+            self.cntmx_cache = None
 
+        self.sparse = state_dict.get('sparse', False)
         self.auxInfo = state_dict.get('auxInfo', _DefaultDict(dict))
         if not isinstance(self.auxInfo, _DefaultDict) and isinstance(self.auxInfo, dict):
             self.auxInfo = _DefaultDict(dict, self.auxInfo)
@@ -2149,6 +2544,8 @@ class DataSet(object):
         -------
         None
         """
+        if self.bStatic and not self._is_compact():
+            return self.compact().save(fileOrFilename)
 
         toPickle = {'cirIndexKeys': list(map(_cir.CompressedCircuit, self.cirIndex.keys())) if self.cirIndex else [],
                     'cirIndexVals': list(self.cirIndex.values()) if self.cirIndex else [],
@@ -2163,7 +2560,8 @@ class DataSet(object):
                     'collisionAction': self.collisionAction,
                     'uuid': self.uuid,
                     'auxInfo': self.auxInfo,
-                    'comment': self.comment}  # Don't pickle counts numpy data b/c it's inefficient
+                    'comment': self.comment,
+                    'sparse': self.sparse}  # Don't pickle counts numpy data b/c it's inefficient
         if not self.bStatic: toPickle['nRows'] = len(self.oliData)
 
         bOpen = isinstance(fileOrFilename, str)
@@ -2197,12 +2595,17 @@ class DataSet(object):
         ----------
         fileOrFilename string or file object.
             If a string,  interpreted as a filename.  If this filename ends
-            in ".gz", the file will be gzip uncompressed as it is read.
+            in ".gz", the file will be gzip uncompressed as it is read.  If
+            it is the name of a directory, the DataSet is loaded from the
+            columnar format written by :method:`save_columnar`.
 
         Returns
         -------
         None
         """
+        if isinstance(fileOrFilename, str) and _os.path.isdir(fileOrFilename):
+            return self.load_columnar(fileOrFilename)
+
         bOpen = isinstance(fileOrFilename, str)
         if bOpen:
             if fileOrFilename.endswith(".gz"):
@@ -2250,6 +2653,7 @@ class DataSet(object):
         self.uuid = state_dict['uuid']
         self.auxInfo = state_dict.get('auxInfo', _DefaultDict(dict))  # backward compat
         self.comment = state_dict.get('comment', '')  # backward compat
+        self.sparse = state_dict.get('sparse', False)  # backward compat
 
         useReps = state_dict['useReps']
 
@@ -2275,9 +2679,142 @@ class DataSet(object):
             else:
                 self.repData = None
             self.cnt_cache = None
+        self.cntmx_cache = None
 
         if bOpen: f.close()
 
+    def save_columnar(self, dirname):
+        """
+        Save this DataSet to a directory in a binary, column-oriented format.
+
+        Unlike :method:`save`, no circuits are pickled: the distinct layer labels
+        and line labels are stored once, in small lookup tables, and each
+        circuit as a range of integer layer codes.  The outcome-index, time and
+        repetition data are stored as raw `.npy` files, so that they can be
+        memory-mapped by :method:`load_columnar`.  A non-static DataSet is saved
+        as the static DataSet it would become after :method:`done_adding_data`.
+
+        Parameters
+        ----------
+        dirname : str
+            The directory to create (if needed) and save into.
+
+        Returns
+        -------
+        None
+        """
+        if self.bStatic:
+            ds = self.compact()
+        else:
+            ds = self.copy(); ds.done_adding_data()
+
+        layerIndex = _OrderedDict(); lineIndex = _OrderedDict()
+        codes = []; offsets = [0]; lines = []; slices = []
+        for circuit, slc in ds.cirIndex.items():
+            for layer in circuit.layertup:
+                codes.append(layerIndex.setdefault(layer, len(layerIndex)))
+            offsets.append(len(codes))
+            lines.append(lineIndex.setdefault(circuit.line_labels, len(lineIndex)))
+            slices.append((slc.start, slc.stop))
+        circuitRows = {circuit: i for i, circuit in enumerate(ds.cirIndex.keys())}
+
+        meta = {'version': 1,
+                'layerLabels': list(layerIndex.keys()),
+                'lineLabels': list(lineIndex.keys()),
+                'olIndex': ds.olIndex,
+                'olIndex_max': ds.olIndex_max,
+                'oliType': _np.dtype(ds.oliType).str,
+                'timeType': _np.dtype(ds.timeType).str,
+                'repType': _np.dtype(ds.repType).str,
+                'useReps': bool(ds.repData is not None),
+                'collisionAction': ds.collisionAction,
+                'uuid': ds.uuid,
+                'auxInfo': {circuitRows[c]: aux for c, aux in ds.auxInfo.items() if c in circuitRows},
+                'comment': ds.comment,
+                'sparse': ds.sparse}
+
+        if not _os.path.isdir(dirname): _os.makedirs(dirname)
+        with open(_os.path.join(dirname, 'meta.pkl'), 'wb') as f:
+            _pickle.dump(meta, f)
+        _np.save(_os.path.join(dirname, 'circuit_layers.npy'), _np.array(codes, _np.int32))
+        _np.save(_os.path.join(dirname, 'circuit_offsets.npy'), _np.array(offsets, _np.int64))
+        _np.save(_os.path.join(dirname, 'circuit_lines.npy'), _np.array(lines, _np.int32))
+        _np.save(_os.path.join(dirname, 'circuit_slices.npy'), _np.array(slices, _np.int64).reshape((-1, 2)))
+        _np.save(_os.path.join(dirname, 'oli.npy'), ds.oliData)
+        _np.save(_os.path.join(dirname, 'time.npy'), ds.timeData)
+        if ds.repData is not None:
+            _np.save(_os.path.join(dirname, 'reps.npy'), ds.repData)
+
+    def load_columnar(self, dirname, mmap=True):
+        """
+        Load a static DataSet from a directory written by :method:`save_columnar`,
+        clearing any data is contained previously.
+
+        Only the small label tables are read eagerly.  When `mmap` is True the
+        data arrays are memory-mapped (read-only) rather than read, and in any
+        case the circuits themselves are only built when they're first needed,
+        so that even very large data sets open quickly.
+
+        Parameters
+        ----------
+        dirname : str
+            The directory to load from.
+
+        mmap : bool, optional
+            Whether to memory-map the data arrays instead of reading them
+            into memory.
+
+        Returns
+        -------
+        None
+        """
+        with open(_os.path.join(dirname, 'meta.pkl'), 'rb') as f:
+            meta = _pickle.load(f)
+        mmap_mode = 'r' if mmap else None
+
+        def load_array(name):
+            return _np.load(_os.path.join(dirname, name), mmap_mode=mmap_mode)
+
+        self.olIndex = meta['olIndex']
+        self.olIndex_max = meta['olIndex_max']
+        self.ol = _OrderedDict([(i, ol) for (ol, i) in self.olIndex.items()])
+        self.bStatic = True
+        self.oliType = _np.dtype(meta['oliType'])
+        self.timeType = _np.dtype(meta['timeType'])
+        self.repType = _np.dtype(meta['repType'])
+        self.collisionAction = meta['collisionAction']
+        self.uuid = meta['uuid']
+        self.comment = meta['comment']
+        self.sparse = meta.get('sparse', False)
+        self.ffdata = {}
+
+        self.oliData = load_array('oli.npy')
+        self.timeData = load_array('time.npy')
+        self.repData = load_array('reps.npy') if meta['useReps'] else None
+
+        # circuit-keyed members that can be filled without building the circuits
+        self.cirIndex = None
+        self._lazy_circuits = (meta['layerLabels'], meta['lineLabels'], load_array('circuit_layers.npy'),
+                               load_array('circuit_offsets.npy'), load_array('circuit_lines.npy'),
+                               load_array('circuit_slices.npy'))
+        self.cnt_cache = _DefaultDict(_ld.OutcomeLabelDict)
+        self.cntmx_cache = None
+        self.auxInfo = _DefaultDict(dict)
+        if len(meta['auxInfo']) > 0:
+            circuits = list(self.cirIndex.keys())
+            self.auxInfo.update({circuits[i]: aux for i, aux in meta['auxInfo'].items()})
+
+    @staticmethod
+    def _build_lazy_cirIndex(layerLabels, lineLabels, codes, offsets, lines, slices):
+        """ Builds the circuit index of a DataSet loaded by :method:`load_columnar` """
+        codes = codes.tolist(); offsets = offsets.tolist()  # python ints are faster to work with
+        cirIndex = _OrderedDict()
+        for i, (line_index, (start, stop)) in enumerate(zip(lines.tolist(), slices.tolist())):
+            layers = tuple([layerLabels[c] for c in codes[offsets[i]:offsets[i + 1]]])
+            circuit = _cir.Circuit(layers, lineLabels[line_index], check=False, expand_subcircuits=False)
+            cirIndex[circuit] = slice(start, stop)
+        return cirIndex
+
     def rename_outcome_labels(self, old_to_new_dict):
         """
         Replaces existing output labels with new ones as per `old_to_new_dict`.
@@ -0,0 +1,317 @@
+""" Defines the DataSetBuilder class """
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import numpy as _np
+import uuid as _uuid
+
+from collections import OrderedDict as _OrderedDict
+
+from . import circuit as _cir
+from . import labeldicts as _ld
+from . import dataset as _ds
+
+
+class DataSetBuilder(object):
+    """
+    An append-only accumulator of (time-series) data that publishes static
+    :class:`DataSet` snapshots.
+
+    Whereas a non-static DataSet concatenates each new piece of data onto a
+    per-circuit array (so that every append reallocates), a DataSetBuilder
+    holds all of its data in single outcome-index, time and repetition arrays
+    that grow geometrically.  Each circuit owns a contiguous region of these
+    arrays whose capacity is doubled (by moving the circuit's data to the end
+    of the arrays) when it fills up, so appends take amortized constant time.
+
+    A circuit's data is never overwritten once written (a moved circuit leaves
+    its old region untouched), so :method:`snapshot` can return a static
+    DataSet whose data arrays are read-only *views* of the builder's arrays:
+    publishing a snapshot doesn't copy any data, and the data of each circuit
+    in a snapshot remains valid (and unchanged) as more data is added to the
+    builder.  Note that a snapshot's arrays (e.g. its `oliData`) also span the
+    bins that lie outside all of its circuits' regions - zero-filled spare
+    capacity, which later appends may write to, and the old regions of moved
+    circuits.
+    """
+
+    def __init__(self, outcomeLabels=None, comment=None, initialRowCapacity=16, initialCapacity=1024):
+        """
+        Create a new, empty, DataSetBuilder.
+
+        Parameters
+        ----------
+        outcomeLabels : list, optional
+            Outcome labels to register (in this order) before any data is
+            added.  Other outcome labels are registered as they are encountered.
+
+        comment : string, optional
+            A user-specified comment string that is given to snapshots.
+
+        initialRowCapacity : int, optional
+            The number of data bins initially reserved for each circuit.
+
+        initialCapacity : int, optional
+            The initial total number of data bins the internal arrays can hold.
+        """
+        self.olIndex = _OrderedDict()
+        if outcomeLabels is not None:
+            for ol in outcomeLabels:
+                self.olIndex[_ld.OutcomeLabelDict.to_outcome(ol)] = len(self.olIndex)
+        self.comment = comment
+        self.auxInfo = _OrderedDict()
+        self.initialRowCapacity = max(int(initialRowCapacity), 1)
+
+        capacity = max(int(initialCapacity), 1)
+        self._oli = _np.zeros(capacity, _ds.Oindex_type)  # zeros => unused bins are never garbage
+        self._time = _np.zeros(capacity, _ds.Time_type)
+        self._reps = _np.zeros(capacity, _ds.Repcount_type)
+        self._end = 0  # arrays are only ever written at or beyond this index, or within a row's capacity
+        self._bHaveReps = False  # whether any repetition counts have been given (otherwise all are 1)
+
+        self.cirIndex = _OrderedDict()  # circuit -> row index
+        self._rowStarts = []
+        self._rowLens = []
+        self._rowCaps = []
+        self._snapshot = None  # the latest snapshot, while it is up to date
+
+    def __len__(self):
+        return len(self.cirIndex)
+
+    def __contains__(self, circuit):
+        if not isinstance(circuit, _cir.Circuit):
+            circuit = _cir.Circuit(circuit)
+        return circuit in self.cirIndex
+
+    def get_outcome_labels(self):
+        """
+        Get a list of *all* the outcome labels contained in this builder.
+
+        Returns
+        -------
+        list of strings or tuples
+        """
+        return list(self.olIndex.keys())
+
+    def num_bins(self):
+        """
+        The total number of data bins, i.e. (outcome, time, repetition) triples, added so far.
+
+        Returns
+        -------
+        int
+        """
+        return sum(self._rowLens)
+
+    def add_raw_series_data(self, circuit, outcomeLabelList, timeStampList,
+                            repCountList=None, recordZeroCnts=True, aux=None):
+        """
+        Append time-series data for a single circuit.
+
+        Parameters
+        ----------
+        circuit : tuple or Circuit
+            A tuple of operation labels specifying the circuit or a Circuit object
+
+        outcomeLabelList : list
+            A list of outcome labels (strings or tuples), one per data bin.
+
+        timeStampList : list
+            A list of floating point timestamps, each associated with the single
+            corresponding outcome in `outcomeLabelList`.
+
+        repCountList : list, optional
+            A list of counts specifying how many outcomes of type given by
+            `outcomeLabelList` occurred at the time given by `timeStampList`.
+            If None, then all counts are assumed to be 1.
+
+        recordZeroCnts : bool, optional
+            Whether zero-counts (elements of `repCountList` that are zero) are
+            actually recorded.  If False, then zero counts are ignored, except
+            for registering new outcome labels.
+
+        aux : dict, optional
+            A dictionary of auxiliary meta information associated with `circuit`.
+
+        Returns
+        -------
+        None
+        """
+        iRow = self._get_row(circuit, aux)
+        olis = _np.array([self._get_oli(ol) for ol in outcomeLabelList], _ds.Oindex_type)
+        times = _np.asarray(timeStampList, _ds.Time_type)
+        assert(olis.shape == times.shape), "Outcome-label and time stamp lists must have the same length!"
+        if repCountList is None:
+            reps = _np.ones(len(olis), _ds.Repcount_type)
+        else:
+            reps = _np.asarray(repCountList, _ds.Repcount_type)
+            assert(reps.shape == olis.shape), "Outcome-label and repetition lists must have the same length!"
+            self._bHaveReps = True
+            if not recordZeroCnts:
+                mask = reps != 0
+                olis, times, reps = olis[mask], times[mask], reps[mask]
+        self._append(iRow, olis, times, reps)
+
+    def add_count_dict(self, circuit, countDict, timestamp=0.0, recordZeroCnts=True, aux=None):
+        """
+        Append the counts of a single circuit at a single time.
+
+        Parameters
+        ----------
+        circuit : tuple or Circuit
+            A tuple of operation labels specifying the circuit or a Circuit object
+
+        countDict : dict
+            A dictionary with keys = outcome labels and values = counts
+
+        timestamp : float, optional
+            The time associated with these counts.
+
+        recordZeroCnts : bool, optional
+            Whether zero-counts are actually recorded.
+
+        aux : dict, optional
+            A dictionary of auxiliary meta information associated with `circuit`.
+
+        Returns
+        -------
+        None
+        """
+        self.add_raw_series_data(circuit, list(countDict.keys()), [timestamp] * len(countDict),
+                                 list(countDict.values()), recordZeroCnts, aux)
+
+    def add_raw_series_batch(self, circuits, outcomeLabelList, timeStampList, repCountList=None):
+        """
+        Append a batch of data bins (e.g. single shots) belonging to any number of circuits.
+
+        This is the most efficient way of adding many bins, since data is
+        appended to each circuit's region of the internal arrays with a single
+        vectorized operation.  The bins of each circuit are appended in the
+        order they are given.
+
+        Parameters
+        ----------
+        circuits : list
+            The circuit (a tuple of operation labels or a Circuit) of each bin.
+
+        outcomeLabelList : list
+            The outcome label of each bin.
+
+        timeStampList : list or numpy.ndarray
+            The time stamp of each bin.
+
+        repCountList : list or numpy.ndarray, optional
+            The repetition count of each bin.  If None, all counts are 1.
+
+        Returns
+        -------
+        None
+        """
+        rowCache = {}  # avoids repeated Circuit construction & lookup when circuits are repeated
+        rows = _np.array([rowCache[c] if c in rowCache else rowCache.setdefault(c, self._get_row(c, None))
+                          for c in circuits], _np.int64)
+        olis = _np.array([self._get_oli(ol) for ol in outcomeLabelList], _ds.Oindex_type)
+        times = _np.asarray(timeStampList, _ds.Time_type)
+        assert(olis.shape == times.shape == rows.shape), "Circuit, outcome-label and time stamp lists must " \
+            + "have the same length!"
+        if repCountList is None:
+            reps = _np.ones(len(olis), _ds.Repcount_type)
+        else:
+            reps = _np.asarray(repCountList, _ds.Repcount_type)
+            self._bHaveReps = True
+
+        order = _np.argsort(rows, kind='stable')  # group bins by row, preserving their order within each row
+        sortedRows = rows[order]
+        boundaries = _np.flatnonzero(_np.diff(sortedRows)) + 1
+        for start, end in zip(_np.concatenate(([0], boundaries)), _np.concatenate((boundaries, [len(rows)]))):
+            if start == end: continue  # only possible for an empty batch
+            indices = order[start:end]
+            self._append(int(sortedRows[start]), olis[indices], times[indices], reps[indices])
+
+    def snapshot(self):
+        """
+        Get a static DataSet holding all the data added so far.
+
+        The returned DataSet's data arrays are read-only views into this
+        builder's arrays (no data is copied), and its circuits' data is
+        unaffected by data added later (only bins outside of every circuit's
+        region, which are initially zero, can change).  While no data has been
+        added since the last call, the same DataSet is returned.
+
+        Returns
+        -------
+        DataSet
+        """
+        if self._snapshot is not None:
+            return self._snapshot
+
+        def view(ar):
+            v = ar[0:self._end]
+            v.flags.writeable = False
+            return v
+
+        cirIndex = _OrderedDict([(circuit, slice(self._rowStarts[i], self._rowStarts[i] + self._rowLens[i]))
+                                 for circuit, i in self.cirIndex.items()])
+        ds = _ds.DataSet(view(self._oli), view(self._time), view(self._reps) if self._bHaveReps else None,
+                         circuitIndices=cirIndex, outcomeLabelIndices=_OrderedDict(self.olIndex),
+                         bStatic=True, comment=self.comment,
+                         auxInfo={circuit: aux.copy() for circuit, aux in self.auxInfo.items()})
+        ds.uuid = _uuid.uuid4()
+        self._snapshot = ds
+        return ds
+
+    def _get_oli(self, outcomeLabel):
+        ol = _ld.OutcomeLabelDict.to_outcome(outcomeLabel)
+        if ol not in self.olIndex:
+            self.olIndex[ol] = len(self.olIndex)
+        return self.olIndex[ol]
+
+    def _get_row(self, circuit, aux):
+        if not isinstance(circuit, _cir.Circuit):
+            circuit = _cir.Circuit(circuit)
+        if circuit not in self.cirIndex:
+            self.cirIndex[circuit] = len(self._rowStarts)
+            self._rowStarts.append(self._reserve(self.initialRowCapacity))
+            self._rowLens.append(0)
+            self._rowCaps.append(self.initialRowCapacity)
+        if aux is not None:
+            self.auxInfo[circuit] = dict(aux)
+        return self.cirIndex[circuit]
+
+    def _reserve(self, n):
+        """ Reserve `n` bins at the end of the data arrays (growing them as needed); returns their start. """
+        start = self._end
+        if start + n > len(self._oli):
+            # new arrays: existing snapshots keep referencing the old ones (which are no longer written to)
+            capacity = max(2 * len(self._oli), start + n)
+            for attr in ('_oli', '_time', '_reps'):
+                old = getattr(self, attr)
+                new = _np.zeros(capacity, old.dtype)
+                new[0:start] = old[0:start]
+                setattr(self, attr, new)
+        self._end = start + n
+        return start
+
+    def _append(self, iRow, olis, times, reps):
+        n = len(olis)
+        if n == 0: return
+        start, length, cap = self._rowStarts[iRow], self._rowLens[iRow], self._rowCaps[iRow]
+        if length + n > cap:  # move this row's data to a new region with (at least) double the capacity
+            cap = max(2 * cap, length + n)
+            newStart = self._reserve(cap)
+            for ar in (self._oli, self._time, self._reps):
+                ar[newStart:newStart + length] = ar[start:start + length]
+            start = newStart
+            self._rowStarts[iRow], self._rowCaps[iRow] = start, cap
+        i = start + length
+        self._oli[i:i + n] = olis
+        self._time[i:i + n] = times
+        self._reps[i:i + n] = reps
+        self._rowLens[iRow] = length + n
+        self._snapshot = None
@@ -587,6 +587,65 @@ class ForwardSimulator(object):
         """
         raise NotImplementedError("bulk_fill_probs(...) is not implemented!")
 
+    def bulk_fill_probs_multi(self, mxToFill, evalTree, paramVectors,
+                              clipTo=None, check=False, comm=None, memLimit=None):
+        """
+        Compute the outcome probabilities for an entire tree of operation sequences
+        at each of several model-parameter vectors.
+
+        This is a batched version of :method:`bulk_fill_probs`, useful when
+        the same circuits must be evaluated at many (typically nearby) points
+        in parameter space.  This default implementation simply loops over
+        the points, but derived classes may amortize work across points.
+        The parameters of this calculator (and its parent model's operators)
+        are restored to their original values before returning.
+
+        Parameters
+        ----------
+        mxToFill : numpy ndarray
+          an already-allocated 2D numpy array of shape `(nPoints, nElements)`,
+          where `nPoints == len(paramVectors)` and `nElements` is the total
+          number of computed elements (i.e. evalTree.num_final_elements()).
+
+        evalTree : EvalTree
+           given by a prior call to bulk_evaltree.  Specifies the *simplified* gate
+           strings to compute the bulk operation on.
+
+        paramVectors : list or numpy ndarray
+           A sequence (or 2D array) of model-parameter vectors, each of which
+           has length equal to the number of model parameters.
+
+        clipTo : 2-tuple, optional
+           (min,max) to clip return value if not None.
+
+        check : boolean, optional
+          If True, perform extra checks within code to verify correctness,
+          generating warnings when checks fail.  Used for testing, and runs
+          much slower when True.
+
+        comm : mpi4py.MPI.Comm, optional
+           When not None, an MPI communicator for distributing the computation
+           across multiple processors.  Distribution is performed over
+           subtrees of evalTree (if it is split).
+
+        memLimit : int, optional
+           A rough memory limit in bytes which restricts how many points have
+           their intermediate values (e.g. product caches) computed at once.
+
+
+        Returns
+        -------
+        None
+        """
+        assert(mxToFill.shape[0] == len(paramVectors)), "`mxToFill` must have one row per parameter vector!"
+        orig_vec = self.to_vector().copy()
+        try:
+            for i, v in enumerate(paramVectors):
+                self.from_vector(v)
+                self.bulk_fill_probs(mxToFill[i], evalTree, clipTo, check, comm)
+        finally:
+            self.from_vector(orig_vec)
+
     def bulk_fill_dprobs(self, mxToFill, evalTree,
                          prMxToFill=None, clipTo=None, check=False,
                          comm=None, wrtFilter=None, wrtBlockSize=None,
@@ -799,3 +858,41 @@ class ForwardSimulator(object):
           - `dprobs12 == dp1[:,:,rowSlice,None] * dp2[:,:,None,colSlice]`
         """
         raise NotImplementedError("bulk_hprobs_by_block(...) is not implemented!")
+
+    def bulk_hprobs_by_block_groups(self, evalTree, wrtSlicesGroups,
+                                    bReturnDProbs12=False, comm=None):
+        """
+        Constructs one block generator (see :method:`bulk_hprobs_by_block`)
+        for each of several groups of Hessian blocks.
+
+        The returned generators may be iterated concurrently, e.g. by different
+        threads, so only simulators whose block computations don't modify any
+        shared state can implement this.  Derived classes may share read-only
+        intermediate results between the generators rather than computing them
+        once per group.  This default implementation raises `NotImplementedError`,
+        since, e.g., the map and term-based simulators compute blocks by finite
+        differences that temporarily change the (shared) operations' parameters.
+
+        Parameters
+        ----------
+        evalTree : EvalTree
+            given by a prior call to bulk_evaltree.  Specifies the operation sequences
+            to compute the bulk operation on.  This tree *cannot* be split.
+
+        wrtSlicesGroups : list
+            A list of `wrtSlicesList` arguments of :method:`bulk_hprobs_by_block`,
+            i.e. a list of lists of `(rowSlice,colSlice)` 2-tuples.
+
+        bReturnDProbs12 : boolean, optional
+            Whether the generators also compute `dprobs12` (see :method:`bulk_hprobs_by_block`).
+
+        comm : mpi4py.MPI.Comm, optional
+           When not None, an MPI communicator for distributing the computation
+           across multiple processors.
+
+        Returns
+        -------
+        list
+            A list of block generators, one per element of `wrtSlicesGroups`.
+        """
+        raise NotImplementedError("%s cannot compute Hessian blocks concurrently" % self.__class__.__name__)
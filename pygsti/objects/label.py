@@ -15,6 +15,31 @@ import os
 import inspect
 debug_record = {}
 
+#Canonical ("interned") label instances, keyed by (label class, label tuple/string, time).  Circuits hold
+# the same few labels (e.g. Gx:0) a great many times, so constructing a label that already exists returns the
+# existing (immutable) object instead of a new copy.  This saves memory, makes equality tests between labels
+# of different circuits identity checks, and (see the `init` methods) skips argument validation.
+_interned_labels = {}
+_MAX_INTERNED_LABELS = 100000  # bounds the table's size (labels beyond this are just not interned)
+
+
+def _intern_label(key, lbl):
+    """ Make `lbl` the canonical label for `key` (when there's room in the table); returns `lbl`. """
+    if len(_interned_labels) < _MAX_INTERNED_LABELS:
+        try:
+            _interned_labels[key] = lbl
+        except TypeError:  # unhashable label contents, e.g. a list of state space labels
+            pass
+    return lbl
+
+
+def _get_interned_label(key):
+    """ The canonical label for `key`, or None if there isn't one (or `key` isn't hashable). """
+    try:
+        return _interned_labels.get(key, None)
+    except TypeError:  # e.g. state space labels given as a list
+        return None
+
 
 class Label(object):
     """
@@ -187,6 +212,9 @@ class LabelTup(Label, tuple):
         time : float
             The time at which this label occurs (can be relative or absolute)
         """
+        if isinstance(stateSpaceLabels, tuple):  # an existing label needs no validation
+            existing = _get_interned_label((cls, (name,) + stateSpaceLabels, time))
+            if existing is not None: return existing
 
         #Type checking
         assert(isinstance(name, str)), "`name` must be a string, but it's '%s'" % str(name)
@@ -211,8 +239,12 @@ class LabelTup(Label, tuple):
         return cls.__new__(cls, tup, time)
 
     def __new__(cls, tup, time=0.0):
-        ret = tuple.__new__(cls, tup)  # creates a LabelTup object using tuple's __new__
-        ret.time = time
+        key = (cls, tup, time)
+        ret = _get_interned_label(key)
+        if ret is None:
+            ret = tuple.__new__(cls, tup)  # creates a LabelTup object using tuple's __new__
+            ret.time = time
+            _intern_label(key, ret)
         return ret
 
     @property
@@ -392,14 +424,21 @@ class LabelStr(Label, str):
             The time at which this label occurs (can be relative or absolute)
         """
 
+        existing = _get_interned_label((cls, name, time))  # an existing label needs no validation
+        if existing is not None: return existing
+
         #Type checking
         assert(isinstance(name, str)), "`name` must be a string, but it's '%s'" % str(name)
         assert(isinstance(time, float)), "`time` must be a floating point value, received: " + str(time)
         return cls.__new__(cls, name, time)
 
     def __new__(cls, name, time=0.0):
-        ret = str.__new__(cls, name)
-        ret.time = time
+        key = (cls, name, time)
+        ret = _get_interned_label(key)
+        if ret is None:
+            ret = str.__new__(cls, name)
+            ret.time = time
+            _intern_label(key, ret)
         return ret
 
     @property
@@ -529,8 +568,19 @@ class LabelTupTup(Label, tuple):
         return cls.__new__(cls, tupOfLabels, time)
 
     def __new__(cls, tupOfLabels, time=0.0):
+        #Only layers of simple labels are interned: since label equality ignores time, the key must contain
+        # the type and time of each component, and this is only sufficient when the components are simple.
+        tupOfLabels = tuple(tupOfLabels)
+        if all([type(lbl) in (LabelStr, LabelTup) for lbl in tupOfLabels]):
+            key = (cls, tupOfLabels, time, tuple([(type(lbl), lbl.time) for lbl in tupOfLabels]))
+            ret = _get_interned_label(key)
+            if ret is not None: return ret
+        else:
+            key = None
+
         ret = tuple.__new__(cls, tupOfLabels)  # creates a LabelTupTup object using tuple's __new__
         ret.time = time
+        if key is not None: _intern_label(key, ret)
         return ret
 
     @property
@@ -995,8 +1045,13 @@ class LabelTupWithArgs(Label, tuple):
         return cls.__new__(cls, tup, time)
 
     def __new__(cls, tup, time=0.0):
-        ret = tuple.__new__(cls, tup)  # creates a LabelTup object using tuple's __new__
-        ret.time = time
+        tup = tuple(tup)
+        key = (cls, tup, time, tuple(map(type, tup)))  # types b/c, e.g., args 1 and 1.0 are equal
+        ret = _get_interned_label(key)
+        if ret is None:
+            ret = tuple.__new__(cls, tup)  # creates a LabelTup object using tuple's __new__
+            ret.time = time
+            _intern_label(key, ret)
         return ret
 
     @property
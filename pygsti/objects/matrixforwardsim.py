@@ -883,6 +883,57 @@ class MatrixForwardSimulator(ForwardSimulator):
 
         return prodCache, scaleCache
 
+    def _compute_product_cache_multi(self, evalTree, opMxs):
+        """
+        Computes a tree of products, as :method:`_compute_product_cache` does,
+        simultaneously for several sets of operation matrices.  `opMxs` is a
+        dictionary of `(nPoints, dim, dim)` arrays, one per operation label, and
+        the returned caches have shapes `(cacheSize, nPoints, dim, dim)` and
+        `(cacheSize, nPoints)`, so that each tree node is computed using a single
+        batched matrix multiplication over all the points.
+        """
+        dim = self.dim
+        nPoints = next(iter(opMxs.values())).shape[0] if len(opMxs) > 0 else 0
+
+        if evalTree.is_split():
+            _warnings.warn("Ignoring tree splitting in product cache calc.")
+
+        cacheSize = len(evalTree)
+        prodCache = _np.zeros((cacheSize, nPoints, dim, dim))
+        scaleCache = _np.zeros((cacheSize, nPoints), 'd')
+
+        #First element of cache are given by evalTree's initial single- or zero-operation labels
+        for i, opLabel in zip(evalTree.get_init_indices(), evalTree.get_init_labels()):
+            if opLabel == "":  # special case of empty label == no gate
+                prodCache[i] = _np.identity(dim)
+                # Note: scaleCache[i] = 0.0 from initialization
+            else:
+                gates = opMxs[opLabel]
+                nG = _np.maximum(_nla.norm(gates, axis=(1, 2)), 1.0)
+                prodCache[i] = gates / nG[:, None, None]
+                scaleCache[i] = _np.log(nG)
+
+        #evaluate operation sequences using tree (skip over the zero and single-gate-strings)
+        for i in evalTree.get_evaluation_order():
+            # combine iLeft + iRight => i (see note on matrix order in _compute_product_cache)
+            (iRight, iLeft) = evalTree[i]
+            L, R = prodCache[iLeft], prodCache[iRight]
+            prodCache[i] = _np.matmul(L, R)
+            scaleCache[i] = scaleCache[iLeft] + scaleCache[iRight]
+
+            small = _np.logical_and(prodCache[i].max(axis=(1, 2)) < PSMALL,
+                                    prodCache[i].min(axis=(1, 2)) > -PSMALL)
+            for p in _np.nonzero(small)[0]:  # rescale, per point, just as in the single-point case
+                nL, nR = max(_nla.norm(L[p]), _np.exp(-scaleCache[iLeft, p]), 1e-300), \
+                    max(_nla.norm(R[p]), _np.exp(-scaleCache[iRight, p]), 1e-300)
+                prodCache[i, p] = _np.dot(L[p] / nL, R[p] / nR)
+                scaleCache[i, p] += _np.log(nL) + _np.log(nR)
+
+        # since all scaled gates start with norm <= 1, products should all have norm <= 1
+        assert(_np.all(_np.isfinite(prodCache)))
+
+        return prodCache, scaleCache
+
     def _compute_dproduct_cache(self, evalTree, prodCache, scaleCache,
                                 comm=None, wrtSlice=None, profiler=None):
         """
@@ -2063,6 +2114,136 @@ class MatrixForwardSimulator(ForwardSimulator):
         if check:
             self._check(evalTree, mxToFill, clipTo=clipTo)
 
+    def bulk_fill_probs_multi(self, mxToFill, evalTree, paramVectors,
+                              clipTo=None, check=False, comm=None, memLimit=None):
+        """
+        Compute the outcome probabilities for an entire tree of operation sequences
+        at each of several model-parameter vectors.
+
+        The operation matrices and SPAM vectors are computed for each point,
+        after which the tree of products is traversed only once, with each
+        product computed for all the points by a single batched matrix
+        multiplication.  This amortizes the tree traversal and Python overhead
+        of calling :method:`bulk_fill_probs` once per point.  The parameters of
+        this calculator are restored to their original values before returning.
+
+        Parameters
+        ----------
+        mxToFill : numpy ndarray
+          an already-allocated 2D numpy array of shape `(nPoints, nElements)`,
+          where `nPoints == len(paramVectors)` and `nElements` is the total
+          number of computed elements (i.e. evalTree.num_final_elements()).
+
+        evalTree : EvalTree
+           given by a prior call to bulk_evaltree.  Specifies the *simplified* gate
+           strings to compute the bulk operation on.
+
+        paramVectors : list or numpy ndarray
+           A sequence (or 2D array) of model-parameter vectors, each of which
+           has length equal to the number of model parameters.
+
+        clipTo : 2-tuple, optional
+           (min,max) to clip return value if not None.
+
+        check : boolean, optional
+          If True, perform extra checks within code to verify correctness,
+          generating warnings when checks fail.  Used for testing, and runs
+          much slower when True.
+
+        comm : mpi4py.MPI.Comm, optional
+           When not None, an MPI communicator for distributing the computation
+           across multiple processors.  Distribution is performed over
+           subtrees of evalTree (if it is split).
+
+        memLimit : int, optional
+           A rough memory limit in bytes which restricts how many points have
+           their intermediate values (e.g. product caches) computed at once.
+
+
+        Returns
+        -------
+        None
+        """
+        assert(mxToFill.shape[0] == len(paramVectors)), "`mxToFill` must have one row per parameter vector!"
+        nPoints = len(paramVectors)
+
+        #get distribution across subtrees (groups if needed)
+        subtrees = evalTree.get_sub_trees()
+        mySubTreeIndices, subTreeOwners, mySubComm = evalTree.distribute(comm)
+
+        spamTuples = set(); opLabels = set()
+        for iSubTree in mySubTreeIndices:
+            spamTuples.update(subtrees[iSubTree].spamtuple_indices.keys())
+            opLabels.update([lbl for lbl in subtrees[iSubTree].get_init_labels() if lbl != ""])
+
+        if self.evotype == "statevec" or not all([isinstance(spamTuple[0], _Label) for spamTuple in spamTuples]):
+            # "custom" spam labels hold fixed SPAMVecs, so just evaluate the points one at a time
+            return ForwardSimulator.bulk_fill_probs_multi(self, mxToFill, evalTree, paramVectors,
+                                                          clipTo, check, comm)
+
+        rholabels = set([rholabel for rholabel, _ in spamTuples])
+        elabels = set([elabel for _, elabel in spamTuples])
+
+        #Evaluate the points in chunks whose (per-point) product caches and operators fit within memLimit
+        if memLimit is not None:
+            cacheSize = max([len(subtrees[i]) for i in mySubTreeIndices])
+            bytesPerPoint = 8 * (cacheSize * (self.dim**2 + 1) + len(opLabels) * self.dim**2
+                                 + (len(rholabels) + len(elabels)) * self.dim)
+            nPerChunk = max(int(memLimit // bytesPerPoint), 1)
+            if nPerChunk < nPoints:
+                for i in range(0, nPoints, nPerChunk):  # (rows of mxToFill are filled in place)
+                    self.bulk_fill_probs_multi(mxToFill[i:i + nPerChunk], evalTree, paramVectors[i:i + nPerChunk],
+                                               clipTo, check, comm)
+                return
+
+        #Gather the operation matrices and SPAM vectors at each point
+        opMxs = {lbl: _np.empty((nPoints, self.dim, self.dim), 'd') for lbl in opLabels}
+        rhos = {lbl: _np.empty((nPoints, self.dim), 'd') for lbl in rholabels}
+        Es = {lbl: _np.empty((nPoints, self.dim), 'd') for lbl in elabels}
+
+        orig_vec = self.to_vector().copy()
+        try:
+            for p, v in enumerate(paramVectors):
+                self.from_vector(v)
+                for lbl in opLabels: opMxs[lbl][p] = self.sos.get_operation(lbl).todense()
+                for lbl in rholabels: rhos[lbl][p] = self.sos.get_prep(lbl).todense()
+                for lbl in elabels: Es[lbl][p] = _np.conjugate(self.sos.get_effect(lbl).todense())
+        finally:
+            self.from_vector(orig_vec)
+
+        #eval on each local subtree
+        for iSubTree in mySubTreeIndices:
+            evalSubTree = subtrees[iSubTree]
+
+            #Free memory from previous subtree iteration before computing caches
+            scaleVals = Gs = prodCache = scaleCache = None
+
+            prodCache, scaleCache = self._compute_product_cache_multi(evalSubTree, opMxs)
+            old_err = _np.seterr(over='ignore')
+            scaleVals = self._scaleExp(evalSubTree.final_view(scaleCache))  # ( nCircuits, nPoints )
+            Gs = evalSubTree.final_view(prodCache, axis=0)  # ( nCircuits, nPoints, dim, dim )
+
+            for (rholabel, elabel), (fInds, gInds) in evalSubTree.spamtuple_indices.items():
+                probs = _np.einsum('pk,ipkl,pl->pi', Es[elabel], Gs[gInds], rhos[rholabel]) * scaleVals[gInds].T
+                _fas(mxToFill, [slice(None), fInds], probs)
+            _np.seterr(**old_err)
+
+        #collect/gather results
+        subtreeElementIndices = [t.final_element_indices(evalTree) for t in subtrees]
+        _mpit.gather_indices(subtreeElementIndices, subTreeOwners,
+                             mxToFill, [], 1, comm)
+
+        if clipTo is not None:
+            _np.clip(mxToFill, clipTo[0], clipTo[1], out=mxToFill)  # in-place clip
+
+        if check:
+            try:
+                for p, v in enumerate(paramVectors):
+                    self.from_vector(v)
+                    self._check(evalTree, mxToFill[p], clipTo=clipTo)
+            finally:
+                self.from_vector(orig_vec)
+
     def bulk_fill_dprobs(self, mxToFill, evalTree,
                          prMxToFill=None, clipTo=None, check=False,
                          comm=None, wrtFilter=None, wrtBlockSize=None,
@@ -2642,10 +2823,54 @@ class MatrixForwardSimulator(ForwardSimulator):
           - `dprobs12 == dp1[:,:,rowSlice,None] * dp2[:,:,None,colSlice]`
         """
         assert(not evalTree.is_split()), "`evalTree` cannot be split"
-        nElements = evalTree.num_final_elements()
 
         #Fill product cache info (not distributed)
         prodCache, scaleCache = self._compute_product_cache(evalTree, comm)
+        return self._hprobs_by_block(evalTree, wrtSlicesList, bReturnDProbs12, comm, prodCache, scaleCache)
+
+    def bulk_hprobs_by_block_groups(self, evalTree, wrtSlicesGroups,
+                                    bReturnDProbs12=False, comm=None):
+        """
+        Constructs one block generator (see :method:`bulk_hprobs_by_block`)
+        for each of several groups of Hessian blocks.
+
+        The product cache of `evalTree` is computed once and shared (read-only)
+        by all the returned generators, which may be iterated concurrently,
+        e.g. by different threads.
+
+        Parameters
+        ----------
+        evalTree : EvalTree
+            given by a prior call to bulk_evaltree.  Specifies the operation sequences
+            to compute the bulk operation on.  This tree *cannot* be split.
+
+        wrtSlicesGroups : list
+            A list of `wrtSlicesList` arguments of :method:`bulk_hprobs_by_block`,
+            i.e. a list of lists of `(rowSlice,colSlice)` 2-tuples.
+
+        bReturnDProbs12 : boolean, optional
+            Whether the generators also compute `dprobs12` (see :method:`bulk_hprobs_by_block`).
+
+        comm : mpi4py.MPI.Comm, optional
+           When not None, an MPI communicator for distributing the computation
+           across multiple processors.
+
+        Returns
+        -------
+        list
+            A list of block generators, one per element of `wrtSlicesGroups`.
+        """
+        assert(not evalTree.is_split()), "`evalTree` cannot be split"
+        prodCache, scaleCache = self._compute_product_cache(evalTree, comm)
+        return [self._hprobs_by_block(evalTree, wrtSlicesList, bReturnDProbs12, comm, prodCache, scaleCache)
+                for wrtSlicesList in wrtSlicesGroups]
+
+    def _hprobs_by_block(self, evalTree, wrtSlicesList, bReturnDProbs12, comm, prodCache, scaleCache):
+        """
+        The block generator of :method:`bulk_hprobs_by_block`, given the
+        (already computed, and only read here) product cache of `evalTree`.
+        """
+        nElements = evalTree.num_final_elements()
         scaleVals = self._scaleExp(evalTree.final_view(scaleCache))
         Gs = evalTree.final_view(prodCache, axis=0)
         #( nCircuits, dim, dim )
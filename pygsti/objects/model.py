@@ -241,6 +241,54 @@ class Model(object):
     def bulk_fill_probs(self, mxToFill, evalTree, clipTo=None, check=False, comm=None):
         raise NotImplementedError("Derived classes should implement this!")
 
+    def bulk_fill_probs_multi(self, mxToFill, evalTree, paramVectors, clipTo=None, check=False, comm=None,
+                              memLimit=None):
+        """
+        Compute the outcome probabilities for an entire tree of operation sequences
+        at each of several model-parameter vectors.
+
+        Parameters
+        ----------
+        mxToFill : numpy ndarray
+          an already-allocated 2D numpy array of shape `(nPoints, nElements)`,
+          where `nPoints == len(paramVectors)` and `nElements` is the total
+          number of computed elements (i.e. evalTree.num_final_elements()).
+
+        evalTree : EvalTree
+           given by a prior call to bulk_evaltree.  Specifies the *simplified* gate
+           strings to compute the bulk operation on.
+
+        paramVectors : list or numpy ndarray
+           A sequence (or 2D array) of parameter vectors for this model.
+
+        clipTo : 2-tuple, optional
+           (min,max) to clip return value if not None.
+
+        check : boolean, optional
+          If True, perform extra checks within code to verify correctness.
+
+        comm : mpi4py.MPI.Comm, optional
+           When not None, an MPI communicator for distributing the computation
+           across multiple processors.
+
+        memLimit : int, optional
+           A rough memory limit in bytes which restricts how many points have
+           their intermediate values (e.g. product caches) computed at once.
+
+        Returns
+        -------
+        None
+        """
+        #Default: evaluate the points one at a time, restoring this model's parameters afterward
+        assert(mxToFill.shape[0] == len(paramVectors)), "`mxToFill` must have one row per parameter vector!"
+        orig_vec = self.to_vector().copy()
+        try:
+            for i, v in enumerate(paramVectors):
+                self.from_vector(v)
+                self.bulk_fill_probs(mxToFill[i], evalTree, clipTo, check, comm)
+        finally:
+            self.from_vector(orig_vec)
+
     def bulk_fill_dprobs(self, mxToFill, evalTree, prMxToFill=None, clipTo=None,
                          check=False, comm=None, wrtBlockSize=None,
                          profiler=None, gatherMemLimit=None):
@@ -257,6 +305,10 @@ class Model(object):
                              bReturnDProbs12=False, comm=None):
         raise NotImplementedError("Derived classes should implement this!")
 
+    def bulk_hprobs_by_block_groups(self, evalTree, wrtSlicesGroups,
+                                    bReturnDProbs12=False, comm=None):
+        raise NotImplementedError("Derived classes should implement this!")
+
     def _init_copy(self, copyInto):
         """
         Copies any "tricky" member of this model into `copyInto`, before
@@ -1956,6 +2008,58 @@ class OpModel(Model):
         return self._fwdsim().bulk_fill_probs(mxToFill,
                                               evalTree, clipTo, check, comm)
 
+    def bulk_fill_probs_multi(self, mxToFill, evalTree, paramVectors, clipTo=None, check=False, comm=None,
+                              memLimit=None):
+        """
+        Compute the outcome probabilities for an entire tree of operation sequences
+        at each of several model-parameter vectors.
+
+        This routine fills the rows of a 2D array, `mxToFill`, with the
+        probabilities (see :method:`bulk_fill_probs`) computed at each of the
+        points in `paramVectors`.  This is faster than calling
+        :method:`from_vector` and :method:`bulk_fill_probs` for each point, as
+        the forward simulator can share work between the points.  This model's
+        parameters are unchanged upon return.
+
+        Parameters
+        ----------
+        mxToFill : numpy ndarray
+          an already-allocated 2D numpy array of shape `(nPoints, nElements)`,
+          where `nPoints == len(paramVectors)` and `nElements` is the total
+          number of computed elements (i.e. evalTree.num_final_elements()).
+
+        evalTree : EvalTree
+           given by a prior call to bulk_evaltree.  Specifies the *simplified* gate
+           strings to compute the bulk operation on.
+
+        paramVectors : list or numpy ndarray
+           A sequence (or 2D array) of parameter vectors for this model, each
+           of length `self.num_params()`.
+
+        clipTo : 2-tuple, optional
+           (min,max) to clip return value if not None.
+
+        check : boolean, optional
+          If True, perform extra checks within code to verify correctness,
+          generating warnings when checks fail.  Used for testing, and runs
+          much slower when True.
+
+        comm : mpi4py.MPI.Comm, optional
+           When not None, an MPI communicator for distributing the computation
+           across multiple processors.  Distribution is performed over
+           subtrees of evalTree (if it is split).
+
+        memLimit : int, optional
+           A rough memory limit in bytes which restricts how many points have
+           their intermediate values (e.g. product caches) computed at once.
+
+        Returns
+        -------
+        None
+        """
+        return self._fwdsim().bulk_fill_probs_multi(mxToFill, evalTree, paramVectors,
+                                                    clipTo, check, comm, memLimit)
+
     def bulk_fill_dprobs(self, mxToFill, evalTree, prMxToFill=None, clipTo=None,
                          check=False, comm=None, wrtBlockSize=None,
                          profiler=None, gatherMemLimit=None):
@@ -2164,6 +2268,45 @@ class OpModel(Model):
             evalTree, wrtSlicesList,
             bReturnDProbs12, comm)
 
+    def bulk_hprobs_by_block_groups(self, evalTree, wrtSlicesGroups,
+                                    bReturnDProbs12=False, comm=None):
+        """
+        Constructs one block generator (see :method:`bulk_hprobs_by_block`)
+        for each of several groups of Hessian blocks.
+
+        The returned generators may be iterated concurrently, e.g. by different
+        threads, and share any read-only intermediate results (e.g. a matrix
+        forward simulator's product cache) rather than computing them once
+        per group.  A `NotImplementedError` is raised when this model's forward
+        simulator cannot compute Hessian blocks concurrently (e.g. the "map" and
+        term-based simulators).
+
+        Parameters
+        ----------
+        evalTree : EvalTree
+           given by a prior call to bulk_evaltree.  Specifies the operation sequences
+           to compute the bulk operation on.  This tree *cannot* be split.
+
+        wrtSlicesGroups : list
+            A list of `wrtSlicesList` arguments of :method:`bulk_hprobs_by_block`,
+            i.e. a list of lists of `(rowSlice,colSlice)` 2-tuples.
+
+        bReturnDProbs12 : boolean, optional
+           Whether the generators also compute `dprobs12` (see :method:`bulk_hprobs_by_block`).
+
+        comm : mpi4py.MPI.Comm, optional
+           When not None, an MPI communicator for distributing the computation
+           across multiple processors.
+
+        Returns
+        -------
+        list
+            A list of block generators, one per element of `wrtSlicesGroups`.
+        """
+        return self._fwdsim().bulk_hprobs_by_block_groups(
+            evalTree, wrtSlicesGroups,
+            bReturnDProbs12, comm)
+
     def _init_copy(self, copyInto):
         """
         Copies any "tricky" member of this model into `copyInto`, before
@@ -15,10 +15,26 @@ from collections import OrderedDict as _OrderedDict
 from collections import defaultdict as _DefaultDict
 
 from .dataset import DataSet as _DataSet
+from .dataset import _slices_to_indices
 from . import circuit as _cir
 from . import labeldicts as _ld
 
 
+def _get_padding_indices(starts, lengths, newLengths):
+    """
+    Returns `(src, pad)` arrays that gather rows of data - row `i` having
+    `lengths[i]` elements starting at `starts[i]` - into contiguous rows of
+    lengths `newLengths >= lengths`.  Row `i` of the result is `data[src]`,
+    where the final `newLengths[i] - lengths[i]` elements (those for which
+    `pad` is True) repeat the last element of row `i` (or for an empty row,
+    the element preceding it).
+    """
+    rowIds = _np.repeat(_np.arange(len(newLengths), dtype=_np.int64), newLengths)
+    offsets = _np.arange(len(rowIds), dtype=_np.int64) - (_np.cumsum(newLengths) - newLengths)[rowIds]
+    src = starts[rowIds] + _np.minimum(offsets, lengths[rowIds] - 1)
+    return src, offsets >= lengths[rowIds]
+
+
 class MultiDataSet_KeyValIterator(object):
     """ Iterator class for datasetName,DataSet pairs of a MultiDataSet """
 
@@ -31,20 +47,7 @@ class MultiDataSet_KeyValIterator(object):
 
     def __next__(self):
         datasetName = next(self.oliDictIter)
-        oliData = self.multidataset.oliDict[datasetName]
-        timeData = self.multidataset.timeDict[datasetName]
-        if self.multidataset.repDict:
-            repData = self.multidataset.repDict[datasetName]
-        else:
-            repData = None
-
-        ds = _DataSet(oliData, timeData, repData,
-                      circuitIndices=self.multidataset.cirIndex,
-                      outcomeLabelIndices=self.multidataset.olIndex,
-                      collisionAction=self.multidataset.collisionActions[datasetName],
-                      bStatic=True, auxInfo=None)
-        ds.auxInfo = self.multidataset.auxInfo  # avoids shallow-copying dict
-        return datasetName, ds
+        return datasetName, self.multidataset[datasetName]
 
     next = __next__
 
@@ -61,20 +64,7 @@ class MultiDataSet_ValIterator(object):
 
     def __next__(self):
         datasetName = next(self.oliDictIter)
-        oliData = self.multidataset.oliDict[datasetName]
-        timeData = self.multidataset.timeDict[datasetName]
-        if self.multidataset.repDict:
-            repData = self.multidataset.repDict[datasetName]
-        else:
-            repData = None
-
-        ds = _DataSet(oliData, timeData, repData,
-                      circuitIndices=self.multidataset.cirIndex,
-                      outcomeLabelIndices=self.multidataset.olIndex,
-                      collisionAction=self.multidataset.collisionActions[datasetName],
-                      bStatic=True, auxInfo=None)
-        ds.auxInfo = self.multidataset.auxInfo  # avoids shallow-copying dict
-        return ds
+        return self.multidataset[datasetName]
 
     next = __next__
 
@@ -97,7 +87,7 @@ class MultiDataSet(object):
                  circuitIndices=None,
                  outcomeLabels=None, outcomeLabelIndices=None,
                  fileToLoadFrom=None, collisionActions=None,
-                 comment=None, comments=None, auxInfo=None):
+                 comment=None, comments=None, auxInfo=None, sparse=False):
         """
         Initialize a MultiDataSet.
 
@@ -155,12 +145,25 @@ class MultiDataSet(object):
             Keys should be the circuits in this MultiDataSet and value should
             be Python dictionaries.
 
+        sparse : bool, optional
+            When True, create a *sparse* MultiDataSet, whose member DataSets are
+            sparse (see :class:`DataSet`).  The zero-count bins that are needed
+            to align the data of different datasets are not part of the DataSets
+            returned by indexing or :method:`get_datasets_aggregate`.  An empty
+            MultiDataSet becomes sparse when a sparse DataSet is the first one
+            added to it.
+
         Returns
         -------
         MultiDataSet
            a new multi data set object.
         """
 
+        # self._views : the (static) DataSets handed out by __getitem__, built on demand and
+        #               kept until this MultiDataSet's data changes (see _get_view)
+        self._views = {}
+        self.sparse = sparse
+
         #Optionally load from a file
         if fileToLoadFrom is not None:
             assert(oliDict is None and timeDict is None and repDict is None
@@ -263,14 +266,41 @@ class MultiDataSet(object):
         return len(self.oliDict)
 
     def __getitem__(self, datasetName):  # return a static DataSet
-        repData = self.repDict[datasetName] if self.repDict else None
-        ds = _DataSet(self.oliDict[datasetName],
-                      self.timeDict[datasetName], repData,
-                      circuitIndices=self.cirIndex,
-                      outcomeLabelIndices=self.olIndex, bStatic=True,
-                      collisionAction=self.collisionActions[datasetName],
-                      auxInfo=None)
-        ds.auxInfo = self.auxInfo  # avoids shallow-copying dict
+        return self._get_view(datasetName)
+
+    def _get_view(self, datasetName):
+        """
+        Returns a static DataSet whose data arrays are those of `datasetName`
+        (not copies).  The DataSet is only constructed the first time a
+        dataset is accessed; after that a shallow copy of it is returned, so
+        that its count caches (and index dictionaries) are shared by all the
+        DataSets handed out for `datasetName`.  When this MultiDataSet is
+        sparse and `datasetName` has zero-count bins, the DataSet holds copies
+        of just the nonzero-count data.
+        """
+        view = self._views.get(datasetName, None)
+        if view is None:
+            oliData, timeData = self.oliDict[datasetName], self.timeDict[datasetName]
+            repData = self.repDict[datasetName] if self.repDict else None
+            circuitIndices = self.cirIndex
+            if self.sparse and repData is not None and not _np.all(repData):
+                # a sparse DataSet doesn't store zero counts, so copy just the nonzero-count data
+                keep = repData != 0
+                nKept = _np.concatenate(([0], _np.cumsum(keep))).tolist()
+                oliData, timeData, repData = oliData[keep], timeData[keep], repData[keep]
+                circuitIndices = _OrderedDict([(opstr, slice(nKept[slc.start], nKept[slc.stop]))
+                                               for opstr, slc in self.cirIndex.items()])
+            view = _DataSet(oliData, timeData, repData,
+                            circuitIndices=circuitIndices,
+                            outcomeLabelIndices=self.olIndex, bStatic=True,
+                            collisionAction=self.collisionActions[datasetName],
+                            auxInfo=None, sparse=self.sparse)
+            view.auxInfo = self.auxInfo  # avoids shallow-copying dict
+            self._views[datasetName] = view
+
+        ds = _DataSet.__new__(_DataSet)  # a shallow copy, so setting attributes of `ds` doesn't affect `view`
+        ds.__dict__.update(view.__dict__)
+        ds.ffdata = {}
         return ds
 
     def __setitem__(self, datasetName, dataset):
@@ -313,65 +343,88 @@ class MultiDataSet(object):
             if datasetName not in self:
                 raise ValueError("No dataset with the name '%s' exists" % datasetName)
 
-        #add data for each gate sequence to build up aggregate lists
-        gstrSlices = _OrderedDict()
-        agg_oli = []; agg_time = []; agg_rep = []; slc_i = 0
-        for opstr, slc in self.cirIndex.items():
-            concat_oli = _np.concatenate([self.oliDict[datasetName][slc]
-                                          for datasetName in datasetNames], axis=0)
-            concat_time = _np.concatenate([self.timeDict[datasetName][slc]
-                                           for datasetName in datasetNames], axis=0)
-            if self.repDict:
-                concat_rep = _np.concatenate([self.repDict[datasetName][slc]
-                                              for datasetName in datasetNames], axis=0)
-            else:
-                concat_rep = None
-
-            # Merge same-timestamp, same-outcome data
-            sortedInds = [i for i, el in sorted(enumerate(concat_time), key=lambda x:x[1])]
-            sorted_oli = []; sorted_time = []; sorted_rep = []
-            last_time = concat_time[sortedInds[0]]; cur_reps = {}
-            for i in sortedInds:
-                if concat_time[i] != last_time:
-                    # dump cur_reps at last_time and reset
-                    for oli, reps in cur_reps.items():
-                        sorted_time.append(last_time)
-                        sorted_oli.append(oli)
-                        sorted_rep.append(reps)
-                    last_time = concat_time[i]; cur_reps = {}
-
-                #add i-th element data to cur_reps
-                reps = concat_rep[i] if (concat_rep is not None) else 1
-                if concat_oli[i] in cur_reps:
-                    cur_reps[concat_oli[i]] += reps
-                else:
-                    cur_reps[concat_oli[i]] = reps
-
-            # dump cur_reps at last_time
-            for oli, reps in cur_reps.items():
-                sorted_time.append(last_time)
-                sorted_oli.append(oli)
-                sorted_rep.append(reps)
-
-            agg_oli.extend(sorted_oli)
-            agg_time.extend(sorted_time)
-            agg_rep.extend(sorted_rep)
-
-            gstrSlices[opstr] = slice(slc_i, slc_i + len(sorted_oli))
-            slc_i += len(sorted_oli)
-
-        agg_oli = _np.array(agg_oli, self.oliType)
-        agg_time = _np.array(agg_time, self.timeType)
-        agg_rep = _np.array(agg_rep, self.repType)
-        if _np.max(agg_rep) == 1: agg_rep = None  # don't store trivial reps
+        #Gather the data of all the datasets (each circuit has the same slice in every dataset)
+        slices = list(self.cirIndex.values())
+        binIndices = _slices_to_indices(slices)
+        rowIds = _np.repeat(_np.arange(len(slices), dtype=_np.int64), [slc.stop - slc.start for slc in slices])
+        rowIds = _np.tile(rowIds, len(datasetNames))
+        olis = _np.concatenate([self.oliDict[nm][binIndices] for nm in datasetNames]).astype(_np.int64)
+        times = _np.concatenate([self.timeDict[nm][binIndices] for nm in datasetNames])
+        reps = _np.concatenate([self.repDict[nm][binIndices] for nm in datasetNames]) if self.repDict \
+            else _np.ones(len(olis), self.repType)
+
+        # Merge same-timestamp, same-outcome data: sort by (circuit, time, outcome) - stably, so
+        # order[starts] is the first bin of each group - and sum the repetitions of each group.
+        order = _np.lexsort((olis, times, rowIds))
+        rowIds, olis, times = rowIds[order], olis[order], times[order]
+        newGroup = _np.ones(len(order), bool)
+        newGroup[1:] = (rowIds[1:] != rowIds[:-1]) | (times[1:] != times[:-1]) | (olis[1:] != olis[:-1])
+        starts = _np.flatnonzero(newGroup)
+        agg_rep = _np.add.reduceat(reps[order], starts) if len(starts) > 0 else reps[0:0]
+
+        # Within each time stamp, outcomes are ordered by their first appearance (data order)
+        groupOrder = _np.lexsort((order[starts], times[starts], rowIds[starts]))
+        starts, agg_rep = starts[groupOrder], agg_rep[groupOrder]
+        aggRows = rowIds[starts]
+        if self.sparse:  # don't store zero counts
+            nonzero = agg_rep != 0
+            starts, agg_rep, aggRows = starts[nonzero], agg_rep[nonzero], aggRows[nonzero]
+        bounds = _np.searchsorted(aggRows, _np.arange(len(slices) + 1)).tolist()
+        gstrSlices = _OrderedDict([(opstr, slice(bounds[i], bounds[i + 1]))
+                                   for i, opstr in enumerate(self.cirIndex.keys())])
+
+        agg_oli = olis[starts].astype(self.oliType)
+        agg_time = times[starts].astype(self.timeType)
+        agg_rep = agg_rep.astype(self.repType)
+        if _np.all(agg_rep == 1): agg_rep = None  # don't store trivial reps
 
         ds = _DataSet(agg_oli, agg_time, agg_rep,
                       circuitIndices=gstrSlices,
                       outcomeLabelIndices=self.olIndex, bStatic=True,
-                      auxInfo=None)  # leave collisionAction as default "aggregate"
+                      auxInfo=None, sparse=self.sparse)  # leave collisionAction as default "aggregate"
         ds.auxInfo = self.auxInfo  # avoids shallow-copying dict
         return ds
 
+    def get_counts_array(self, circuits=None, datasetNames=None):
+        """
+        Get the counts of many circuits in several member datasets as a 3D
+        array, computed directly from the (aligned) data arrays of the datasets.
+
+        Parameters
+        ----------
+        circuits : list, optional
+            The circuits (tuples or Circuits) to get counts for.  If None, all
+            the circuits of this MultiDataSet are used (in order).
+
+        datasetNames : list, optional
+            The names of the datasets to get counts for.  If None, all the
+            datasets are used (in order).
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape `(len(datasetNames), len(circuits), num_outcome_indices)`
+            whose `[k, i, j]` element is the count of the outcome with index `j`
+            (see `olIndex`) for the `i`-th circuit in the `k`-th dataset.
+        """
+        if datasetNames is None: datasetNames = self.keys()
+        slices = list(self.cirIndex.values())
+        nCols = max(self.olIndex.values()) + 1 if self.olIndex else 0
+        binIndices = _slices_to_indices(slices)
+        rowOffsets = _np.repeat(_np.arange(len(slices), dtype=_np.int64) * nCols,
+                                [slc.stop - slc.start for slc in slices])
+        if circuits is not None:
+            rowIndex = {circuit: i for i, circuit in enumerate(self.cirIndex.keys())}
+            rows = [rowIndex[c if isinstance(c, _cir.Circuit) else _cir.Circuit(c)] for c in circuits]
+
+        counts = _np.empty((len(datasetNames), len(slices) if (circuits is None) else len(rows), nCols), 'd')
+        for k, datasetName in enumerate(datasetNames):
+            reps = self.repDict[datasetName][binIndices] if self.repDict else None
+            cntMx = _np.bincount(rowOffsets + self.oliDict[datasetName][binIndices], reps,
+                                 minlength=len(slices) * nCols).reshape(len(slices), nCols)
+            counts[k] = cntMx if (circuits is None) else cntMx[rows]
+        return counts
+
     def add_dataset(self, datasetName, dataset, update_auxinfo=True):
         """
         Add a DataSet to this MultiDataSet.  The dataset
@@ -396,6 +449,11 @@ class MultiDataSet(object):
         #Check if dataset is compatible
         if not dataset.bStatic:
             raise ValueError("Cannot add dataset: only static DataSets can be added to a MultiDataSet")
+        if len(self.oliDict) == 0 and dataset.sparse:
+            self.sparse = True  # a MultiDataSet of sparse DataSets is sparse
+        elif dataset.sparse != self.sparse:
+            raise ValueError("Cannot add dataset: a %ssparse DataSet can't be added to a %ssparse MultiDataSet"
+                             % ("" if dataset.sparse else "non-", "" if self.sparse else "non-"))
         if self.cirIndex is not None and set(dataset.cirIndex.keys()) != set(self.cirIndex.keys()):
             raise ValueError("Cannot add dataset: circuits do not match")
 
@@ -407,20 +465,19 @@ class MultiDataSet(object):
 
         # Check if outcome labels use the same indexing; if not, update dataset.oliData
         ds_oliData = dataset.oliData  # default - just use dataset's outcome indices as is...
-        update_map = {}  # default - no updates needed
         if dataset.olIndex != self.olIndex:
             next_olIndex = max(self.olIndex.values()) + 1
+            oli_map = _np.arange(dataset.olIndex_max + 1)  # maps dataset's outcome indices -> ours
             for ol, i in dataset.olIndex.items():
                 if ol not in self.olIndex:  # then add a new outcome label
                     self.olIndex[ol] = next_olIndex; next_olIndex += 1
-                if self.olIndex[ol] != i:  # if we need to update dataset's indices
-                    update_map[i] = self.olIndex[ol]  # old -> new index
-            if update_map:
+                oli_map[i] = self.olIndex[ol]
+            if _np.any(oli_map != _np.arange(len(oli_map))):
                 # update dataset's outcome indices to conform to self.olIndex
-                ds_oliData = _np.array([update_map.get(oli, oli)
-                                        for oli in dataset.oliData], self.oliType)
+                ds_oliData = oli_map[dataset.oliData].astype(self.oliType)
 
         #Do easy additions
+        self._views = {}  # the indices and data of existing datasets may change below
         self.collisionActions[datasetName] = dataset.collisionAction
         self.comments[datasetName] = dataset.comment
 
@@ -465,56 +522,34 @@ class MultiDataSet(object):
             ds_repData = dataset.repData if (dataset.repData is not None) \
                 else _np.ones(len(ds_oliData), self.repType)
 
-            #Create new arrays to populate with dataset's data
-            self.oliDict[datasetName] = _np.zeros(dataLen, self.oliType)
-            self.timeDict[datasetName] = _np.zeros(dataLen, self.timeType)
-            self.repDict[datasetName] = _np.zeros(dataLen, self.repType)
-
-            #sort keys in order of increasing slice-start position (w.r.t. self)
-            sorted_cirIndex = sorted(list(self.cirIndex.items()), key=lambda x: x[1].start)
-
-            off = 0
-            for opstr, slc in sorted_cirIndex:
-                other_slc = dataset.cirIndex[opstr]  # we know key exists from check above
-                l1 = slc.stop - slc.start; assert(slc.step is None)
-                l2 = other_slc.stop - other_slc.start; assert(slc.step is None)
-
-                #Update cirIndex - (expands slice if l2 > l1; adds in offset)
-                l = max(l1, l2)
-                new_slc = slice(off + slc.start, off + slc.start + l)
-                self.cirIndex[opstr] = new_slc
-
-                #Update existing data & new data arrays
-                if l2 > l1:  # insert 0-reps into self's data arrays
-                    nToInsert = l2 - l1; insertAt = off + slc.stop
-                    for nm in self:
-                        oliVal = self.oliDict[nm][insertAt - 1]    # just repeat the final bin's outcome
-                        timeVal = self.timeDict[nm][insertAt - 1]  # index and timestamp in 0-count bins
-                        self.oliDict[nm] = _np.insert(self.oliDict[nm], insertAt,
-                                                      oliVal * _np.ones(nToInsert, self.oliType))
-                        self.timeDict[nm] = _np.insert(self.timeDict[nm], insertAt,
-                                                       timeVal * _np.ones(nToInsert, self.timeType))
-                        self.repDict[nm] = _np.insert(self.repDict[nm], insertAt,
-                                                      _np.zeros(nToInsert, self.repType))
-                    off += nToInsert
-
-                #Copy dataset's data into new_ arrays (already padded as needed above)
-                if l2 >= l1:  # no need to pad dataset's array
-                    self.oliDict[datasetName][new_slc] = ds_oliData[other_slc]
-                    self.timeDict[datasetName][new_slc] = ds_timeData[other_slc]
-                    self.repDict[datasetName][new_slc] = ds_repData[other_slc]
-                else:  # l2 < l1 - need to pad dataset arrays w/0-counts
-                    new_slc_part1 = slice(new_slc.start, new_slc.start + l2)
-                    new_slc_part2 = slice(new_slc.start + l2, new_slc.stop)
-                    self.oliDict[datasetName][new_slc_part1] = ds_oliData[other_slc]
-                    self.timeDict[datasetName][new_slc_part1] = ds_timeData[other_slc]
-                    self.repDict[datasetName][new_slc_part1] = ds_repData[other_slc]
-
-                    timeVal = ds_timeData[other_slc.stop - 1]  # index and timestamp in 0-count bins
-                    oliVal = ds_oliData[other_slc.stop - 1]       # just repeat the final bin's outcome
-                    self.oliDict[datasetName][new_slc_part2] = oliVal
-                    self.timeDict[datasetName][new_slc_part2] = timeVal
-                    # (leave self.repDict[datasetName] with zeros in remaining "part2" of slice)
+            #Each circuit's data is padded with 0-count bins to the larger of its length in self and in dataset.
+            # Circuits are kept in order of increasing slice-start position (w.r.t. self).
+            circuits, slices = zip(*sorted(list(self.cirIndex.items()), key=lambda x: x[1].start))
+            other_slices = [dataset.cirIndex[opstr] for opstr in circuits]  # we know keys exist from check above
+            l1 = _np.array([slc.stop - slc.start for slc in slices], _np.int64)
+            l2 = _np.array([slc.stop - slc.start for slc in other_slices], _np.int64)
+            newLengths = _np.maximum(l1, l2)
+            newStarts = _np.cumsum(newLengths) - newLengths
+            newSlices = {opstr: slice(start, start + l)
+                         for opstr, start, l in zip(circuits, newStarts.tolist(), newLengths.tolist())}
+            self.cirIndex = _OrderedDict([(opstr, newSlices[opstr]) for opstr in self.cirIndex])
+
+            def padded(ar, rowSlices, lengths, bRep):
+                """ `ar`'s data rows (`rowSlices`), each padded to its new length """
+                src, pad = _get_padding_indices(_np.array([slc.start for slc in rowSlices], _np.int64),
+                                                lengths, newLengths)
+                newAr = ar[src]
+                if bRep: newAr[pad] = 0  # 0-rep padding bins (which repeat the final bin's outcome index and time)
+                return newAr
+
+            for nm in self:
+                self.oliDict[nm] = padded(self.oliDict[nm], slices, l1, False)
+                self.timeDict[nm] = padded(self.timeDict[nm], slices, l1, False)
+                self.repDict[nm] = padded(self.repDict[nm], slices, l1, True)
+
+            self.oliDict[datasetName] = padded(ds_oliData, other_slices, l2, False)
+            self.timeDict[datasetName] = padded(ds_timeData, other_slices, l2, False)
+            self.repDict[datasetName] = padded(ds_repData, other_slices, l2, True)
 
         # Update auxInfo
         if update_auxinfo and dataset.auxInfo:
@@ -539,7 +574,8 @@ class MultiDataSet(object):
                             circuitIndices=_copy.deepcopy(self.cirIndex) if (self.cirIndex is not None) else None,
                             outcomeLabelIndices=_copy.deepcopy(self.olIndex) if (self.olIndex is not None) else None,
                             collisionActions=self.collisionActions, comments=_copy.deepcopy(self.comments),
-                            comment=(self.comment + " copy") if self.comment else None, auxInfo=self.auxInfo)
+                            comment=(self.comment + " copy") if self.comment else None, auxInfo=self.auxInfo,
+                            sparse=self.sparse)
 
     def __getstate__(self):
         toPickle = {'cirIndexKeys': list(map(_cir.CompressedCircuit,
@@ -552,7 +588,8 @@ class MultiDataSet(object):
                     'collisionActions': self.collisionActions,
                     'auxInfo': self.auxInfo,
                     'comments': self.comments,
-                    'comment': self.comment}
+                    'comment': self.comment,
+                    'sparse': self.sparse}
         return toPickle
 
     def __setstate__(self, state_dict):
@@ -565,6 +602,8 @@ class MultiDataSet(object):
         self.collisionActions = state_dict['collisionActions']
         self.comments = state_dict['comments']
         self.comment = state_dict['comment']
+        self.sparse = state_dict.get('sparse', False)  # backward compat
+        self._views = {}
 
         self.auxInfo = state_dict.get('auxInfo', _DefaultDict(dict))
         if not isinstance(self.auxInfo, _DefaultDict) and isinstance(self.auxInfo, dict):
@@ -593,7 +632,8 @@ class MultiDataSet(object):
                     'collisionActions': self.collisionActions,
                     'auxInfo': self.auxInfo,
                     'comments': self.comments,
-                    'comment': self.comment}  # Don't pickle *Dict numpy data b/c it's inefficient
+                    'comment': self.comment,
+                    'sparse': self.sparse}  # Don't pickle *Dict numpy data b/c it's inefficient
         # Compatability for unicode-literal filenames
         bOpen = not (hasattr(fileOrFilename, 'write'))
         if bOpen:
@@ -658,6 +698,8 @@ class MultiDataSet(object):
         self.auxInfo = state_dict.get('auxInfo', _DefaultDict(dict))  # backward compat
         self.comments = state_dict["comments"]
         self.comment = state_dict["comment"]
+        self.sparse = state_dict.get('sparse', False)  # backward compat
+        self._views = {}
 
         self.oliDict = _OrderedDict()
         for key in state_dict['oliKeys']:
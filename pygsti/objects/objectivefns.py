@@ -17,7 +17,52 @@ from ..tools import listtools as _lt
 
 
 class ObjectiveFunction(object):
-    pass
+
+    def fn_and_jac(self, vectorGS):
+        """
+        Evaluate the objective function and its Jacobian at a single point.
+
+        Because the probabilities computed by `fn` are memoized, the Jacobian
+        evaluation reuses them rather than performing a second forward pass.
+
+        Parameters
+        ----------
+        vectorGS : numpy array
+            The model parameter vector to evaluate at.
+
+        Returns
+        -------
+        v : numpy array
+            The objective-function vector, as returned by `fn`.
+        jac : numpy array
+            The Jacobian matrix, as returned by `jfn`.
+        """
+        v = self.fn(vectorGS)
+        return v, self.jfn(vectorGS)
+
+    def _fill_probs(self, vectorGS):
+        """ Set model parameters to `vectorGS` and compute `self.probs`, remembering the point. """
+        self.mdl.from_vector(vectorGS)
+        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval, self.check, self.comm)
+        self._probs_x = vectorGS.copy()
+
+    def _fill_dprobs(self, dprobs, vectorGS):
+        """
+        Set model parameters to `vectorGS` and compute `dprobs` (and `self.probs`).
+
+        When `self.probs` was last computed at this same parameter vector (the
+        usual case when an optimizer requests the Jacobian at a point it just
+        evaluated the objective at) the probabilities are reused, saving a full
+        forward-simulation pass.
+        """
+        self.mdl.from_vector(vectorGS)
+        probs_are_current = self._probs_x is not None and _np.array_equal(self._probs_x, vectorGS)
+        self.mdl.bulk_fill_dprobs(dprobs, self.evTree,
+                                  prMxToFill=None if probs_are_current else self.probs,
+                                  clipTo=self.probClipInterval,
+                                  check=self.check, comm=self.comm, wrtBlockSize=self.wrtBlkSize,
+                                  profiler=self.profiler, gatherMemLimit=self.gthrMem)
+        self._probs_x = vectorGS.copy()
 
 
 #NOTE on chi^2 expressions:
@@ -73,6 +118,7 @@ class Chi2Function(ObjectiveFunction):
         #   tree and initialization of dsCircuitsToUse)
         self.probs = _np.empty(KM, 'd')
         self.jac = _np.empty((KM + self.ex, vec_gs_len), 'd')
+        self._probs_x = None  # parameter vector at which self.probs was last computed
 
         #Detect omitted frequences (assumed to be 0) so we can compute chi2 correctly
         self.firsts = []; self.indicesOfCircuitsWithOmittedData = []
@@ -164,8 +210,7 @@ class Chi2Function(ObjectiveFunction):
 
     def simple_chi2(self, vectorGS):
         tm = _time.time()
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval, self.check, self.comm)
+        self._fill_probs(vectorGS)
         v = (self.probs - self.f) * self.get_weights(self.probs)  # dims K x M (K = nSpamLabels, M = nCircuits)
 
         if self.firsts is not None:
@@ -177,8 +222,7 @@ class Chi2Function(ObjectiveFunction):
 
     def termgap_chi2(self, vectorGS, oob_check=False):
         tm = _time.time()
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval, self.check, self.comm)
+        self._fill_probs(vectorGS)
 
         if oob_check:
             if not self.mdl.bulk_probs_paths_are_sufficient(self.evTree,
@@ -199,8 +243,7 @@ class Chi2Function(ObjectiveFunction):
 
     def regularized_chi2(self, vectorGS):
         tm = _time.time()
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval, self.check, self.comm)
+        self._fill_probs(vectorGS)
         weights = self.get_weights(self.probs)
         v = (self.probs - self.f) * weights  # dim KM (K = nSpamLabels, M = nCircuits)
 
@@ -213,8 +256,7 @@ class Chi2Function(ObjectiveFunction):
 
     def penalized_chi2(self, vectorGS):
         tm = _time.time()
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval, self.check, self.comm)
+        self._fill_probs(vectorGS)
         weights = self.get_weights(self.probs)
         v = (self.probs - self.f) * weights  # dims K x M (K = nSpamLabels, M = nCircuits)
 
@@ -234,8 +276,7 @@ class Chi2Function(ObjectiveFunction):
 
     def verbose_chi2(self, vectorGS):
         tm = _time.time()
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval, self.check, self.comm)
+        self._fill_probs(vectorGS)
         weights = self.get_weights(self.probs)
 
         v = (self.probs - self.f) * weights
@@ -278,11 +319,7 @@ class Chi2Function(ObjectiveFunction):
         tm = _time.time()
         dprobs = self.jac.view()  # avoid mem copying: use jac mem for dprobs
         dprobs.shape = (self.KM, self.vec_gs_len)
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_dprobs(dprobs, self.evTree,
-                                  prMxToFill=self.probs, clipTo=self.probClipInterval,
-                                  check=self.check, comm=self.comm, wrtBlockSize=self.wrtBlkSize,
-                                  profiler=self.profiler, gatherMemLimit=self.gthrMem)
+        self._fill_dprobs(dprobs, vectorGS)
 
         #DEBUG TODO REMOVE - test dprobs to make sure they look right.
         #EPS = 1e-7
@@ -327,11 +364,7 @@ class Chi2Function(ObjectiveFunction):
         tm = _time.time()
         dprobs = self.jac[0:self.KM, :]  # avoid mem copying: use jac mem for dprobs
         dprobs.shape = (self.KM, self.vec_gs_len)
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_dprobs(dprobs, self.evTree,
-                                  prMxToFill=self.probs, clipTo=self.probClipInterval,
-                                  check=self.check, comm=self.comm, wrtBlockSize=self.wrtBlkSize,
-                                  profiler=self.profiler, gatherMemLimit=self.gthrMem)
+        self._fill_dprobs(dprobs, vectorGS)
         if self.firsts is not None:
             for ii, i in enumerate(self.indicesOfCircuitsWithOmittedData):
                 self.dprobs_omitted_rowsum[ii, :] = _np.sum(dprobs[self.lookup[i], :], axis=0)
@@ -359,11 +392,7 @@ class Chi2Function(ObjectiveFunction):
         tm = _time.time()
         dprobs = self.jac[0:self.KM, :]  # avoid mem copying: use jac mem for dprobs
         dprobs.shape = (self.KM, self.vec_gs_len)
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_dprobs(dprobs, self.evTree,
-                                  prMxToFill=self.probs, clipTo=self.probClipInterval,
-                                  check=self.check, comm=self.comm, wrtBlockSize=self.wrtBlkSize,
-                                  profiler=self.profiler, gatherMemLimit=self.gthrMem)
+        self._fill_dprobs(dprobs, vectorGS)
         if self.firsts is not None:
             for ii, i in enumerate(self.indicesOfCircuitsWithOmittedData):
                 self.dprobs_omitted_rowsum[ii, :] = _np.sum(dprobs[self.lookup[i], :], axis=0)
@@ -392,11 +421,7 @@ class Chi2Function(ObjectiveFunction):
         tm = _time.time()
         dprobs = self.jac[0:self.KM, :]  # avoid mem copying: use jac mem for dprobs
         dprobs.shape = (self.KM, self.vec_gs_len)
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_dprobs(dprobs, self.evTree,
-                                  prMxToFill=self.probs, clipTo=self.probClipInterval,
-                                  check=self.check, comm=self.comm, wrtBlockSize=self.wrtBlkSize,
-                                  profiler=self.profiler, gatherMemLimit=self.gthrMem)
+        self._fill_dprobs(dprobs, vectorGS)
         if self.firsts is not None:
             for ii, i in enumerate(self.indicesOfCircuitsWithOmittedData):
                 self.dprobs_omitted_rowsum[ii, :] = _np.sum(dprobs[self.lookup[i], :], axis=0)
@@ -657,19 +682,14 @@ class LogLFunction(ObjectiveFunction):
                 evaltree_cache['lookup'] = lookup
                 evaltree_cache['outcomes_lookup'] = outcomes_lookup
 
-        nEls = evalTree.num_final_elements()
         if evaltree_cache and 'cntVecMx' in evaltree_cache:
             countVecMx = evaltree_cache['cntVecMx']
             totalCntVec = evaltree_cache['totalCntVec']
         else:
             ds_circuit_list = _lt.apply_aliases_to_circuit_list(circuit_list, opLabelAliases)
 
-            countVecMx = _np.empty(nEls, 'd')
-            totalCntVec = _np.empty(nEls, 'd')
-            for (i, opStr) in enumerate(ds_circuit_list):
-                cnts = dataset[opStr].counts
-                totalCntVec[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-                countVecMx[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
+            countVecMx, totalCntVec = dataset.to_count_matrix(ds_circuit_list, lookup, outcomes_lookup,
+                                                              evalTree.num_final_elements())
 
             #could add to cache, but we don't have option of circuitWeights
             # here yet, so let's be conservative and not do this:
@@ -716,6 +736,7 @@ class LogLFunction(ObjectiveFunction):
         #Allocate peristent memory
         self.probs = _np.empty(self.KM, 'd')
         self.jac = _np.empty((self.KM + self.ex, self.vec_gs_len), 'd')
+        self._probs_x = None  # parameter vector at which self.probs was last computed
 
         #Detect omitted frequences (assumed to be 0) so we can compute liklihood correctly
         self.firsts = []; self.indicesOfCircuitsWithOmittedData = []
@@ -789,9 +810,7 @@ class LogLFunction(ObjectiveFunction):
 
     def poisson_picture_logl(self, vectorGS):
         tm = _time.time()
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval,
-                                 self.check, self.comm)
+        self._fill_probs(vectorGS)
         return self._poisson_picture_v_from_probs(tm)
 
     def _poisson_picture_v_from_probs(self, tm_start):
@@ -876,11 +895,7 @@ class LogLFunction(ObjectiveFunction):
         tm = _time.time()
         dprobs = self.jac[0:self.KM, :]  # avoid mem copying: use jac mem for dprobs
         dprobs.shape = (self.KM, self.vec_gs_len)
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_dprobs(dprobs, self.evTree,
-                                  prMxToFill=self.probs, clipTo=self.probClipInterval,
-                                  check=self.check, comm=self.comm, wrtBlockSize=self.wrtBlkSize,
-                                  profiler=self.profiler, gatherMemLimit=self.gthrMem)
+        self._fill_dprobs(dprobs, vectorGS)
 
         pos_probs = _np.where(self.probs < self.min_p, self.min_p, self.probs)
         S = self.minusCntVecMx / self.min_p + self.totalCntVec
@@ -948,7 +963,7 @@ class LogLFunction(ObjectiveFunction):
 
         if self.check: _opt.check_jac(lambda v: self.poisson_picture_logl(v), vectorGS, self.jac,
                                       tol=1e-3, eps=1e-6, errType='abs')
-        self.profiler.add_time("do_mlgst: JACOBIAN", tm)
+        if self.profiler: self.profiler.add_time("do_mlgst: JACOBIAN", tm)
         return self.jac
 
     def _termgap_v2_from_probs(self, probs, S, S2):
@@ -980,9 +995,7 @@ class LogLFunction(ObjectiveFunction):
 
     def termgap_poisson_picture_logl(self, vectorGS, oob_check=False):
         tm = _time.time()
-        self.mdl.from_vector(vectorGS)
-        self.mdl.bulk_fill_probs(self.probs, self.evTree, self.probClipInterval,
-                                 self.check, self.comm)
+        self._fill_probs(vectorGS)
 
         if oob_check:
             if not self.mdl.bulk_probs_paths_are_sufficient(self.evTree,
@@ -1346,5 +1359,6 @@ class LogLWildcardFunction(ObjectiveFunction):
                                           self.logl_objfn.circuitsToUse,
                                           self.logl_objfn.lookup,
                                           self.wildcard_budget_precomp)
+        self.logl_objfn._probs_x = None  # probs were overwritten, so they can't be reused
 
         return self.logl_objfn._poisson_picture_v_from_probs(tm)
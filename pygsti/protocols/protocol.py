@@ -429,7 +429,8 @@ class ExperimentDesign(_TreeNode):
         dirname = _pathlib.Path(dirname)
         ret = cls.__new__(cls)
         ret.__dict__.update(_io.load_meta_based_dir(dirname / 'edesign', 'auxfile_types'))
-        ret._init_children(dirname, 'edesign')
+        ret.auxfile_types.update({k: 'none' for k in _TreeNode._treenode_members})  # in case of older meta.json
+        ret._init_children(dirname, 'edesign')  # sets up (lazy) loading of child nodes
         ret._loaded_from = str(dirname.absolute())
         return ret
 
@@ -487,7 +488,7 @@ class ExperimentDesign(_TreeNode):
                               'default_protocols': 'dict-of-protocolobjs'}
 
         # because TreeNode takes care of its own serialization:
-        self.auxfile_types.update({'_dirs': 'none', '_vals': 'none', '_childcategory': 'none', '_loaded_from': 'none'})
+        self.auxfile_types.update({k: 'none' for k in _TreeNode._treenode_members})
 
         if qubit_labels is None:
             if children:
@@ -894,9 +895,7 @@ class SimultaneousExperimentDesign(ExperimentDesign):
             actual_to_desired.update({actual: desired for actual, desired in
                                       zip(sub_design.alt_actual_circuits_executed,
                                           sub_design.all_circuits_needing_data)})
-            filtered_ds = filtered_ds.copy_nonstatic()
-            filtered_ds.process_circuits(lambda c: actual_to_desired[c], aggregate=False)
-            filtered_ds.done_adding_data()
+            filtered_ds.process_circuits(lambda c: actual_to_desired[c], aggregate=False)  # a new, static, DataSet
         return ProtocolData(sub_design, filtered_ds)
 
 
@@ -947,7 +946,7 @@ class ProtocolData(_TreeNode):
         cache = _io.read_json_or_pkl_files_to_dict(data_dir / 'cache')
 
         ret = cls(edesign, dataset, cache)
-        ret._init_children(dirname, 'data')  # loads child nodes
+        ret._init_children(dirname, 'data')  # child nodes are loaded when they're first accessed
         return ret
 
     def __init__(self, edesign, dataset=None, cache=None):
@@ -1050,8 +1049,8 @@ class ProtocolData(_TreeNode):
                 copy the non-edesign parts of a 'src_data' ProtocolData """
             ret = ProtocolData(des, src_data.dataset, src_data.cache)
             for subname, subedesign in des.items():
-                if subname in src_data._vals:  # if we've actually created this sub-data...
-                    ret._vals[subname] = build_data(subedesign, src_data._vals[subname])
+                if subname in src_data._vals or subname in src_data._child_src_dirs:  # if this sub-data exists...
+                    ret._vals[subname] = build_data(subedesign, src_data[subname])
             return ret
         filtered_edesign = self.edesign.filter_paths(paths, paths_are_sorted)
         return build_data(filtered_edesign, self)
@@ -1095,9 +1094,9 @@ class ProtocolData(_TreeNode):
                 data_dir.mkdir(exist_ok=True)
                 if isinstance(self.dataset, _objs.MultiDataSet):
                     for dsname, ds in self.dataset.items():
-                        _io.write_dataset(data_dir / (dsname + '.txt'), ds)
+                        _io.write_file_atomically(data_dir / (dsname + '.txt'), _io.write_dataset, ds)
                 else:
-                    _io.write_dataset(data_dir / 'dataset.txt', self.dataset)
+                    _io.write_file_atomically(data_dir / 'dataset.txt', _io.write_dataset, self.dataset)
 
         if self.cache:
             _io.write_dict_to_json_or_pkl_files(self.cache, data_dir / 'cache')
@@ -1322,7 +1321,7 @@ class ProtocolResultsDir(_TreeNode):
                         dirname, pth.name, preloaded_data=data)
 
         ret = cls(data, results, {})  # don't initialize children now
-        ret._init_children(dirname, meta_subdir='results')
+        ret._init_children(dirname, meta_subdir='results')  # child nodes are loaded when they're first accessed
         return ret
 
     def __init__(self, data, protocol_results=None, children=None):
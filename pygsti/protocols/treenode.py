@@ -11,6 +11,7 @@
 import json as _json
 import pathlib as _pathlib
 import copy as _copy
+import collections as _collections
 
 from .. import io as _io
 
@@ -18,8 +19,17 @@ from .. import io as _io
 class TreeNode(object):
     """ TODO: docstring
     A base class for representing an object that lives "at" a filesystem directory
+
+    Child nodes of a tree node that is loaded from disk are only loaded when they
+    are first accessed.  If `_max_loaded_children` is not None, at most this many
+    of these (from-disk) children are kept in memory at once: the least recently
+    used ones are dropped, and re-loaded from disk if they're needed again.
     """
 
+    # members that hold the tree structure (and aren't serialized along with other members)
+    _treenode_members = ('_dirs', '_vals', '_childcategory', '_loaded_from',
+                         '_child_src_dirs', '_loaded_children', '_max_loaded_children')
+
     @classmethod
     def from_dir(cls, dirname, parent=None, name=None):
         raise NotImplementedError("Derived classes should implement from_dir(...)!")
@@ -36,6 +46,9 @@ class TreeNode(object):
         self._vals = child_values if child_values else {}
         self._childcategory = child_category
         self._loaded_from = None
+        self._child_src_dirs = {}  # maps child keys -> directory holding child's meta.json (for lazy loading)
+        self._loaded_children = _collections.OrderedDict()  # keys of loaded from-disk children, in LRU order
+        self._max_loaded_children = None
 
     @property
     def child_category(self):
@@ -55,16 +68,41 @@ class TreeNode(object):
         self._dirs = child_dirs
         self._vals = {}
         self._childcategory = meta.get('category', None)
+        self._child_src_dirs = {}
+        self._loaded_children = _collections.OrderedDict()
+        if not hasattr(self, '_max_loaded_children'): self._max_loaded_children = None
 
+        #Children aren't loaded here, only when they're accessed (see `_load_child`)
         for nm, subdir in child_dirs.items():
             subobj_dir = dirname / subdir
             #if meta_subdir:
             submeta_dir = subobj_dir / meta_subdir
             if submeta_dir.exists():  # It's ok if not all possible sub-nodes exist
-                self._vals[nm] = _io.cls_from_meta_json(submeta_dir).from_dir(subobj_dir, parent=self, name=nm)
+                self._child_src_dirs[nm] = submeta_dir
             #else:  # if meta_subdir is None, we default to the same class as self
             #    self._vals[nm] = self.__class__.from_dir(subobj_dir, parent=self, name=nm)
 
+    def _load_child(self, key):
+        """ Load the child node `key` from disk, dropping the least recently used loaded child if needed """
+        submeta_dir = self._child_src_dirs[key]
+        subobj_dir = submeta_dir.parent
+        val = _io.cls_from_meta_json(submeta_dir).from_dir(subobj_dir, parent=self, name=key)
+        if isinstance(val, TreeNode): val._set_max_loaded_children(self._max_loaded_children)
+
+        self._vals[key] = val
+        self._loaded_children[key] = True
+        if self._max_loaded_children is not None:
+            while len(self._loaded_children) > max(self._max_loaded_children, 1):
+                lru_key, _ = self._loaded_children.popitem(last=False)
+                del self._vals[lru_key]  # (it will be re-loaded from disk if it's needed again)
+        return val
+
+    def _set_max_loaded_children(self, max_loaded_children):
+        """ Set the maximum number of loaded-from-disk children to keep in memory (for this and child nodes) """
+        self._max_loaded_children = max_loaded_children
+        for val in self._vals.values():
+            if isinstance(val, TreeNode): val._set_max_loaded_children(max_loaded_children)
+
     def keys(self):
         return self._dirs.keys()
 
@@ -81,8 +119,12 @@ class TreeNode(object):
     def __getitem__(self, key):
         if key not in self._dirs:
             raise KeyError("Invalid key: %s" % key)
-        if key not in self._vals:
-            self._vals[key] = self._create_childval(key)
+        if key in self._vals:
+            if key in self._loaded_children: self._loaded_children.move_to_end(key)
+            return self._vals[key]
+        if key in self._child_src_dirs:
+            return self._load_child(key)
+        self._vals[key] = self._create_childval(key)
         return self._vals[key]
 
     def _create_childval(self, key):
@@ -100,6 +142,7 @@ class TreeNode(object):
         view = _copy.deepcopy(self)  # is deep copy really needed here??
         view._dirs = {k: self._dirs[k] for k in keys_to_keep}
         view._vals = {k: self[k] for k in keys_to_keep}
+        view._child_src_dirs = {}; view._loaded_children = _collections.OrderedDict()  # children are held
         return view
 
     def filter_paths(self, paths, paths_are_sorted=False):
@@ -126,6 +169,7 @@ class TreeNode(object):
         view = _copy.deepcopy(self)  # copies type of this tree node
         view._dirs = {k: self._dirs[k] for k in children_to_keep}
         view._vals = children_to_keep
+        view._child_src_dirs = {}; view._loaded_children = _collections.OrderedDict()  # children are held
         return view
 
     def write(self, dirname, parent=None):
@@ -146,8 +190,14 @@ class TreeNode(object):
             with open(dirname / 'edesign' / 'subdirs.json', 'w') as f:
                 _json.dump(subdirs, f)
 
-        for nm, val in self._vals.items():  # only write *existing* values
-            subdir = self._dirs[nm]
+        for nm, subdir in self._dirs.items():  # only write *existing* values
             outdir = dirname / subdir
+            if nm in self._vals:
+                val = self._vals[nm]
+            elif nm in self._child_src_dirs:  # an unloaded child only needs writing if it's written elsewhere
+                if outdir.exists() and self._child_src_dirs[nm].parent.resolve() == outdir.resolve(): continue
+                val = self[nm]
+            else:
+                continue
             outdir.mkdir(exist_ok=True)
-            self._vals[nm].write(outdir, parent=self)
+            val.write(outdir, parent=self)
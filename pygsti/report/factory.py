@@ -35,7 +35,7 @@ from . import Report as _Report
 from . import section as _section
 from .notebook import Notebook as _Notebook
 from ..objects.label import Label as _Lbl
-from ..modelpacks import RBModelPack as _RBModelPack
+from .. import modelpacks as _modelpacks  # (not `from ..modelpacks import ...` b/c of circular imports)
 
 #maybe import these from drivers.longsequence so they stay synced?
 ROBUST_SUFFIX_LIST = [".robust", ".Robust", ".robust+", ".Robust+"]  # ".wildcard" (not a separate estimate anymore)
@@ -1077,7 +1077,7 @@ def find_std_clifford_compilation(model, verbosity=0):
            set(target_model.preps.keys()) == set(model.preps.keys()) and \
            set(target_model.povms.keys()) == set(model.povms.keys()):
             if target_model.frobeniusdist(model) < 1e-6:
-                if isinstance(mod, _RBModelPack):
+                if isinstance(mod, _modelpacks.RBModelPack):
                     printer.log("Found standard clifford compilation from %s" % module_name)
                     return mod.clifford_compilation(qubit_labels)
 
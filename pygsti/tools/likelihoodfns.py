@@ -9,11 +9,11 @@
 #***************************************************************************************************
 
 import numpy as _np
-import scipy.stats as _stats
 import warnings as _warnings
 import itertools as _itertools
 import time as _time
 import sys as _sys
+import concurrent.futures as _futures
 from collections import OrderedDict as _OrderedDict
 from . import basistools as _bt
 from . import listtools as _lt
@@ -21,6 +21,7 @@ from . import jamiolkowski as _jam
 from . import mpitools as _mpit
 from . import slicetools as _slct
 from ..objects.smartcache import smart_cached
+from ..objects.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 
 TOL = 1e-20
 
@@ -108,6 +109,55 @@ TOL = 1e-20
 #   F(p) = piecewise{ if( p>r ) then p; else (r-p)^2/(2*r) + p }
 
 
+def _logl_element_terms(probs, countVecMx, totalCntVec, min_p, a, poissonPicture,
+                        firsts=None, omitted_lookups=None):
+    """
+    The (patched) log-likelihood contribution of each element, computed from the
+    probabilities `probs`, whose last axis indexes the same elements as `countVecMx`
+    and `totalCntVec` (any leading axes, e.g. over parameter vectors, are broadcast).
+    `firsts` and `omitted_lookups` hold the first element and the element indices of
+    each circuit whose data omits some of its outcomes (None if there are none).
+    """
+    pos_probs = _np.where(probs < min_p, min_p, probs)
+
+    # XXX: aren't the next blocks duplicated elsewhere?
+    if poissonPicture:
+        S = countVecMx / min_p - totalCntVec  # slope term that is derivative of logl at min_p
+        S2 = -0.5 * countVecMx / (min_p**2)          # 2nd derivative of logl term at min_p
+        v = countVecMx * _np.log(pos_probs) - totalCntVec * pos_probs  # dim KM (K = nSpamLabels, M = nCircuits)
+        # remove small positive elements due to roundoff error (above expression *cannot* really be positive)
+        v = _np.minimum(v, 0)
+        # quadratic extrapolation of logl at min_p for probabilities < min_p
+        v = _np.where(probs < min_p, v + S * (probs - min_p) + S2 * (probs - min_p)**2, v)
+        v = _np.where(countVecMx == 0,
+                      -totalCntVec * _np.where(probs >= a, probs,
+                                               (-1.0 / (3 * a**2)) * probs**3 + probs**2 / a + a / 3.0),
+                      v)
+        #special handling for f == 0 poissonPicture terms using quadratic rounding of function with minimum:
+        #max(0,(a-p))^2/(2a) + p
+
+        if firsts is not None:
+            omitted_probs = 1.0 - _np.stack([_np.sum(pos_probs[..., lkup], axis=-1)
+                                             for lkup in omitted_lookups], axis=-1)
+            v[..., firsts] -= totalCntVec[firsts] * \
+                _np.where(omitted_probs >= a, omitted_probs,
+                          (-1.0 / (3 * a**2)) * omitted_probs**3 + omitted_probs**2 / a + a / 3.0)
+
+    else:
+        # (the non-poisson picture requires that the probabilities of the spam labels for a given string are constrained
+        # to sum to 1)
+        S = countVecMx / min_p               # slope term that is derivative of logl at min_p
+        S2 = -0.5 * countVecMx / (min_p**2)  # 2nd derivative of logl term at min_p
+        v = countVecMx * _np.log(pos_probs)  # dim KM (K = nSpamLabels, M = nCircuits)
+        # remove small positive elements due to roundoff error (above expression *cannot* really be positive)
+        v = _np.minimum(v, 0)
+        # quadratic extrapolation of logl at min_p for probabilities < min_p
+        v = _np.where(probs < min_p, v + S * (probs - min_p) + S2 * (probs - min_p)**2, v)
+        v = _np.where(countVecMx == 0, 0.0, v)
+        #Note: no need to account for omitted probs at all (they contribute nothing)
+    return v
+
+
 #@smart_cached
 def logl_terms(model, dataset, circuit_list=None,
                minProbClip=1e-6, probClipInterval=(-1e6, 1e6), radius=1e-4,
@@ -168,12 +218,7 @@ def logl_terms(model, dataset, circuit_list=None,
         countVecMx = evaltree_cache['cntVecMx']
         totalCntVec = evaltree_cache['totalCntVec']
     else:
-        countVecMx = _np.empty(nEls, 'd')
-        totalCntVec = _np.empty(nEls, 'd')
-        for (i, opStr) in enumerate(ds_circuit_list):
-            cnts = dataset[opStr].counts
-            totalCntVec[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-            countVecMx[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
+        countVecMx, totalCntVec = dataset.to_count_matrix(ds_circuit_list, lookup, outcomes_lookup, nEls)
 
         #could add to cache, but we don't have option of circuitWeights
         # here yet, so let's be conservative and not do this:
@@ -198,43 +243,8 @@ def logl_terms(model, dataset, circuit_list=None,
     if wildcard:
         probs_in = probs.copy()
         wildcard.update_probs(probs_in, probs, countVecMx / totalCntVec, circuit_list, lookup)
-    pos_probs = _np.where(probs < min_p, min_p, probs)
-
-    # XXX: aren't the next blocks duplicated elsewhere?
-    if poissonPicture:
-        S = countVecMx / min_p - totalCntVec  # slope term that is derivative of logl at min_p
-        S2 = -0.5 * countVecMx / (min_p**2)          # 2nd derivative of logl term at min_p
-        v = countVecMx * _np.log(pos_probs) - totalCntVec * pos_probs  # dim KM (K = nSpamLabels, M = nCircuits)
-        # remove small positive elements due to roundoff error (above expression *cannot* really be positive)
-        v = _np.minimum(v, 0)
-        # quadratic extrapolation of logl at min_p for probabilities < min_p
-        v = _np.where(probs < min_p, v + S * (probs - min_p) + S2 * (probs - min_p)**2, v)
-        v = _np.where(countVecMx == 0,
-                      -totalCntVec * _np.where(probs >= a, probs,
-                                               (-1.0 / (3 * a**2)) * probs**3 + probs**2 / a + a / 3.0),
-                      v)
-        #special handling for f == 0 poissonPicture terms using quadratic rounding of function with minimum:
-        #max(0,(a-p))^2/(2a) + p
-
-        if firsts is not None:
-            omitted_probs = 1.0 - _np.array([_np.sum(pos_probs[lookup[i]])
-                                             for i in indicesOfCircuitsWithOmittedData])
-            v[firsts] -= totalCntVec[firsts] * \
-                _np.where(omitted_probs >= a, omitted_probs,
-                          (-1.0 / (3 * a**2)) * omitted_probs**3 + omitted_probs**2 / a + a / 3.0)
-
-    else:
-        # (the non-poisson picture requires that the probabilities of the spam labels for a given string are constrained
-        # to sum to 1)
-        S = countVecMx / min_p               # slope term that is derivative of logl at min_p
-        S2 = -0.5 * countVecMx / (min_p**2)  # 2nd derivative of logl term at min_p
-        v = countVecMx * _np.log(pos_probs)  # dim KM (K = nSpamLabels, M = nCircuits)
-        # remove small positive elements due to roundoff error (above expression *cannot* really be positive)
-        v = _np.minimum(v, 0)
-        # quadratic extrapolation of logl at min_p for probabilities < min_p
-        v = _np.where(probs < min_p, v + S * (probs - min_p) + S2 * (probs - min_p)**2, v)
-        v = _np.where(countVecMx == 0, 0.0, v)
-        #Note: no need to account for omitted probs at all (they contribute nothing)
+    omitted_lookups = [lookup[i] for i in indicesOfCircuitsWithOmittedData] if (firsts is not None) else None
+    v = _logl_element_terms(probs, countVecMx, totalCntVec, min_p, a, poissonPicture, firsts, omitted_lookups)
 
     #DEBUG
     #print "num clipped = ",_np.sum(probs < min_p)," of ",probs.shape
@@ -340,6 +350,73 @@ def logl(model, dataset, circuit_list=None,
     return _np.sum(v)  # sum over *all* dimensions
 
 
+def logl_multi(model, dataset, paramVectors, circuit_list=None,
+               minProbClip=1e-6, probClipInterval=(-1e6, 1e6), radius=1e-4,
+               poissonPicture=True, check=False, opLabelAliases=None,
+               comm=None, memLimit=None):
+    """
+    The log-likelihood function evaluated at each of several model-parameter vectors.
+
+    This gives the same values as setting `model`'s parameters to each vector
+    in turn and calling :func:`logl`, but computes the probabilities for all the
+    vectors at once using :method:`Model.bulk_fill_probs_multi`, which (e.g. for
+    the matrix simulator) amortizes the evaluation-tree traversal over the points.
+    This is useful when scanning the log-likelihood over many nearby points,
+    e.g. for profile likelihoods or wildcard-budget fitting.
+
+    Parameters
+    ----------
+    model : Model
+        Model of parameterized gates.  Its parameters are restored before returning.
+
+    dataset : DataSet
+        Probability data
+
+    paramVectors : list or numpy ndarray
+        A sequence (or 2D array) of parameter vectors for `model`.
+
+    circuit_list : list of (tuples or Circuits), optional
+        Each element specifies a operation sequence to include in the log-likelihood
+        sum.  Default value of None implies all the operation sequences in dataset
+        should be used.
+
+    minProbClip, probClipInterval, radius, poissonPicture, check, opLabelAliases : optional
+        See :func:`logl`.
+
+    comm : mpi4py.MPI.Comm, optional
+        When not None, an MPI communicator for distributing the computation
+        across multiple processors.
+
+    memLimit : int, optional
+        A rough memory limit in bytes which restricts how many parameter vectors
+        have their intermediate (per-point) values computed at once.
+
+    Returns
+    -------
+    numpy.ndarray
+        A 1D array of log-likelihood values, one per parameter vector.
+    """
+    if circuit_list is None:
+        circuit_list = list(dataset.keys())
+
+    evalTree, _, _, lookup, outcomes_lookup = model.bulk_evaltree_from_resources(
+        circuit_list, comm, dataset=dataset)
+    nEls = evalTree.num_final_elements()
+    ds_circuit_list = _lt.apply_aliases_to_circuit_list(circuit_list, opLabelAliases)
+    countVecMx, totalCntVec = dataset.to_count_matrix(ds_circuit_list, lookup, outcomes_lookup, nEls)
+
+    #Detect omitted frequences (assumed to be 0) so we can compute liklihood correctly
+    omitted = [i for i, c in enumerate(circuit_list) if 0 < _slct.length(lookup[i]) < model.get_num_outcomes(c)]
+    firsts = _np.array([_slct.as_array(lookup[i])[0] for i in omitted], 'i') if len(omitted) > 0 else None
+
+    probs = _np.empty((len(paramVectors), nEls), 'd')
+    mlim = None if (memLimit is None) else memLimit - probs.nbytes
+    model.bulk_fill_probs_multi(probs, evalTree, paramVectors, probClipInterval, check, comm, mlim)
+    v = _logl_element_terms(probs, countVecMx, totalCntVec, minProbClip, radius, poissonPicture,
+                            firsts, [lookup[i] for i in omitted])
+    return _np.sum(v, axis=1)
+
+
 def logl_jacobian(model, dataset, circuit_list=None,
                   minProbClip=1e-6, probClipInterval=(-1e6, 1e6), radius=1e-4,
                   poissonPicture=True, check=False, comm=None,
@@ -451,12 +528,7 @@ def logl_jacobian(model, dataset, circuit_list=None,
 
     ds_circuit_list = _lt.apply_aliases_to_circuit_list(circuit_list, opLabelAliases)
 
-    countVecMx = _np.empty(nEls, 'd')
-    totalCntVec = _np.empty(nEls, 'd')
-    for (i, opStr) in enumerate(ds_circuit_list):
-        cnts = dataset[opStr].counts
-        totalCntVec[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-        countVecMx[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
+    countVecMx, totalCntVec = dataset.to_count_matrix(ds_circuit_list, lookup, outcomes_lookup, nEls)
 
     #Detect omitted frequences (assumed to be 0) so we can compute liklihood correctly
     firsts = []; indicesOfCircuitsWithOmittedData = []
@@ -550,7 +622,7 @@ def logl_jacobian(model, dataset, circuit_list=None,
 def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
                  probClipInterval=(-1e6, 1e6), radius=1e-4, poissonPicture=True,
                  check=False, comm=None, memLimit=None,
-                 opLabelAliases=None, smartc=None, verbosity=0):
+                 opLabelAliases=None, smartc=None, verbosity=0, numThreads=1, _hprobsTermOnly=False):
     """
     The hessian of the log-likelihood function.
 
@@ -610,6 +682,14 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
     verbosity : int, optional
         How much detail to print to stdout.
 
+    numThreads : int, optional
+        The number of threads used to compute (disjoint) blocks of the Hessian
+        concurrently when `comm` is None.  The threads share `model` and its
+        (read-only) product cache, and the memory limit is shared between them.
+        Threads are only used when the model's forward simulator can compute
+        blocks concurrently (see :method:`Model.bulk_hprobs_by_block_groups`),
+        e.g. the "matrix" simulator; otherwise the blocks are computed serially.
+
 
     Returns
     -------
@@ -642,7 +722,8 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
     #  Estimate & check intermediate memory
     #  - figure out how many row & column partitions are needed
     #    to fit computation within available memory (and use all cpus)
-    mlim = None if (memLimit is None) else memLimit - persistentMem
+    if comm is not None: numThreads = 1  # MPI processes take the place of threads
+    mlim = None if (memLimit is None) else (memLimit - persistentMem) / numThreads  # each thread holds its own blocks
     # Note: simplify_circuits doesn't support aliased dataset (yet)
     dstree = dataset if (opLabelAliases is None) else None
     evalTree, blkSize1, blkSize2, lookup, outcomes_lookup = \
@@ -650,8 +731,10 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
               circuit_list, comm, mlim, "deriv", ['bulk_hprobs_by_block'],
               dstree, verbosity)
 
-    rowParts = int(round(nP / blkSize1)) if (blkSize1 is not None) else 1
-    colParts = int(round(nP / blkSize2)) if (blkSize2 is not None) else 1
+    rowParts = max(int(round(nP / blkSize1)), 1) if (blkSize1 is not None) else 1
+    colParts = max(int(round(nP / blkSize2)), 1) if (blkSize2 is not None) else 1
+    if numThreads > 1:  # need at least one (upper-triangle) block per thread
+        rowParts = colParts = min(max(rowParts, colParts, numThreads), nP)
 
     a = radius  # parameterizes "roundness" of f == 0 terms
     min_p = minProbClip
@@ -680,7 +763,8 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
 
             #Allocate these above?  Need to know block sizes of dprobs12 & hprobs...
             if firsts is not None:
-                dprobs12_omitted_rowsum = _np.empty((len(firsts),) + dprobs12.shape[1:], 'd')
+                if dprobs12 is not None:
+                    dprobs12_omitted_rowsum = _np.empty((len(firsts),) + dprobs12.shape[1:], 'd')
                 hprobs_omitted_rowsum = _np.empty((len(firsts),) + hprobs.shape[1:], 'd')
 
             # # (K,M,1,1) * (K,M,N,N')
@@ -700,7 +784,8 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
 
             omitted_probs = 1.0 - _np.array([_np.sum(pos_probs[lookup[i]]) for i in indicesOfCircuitsWithOmittedData])
             for ii, i in enumerate(indicesOfCircuitsWithOmittedData):
-                dprobs12_omitted_rowsum[ii, :, :] = _np.sum(dprobs12[lookup[i], :, :], axis=0)
+                if dprobs12 is not None:
+                    dprobs12_omitted_rowsum[ii, :, :] = _np.sum(dprobs12[lookup[i], :, :], axis=0)
                 hprobs_omitted_rowsum[ii, :, :] = _np.sum(hprobs[lookup[i], :, :], axis=0)
 
             #Accomplish the same thing as the above commented-out lines,
@@ -727,11 +812,14 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
             # hessian = hprobs_coeffs * hprobs + dprobs12_coeff * dprobs12
             #  but re-using dprobs12 and hprobs memory (which is overwritten!)
             hprobs *= hprobs_coeffs[:, None, None]
-            dprobs12 *= dprobs12_coeffs[:, None, None]
             if firsts is not None:
                 hprobs[firsts, :, :] += hprobs_omitted_coeffs[:, None, None] * hprobs_omitted_rowsum
-                dprobs12[firsts, :, :] += dprobs12_omitted_coeffs[:, None, None] * dprobs12_omitted_rowsum
-            hessian = dprobs12; hessian += hprobs
+            hessian = hprobs
+            if dprobs12 is not None:  # None => only the hprobs term is wanted
+                dprobs12 *= dprobs12_coeffs[:, None, None]
+                if firsts is not None:
+                    dprobs12[firsts, :, :] += dprobs12_omitted_coeffs[:, None, None] * dprobs12_omitted_rowsum
+                hessian += dprobs12
 
             # hessian[iSpamLabel,iCircuit,iModelParam1,iModelParams2] contains all
             #  d2(logl)/d(modelParam1)d(modelParam2) contributions
@@ -773,8 +861,10 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
             # hessian = hprobs_coeffs * hprobs + dprobs12_coeff * dprobs12
             #  but re-using dprobs12 and hprobs memory (which is overwritten!)
             hprobs *= hprobs_coeffs[:, None, None]
-            dprobs12 *= dprobs12_coeffs[:, None, None]
-            hessian = dprobs12; hessian += hprobs
+            hessian = hprobs
+            if dprobs12 is not None:  # None => only the hprobs term is wanted
+                dprobs12 *= dprobs12_coeffs[:, None, None]
+                hessian += dprobs12
             #Note: no need to correct for omitted probs (zero contribution)
 
             return _np.sum(hessian, axis=0)  # see comments as above
@@ -793,18 +883,12 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
     #  Allocate memory (alloc max required & take views)
     max_nEls = max([subtrees[i].num_final_elements() for i in mySubTreeIndices])
     probs_mem = _np.empty(max_nEls, 'd')
+    bReturnDProbs12 = not _hprobsTermOnly  # dprobs12 blocks aren't needed for the hprobs term alone
 
     # Fill cntVecMx, totalCntVec for all elements (all subtrees)
-    nEls = evalTree.num_final_elements()
-    cntVecMx_all = _np.empty(nEls, 'd')
-    totalCntVec_all = _np.empty(nEls, 'd')
-
     ds_subtree_circuit_list = _lt.apply_aliases_to_circuit_list(circuit_list, opLabelAliases)
-
-    for (i, opStr) in enumerate(ds_subtree_circuit_list):
-        cnts = dataset[opStr].counts
-        totalCntVec_all[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-        cntVecMx_all[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
+    cntVecMx_all, totalCntVec_all = dataset.to_count_matrix(ds_subtree_circuit_list, lookup, outcomes_lookup,
+                                                            evalTree.num_final_elements())
 
     tStart = _time.time()
 
@@ -840,9 +924,9 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
         blocks2 = _mpit.slice_up_range(nCols, colParts)
         sliceTupList_all = list(_itertools.product(blocks1, blocks2))
         #cull out lower triangle blocks, which have no overlap with
-        # the upper triangle of the hessian
+        # the upper triangle (including the diagonal) of the hessian
         sliceTupList = [(slc1, slc2) for slc1, slc2 in sliceTupList_all
-                        if slc1.start <= slc2.stop]
+                        if slc1.start < slc2.stop]
 
         loc_iBlks, blkOwners, blkComm = \
             _mpit.distribute_indices(list(range(len(sliceTupList))), mySubComm)
@@ -850,22 +934,43 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
 
         subtree_hessian = _np.zeros((nP, nP), 'd')
 
-        k, kmax = 0, len(mySliceTupList)
-        for (slice1, slice2, hprobs, dprobs12) in model.bulk_hprobs_by_block(
-                evalSubTree, mySliceTupList, True, blkComm):
-            rank = comm.Get_rank() if (comm is not None) else 0
-
-            if verbosity > 3 or (verbosity == 3 and rank == 0):
-                iSub = mySubTreeIndices.index(iSubTree)
-                print("rank %d: %gs: block %d/%d, sub-tree %d/%d, sub-tree-len = %d"
-                      % (rank, _time.time() - tStart, k, kmax, iSub,
-                         len(mySubTreeIndices), len(evalSubTree)))
-                _sys.stdout.flush(); k += 1
-
-            subtree_hessian[slice1, slice2] = \
-                hessian_from_hprobs(hprobs, dprobs12, cntVecMx,
-                                    totalCntVec, pos_probs)
-            #NOTE: hessian_from_hprobs MAY modify hprobs and dprobs12
+        def fill_blocks(block_generator, kmax):
+            """ Stream the Hessian blocks of `block_generator` into `subtree_hessian` (blocks are disjoint) """
+            k = 0
+            for blk in block_generator:
+                slice1, slice2, hprobs = blk[0:3]
+                dprobs12 = blk[3] if bReturnDProbs12 else None
+                rank = comm.Get_rank() if (comm is not None) else 0
+
+                if verbosity > 3 or (verbosity == 3 and rank == 0):
+                    iSub = mySubTreeIndices.index(iSubTree)
+                    print("rank %d: %gs: block %d/%d, sub-tree %d/%d, sub-tree-len = %d"
+                          % (rank, _time.time() - tStart, k, kmax, iSub,
+                             len(mySubTreeIndices), len(evalSubTree)))
+                    _sys.stdout.flush(); k += 1
+
+                subtree_hessian[slice1, slice2] = \
+                    hessian_from_hprobs(hprobs, dprobs12, cntVecMx,
+                                        totalCntVec, pos_probs)
+                #NOTE: hessian_from_hprobs MAY modify hprobs and dprobs12
+
+        block_generators = None
+        if numThreads > 1 and len(mySliceTupList) > 1:
+            # contiguous chunks keep consecutive blocks sharing a row slice on the same thread
+            chunks = [mySliceTupList[s] for s in _mpit.slice_up_range(
+                len(mySliceTupList), min(numThreads, len(mySliceTupList)))]
+            try:
+                block_generators = model.bulk_hprobs_by_block_groups(evalSubTree, chunks, bReturnDProbs12, blkComm)
+            except NotImplementedError:
+                pass  # the forward simulator isn't thread-safe => compute the blocks serially (below)
+
+        if block_generators is not None:
+            with _futures.ThreadPoolExecutor(len(chunks)) as executor:
+                jobs = [executor.submit(fill_blocks, gen, len(chunk)) for gen, chunk in zip(block_generators, chunks)]
+                for job in jobs: job.result()  # re-raises any exception from the worker threads
+        else:
+            fill_blocks(model.bulk_hprobs_by_block(evalSubTree, mySliceTupList, bReturnDProbs12, blkComm),
+                        len(mySliceTupList))
 
         #Gather columns from different procs and add to running final hessian
         #_mpit.gather_slices_by_owner(slicesIOwn, subtree_hessian,[], (0,1), mySubComm)
@@ -880,9 +985,7 @@ def logl_hessian(model, dataset, circuit_list=None, minProbClip=1e-6,
         final_hessian = comm.allreduce(final_hessian)
 
     #copy upper triangle to lower triangle (we only compute upper)
-    for i in range(final_hessian.shape[0]):
-        for j in range(i + 1, final_hessian.shape[1]):
-            final_hessian[j, i] = final_hessian[i, j]
+    final_hessian = _np.triu(final_hessian) + _np.triu(final_hessian, 1).T
 
     return final_hessian  # (N,N)
 
@@ -1011,12 +1114,7 @@ def logl_approximate_hessian(model, dataset, circuit_list=None,
 
     ds_circuit_list = _lt.apply_aliases_to_circuit_list(circuit_list, opLabelAliases)
 
-    cntVecMx = _np.empty(nEls, 'd')
-    totalCntVec = _np.empty(nEls, 'd')
-    for (i, opStr) in enumerate(ds_circuit_list):
-        cnts = dataset[opStr].counts
-        totalCntVec[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-        cntVecMx[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
+    cntVecMx, totalCntVec = dataset.to_count_matrix(ds_circuit_list, lookup, outcomes_lookup, nEls)
 
     smart(model.bulk_fill_dprobs, dprobs, evalTree, prMxToFill=probs,
           clipTo=probClipInterval, check=check, comm=comm,
@@ -1058,6 +1156,173 @@ def logl_approximate_hessian(model, dataset, circuit_list=None,
     return hessian
 
 
+def logl_corrected_approximate_hessian(model, dataset, circuit_list=None,
+                                       minProbClip=1e-6, probClipInterval=(-1e6, 1e6), radius=1e-4,
+                                       poissonPicture=True, check=False, comm=None,
+                                       memLimit=None, opLabelAliases=None, smartc=None,
+                                       verbosity=0, correctionTol=1e-2, returnNeglectedWeight=False,
+                                       numThreads=1):
+    """
+    An approximate Hessian of the log-likelihood with a partial second-derivative correction.
+
+    The "Gauss-Newton" Hessian `J * d2(logl)/dprobs2 * J.T` computed by
+    :function:`logl_approximate_hessian` neglects the `d2(probs)/d(params)2`
+    ("hprobs") terms of the true Hessian.  Each such term is weighted by
+    `d(logl)/dprob`, e.g. `N_{i,sl}/p_{i,sl} - N[i]` in the Poisson picture,
+    which is small for most circuits near the MLE.  This function computes
+    the Gauss-Newton Hessian for all the circuits and then adds the hprobs
+    terms of only the circuits with the largest hprobs weights (so that these
+    circuits contribute exactly as in :function:`logl_hessian`).  The
+    expensive hprobs computation is thereby restricted to a (usually small)
+    subset of the circuits.
+
+    The weight of a circuit is taken to be half the spread of the hprobs
+    coefficients of its outcomes (since the hprobs of all a circuit's outcomes
+    sum to zero for a trace-preserving model, adding a constant to all the
+    coefficients doesn't change the Hessian).  Circuits are corrected, in order
+    of decreasing weight, until the total weight of the uncorrected circuits is
+    at most `correctionTol` times the total weight of all the circuits.
+
+    Parameters
+    ----------
+    model : Model
+        Model of parameterized gates (including SPAM)
+
+    dataset : DataSet
+        Probability data
+
+    circuit_list : list of (tuples or Circuits), optional
+        Each element specifies a operation sequence to include in the log-likelihood
+        sum.  Default value of None implies all the operation sequences in dataset
+        should be used.
+
+    minProbClip : float, optional
+        The minimum probability treated normally in the evaluation of the log-likelihood.
+        A penalty function replaces the true log-likelihood for probabilities that lie
+        below this threshold so that the log-likelihood never becomes undefined (which improves
+        optimizer performance).
+
+    probClipInterval : 2-tuple or None, optional
+        (min,max) values used to clip the probabilities predicted by models during MLEGST's
+        search for an optimal model (if not None).  if None, no clipping is performed.
+
+    radius : float, optional
+        Specifies the severity of rounding used to "patch" the zero-frequency
+        terms of the log-likelihood.
+
+    poissonPicture : boolean, optional
+        Whether the Poisson-picutre log-likelihood should be differentiated.
+
+    check : boolean, optional
+        If True, perform extra checks within code to verify correctness.  Used
+        for testing, and runs much slower when True.
+
+    comm : mpi4py.MPI.Comm, optional
+        When not None, an MPI communicator for distributing the computation
+        across multiple processors.
+
+    memLimit : int, optional
+        A rough memory limit in bytes which restricts the amount of intermediate
+        values that are computed and stored.
+
+    opLabelAliases : dictionary, optional
+        Dictionary whose keys are operation label "aliases" and whose values are tuples
+        corresponding to what that operation label should be expanded into before querying
+        the dataset. Defaults to the empty dictionary (no aliases defined)
+        e.g. opLabelAliases['Gx^3'] = ('Gx','Gx','Gx')
+
+    smartc : SmartCache, optional
+        A cache object to cache & use previously cached values inside this
+        function.
+
+    verbosity : int or VerbosityPrinter, optional
+        How much detail to print to stdout.
+
+    correctionTol : float, optional
+        The maximum fraction of the total hprobs weight which may be left
+        uncorrected.  Zero computes the exact Hessian (every circuit with a
+        nonzero weight is corrected) and values >= 1 give the uncorrected
+        Gauss-Newton approximation.
+
+    returnNeglectedWeight : bool, optional
+        If True, also return the fraction of the total hprobs weight that
+        was neglected (left uncorrected).  This is a heuristic indicator of
+        the quality of the approximation, *not* a bound on the error of the
+        returned Hessian.
+
+    numThreads : int, optional
+        The number of threads used to compute the hprobs terms of the
+        corrected circuits.  See :function:`logl_hessian`.
+
+    Returns
+    -------
+    hessian : numpy array
+        array of shape (M,M), where M is the length of the vectorized model.
+
+    neglected_weight_fraction : float
+        The fraction of the total hprobs weight that was neglected (0 when
+        the returned Hessian is exact).  Only returned when
+        `returnNeglectedWeight=True`.
+    """
+    printer = _VerbosityPrinter.build_printer(verbosity, comm)
+    if circuit_list is None:
+        circuit_list = list(dataset.keys())
+
+    hessian = logl_approximate_hessian(model, dataset, circuit_list, minProbClip, probClipInterval, radius,
+                                       poissonPicture, check, comm, memLimit, opLabelAliases, smartc,
+                                       printer.verbosity - 1)
+
+    a = radius  # parameterizes "roundness" of f == 0 terms
+    min_p = minProbClip
+    ds_circuit_list = _lt.apply_aliases_to_circuit_list(circuit_list, opLabelAliases)
+    probs_by_circuit = model.bulk_probs(circuit_list, clipTo=probClipInterval, comm=comm)
+
+    weights = _np.zeros(len(circuit_list), 'd')
+    for i, (opStr, dsStr) in enumerate(zip(circuit_list, ds_circuit_list)):
+        cnts = dataset[dsStr].counts
+        totCnts = sum(cnts.values())
+        outcome_probs = probs_by_circuit[opStr]
+        probs = _np.array(list(outcome_probs.values()), 'd')
+        cntVec = _np.array([cnts.get(ol, 0) for ol in outcome_probs.keys()], 'd')
+        pos_probs = _np.where(probs < min_p, min_p, probs)
+
+        # Same coefficients as the `hprobs_coeffs` of `logl_hessian`
+        if poissonPicture:
+            S = cntVec / min_p - totCnts
+            S2 = -0.5 * cntVec / (min_p**2)
+            hprobs_coeffs = _np.where(probs < min_p, S + 2 * S2 * (probs - min_p), cntVec / pos_probs - totCnts)
+            zfc = _np.where(probs >= a, -totCnts, -totCnts * ((-1.0 / a**2) * probs**2 + 2 * probs / a))
+            hprobs_coeffs = _np.where(cntVec == 0, zfc, hprobs_coeffs)
+        else:
+            S = cntVec / min_p
+            S2 = -0.5 * cntVec / (min_p**2)
+            hprobs_coeffs = _np.where(probs < min_p, S + 2 * S2 * (probs - min_p), cntVec / pos_probs)
+            hprobs_coeffs = _np.where(cntVec == 0, 0.0, hprobs_coeffs)
+        weights[i] = 0.5 * (_np.max(hprobs_coeffs) - _np.min(hprobs_coeffs))
+
+    total_weight = _np.sum(weights)
+    order = _np.argsort(-weights, kind='stable')
+    # remaining_weight[k] = weight left uncorrected after correcting the k largest-weight circuits
+    remaining_weight = _np.concatenate((_np.cumsum(weights[order][::-1])[::-1], [0.0]))
+    nCorrected = int(_np.argmax(remaining_weight <= correctionTol * total_weight))
+    corrected_indices = sorted(order[0:nCorrected])
+    neglected_weight = total_weight - _np.sum(weights[corrected_indices])
+    neglected_weight_fraction = neglected_weight / total_weight if total_weight > 0 else 0.0
+
+    if len(corrected_indices) > 0:
+        # The Gauss-Newton (dprobs12) terms are already in `hessian` - just add the hprobs terms
+        corrected_circuits = [circuit_list[i] for i in corrected_indices]
+        hessian += logl_hessian(model, dataset, corrected_circuits, minProbClip, probClipInterval, radius,
+                                poissonPicture, check, comm, memLimit, opLabelAliases, smartc,
+                                printer.verbosity - 1, numThreads, _hprobsTermOnly=True)
+
+    printer.log("Corrected approximate Hessian: hprobs terms for %d of %d circuits; "
+                "neglected fraction of hprobs weight = %g"
+                % (len(corrected_indices), len(circuit_list), neglected_weight_fraction))
+
+    return (hessian, neglected_weight_fraction) if returnNeglectedWeight else hessian
+
+
 #@smart_cached
 def logl_max(model, dataset, circuit_list=None, poissonPicture=True,
              check=False, opLabelAliases=None, evaltree_cache=None,
@@ -1182,12 +1447,7 @@ def logl_max_terms(model, dataset, circuit_list=None,
         countVecMx = evaltree_cache['cntVecMx']
         totalCntVec = evaltree_cache['totalCntVec']
     else:
-        countVecMx = _np.empty(nEls, 'd')
-        totalCntVec = _np.empty(nEls, 'd')
-        for (i, opStr) in enumerate(circuit_list):
-            cnts = dataset[opStr].counts
-            totalCntVec[lookup[i]] = sum(cnts.values())  # dataset[opStr].total
-            countVecMx[lookup[i]] = [cnts.get(x, 0) for x in outcomes_lookup[i]]
+        countVecMx, totalCntVec = dataset.to_count_matrix(circuit_list, lookup, outcomes_lookup, nEls)
 
         #could add to cache, but we don't have option of circuitWeights
         # here yet, so let's be conservative and not do this:
@@ -1355,6 +1615,7 @@ def two_delta_logl(model, dataset, circuit_list=None,
     k = max(Ns - mdl_dof, 1)
     if Ns <= mdl_dof: _warnings.warn("Max-model params (%d) <= model params (%d)!  Using k == 1." % (Ns, mdl_dof))
 
+    import scipy.stats as _stats  # (imported here b/c importing scipy.stats is slow)
     Nsigma = (twoDeltaLogL - k) / _np.sqrt(2 * k)
     pvalue = 1.0 - _stats.chi2.cdf(twoDeltaLogL, k)
     return twoDeltaLogL, Nsigma, pvalue
@@ -1405,6 +1666,7 @@ def two_delta_logl_terms(model, dataset, circuit_list=None,
     # HACK - just take a single average #dof per circuit to use as chi_k distribution!
     k = int(_np.ceil(k / (1.0 * len(circuit_list))))
 
+    import scipy.stats as _stats  # (imported here b/c importing scipy.stats is slow)
     Nsigma = (twoDeltaLogL_terms - k) / _np.sqrt(2 * k)
     pvalue = _np.array([1.0 - _stats.chi2.cdf(x, k) for x in twoDeltaLogL_terms], 'd')
     return twoDeltaLogL_terms, Nsigma, pvalue
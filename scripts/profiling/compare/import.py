@@ -1 +1,40 @@
+""" Time how long `import pygsti` (and accessing its lazily-imported sub-packages) takes """
+import sys
+import subprocess
+import argparse
+
+HEAVY_MODULES = ('pygsti.report', 'pygsti.protocols', 'pygsti.drivers', 'pygsti.extras', 'pygsti.modelpacks',
+                 'scipy.stats', 'plotly', 'pkg_resources')
+
+TIMING_CODE = """
+import sys, time
+t0 = time.perf_counter()
 import pygsti
+t1 = time.perf_counter()
+{access}
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1, ','.join([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+
+def time_import(access="", repeat=5):
+    """ Best-of-`repeat` times (in fresh interpreters) of `import pygsti` and of then running `access` """
+    best_import = best_access = float('inf'); loaded = ''
+    for i in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', TIMING_CODE.format(access=access, heavy=HEAVY_MODULES)],
+                                      universal_newlines=True)
+        import_time, access_time, loaded = out.rstrip('\n').split('\n')[-1].split(' ', 2)
+        best_import = min(best_import, float(import_time)); best_access = min(best_access, float(access_time))
+    return best_import, best_access, loaded
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help="number of fresh interpreters to time (best is shown)")
+    args = parser.parse_args()
+
+    for access in ("", "pygsti.protocols", "pygsti.report", "pygsti.do_long_sequence_gst"):
+        import_time, access_time, loaded = time_import(access, args.repeat)
+        print("import pygsti: %.3fs" % import_time, end='')
+        if access: print(" + %s: %.3fs" % (access, access_time), end='')
+        print("   (loaded: %s)" % (loaded if loaded else "none of " + ', '.join(HEAVY_MODULES)))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the objective functions used on the GST hot path.
+
+Times the objective function (`fn`) and Jacobian (`jfn`) evaluations of
+:class:`Chi2Function`, :class:`LogLFunction` and
+:class:`TimeDependentLogLFunction` for a set of standard modelpacks,
+forward-simulator types and circuit-list sizes, and writes the results
+(including the peak memory allocated by each case) as JSON so that runs can
+be compared between releases.
+
+Every timed call is made at a different parameter vector, so that `jfn` never
+reuses the probabilities memoized by a preceding `fn` call.  Peak memory is
+measured with `tracemalloc` (which sees numpy's allocations) in a separate,
+untimed pass over each case.
+
+Usage:
+    python bench_objfns.py [-o results.json] [--quick]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import pygsti
+from pygsti.objects import objectivefns as _objfns
+from pygsti.objects.profiler import Profiler
+from pygsti.modelpacks import smq1Q_XYI, smq2Q_XYICNOT
+
+MODELPACKS = {'smq1Q_XYI': smq1Q_XYI, 'smq2Q_XYICNOT': smq2Q_XYICNOT}
+
+# sim_type -> parameterization used to build the model
+SIM_TYPES = {'matrix': 'full', 'map': 'full', 'termorder': 'H+S terms'}
+
+# objective name -> sim types it supports
+OBJECTIVES = {'chi2': ('matrix', 'map', 'termorder'),
+              'logl': ('matrix', 'map', 'termorder'),
+              'tdlogl': ('map',)}  # time-dependent objectives are only implemented by the map simulator
+
+MAX_LENGTHS = {'smq1Q_XYI': [1, 4, 16], 'smq2Q_XYICNOT': [1, 2, 4]}
+QUICK_MAX_LENGTHS = {'smq1Q_XYI': [1, 4], 'smq2Q_XYICNOT': [1]}
+
+
+def build_objective(name, mdl, dataset, circuits, profiler):
+    """ Construct the objective function object `name` the way `algorithms.core` does. """
+    evTree, wrtBlkSize, _, lookup, outcomes_lookup = mdl.bulk_evaltree_from_resources(
+        circuits, None, None, "deriv", ["bulk_fill_probs", "bulk_fill_dprobs"], dataset, 0)
+
+    cntVecMx, N = dataset.to_count_matrix(circuits, lookup, outcomes_lookup, evTree.num_final_elements())
+
+    if name == 'chi2':
+        return _objfns.Chi2Function(mdl, evTree, lookup, circuits, None, 0, 0, 0, cntVecMx, N,
+                                    1e-4, (-1e6, 1e6), wrtBlkSize, None, profiler=profiler)
+    elif name == 'logl':
+        return _objfns.LogLFunction(mdl, evTree, lookup, circuits, None, 0, 0, cntVecMx, N, 1e-4, 1e-4,
+                                    (-1e6, 1e6), wrtBlkSize, None, None, True, profiler=profiler)
+    elif name == 'tdlogl':
+        return _objfns.TimeDependentLogLFunction(mdl, evTree, lookup, circuits, None, 0, 0, circuits, dataset,
+                                                 1e-4, 1e-4, (-1e6, 1e6), wrtBlkSize, None, None, True,
+                                                 profiler=profiler)
+    raise ValueError("Unknown objective: %s" % name)
+
+
+def nearby_points(x0, n, seed):
+    """ Returns `n` distinct parameter vectors close to `x0`. """
+    rndm = np.random.RandomState(seed)
+    return [x0 + 1e-6 * rndm.random_sample(len(x0)) for i in range(n)]
+
+
+def time_calls(fn, points):
+    """ Returns the (min, mean) wall time of calling `fn` at each of `points`. """
+    times = []
+    for x in points:
+        t0 = time.perf_counter()
+        fn(x)
+        times.append(time.perf_counter() - t0)
+    return min(times), sum(times) / len(times)
+
+
+def peak_memory(name, mdl, dataset, circuits, x_fn, x_jac):
+    """ The peak memory (bytes) allocated while building objective `name` and calling its `fn` and `jfn` once. """
+    tracemalloc.start()
+    try:
+        objfn = build_objective(name, mdl, dataset, circuits, Profiler())
+        objfn.fn(x_fn)
+        objfn.jfn(x_jac)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(pack_name, sim_type, max_length, objective_names, repeats):
+    pack = MODELPACKS[pack_name]
+    param = SIM_TYPES[sim_type]
+    if sim_type == 'termorder':
+        target = pack.target_model('full')
+        target.set_all_parameterizations(param)
+        target.set_simtype('termorder', max_order=1)
+    else:
+        target = pack.target_model(param, sim_type=sim_type)
+    datagen = pack.target_model('full').depolarize(op_noise=0.01, spam_noise=0.001)
+
+    circuits = pack.get_gst_experiment_design(max_length).all_circuits_needing_data
+    dataset = pygsti.construction.generate_fake_data(datagen, circuits, nSamples=1000,
+                                                     sampleError='multinomial', seed=1234)
+    x0 = target.to_vector()
+
+    results = []
+    for name in objective_names:
+        if sim_type not in OBJECTIVES[name]: continue
+        mdl = target.copy()
+        if name == 'tdlogl':
+            mdl.set_simtype('map', max_cache_size=0)  # no caching allowed for time-dependent calcs
+        case = {'modelpack': pack_name, 'sim_type': sim_type, 'max_length': max_length,
+                'objective': name, 'num_circuits': len(circuits), 'num_params': mdl.num_params(),
+                'repeats': repeats}
+        try:
+            profiler = Profiler()
+            t0 = time.perf_counter()
+            objfn = build_objective(name, mdl, dataset, circuits, profiler)
+            setup_time = time.perf_counter() - t0
+
+            # fresh points for each call, so that jfn can't reuse the probabilities memoized by fn
+            points = nearby_points(x0, 2 * repeats + 2, seed=1234)
+            fn_min, fn_mean = time_calls(objfn.fn, points[0:repeats])
+            jac_min, jac_mean = time_calls(objfn.jfn, points[repeats:2 * repeats])
+            peak_mem = peak_memory(name, mdl, dataset, circuits, points[-2], points[-1])
+        except Exception as e:  # record failures (e.g. a sim type unsupported by this build) and keep going
+            case['error'] = "%s: %s" % (type(e).__name__, str(e))
+            print("%-14s %-9s L=%-4d %-7s FAILED (%s)" % (pack_name, sim_type, max_length, name, case['error']))
+        else:
+            case.update({'num_elements': objfn.KM, 'setup_time': setup_time,
+                         'fn_time_min': fn_min, 'fn_time_mean': fn_mean,
+                         'jac_time_min': jac_min, 'jac_time_mean': jac_mean,
+                         'mem_peak': peak_mem})
+            print("%-14s %-9s L=%-4d %-7s nCircuits=%-6d fn=%.4fs jac=%.4fs mem=%.1fMB" %
+                  (pack_name, sim_type, max_length, name, len(circuits), fn_min, jac_min, peak_mem / 1024.0**2))
+        results.append(case)
+    return results
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark pyGSTi objective functions.")
+    parser.add_argument('-o', '--output', default='objfn_benchmarks.json', help="JSON file to write results to")
+    parser.add_argument('--modelpacks', nargs='+', default=list(MODELPACKS.keys()), choices=list(MODELPACKS.keys()))
+    parser.add_argument('--sim-types', nargs='+', default=list(SIM_TYPES.keys()), choices=list(SIM_TYPES.keys()))
+    parser.add_argument('--objectives', nargs='+', default=list(OBJECTIVES.keys()), choices=list(OBJECTIVES.keys()))
+    parser.add_argument('--repeats', type=int, default=3, help="number of timed calls per function")
+    parser.add_argument('--quick', action='store_true', help="only run the smallest circuit lists")
+    args = parser.parse_args(argv)
+
+    max_lengths = QUICK_MAX_LENGTHS if args.quick else MAX_LENGTHS
+    results = []
+    for pack_name in args.modelpacks:
+        for sim_type in args.sim_types:
+            for L in max_lengths[pack_name]:
+                results.extend(run_case(pack_name, sim_type, L, args.objectives, args.repeats))
+
+    report = {'pygsti_version': pygsti.__version__, 'python_version': platform.python_version(),
+              'numpy_version': np.__version__, 'platform': platform.platform(),
+              'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"), 'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print("Wrote %d results to %s" % (len(results), args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,4 +1,5 @@
 import numpy as np
+from pathlib import Path
 
 from . import IOBase, with_temp_path
 from .references import generator as io_gen
@@ -32,6 +33,28 @@ class LoadersTester(IOBase):
             self.assertEqual(ds[s]['0'], ds5[s][('0',)])
             self.assertEqual(ds[s]['1'], ds5[s][('1',)])
 
+    @with_temp_path
+    def test_load_dataset_cache_dir(self, tmp_path):
+        tmp_path = str(tmp_path)
+        cache_dir = Path(tmp_path).parent / "cache"
+        ds = io_gen.ds.copy()
+        io.write_dataset(tmp_path, ds)
+        ds2 = loaders.load_dataset(tmp_path, cache=str(cache_dir))  # creates cache file
+        self.assertEqual(len(list(cache_dir.glob("*.cache"))), 1)
+        ds3 = loaders.load_dataset(tmp_path, cache=str(cache_dir))  # loads from cache file
+        self.assertEqual(len(list(cache_dir.glob("*.cache"))), 1)
+        for s in ds:
+            self.assertEqual(ds2[s].counts, ds3[s].counts)
+
+        # different parser options or file contents use a different cache file
+        loaders.load_dataset(tmp_path, cache=str(cache_dir), collisionAction="keepseparate")
+        self.assertEqual(len(list(cache_dir.glob("*.cache"))), 2)
+        ds.comment = "# Changed"
+        io.write_dataset(tmp_path, ds)
+        ds4 = loaders.load_dataset(tmp_path, cache=str(cache_dir))
+        self.assertEqual(len(list(cache_dir.glob("*.cache"))), 3)
+        self.assertEqual(ds4.comment, "Changed")
+
     def test_load_sparse_dataset(self):
         ds1a = loaders.load_dataset(str(self.reference_path('sparse_dataset1a.txt')))
         ds2a = loaders.load_dataset(str(self.reference_path('sparse_dataset2a.txt')))
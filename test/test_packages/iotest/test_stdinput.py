@@ -178,6 +178,31 @@ G_my_xG_my_y 0.5 24.0
         ds = self.std.parse_datafile(tmp_path)
         # TODO assert correctness
 
+    @with_temp_path
+    def test_parse_datafile_parallel(self, tmp_path):
+        dict_path = str(Path(tmp_path).parent / "sip_test.dict")
+        self._write_dictfile(dict_path)
+
+        lines = ["#Parallel data file", "## Lookup = {}".format(dict_path),
+                 "## Columns = 0 count, count total"]
+        for i in range(200):  # many duplicates, so chunks share circuits
+            lines.append("(G1G2)^%d  %d  100  # {'idx': %d}" % (i % 7, i % 50, i))
+        lines.append("G1G2G3G4  0  0")  # zero-count line
+        with open(tmp_path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+
+        for collisionAction in ("aggregate", "keepseparate", "overwrite"):
+            ds = self.std.parse_datafile(tmp_path, collisionAction=collisionAction)
+            ds_parallel = self.std.parse_datafile(tmp_path, collisionAction=collisionAction, numProcs=2)
+            self.assertTrue(ds_parallel.bStatic)
+            self.assertEqual(list(ds_parallel.keys()), list(ds.keys()))
+            self.assertEqual(ds_parallel.olIndex, ds.olIndex)
+            self.assertEqual(dict(ds_parallel.auxInfo), dict(ds.auxInfo))
+            for circuit in ds:
+                self.assertArraysAlmostEqual(ds_parallel[circuit].oli, ds[circuit].oli)
+                self.assertArraysAlmostEqual(ds_parallel[circuit].time, ds[circuit].time)
+                self.assertArraysAlmostEqual(ds_parallel[circuit].reps, ds[circuit].reps)
+
     @with_temp_path
     def test_parse_multidatafile(self, tmp_path):
         # write lookup dict
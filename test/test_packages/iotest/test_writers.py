@@ -7,6 +7,7 @@ from .references import generator as io_gen
 from pygsti import io
 import pygsti.construction as pc
 from pygsti.io import writers
+from pygsti.objects import DataSet
 
 
 class WriteDatasetTester(IOBase):
@@ -60,6 +61,20 @@ class WriteSparseDatasetTester(IOBase):
         writers.write_dataset(tmp_path, self.ds, outcomeLabelOrder=ordering, fixedColumnMode=False)
         self.assertFilesEquivalent(tmp_path, self.reference_path('sparse_dataset2b.txt'))
 
+    @with_temp_path
+    def test_write_sparse_mode_dataset(self, tmp_path):
+        ds = DataSet(sparse=True)
+        ds.add_count_dict(('Gx',), {'000': 10, '011': 0, '111': 90})
+        ds.add_count_dict(('Gy',), {'000': 0, '101': 100})
+        ds.done_adding_data()
+        writers.write_dataset(tmp_path, ds)  # sparse DataSets are written in the outcome:count format by default
+        with open(tmp_path) as f:
+            self.assertEqual([line.split() for line in f if not line.startswith('#')],
+                             [['Gx', '000:10', '111:90'], ['Gy', '101:100']])
+        ds_loaded = io.load_dataset(tmp_path, cache=False)
+        for opstr in ds:
+            self.assertEqual(ds_loaded[opstr].counts, ds[opstr].counts)
+
 
 class WriteMultidatasetTester(IOBase):
     def setUp(self):
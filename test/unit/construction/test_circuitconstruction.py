@@ -95,6 +95,26 @@ class CircuitConstructionTester(BaseCase):
                      "Gf1(G1aG1b)Gf1"]
         self.assertEqual([x.str for x in gateStrings3], expected3)
 
+    def test_list_fiducial_pair_circuits(self):
+        fids = cc.circuit_list([(), ('Gf0',), ('Gf1', 'Gf1')])
+        base = Circuit(('G1a', 'G1b')) * 2
+        pairs = [(fids[i], fids[j]) for i in range(3) for j in range(3)]
+        circuits = cc.list_fiducial_pair_circuits(base, pairs)
+        expected = [prep + base + effect for prep, effect in pairs]
+        self.assertEqual(circuits, expected)
+        self.assertEqual([c.str for c in circuits], [c.str for c in expected])
+        self.assertEqual(circuits[1].str, "(G1aG1b)^2Gf0")
+
+        #line labels & sub-circuits (which are expanded) are handled as by Circuit.__add__
+        prep = Circuit([('Gx', 0)], line_labels=(0,))
+        effect = Circuit([('Gy', 1)], line_labels=(1,))
+        subcircuit_base = Circuit([Circuit([('Gx', 0)], line_labels=(0,)).as_label(nreps=2)],
+                                  line_labels=(0,), expand_subcircuits=False)
+        for b in (Circuit([('Gz', 0)], line_labels=(0,)), subcircuit_base):
+            c, = cc.list_fiducial_pair_circuits(b, [(prep, effect)])
+            self.assertEqual(c, prep + b + effect)
+            self.assertEqual((c.str, c.line_labels), ((prep + b + effect).str, (0, 1)))
+
     def test_truncate_methods(self):
         self.assertEqual(cc.repeat_and_truncate(('A', 'B', 'C'), 5), ('A', 'B', 'C', 'A', 'B'))
         self.assertEqual(cc.repeat_with_max_length(('A', 'B', 'C'), 5), ('A', 'B', 'C'))
@@ -2,6 +2,7 @@ import numpy as np
 
 from ..util import BaseCase
 
+import pygsti
 import pygsti.construction as pc
 from pygsti.tools import listtools as lt
 import pygsti.construction.datasetconstruction as dc
@@ -68,3 +69,20 @@ class DataSetConstructionTester(BaseCase):
         merged_dataset = pc.merge_outcomes(self.dataset, {'merged_outcome_label': [('0',), ('1',)]})
         for dsRow in merged_dataset.values():
             self.assertEqual(dsRow.total, dsRow['merged_outcome_label'])
+
+    def test_merge_outcomes_ordering_and_zero_counts(self):
+        ds = pygsti.objects.DataSet(outcomeLabels=['00', '01', '10', '11'])
+        ds.add_raw_series_data(('Gx',), ['00', '01', '11', '10', '00', '11'], [0., 0., 0., 1., 1., 2.],
+                               [3, 0, 2, 0, 1, 4])
+        ds.done_adding_data()
+        merge_dict = {'b': ['00', '01'], 'a': ['10', '11']}
+
+        merged = pc.merge_outcomes(ds, merge_dict)
+        self.assertEqual(merged.get_outcome_labels(), [('b',), ('a',)])  # key order
+        self.assertEqual(merged[('Gx',)].outcomes, [('a',), ('b',)] * 3)  # sorted within each time
+        self.assertEqual(list(merged[('Gx',)].reps), [2, 3, 0, 1, 4, 0])
+
+        merged = pc.merge_outcomes(ds, merge_dict, recordZeroCnts=False)
+        self.assertEqual(merged[('Gx',)].outcomes, [('a',), ('b',), ('b',), ('a',)])
+        self.assertEqual(list(merged[('Gx',)].reps), [2, 3, 1, 4])
+        self.assertEqual(list(merged[('Gx',)].time), [0., 0., 1., 2.])
@@ -64,3 +64,24 @@ def test_slow_circuit_parser():
 @unittest.skipUnless(_FASTCIRCUITPARSER_LOADED, "`pygsti.io.fastcircuitparser` not built")
 def test_fast_circuit_parser():
     yield from _test_circuit_parser(fastcircuitparser)
+
+
+class MemoizedCircuitParserTester(BaseCase):
+    def test_parse_circuit_memoized(self):
+        from pygsti.io import circuitparser
+        strings = ["{}", "{}^3", "G1(G2G3)^2G1", "G1*((G2G3)^2G4G5)^2G7", "Gx:0Gy:1@(0,1)", "[Gx:0Gy:1]^2Gcnot:0:1",
+                   "rho0(GxGy)^2Mz", "Gx;1.5:0!0.25Gy:1", "G1(G2)^3G3", "Gx@()"]
+        for create_subcircuits in (True, False):
+            expected = [circuitparser.parse_circuit(s, create_subcircuits, True) for s in strings]
+            for s, (lbls, line_lbls) in zip(strings, expected):
+                self.assertEqual(circuitparser.parse_circuit_memoized(s, create_subcircuits), (lbls, line_lbls))
+            self.assertEqual(circuitparser.parse_circuits(strings, create_subcircuits), expected)
+            self.assertEqual(circuitparser.CircuitParser().parse_circuits(strings, create_subcircuits), expected)
+
+        self.assertTrue(circuitparser.parse_circuit_memoized("GxGy(Gx)^4")[0][2] is
+                        circuitparser.parse_circuit_memoized("(Gx)^4Gy")[0][0])  # shared sub-expressions
+
+        #preps and POVMs in the middle of a string are still errors
+        for s in ("G1(rho0)", "G1MzG2", "(G1Mz)G2", "G1G2^2^2", "(G1"):
+            with self.assertRaises(ValueError):
+                circuitparser.parse_circuit_memoized(s)
@@ -0,0 +1,102 @@
+from ..util import BaseCase, with_temp_path
+
+from pygsti import io
+from pygsti import protocols
+from pygsti.objects import Circuit, DataSet, VerbosityPrinter
+
+
+class ProtocolDirLoadingTester(BaseCase):
+    def setUp(self):
+        circuits = {'a': [Circuit("Gx"), Circuit("Gy")], 'b': [Circuit("GxGx")], 'c': [Circuit("Gy")]}
+        edesign = protocols.CombinedExperimentDesign({k: protocols.ExperimentDesign(v) for k, v in circuits.items()})
+        ds = DataSet(outcomeLabels=['0', '1'])
+        for c in edesign.all_circuits_needing_data:
+            ds.add_count_dict(c, {'0': 10, '1': 5})
+        ds.done_adding_data()
+        self.data = protocols.ProtocolData(edesign, ds)
+        for k in circuits: self.data[k]  # creates sub-datas (so they're written)
+        self.circuits = circuits
+
+    @with_temp_path
+    @with_temp_path
+    def test_children_load_lazily(self, root, root2):
+        self.data.write(root)
+        data = io.load_data_from_dir(root)
+        self.assertEqual(len(data._vals), 0)  # nothing loaded yet
+        self.assertEqual(data['b'].edesign.all_circuits_needing_data, self.circuits['b'])
+        self.assertEqual(list(data._vals.keys()), ['b'])
+
+        data.write(root2)  # unloaded children get written to a new location
+        data2 = io.load_data_from_dir(root2)
+        self.assertEqual({k: v.edesign.all_circuits_needing_data for k, v in data2.items()}, self.circuits)
+        self.assertEqual(list(data2.filter_paths([('a',)])['a'].dataset.keys()), self.circuits['a'])
+
+    @with_temp_path
+    def test_max_loaded_children(self, root):
+        self.data.write(root)
+        data = io.load_data_from_dir(root, max_loaded_children=2)
+        data['a']; data['b']; data['a']; data['c']
+        self.assertEqual(list(data._vals.keys()), ['a', 'c'])  # 'b' was least recently used
+        self.assertEqual(data['b'].edesign.all_circuits_needing_data, self.circuits['b'])  # re-loaded
+        self.assertEqual(sorted(data._vals.keys()), ['b', 'c'])
+
+
+class BinaryCircuitListTester(BaseCase):
+    def setUp(self):
+        fiducials = [Circuit("{}"), Circuit("Gx"), Circuit("GyGy")]
+        germs = [Circuit("Gx"), Circuit("GxGy")]
+        self.circuits = [f1 + Circuit(None, stringrep="(%s)^%d" % (g.str, L)) + f2
+                         for L in (1, 2, 8) for g in germs for f1 in fiducials for f2 in fiducials]
+        self.circuits += [Circuit("[Gx:0Gy:1](Gx:0)^3@(0,1)"), Circuit("((Gx)^2Gy)^3"), Circuit("rho0GxMdefault"),
+                          Circuit("Gx!1.5(Gy;1.2:0)^2", line_labels=(0,)), Circuit(("Gx", "Gy"))]
+
+    @with_temp_path
+    @with_temp_path
+    def test_write_and_load(self, txt_path, bin_path):
+        io.write_circuit_list(txt_path, self.circuits)
+        io.write_binary_circuit_list(bin_path, self.circuits)
+        from_text = io.load_circuit_list(txt_path)
+        loaded = io.load_circuit_list(bin_path)
+
+        self.assertEqual(loaded, from_text)
+        self.assertEqual([c.str for c in loaded], [c.str for c in from_text])
+        self.assertEqual([c.line_labels for c in loaded], [c.line_labels for c in from_text])
+        self.assertEqual(io.load_circuit_list(bin_path, readRawStrings=True), [c.str for c in self.circuits])
+
+    @with_temp_path
+    def test_empty_list(self, bin_path):
+        io.write_binary_circuit_list(bin_path, [])
+        self.assertEqual(io.load_circuit_list(bin_path), [])
+
+
+class LoadWithCacheTester(BaseCase):
+    def test_root_exception_is_broadcast(self):
+        def bad_parse():
+            raise ValueError("bad file")
+
+        root_comm = _FakeComm(0)
+        with self.assertRaises(ValueError):
+            io.loaders._load_with_cache("f.txt", False, 'dataset', {}, bad_parse, DataSet,
+                                        VerbosityPrinter(0), root_comm)
+        self.assertEqual(len(root_comm.sent), 1)
+        cache_filename, obj, exc = root_comm.sent[0]
+        self.assertIsInstance(exc, ValueError)
+
+        with self.assertRaises(ValueError):  # other ranks re-raise the root's exception
+            io.loaders._load_with_cache("f.txt", False, 'dataset', {}, bad_parse, DataSet,
+                                        VerbosityPrinter(0), _FakeComm(1, root_comm.sent[0]))
+
+
+class _FakeComm(object):
+    """ A stand-in for an MPI communicator whose `bcast` records (on rank 0) or returns (otherwise) values """
+    def __init__(self, rank, received=None):
+        self.rank = rank; self.received = received; self.sent = []
+
+    def Get_rank(self):
+        return self.rank
+
+    def bcast(self, val, root=0):
+        if self.rank == root:
+            self.sent.append(val)
+            return val
+        return self.received
@@ -0,0 +1,81 @@
+import os
+import pathlib
+
+from ..util import BaseCase, with_temp_path
+
+from pygsti.io import metadir
+from pygsti.objects import Circuit
+
+
+class MetaDirTester(BaseCase):
+    def setUp(self):
+        self.values = {'name': 'test', 'circuits': [Circuit("Gx"), Circuit("GxGy")],
+                       'circuit_lists': [[Circuit("Gx")], [Circuit("Gy")]],
+                       'info': {'a': 1}, 'obj': {1: (2, 3)}, 'missing': None}
+        self.auxfile_types = {'circuits': 'text-circuit-list', 'circuit_lists': 'text-circuit-lists',
+                              'info': 'json', 'obj': 'pickle', 'missing': 'pickle'}
+
+    @with_temp_path
+    def test_write_and_load(self, root):
+        metadir.write_meta_based_dir(root, self.values, self.auxfile_types)
+        loaded = metadir.load_meta_based_dir(root, separate_auxfiletypes=True)[0]
+        self.assertEqual(loaded, self.values)
+        self.assertEqual([p.name for p in pathlib.Path(root).iterdir() if p.suffix == '.tmp'], [])
+
+    @with_temp_path
+    def test_unchanged_files_are_not_rewritten(self, root):
+        metadir.write_meta_based_dir(root, self.values, self.auxfile_types)
+        root = pathlib.Path(root)
+        mtimes = {p.name: p.stat().st_mtime_ns for p in root.iterdir()}
+        for p in root.iterdir(): os.utime(p, ns=(0, 0))  # so a rewrite is detected regardless of clock resolution
+
+        metadir.write_meta_based_dir(root, self.values, self.auxfile_types)
+        self.assertEqual([p.name for p in root.iterdir() if p.stat().st_mtime_ns != 0], [])
+
+        self.values['info'] = {'a': 2}
+        metadir.write_meta_based_dir(root, self.values, self.auxfile_types)
+        rewritten = sorted([p.name for p in root.iterdir() if p.stat().st_mtime_ns != 0])
+        self.assertEqual(rewritten, ['info.json', 'meta.json'])  # meta.json holds the new digest
+        self.assertEqual(sorted(mtimes.keys()), sorted([p.name for p in root.iterdir()]))
+
+    @with_temp_path
+    def test_missing_files_are_rewritten(self, root):
+        metadir.write_meta_based_dir(root, self.values, self.auxfile_types)
+        (pathlib.Path(root) / 'obj.pkl').unlink()
+        metadir.write_meta_based_dir(root, self.values, self.auxfile_types)
+        self.assertEqual(metadir.load_meta_based_dir(root, separate_auxfiletypes=True)[0], self.values)
+
+    @with_temp_path
+    def test_write_protocolobj_members(self, root):
+        self.values['sub'] = _DirObject()
+        self.values['subs'] = {'x': _DirObject(), 'y': _DirObject()}
+        self.auxfile_types.update({'sub': 'protocolobj', 'subs': 'dict-of-protocolobjs'})
+        metadir.write_meta_based_dir(root, self.values, self.auxfile_types)
+        for subdir in ('sub', 'subs_x', 'subs_y'):
+            self.assertEqual(metadir.cls_from_meta_json(pathlib.Path(root) / subdir), _DirObject)
+
+    @with_temp_path
+    def test_interrupted_write_leaves_file_intact(self, root):
+        def failing_write(filename, contents):
+            with open(filename, 'w') as f:
+                f.write(contents)
+            raise KeyboardInterrupt()
+
+        os.mkdir(root)
+        pth = pathlib.Path(root) / 'file.txt'
+        metadir.write_file_atomically(pth, _write, 'ok')
+        with self.assertRaises(KeyboardInterrupt):
+            metadir.write_file_atomically(pth, failing_write, 'partial')
+        self.assertEqual(pth.read_text(), 'ok')
+        self.assertEqual(os.listdir(root), ['file.txt'])
+
+
+def _write(filename, contents):
+    with open(filename, 'w') as f:
+        f.write(contents)
+
+
+class _DirObject(object):
+    def write(self, dirname):
+        os.mkdir(dirname)
+        metadir.obj_to_meta_json(self, dirname)
@@ -0,0 +1,65 @@
+import unittest
+import collections
+import numpy as np
+
+from ..util import BaseCase
+
+from pygsti.objects import Circuit, Label as L
+from pygsti.io import jsoncodec
+
+try:
+    import msgpack
+    from pygsti.io import msgpack as pmsgpack
+    _MSGPACK_LOADED = True
+except ImportError:
+    _MSGPACK_LOADED = False
+
+
+@unittest.skipUnless(_MSGPACK_LOADED, "`msgpack` not installed")
+class MsgpackTester(BaseCase):
+    def setUp(self):
+        self.circuits = [Circuit('GxGy(Gx)^2'), Circuit('Gx:0Gy:1@(0,1)'), Circuit(()),
+                         Circuit([L('Gx', 0, time=1.5)], line_labels=(0,)), Circuit('[Gx:0Gy:1]Gcnot:0:1')]
+
+    def test_roundtrip(self):
+        objs = [np.arange(12, dtype='d').reshape(3, 4).T, np.zeros((2, 0), complex), np.array(2.5),
+                np.array(['a', 'bc']),
+                [1.0, -0.0, 2.5], [1, 2, 3], [('0',), ('1', '0')], [], (1, 'a', 2.0), {1: 'a', (2, 3): [4.0]},
+                collections.OrderedDict([(self.circuits[0], slice(0, 2))]), {1, 2}, range(3), 4 + 3j,
+                L('Gx', 0, time=1.0), L([('Gx', 0), ('Gy', 1)]), L('Gx', 0, args=(1.5,)),
+                self.circuits, self.circuits[1], Circuit('Gx', editable=True), [Circuit('Gx', name='foo')]]
+        for obj in objs:
+            decoded = pmsgpack.loads(pmsgpack.dumps(obj))
+            self.assertEqual(type(decoded), type(obj))
+            if isinstance(obj, np.ndarray):
+                self.assertArraysEqual(decoded, obj)
+                self.assertEqual((decoded.dtype, decoded.shape), (obj.dtype, obj.shape))
+                self.assertTrue(decoded.flags.writeable)
+            else:
+                self.assertEqual(decoded, obj)
+
+        decoded = pmsgpack.loads(pmsgpack.dumps(self.circuits))
+        self.assertEqual([c.str for c in decoded], [c.str for c in self.circuits])
+        self.assertEqual([c.line_labels for c in decoded], [c.line_labels for c in self.circuits])
+        self.assertEqual(decoded[3][0].time, 1.5)
+
+    def test_uses_ext_types(self):
+        data = pmsgpack.dumps({'circuits': self.circuits, 'mx': np.identity(4)})
+        self.assertLess(len(data), len(msgpack.packb(jsoncodec.encode_obj({'circuits': self.circuits,
+                                                                           'mx': np.identity(4)}, False))))
+        encoded = msgpack.unpackb(data)
+        for k, v in encoded['__ndict__']:
+            self.assertTrue(isinstance(v, msgpack.ExtType))
+
+    def test_loads_encode_obj_format(self):
+        obj = {'circuits': self.circuits, 'mx': np.identity(4)}
+        decoded = pmsgpack.loads(msgpack.packb(jsoncodec.encode_obj(obj, False)))  # as written by earlier versions
+        self.assertEqual(decoded['circuits'], self.circuits)
+        self.assertArraysEqual(decoded['mx'], obj['mx'])
+
+    def test_dump_and_load(self):
+        with self.temp_path() as tmp_path:
+            with open(tmp_path, 'wb') as f:
+                pmsgpack.dump(self.circuits, f)
+            with open(tmp_path, 'rb') as f:
+                self.assertEqual(pmsgpack.load(f), self.circuits)
@@ -1,4 +1,5 @@
 import copy
+import pickle
 import unittest
 
 from ..util import BaseCase
@@ -486,6 +487,65 @@ class CircuitOperationTester(BaseCase):
         self.assertEqual(self.s1, s6)
         self.assertEqual(self.s1, s7)
 
+    def test_pickle(self):
+        self.s1.auxinfo['note'] = 'hello'
+        s = pickle.loads(pickle.dumps(self.s1))
+        self.assertEqual(s, self.s1)
+        self.assertEqual(hash(s), hash(self.s1))
+        self.assertEqual(s.str, "Gx^2")
+        self.assertEqual(s.auxinfo, {'note': 'hello'})
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.s1, '__dict__'))
+        self.assertTrue(self.s1._auxinfo is None)  # not allocated until needed
+        self.assertEqual(self.s1.auxinfo, {})
+
+    def test_cached_hash(self):
+        c = circuit.Circuit([('Gx', 0), ('Gy', 1)], line_labels=(0, 1))
+        self.assertEqual(hash(c), hash(c.tup))
+        self.assertEqual(c._hash, hash(c.tup))
+        c.reorder_lines((1, 0))  # line labels are part of the hashed value
+        self.assertEqual(hash(c), hash(c.tup))
+
+        e = c.copy(editable=True)
+        e.append_circuit(circuit.Circuit([('Gx', 0)], line_labels=(0, 1)))
+        e.done_editing()
+        self.assertEqual(hash(e), hash(e.tup))
+        self.assertNotEqual(e, c)
+
+    def test_cached_hash_after_idling_line_changes(self):
+        c = circuit.Circuit([('Gx', 0)], line_labels=(0, 1))
+        hash(c)
+        c.delete_idling_lines()
+        fresh = circuit.Circuit([('Gx', 0)], line_labels=(0,))
+        self.assertEqual(c.line_labels, (0,))
+        self.assertEqual(c, fresh)
+        self.assertEqual(hash(c), hash(fresh))
+        self.assertTrue(c in {fresh: 0})
+
+        c.insert_idling_lines(None, [1])
+        self.assertEqual(hash(c), hash(circuit.Circuit([('Gx', 0)], line_labels=(0, 1))))
+
+    def test_eq_fast_path(self):
+        c1 = circuit.Circuit(['Gx', 'Gy'])
+        c2 = circuit.Circuit(['Gx', 'Gy'], line_labels=(), check=False)
+        hash(c1)
+        self.assertEqual(c1, c2)  # ('*',) and () both mean "no line labels"
+        self.assertEqual(hash(c1), hash(c2))
+        self.assertNotEqual(c1, circuit.Circuit(['Gx', 'Gx']))
+        self.assertNotEqual(circuit.Circuit([('Gx', 0)], line_labels=(0,)),
+                            circuit.Circuit([('Gx', 0)], line_labels=(0, 1)))
+        self.assertEqual(c1, circuit.Circuit(['Gx', 'Gy'], editable=True))
+
+    def test_layer_labels_are_interned(self):
+        c1 = circuit.Circuit([('Gx', 0), ('Gy', 1)])
+        c2 = circuit.Circuit(None, stringrep="Gx:0Gy:1")
+        self.assertTrue(all([l1 is l2 for l1, l2 in zip(c1, c2)]))
+
+        c3 = circuit.Circuit([Label('Gx', 0, time=1.0)])  # labels differing only by time are not conflated
+        self.assertEqual(c3[0].time, 1.0)
+        self.assertEqual(c1[0].time, 0.0)
+
     def test_lt_gt(self):
         self.assertFalse(self.s1 < self.s2)
         self.assertFalse(self.s1 > self.s2)
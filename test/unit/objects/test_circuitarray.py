@@ -0,0 +1,72 @@
+import itertools
+import pickle
+import numpy as np
+
+from ..util import BaseCase
+
+from pygsti.objects import Circuit, CircuitArray
+from pygsti.construction import circuitconstruction as cc
+
+
+class CircuitArrayTester(BaseCase):
+    def setUp(self):
+        self.fiducials = [Circuit(()), Circuit(('Gx',)), Circuit(('Gy',)), Circuit(('Gx', 'Gx'))]
+        self.germs = [Circuit(('Gx',)), Circuit(('Gx', 'Gy')), Circuit(('Gi',))]
+        self.circuits = [p + g * 2 + e for p, g, e in itertools.product(self.fiducials, self.germs, self.fiducials)]
+        self.array = CircuitArray(self.circuits)
+
+    def test_construction_and_indexing(self):
+        self.assertEqual(len(self.array), len(self.circuits))
+        self.assertEqual(list(self.array), self.circuits)
+        self.assertArraysAlmostEqual(self.array.lengths, np.array([len(c) for c in self.circuits]))
+        self.assertEqual(self.array[-1], self.circuits[-1])
+        self.assertEqual(self.array[2:5].to_circuits(), self.circuits[2:5])
+        self.assertEqual(self.array[[3, 1, 3]].to_circuits(), [self.circuits[i] for i in (3, 1, 3)])
+
+        ar = CircuitArray.from_arrays(self.array.labels, self.array.codes, self.array.offsets,
+                                      self.array.line_label_tuples, self.array.line_codes)
+        self.assertEqual(ar.to_circuits(), self.circuits)  # circuits are materialized from the codes
+        self.assertEqual(CircuitArray(["GxGy", ('Gx',)]).to_circuits(), [Circuit(('Gx', 'Gy')), Circuit(('Gx',))])
+
+    def test_pickle(self):
+        ar = pickle.loads(pickle.dumps(self.array))
+        self.assertEqual(ar.to_circuits(), self.circuits)
+
+    def test_translate(self):
+        aliases = {'Gx': ('Gy', 'Gy'), 'Gi': ()}
+        translated = cc.translate_circuit_list(self.array, aliases)
+        self.assertTrue(isinstance(translated, CircuitArray))
+        self.assertEqual(translated.to_circuits(), cc.translate_circuit_list(self.circuits, aliases))
+
+    def test_concatenate_and_product(self):
+        preps, germs, effects = CircuitArray(self.fiducials), CircuitArray(self.germs), CircuitArray(self.fiducials)
+        germPowers = CircuitArray.concatenate([germs, germs])
+        self.assertEqual(CircuitArray.product([preps, germPowers, effects]).to_circuits(), self.circuits)
+
+        prefixed = CircuitArray.concatenate([CircuitArray([Circuit([('Gx', 0)], line_labels=(0, 1))]), germs])
+        self.assertEqual(prefixed.to_circuits(), [Circuit([('Gx', 0)], line_labels=(0, 1)) + g for g in self.germs])
+        self.assertEqual(prefixed[0].line_labels, (0, 1, '*'))  # line labels are combined as by Circuit.__add__
+
+    def test_hash_codes_and_unique_indices(self):
+        ar = CircuitArray(self.circuits + self.circuits[::-1])
+        hashes = ar.hash_codes()
+        self.assertArraysAlmostEqual(hashes[:len(self.circuits)], hashes[len(self.circuits):][::-1])
+
+        expected = []
+        for i, c in enumerate(ar):
+            if c not in [ar[j] for j in expected]: expected.append(i)
+        self.assertEqual(list(ar.unique_indices()), expected)
+
+    def test_filter(self):
+        circuits = [Circuit([('Gx', 1), ('Gy', 0)], line_labels=(0, 1)), Circuit([('Gx', 1)], line_labels=(0, 1))]
+        filtered = cc.filter_circuits(CircuitArray(circuits), [0])
+        self.assertTrue(isinstance(filtered, CircuitArray))
+        self.assertEqual(filtered.to_circuits(), cc.filter_circuits(circuits, [0]))
+        self.assertEqual(cc.filter_circuits(CircuitArray(circuits), [0], drop=True, idle=None).to_circuits(),
+                         cc.filter_circuits(circuits, [0], drop=True, idle=None))
+
+    def test_filter_raises_on_partial_intersection(self):
+        circuits = [Circuit([('Gcnot', 0, 1)], line_labels=(0, 1))]
+        with self.assertRaises(ValueError):
+            cc.filter_circuits(CircuitArray(circuits), [0])
+        self.assertEqual(len(cc.filter_circuits(CircuitArray(circuits), [0], drop=True)), 0)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from ..util import BaseCase
 
 from pygsti.modelpacks.legacy import std1Q_XYI
@@ -76,6 +78,26 @@ class DataComparatorTester(BaseCase):
 
 
 
+    def test_vectorized_statistics(self):
+        circuits = self.DS_0.keys()[0:20]
+        counts = np.array([self.DS_0.get_counts_array(circuits), self.DS_1.get_counts_array(circuits)])
+        for i, circuit in enumerate(circuits):
+            nListList = np.array([list(self.DS_0[circuit].allcounts.values()),
+                                  list(self.DS_1[circuit].allcounts.values())])
+            self.assertAlmostEqual(dc.loglikelihoodRatios(counts)[i], dc.loglikelihoodRatio(nListList))
+            self.assertAlmostEqual(dc.tvds_of_counts(counts)[i], dc.tvd(nListList))
+
+    def test_multidataset_matches_list(self):
+        mds = MultiDataSet(outcomeLabels=[('0',), ('1',)])
+        mds.add_dataset('D0', self.DS_0)
+        mds.add_dataset('D1', self.DS_1)
+        comparator = dc.DataComparator(mds, op_exclusions=['Gx'])
+        list_comparator = dc.DataComparator([self.DS_0, self.DS_1], op_exclusions=['Gx'])
+        self.assertEqual(list(comparator.llrs.keys()), list(list_comparator.llrs.keys()))
+        for attr in ('llrs', 'tvds'):
+            self.assertArraysAlmostEqual(np.array(list(getattr(comparator, attr).values())),
+                                         np.array(list(getattr(list_comparator, attr).values())))
+
     def test_construction_raises_on_bad_ds_names(self):
         with self.assertRaises(ValueError):
             dc.DataComparator([self.DS_0, self.DS_1], DS_names=["foobar"])
@@ -2,7 +2,7 @@ import numpy as np
 from collections import OrderedDict
 import pickle
 
-from ..util import BaseCase
+from ..util import BaseCase, with_temp_path
 
 import pygsti.construction as pc
 from pygsti.objects import DataSet, labeldicts as ld, Circuit
@@ -97,6 +97,14 @@ class DataSetTester(BaseCase):
         with self.assertRaises(ValueError):
             DataSet(circuits=self.gstrs, outcomeLabels=['0', '1'], bStatic=True)
 
+    def test_merge_outcomes_keeps_recorded_zero_counts(self):
+        ds = DataSet(outcomeLabels=['00', '01', '10', '11'])
+        ds.add_raw_series_data(('Gx',), ['00', '01', '11', '10', '00', '11'], [0., 0., 0., 1., 1., 2.],
+                               [3, 0, 2, 0, 1, 4])
+        merged = ds.merge_outcomes({'b': ['00', '01'], 'a': ['10', '11']}, recordZeroCnts=False)
+        self.assertEqual(merged[('Gx',)].outcomes, [('a',), ('b',), ('a',), ('b',), ('a',)])
+        self.assertEqual(list(merged[('Gx',)].reps), [2, 3, 0, 1, 4])  # ('a',) at t=1 has (zero-count) data
+
 
 class DefaultDataSetInstance(object):
     def setUp(self):
@@ -167,6 +175,33 @@ class DataSetMethodBase(object):
         dof = self.ds.get_degrees_of_freedom([('Gx',)])
         # TODO assert correctness
 
+    def test_to_count_matrix(self):
+        circuits = list(self.ds.keys())
+        outcomes = [('1',), ('0',), ('2',)]  # ('2',) isn't in the data set => zero counts
+        lookup = {i: slice(3 * i, 3 * i + 3) for i in range(len(circuits))}
+        outcomes_lookup = {i: outcomes for i in range(len(circuits))}
+        counts, totals = self.ds.to_count_matrix(circuits, lookup, outcomes_lookup, 3 * len(circuits))
+        for i, c in enumerate(circuits):
+            cnts = self.ds[c].counts
+            self.assertArraysAlmostEqual(counts[lookup[i]], [cnts.get(ol, 0) for ol in outcomes])
+            self.assertArraysAlmostEqual(totals[lookup[i]], [self.ds[c].total] * 3)
+
+        with self.assertRaises(AssertionError):  # elements not covered by `lookup`
+            self.ds.to_count_matrix(circuits, lookup, outcomes_lookup, 3 * len(circuits) + 1)
+
+    def test_get_all_row_counts(self):
+        all_counts = self.ds.get_all_row_counts()
+        self.assertEqual(list(all_counts.keys()), list(self.ds.keys()))
+        for c, cnts in all_counts.items():
+            self.assertEqual(cnts, self.ds[c].counts)
+            self.assertEqual(self.ds.get_all_row_counts(all_outcomes=True)[c], self.ds[c].allcounts)
+
+    def test_get_counts_array(self):
+        circuits = list(self.ds.keys())[::-1]
+        cntArray = self.ds.get_counts_array(circuits)
+        for i, c in enumerate(circuits):
+            self.assertArraysAlmostEqual(cntArray[i], [self.ds[c].allcounts[ol] for ol in self.ds.olIndex])
+
     def test_truncate(self):
         trunc = self.ds.truncate([('Gx',)])
         # TODO assert correctness
@@ -206,6 +241,34 @@ class DataSetMethodBase(object):
         ds_slice = self.ds.time_slice(1.0, 2.0, aggregateToTime=0.0)
         # TODO assert correctness
 
+    def test_time_slice_times(self):
+        ds_slice = self.ds.time_slice(0.5, 1.35)
+        for opstr in self.ds:
+            times = self.ds[opstr].time
+            inWindow = (times >= 0.5) & (times < 1.35)
+            self.assertArraysAlmostEqual(ds_slice[opstr].time, times[inWindow])
+            self.assertEqual(ds_slice[opstr].outcomes, [ol for ol, w in zip(self.ds[opstr].outcomes, inWindow) if w])
+
+    def test_merge_outcomes(self):
+        merged = self.ds.merge_outcomes({'x': ['0', '1']})
+        for opstr in self.ds:
+            self.assertEqual(merged[opstr]['x'], self.ds[opstr].total)
+            self.assertArraysAlmostEqual(merged[opstr].time, sorted(set(self.ds[opstr].time)))
+
+    def test_merge_outcomes_raises_on_missing_outcomes(self):
+        with self.assertRaises(ValueError):
+            self.ds.merge_outcomes({'x': ['0']})
+
+    def test_merge_outcomes_many(self):
+        merge_dicts = [{'x': ['0', '1']}, {'b': ['0'], 'a': ['1']}]
+        merged = self.ds.merge_outcomes_many(merge_dicts, recordZeroCnts=False)
+        self.assertEqual(merged[1].get_outcome_labels(), [('a',), ('b',)])
+        for merged_ds, merge_dict in zip(merged, merge_dicts):
+            expected = self.ds.merge_outcomes(merge_dict, recordZeroCnts=False)
+            for opstr in self.ds:
+                self.assertEqual(merged_ds[opstr].counts, expected[opstr].counts)
+                self.assertEqual(merged[1][opstr]['a'], self.ds[opstr]['1'])
+
     def test_pickle(self):
         s = pickle.dumps(self.ds)
         ds_pickled = pickle.loads(s)
@@ -213,6 +276,17 @@ class DataSetMethodBase(object):
             for expected, actual in zip(expected_row, actual_row):
                 self.assertEqual(expected, actual)
 
+    @with_temp_path
+    def test_save_load_columnar(self, tmp_path):
+        self.ds.save_columnar(tmp_path)
+        ds_loaded = DataSet(fileToLoadFrom=tmp_path)  # a directory => columnar format
+        self.assertTrue(ds_loaded.bStatic)
+        self.assertEqual(len(ds_loaded), len(self.ds))
+        self.assertEqual(list(ds_loaded.keys()), list(self.ds.keys()))
+        for opstr in self.ds:
+            self.assertEqual(ds_loaded[opstr].counts, self.ds[opstr].counts)
+            self.assertArraysAlmostEqual(ds_loaded[opstr].time, self.ds[opstr].time)
+
     # Row instance tests
     def test_row_get_expanded_ol(self):
         self.dsRow.get_expanded_ol()
@@ -241,6 +315,24 @@ class DataSetMethodBase(object):
         self.dsRow.timeseries('0', all_times)
         # TODO assert correctness
 
+    def test_row_timeseries_at_timestamps(self):
+        all_times, all_counts = self.dsRow.timeseries('all')
+        times, counts0 = self.dsRow.timeseries('0', all_times)
+        _, counts1 = self.dsRow.timeseries('1', all_times)
+        self.assertArraysAlmostEqual(times, all_times)
+        self.assertArraysAlmostEqual(counts0 + counts1, all_counts)
+
+    def test_row_timeseries_unsorted(self):
+        ds = DataSet(outcomeLabels=['0', '1'])
+        ds.add_raw_series_data(('Gx',), ['0', '1', '0', '0', '1'], [2.0, 0.0, 2.0, 1.0, 1.0])
+        row = ds[('Gx',)]
+        times, counts = row.timeseries('all')
+        self.assertArraysAlmostEqual(times, [0.0, 1.0, 2.0])
+        self.assertArraysAlmostEqual(counts, [1, 2, 2])
+        times, counts = row.timeseries('0', [2.0, 0.0, 1.0, 3.0])
+        self.assertArraysAlmostEqual(times, [2.0, 0.0, 1.0, 3.0])
+        self.assertArraysAlmostEqual(counts, [2, 0, 1, 0])
+
     def test_row_len(self):
         len(self.dsRow)
         # TODO assert correctness
@@ -333,3 +425,92 @@ class RawSeriesDatasetStaticInstanceTester(DataSetMethodBase, RawSeriesDataSetIn
     def test_raise_on_build_repetition_counts(self):
         with self.assertRaises(ValueError):
             self.ds.build_repetition_counts()
+
+    def test_views_share_data(self):
+        trunc = self.ds.truncate([('Gy', 'Gy')])
+        ds_slice = self.ds.time_slice(0.5, 1.35)
+        for view in (trunc, ds_slice):
+            self.assertTrue(view.bStatic)
+            self.assertTrue(view.oliData is self.ds.oliData and view.timeData is self.ds.timeData)
+            self.assertNotEqual(view.uuid, self.ds.uuid)
+        self.assertEqual(ds_slice[('Gx',)].counts, {('0',): 2, ('1',): 4})
+
+        compacted = ds_slice.compact()
+        self.assertFalse(compacted.oliData is self.ds.oliData)
+        self.assertEqual(len(compacted.oliData), 7)
+        self.assertTrue(compacted.compact() is compacted)
+        self.assertTrue(self.ds.compact() is self.ds)
+        ds_pickled = pickle.loads(pickle.dumps(ds_slice))
+        self.assertEqual(len(ds_pickled.oliData), 7)
+        for opstr in ds_slice:
+            self.assertEqual(ds_pickled[opstr].counts, ds_slice[opstr].counts)
+
+    def test_time_slice_unsorted_times(self):
+        ds = DataSet(outcomeLabels=['0', '1'])
+        ds.add_raw_series_data(('Gx',), ['0', '1', '1', '0'], [1.0, 0.0, 1.5, 0.5])
+        ds.done_adding_data()
+        ds_slice = ds.time_slice(0.5, 1.2)  # not a contiguous part of the row, so copied
+        self.assertFalse(ds_slice.timeData is ds.timeData)
+        self.assertArraysAlmostEqual(ds_slice[('Gx',)].time, [1.0, 0.5])
+
+    def test_process_circuits(self):
+        oliData = self.ds.oliData
+        self.ds.process_circuits(lambda s: Circuit(('Gz',)) if s == Circuit(('Gx',)) else None)
+        self.assertEqual(list(self.ds.keys()), [Circuit(('Gz',))])
+        self.assertTrue(self.ds.oliData is oliData)
+        self.assertEqual(self.ds[('Gz',)].counts, {('0',): 5, ('1',): 5})
+
+    def test_process_circuits_aggregate(self):
+        expected = self.ds.copy_nonstatic()
+        expected.process_circuits(lambda s: Circuit(('Gz',)), aggregate=True)
+        self.ds.process_circuits(lambda s: Circuit(('Gz',)), aggregate=True)
+        self.assertTrue(self.ds.bStatic)
+        self.assertArraysAlmostEqual(self.ds[('Gz',)].time, expected[('Gz',)].time)
+        self.assertEqual(self.ds[('Gz',)].counts, expected[('Gz',)].counts)
+
+
+class SparseDataSetTester(BaseCase):
+    def setUp(self):
+        self.ds = DataSet(sparse=True)
+        self.ds.add_count_dict(('Gx',), {'000': 10, '001': 0, '110': 20, '111': 70})
+        self.ds.add_count_dict(('Gx',), {'000': 0, '111': 100})
+        self.ds.add_count_dict(('Gy',), {'010': 0, '011': 50, '100': 50})
+        self.ds.done_adding_data()
+
+    def test_only_nonzero_counts_stored(self):
+        self.assertEqual(self.ds.get_outcome_labels(), [('000',), ('110',), ('111',), ('011',), ('100',)])
+        self.assertEqual(len(self.ds.oliData), 6)
+        self.assertEqual(self.ds[('Gx',)].counts, {('000',): 10, ('110',): 20, ('111',): 170})
+        self.assertEqual(self.ds[('Gx',)]['011'], 0)
+        self.assertEqual(self.ds[('Gx',)]['010'], 0)  # never observed, so not even registered
+
+    def test_get_degrees_of_freedom(self):
+        self.assertEqual(self.ds.get_degrees_of_freedom(), 2 + 1)
+        self.assertEqual(self.ds.get_degrees_of_freedom(aggregate_times=False), 2 + 0 + 1)
+        self.assertEqual(self.ds.get_degrees_of_freedom([('Gy',)], method='all_outcomes-1'), 4)
+
+    def test_merge_outcomes(self):
+        merged = self.ds.merge_outcomes(pc.create_qubit_merge_dict(3, [0]))  # includes unobserved outcomes
+        self.assertTrue(merged.sparse)
+        self.assertEqual(merged[('Gx',)].counts, {('0',): 10, ('1',): 190})
+        self.assertEqual(merged[('Gy',)].counts, {('0',): 50, ('1',): 50})
+        self.assertEqual(len(merged.oliData), 5)  # no zero counts
+
+    def test_merge_outcomes_many(self):
+        marginals = self.ds.merge_outcomes_many([pc.create_qubit_merge_dict(3, [i]) for i in range(3)])
+        self.assertEqual([m[('Gx',)].counts for m in marginals],
+                         [{('0',): 10, ('1',): 190}, {('0',): 10, ('1',): 190}, {('0',): 30, ('1',): 170}])
+        self.assertEqual(marginals[2][('Gy',)].counts, {('0',): 50, ('1',): 50})
+
+    def test_to_count_matrix(self):
+        circuits = [Circuit(('Gx',)), Circuit(('Gy',))]
+        lookup = {0: slice(0, 2), 1: slice(2, 4)}
+        outcomes_lookup = {0: [('111',), ('010',)], 1: [('011',), ('000',)]}
+        counts, totals = self.ds.to_count_matrix(circuits, lookup, outcomes_lookup, 4)
+        self.assertArraysAlmostEqual(counts, [170, 0, 50, 0])
+        self.assertArraysAlmostEqual(totals, [200, 200, 100, 100])
+
+    def test_pickle(self):
+        ds_pickled = pickle.loads(pickle.dumps(self.ds))
+        self.assertTrue(ds_pickled.sparse)
+        self.assertTrue(ds_pickled.copy_nonstatic().sparse)
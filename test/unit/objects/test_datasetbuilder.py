@@ -0,0 +1,82 @@
+import numpy as np
+
+from ..util import BaseCase
+
+from pygsti.objects import DataSet, DataSetBuilder, Circuit
+
+
+class DataSetBuilderTester(BaseCase):
+    def setUp(self):
+        self.circuits = [Circuit(('Gx',)), Circuit(('Gx', 'Gy')), Circuit(('Gy',))]
+        # tiny capacities so that rows are moved and the arrays grow
+        self.builder = DataSetBuilder(outcomeLabels=['0', '1'], initialRowCapacity=2, initialCapacity=4)
+
+    def test_add_count_dict(self):
+        ds = DataSet(outcomeLabels=['0', '1'])
+        for t in range(10):
+            for i, c in enumerate(self.circuits):
+                counts = {'0': t + i, '1': 10 - t}
+                self.builder.add_count_dict(c, counts, timestamp=float(t))
+                ds.add_raw_series_data(c, ['0', '1'], [float(t)] * 2, [t + i, 10 - t], overwriteExisting=False)
+        ds.done_adding_data()
+        snapshot = self.builder.snapshot()
+
+        self.assertTrue(snapshot.bStatic)
+        self.assertEqual(list(snapshot.keys()), list(ds.keys()))
+        self.assertEqual(self.builder.num_bins(), 60)
+        for c in ds:
+            self.assertArraysAlmostEqual(snapshot[c].oli, ds[c].oli)
+            self.assertArraysAlmostEqual(snapshot[c].time, ds[c].time)
+            self.assertArraysAlmostEqual(snapshot[c].reps, ds[c].reps)
+            self.assertEqual(snapshot[c].counts, ds[c].counts)
+
+    def test_add_raw_series_batch(self):
+        rng = np.random.RandomState(1234)
+        rows = rng.randint(0, 3, size=200)
+        outcomes = rng.choice(['0', '1', '2'], size=200)
+        times = np.arange(200, dtype='d')
+        self.builder.add_raw_series_batch([self.circuits[i] for i in rows], outcomes, times)
+
+        snapshot = self.builder.snapshot()
+        self.assertEqual(snapshot.get_outcome_labels(), [('0',), ('1',), ('2',)])
+        self.assertTrue(snapshot.repData is None)
+        for i, c in enumerate(self.circuits):
+            self.assertArraysAlmostEqual(snapshot[c].time, times[rows == i])
+            self.assertEqual(snapshot[c].outcomes, [(o,) for o in outcomes[rows == i]])
+
+    def test_snapshot_unused_bins_are_zero(self):
+        for t in range(2):  # 2nd round grows the arrays (3 rows of capacity 2 > initial capacity 4)
+            for c in self.circuits:
+                self.builder.add_raw_series_data(c, ['1'], [t + 1.0], [5])
+        self.builder.add_raw_series_data(self.circuits[0], ['1'], [3.0], [5])  # moves row 0
+        snapshot = self.builder.snapshot()
+
+        used = np.zeros(len(snapshot.oliData), bool)
+        for c in self.circuits:
+            used[snapshot.cirIndex[c]] = True
+        used[0:2] = True  # the old region of the moved row 0 retains its (stale) data
+        self.assertFalse(np.any(snapshot.oliData[~used]))
+        self.assertFalse(np.any(snapshot.timeData[~used]))
+        self.assertFalse(np.any(snapshot.repData[~used]))
+
+    def test_snapshot_is_readonly_view(self):
+        for t in range(5):
+            self.builder.add_raw_series_data(self.circuits[0], ['0', '1'], [t, t], [3, 4])
+        snapshot = self.builder.snapshot()
+        self.assertTrue(self.builder.snapshot() is snapshot)
+        self.assertTrue(np.shares_memory(snapshot.oliData, self.builder._oli))
+        with self.assertRaises(ValueError):
+            snapshot.oliData[0] = 1
+
+        # adding more data (moving rows and growing the arrays) doesn't change the snapshot
+        old_counts = snapshot[self.circuits[0]].counts
+        for t in range(5, 50):
+            self.builder.add_raw_series_data(self.circuits[0], ['0', '1'], [t, t], [1, 1])
+            self.builder.add_raw_series_data(self.circuits[1], ['1'], [t], [2])
+        self.assertEqual(snapshot[self.circuits[0]].counts, old_counts)
+        self.assertEqual(len(snapshot), 1)
+
+        new_snapshot = self.builder.snapshot()
+        self.assertFalse(new_snapshot is snapshot)
+        self.assertEqual(len(new_snapshot), 2)
+        self.assertEqual(new_snapshot[self.circuits[0]].total, 7 * 5 + 2 * 45)
@@ -91,6 +91,24 @@ class LabelTester(BaseCase):
         self.assertEqual(l1, l2)
         self.assertTrue(l1.time != l2.time)
 
+    def test_labels_are_interned(self):
+        self.assertTrue(L('Gx', 0) is L(('Gx', 0)))
+        self.assertTrue(L('Gx', 0) is L('Gx', '0'))  # sslbls are integerized *before* interning
+        self.assertTrue(L('Gx') is L('Gx', None))
+        self.assertTrue(L([('Gx', 0), ('Gy', 1)]) is L((L('Gx', 0), L('Gy', 1))))
+        self.assertTrue(L('Gx', 0) is pickle.loads(pickle.dumps(L('Gx', 0))))
+        self.assertTrue(Circuit("Gx:0Gy:1")[1] is L('Gy', 1))  # parsed labels too
+
+        #Labels that are equal but have different times or argument types must not be conflated
+        self.assertTrue(L('Gx', 0, time=1.0).time == 1.0 and L('Gx', 0).time == 0.0)
+        l1 = L([L('Gx', 0, time=1.0), L('Gy', 1)], time=1.0)
+        l2 = L([L('Gx', 0), L('Gy', 1, time=1.0)], time=1.0)
+        self.assertEqual(l1, l2)
+        self.assertEqual([l.time for l in l1], [1.0, 0.0])
+        self.assertEqual([l.time for l in l2], [0.0, 1.0])
+        self.assertEqual(L('Gx', 0, args=(1,)).args, (1,))
+        self.assertTrue(isinstance(L('Gx', 0, args=(1.0,)).args[0], float))
+
     def test_only_nonzero_time_is_printed(self):
         l = L('GrotX', (0, 1), args=('1.4',))
         self.assertEqual(str(l), "GrotX;1.4:0:1")  # make sure we don't print time when it's not given (i.e. zero)
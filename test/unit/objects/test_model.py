@@ -406,6 +406,32 @@ class SimMethodBase(object):
         self.assertAlmostEqual(1 - expected_1, actual_1[1])
         self.assertAlmostEqual(1 - expected_2, actual_2[1])
 
+    def test_bulk_fill_probs_multi(self):
+        evt, lookup, _ = self.model.bulk_evaltree([self.gatestring1, self.gatestring2])
+        nElements = evt.num_final_elements()
+        v0 = self.model.to_vector().copy()
+        param_vectors = [v0, v0 + 0.01, v0 - 0.02]
+        probs_to_fill = np.empty((len(param_vectors), nElements), 'd')
+
+        with self.assertNoWarns():
+            self.model.bulk_fill_probs_multi(probs_to_fill, evt, param_vectors, check=True)
+        self.assertArraysAlmostEqual(self.model.to_vector(), v0)  # parameters are restored
+
+        for v, probs in zip(param_vectors, probs_to_fill):
+            mdl = self.model.copy()
+            mdl.from_vector(v)
+            expected = np.empty(nElements, 'd')
+            mdl.bulk_fill_probs(expected, evt)
+            self.assertArraysAlmostEqual(probs, expected)
+
+        chunked = np.empty((len(param_vectors), nElements), 'd')
+        self.model.bulk_fill_probs_multi(chunked, evt, param_vectors, memLimit=1)  # one point at a time
+        self.assertArraysAlmostEqual(chunked, probs_to_fill)
+
+        with self.assertRaises(AttributeError):  # bad 2nd point => parameters still restored
+            self.model.bulk_fill_probs_multi(probs_to_fill[0:2], evt, [v0 + 0.01, None])
+        self.assertArraysAlmostEqual(self.model.to_vector(), v0)
+
     def test_bulk_dprobs(self):
         with self.assertNoWarns():
             bulk_dprobs = self.model.bulk_dprobs([self.gatestring1, self.gatestring2], returnPr=False)
@@ -529,6 +555,26 @@ class SimMethodBase(object):
         all_d12cols = np.concatenate(d12cols, axis=2)
         # TODO assert correctness
 
+    def test_bulk_hprobs_by_block_groups(self):
+        evt, lookup, _ = self.model.bulk_evaltree([self.gatestring1, self.gatestring2])
+        nP = self.model.num_params()
+        slicesList = [(slice(0, nP), slice(i, i + 1)) for i in range(nP)]
+        groups = [slicesList[0:2], slicesList[2:]]
+
+        expected = list(self.model.bulk_hprobs_by_block(evt, slicesList, True))
+        if self.model.simtype != 'matrix':  # only the matrix simulator computes blocks concurrently
+            with self.assertRaises(NotImplementedError):
+                self.model.bulk_hprobs_by_block_groups(evt, groups, True)
+            return
+        generators = self.model.bulk_hprobs_by_block_groups(evt, groups, True)
+        self.assertEqual(len(generators), 2)
+        actual = list(generators[1]) + list(generators[0])  # groups are independent of each other
+        self.assertEqual([blk[0:2] for blk in actual], groups[1] + groups[0])
+        actual = actual[len(groups[1]):] + actual[0:len(groups[1])]
+        for (s1, s2, hprobs, dprobs12), (t1, t2, hprobs_grp, dprobs12_grp) in zip(expected, actual):
+            self.assertArraysAlmostEqual(hprobs, hprobs_grp)
+            self.assertArraysAlmostEqual(dprobs12, dprobs12_grp)
+
     def test_bulk_evaltree(self):
         # Test tree construction
         circuits = pc.circuit_list(
@@ -633,6 +679,9 @@ class StaticModelTester(StaticModelBase, StandardMethodBase, BaseCase):
     def test_bulk_hprobs_by_block(self):
         self.skipTest("TODO should probably warn user?")
 
+    def test_bulk_hprobs_by_block_groups(self):
+        self.skipTest("TODO should probably warn user?")
+
 
 class FullMapSimMethodTester(FullModelBase, SimMethodBase, BaseCase):
     def setUp(self):
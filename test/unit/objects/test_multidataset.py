@@ -72,7 +72,24 @@ class MultiDataSetMethodBase(object):
     def test_get_datasets_aggregate(self):
         keyset = self.mds.keys()
         sumDS = self.mds.get_datasets_aggregate(*keyset)
-        # TODO assert correctness
+        for circuit in self.mds['ds1']:
+            self.assertEqual(sumDS[circuit].counts,
+                             {ol: sum([self.mds[nm][circuit][ol] for nm in keyset]) for ol in [('0',), ('1',)]})
+            self.assertEqual(len(sumDS[circuit]), 2)  # same-time, same-outcome bins are merged
+
+    def test_get_counts_array(self):
+        counts = self.mds.get_counts_array()
+        self.assertEqual(counts.shape, (2, 3, 2))
+        for k, nm in enumerate(self.mds.keys()):
+            self.assertArraysAlmostEqual(counts[k], self.mds[nm].get_counts_array())
+        self.assertArraysAlmostEqual(self.mds.get_counts_array([('Gy',)], ['ds2']), counts[1:2, 2:3, :])
+
+    def test_getitem_shares_data(self):
+        ds = self.mds['ds1']
+        self.assertTrue(ds.oliData is self.mds.oliDict['ds1'])
+        self.assertEqual(ds[('Gx',)].counts, self.mds['ds1'][('Gx',)].counts)
+        ds.comment = "changed"  # doesn't affect the DataSets handed out later
+        self.assertEqual(self.mds['ds1'].comment, None)
 
     def test_to_string(self):
         mds_str = str(self.mds)
@@ -91,6 +108,21 @@ class MultiDataSetMethodBase(object):
         with self.assertRaises(ValueError):
             self.mds.get_datasets_aggregate('ds1', 'foobar')
 
+    def test_add_dataset_with_different_row_lengths(self):
+        ds = DataSet(outcomeLabels=['1', '0', '2'])  # a different outcome label order, and a new label
+        ds.add_count_dict(('Gx',), {'0': 10, '1': 90, '2': 5})
+        ds.add_count_dict(('Gx', 'Gy'), {'1': 20})
+        ds.add_count_dict(('Gy',), {'0': 20, '1': 80})
+        ds.done_adding_data()
+        old_counts = {nm: {c: self.mds[nm][c].counts for c in gstrInds} for nm in self.mds}
+        self.mds['newDS'] = ds
+        self.assertEqual(self.mds.get_outcome_labels(), [('0',), ('1',), ('2',)])
+        for nm, counts in old_counts.items():
+            for c, cnts in counts.items():
+                self.assertEqual({ol: n for ol, n in self.mds[nm][c].counts.items() if n > 0}, cnts)
+        for c in gstrInds:
+            self.assertEqual(dict(self.mds['newDS'][c].counts), dict(ds[c].counts))
+
     def test_add_dataset_raises_on_gate_mismatch(self):
         ds = DataSet(outcomeLabels=['0', '1'])  # different operation sequences
         ds.add_count_dict(('Gx',), {'0': 10, '1': 90})
@@ -115,3 +147,47 @@ class MultiDataSetNoRepInstanceTester(MultiDataSetMethodBase, BaseCase):
     def setUp(self):
         self.mds = MultiDataSet(mds_oli, mds_time, None, circuitIndices=gstrInds,
                                 outcomeLabels=['0', '1'])
+
+
+class SparseMultiDataSetTester(BaseCase):
+    def setUp(self):
+        self.ds1 = DataSet(sparse=True)
+        self.ds1.add_count_dict(('Gx',), {'000': 10, '111': 90})
+        self.ds1.add_count_dict(('Gy',), {'011': 50, '100': 50})
+        self.ds1.done_adding_data()
+        self.ds2 = DataSet(sparse=True)
+        self.ds2.add_count_dict(('Gx',), {'000': 100})  # a shorter row => padded when added
+        self.ds2.add_count_dict(('Gy',), {'011': 30, '101': 20, '100': 50})
+        self.ds2.done_adding_data()
+        self.mds = MultiDataSet()
+        self.mds.add_dataset('ds1', self.ds1)
+        self.mds.add_dataset('ds2', self.ds2)
+
+    def test_sparse_flag_is_kept(self):
+        self.assertTrue(self.mds.sparse)
+        for name in ('ds1', 'ds2'):
+            self.assertTrue(self.mds[name].sparse)
+        self.assertTrue(self.mds.copy().sparse)
+        self.assertTrue(pickle.loads(pickle.dumps(self.mds)).sparse)
+
+    def test_views_have_no_zero_counts(self):
+        for name, ds in (('ds1', self.ds1), ('ds2', self.ds2)):
+            view = self.mds[name]
+            self.assertTrue(np.all(view.repData != 0))
+            for circuit in ds.keys():
+                self.assertEqual(view[circuit].counts, ds[circuit].counts)
+        self.assertEqual(self.mds['ds2'].get_degrees_of_freedom(), self.ds2.get_degrees_of_freedom())
+
+    def test_get_datasets_aggregate(self):
+        agg = self.mds.get_datasets_aggregate('ds1', 'ds2')
+        self.assertTrue(agg.sparse)
+        self.assertTrue(np.all(agg.repData != 0))
+        self.assertEqual(agg[('Gx',)].counts, {('000',): 110, ('111',): 90})
+
+    def test_add_dataset_raises_on_sparsity_mismatch(self):
+        ds = DataSet(outcomeLabels=['000', '111'])
+        ds.add_count_dict(('Gx',), {'000': 10, '111': 90})
+        ds.add_count_dict(('Gy',), {'000': 50, '111': 50})
+        ds.done_adding_data()
+        with self.assertRaises(ValueError):
+            self.mds.add_dataset('ds3', ds)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from ..util import BaseCase
+from . import fixtures as pkg
+
+from pygsti.objects import objectivefns as objfns
+
+
+class LogLFunctionTester(BaseCase):
+    def setUp(self):
+        self.model = pkg.datagen_gateset.copy()
+        self.objfn = objfns.LogLFunction.simple_init(self.model, pkg.dataset)
+        self.x0 = self.model.to_vector()
+
+    def test_jacobian_reuses_memoized_probs(self):
+        v = self.objfn.fn(self.x0).copy()
+        self.assertArraysEqual(self.objfn._probs_x, self.x0)
+        jac = self.objfn.jfn(self.x0).copy()
+
+        fresh = objfns.LogLFunction.simple_init(self.model.copy(), pkg.dataset)
+        fresh_jac = fresh.jfn(self.x0)
+        self.assertArraysAlmostEqual(jac, fresh_jac)
+        self.assertArraysAlmostEqual(v, fresh.fn(self.x0))
+
+    def test_jacobian_at_new_point_recomputes_probs(self):
+        self.objfn.fn(self.x0)
+        x1 = self.x0 + 1e-3
+        jac = self.objfn.jfn(x1).copy()
+        probs = self.objfn.probs.copy()
+        self.assertArraysEqual(self.objfn._probs_x, x1)
+
+        fresh = objfns.LogLFunction.simple_init(self.model.copy(), pkg.dataset)
+        fresh.fn(x1)
+        self.assertArraysAlmostEqual(probs, fresh.probs)
+        self.assertArraysAlmostEqual(jac, fresh.jfn(x1))
+
+    def test_fn_and_jac(self):
+        v, jac = self.objfn.fn_and_jac(self.x0)
+        fresh = objfns.LogLFunction.simple_init(self.model.copy(), pkg.dataset)
+        self.assertArraysAlmostEqual(v, fresh.fn(self.x0))
+        self.assertArraysAlmostEqual(jac, fresh.jfn(self.x0))
@@ -1,3 +1,5 @@
+import numpy as np
+
 from ..util import BaseCase
 from . import fixtures as pkg
 
@@ -34,6 +36,18 @@ class LogLTester(LikelihoodFunctionsBase):
                       poissonPicture=False, check=False)
         # TODO assert correctness
 
+    def test_logl_multi(self):
+        v0 = self.model.to_vector()
+        param_vectors = np.array([v0, v0 + 0.01, v0 - 0.02])
+        for poissonPicture in (True, False):
+            values = lfn.logl_multi(self.model, self.ds, param_vectors, self.circuits,
+                                    poissonPicture=poissonPicture, memLimit=1024**2)
+            self.assertArraysAlmostEqual(self.model.to_vector(), v0)  # parameters are restored
+            for v, value in zip(param_vectors, values):
+                mdl = self.model.copy()
+                mdl.from_vector(v)
+                self.assertAlmostEqual(value, lfn.logl(mdl, self.ds, self.circuits, poissonPicture=poissonPicture))
+
     def test_logl_jacobian(self):
         dL1 = lfn.logl_jacobian(self.model, self.ds, self.circuits,
                                 probClipInterval=(-1e6, 1e6), radius=1e-4,
@@ -62,6 +76,45 @@ class LogLTester(LikelihoodFunctionsBase):
                                 poissonPicture=False, check=False)
         # TODO assert correctness
 
+    def test_logl_hessian_threaded_blocks(self):
+        hL = lfn.logl_hessian(self.model, self.ds, self.circuits)
+        hL_threaded = lfn.logl_hessian(self.model, self.ds, self.circuits, numThreads=3)
+        self.assertArraysAlmostEqual(hL_threaded, hL)
+        self.assertArraysAlmostEqual(hL_threaded, hL_threaded.T)
+
+        # the map simulator perturbs the model's operations, so it must fall back to serial computation
+        self.model.set_simtype('map')
+        v0 = self.model.to_vector()
+        hL_map = lfn.logl_hessian(self.model, self.ds, self.circuits)
+        hL_map_threaded = lfn.logl_hessian(self.model, self.ds, self.circuits, numThreads=4)
+        self.assertArraysAlmostEqual(hL_map_threaded, hL_map)
+        self.assertArraysAlmostEqual(self.model.to_vector(), v0)
+
+    def test_logl_corrected_approximate_hessian(self):
+        hL = lfn.logl_hessian(self.model, self.ds, self.circuits)
+        hL_approx = lfn.logl_approximate_hessian(self.model, self.ds, self.circuits)
+
+        hL0, neglected0 = lfn.logl_corrected_approximate_hessian(self.model, self.ds, self.circuits,
+                                                                 correctionTol=0, returnNeglectedWeight=True)
+        self.assertArraysAlmostEqual(hL0, hL)
+        self.assertEqual(neglected0, 0.0)
+
+        hL1, neglected1 = lfn.logl_corrected_approximate_hessian(self.model, self.ds, self.circuits,
+                                                                 correctionTol=1.0, returnNeglectedWeight=True)
+        self.assertArraysAlmostEqual(hL1, hL_approx)
+        self.assertAlmostEqual(neglected1, 1.0)
+
+        hL2, neglected2 = lfn.logl_corrected_approximate_hessian(self.model, self.ds, self.circuits,
+                                                                 correctionTol=0.5, returnNeglectedWeight=True,
+                                                                 verbosity=1)
+        self.assertLessEqual(neglected2, 0.5)
+        self.assertLessEqual(np.linalg.norm(hL2 - hL), np.linalg.norm(hL_approx - hL))
+
+        hL_nonpoisson = lfn.logl_hessian(self.model, self.ds, self.circuits, poissonPicture=False)
+        hL3 = lfn.logl_corrected_approximate_hessian(self.model, self.ds, self.circuits,
+                                                     poissonPicture=False, correctionTol=0)
+        self.assertArraysAlmostEqual(hL3, hL_nonpoisson)
+
     def test_logl_max(self):
         maxL1 = lfn.logl_max(self.model, self.ds, self.circuits, poissonPicture=True, check=True)
         maxL2 = lfn.logl_max(self.model, self.ds, self.circuits, poissonPicture=False, check=True)